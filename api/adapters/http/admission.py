@@ -0,0 +1,42 @@
+"""Отказы контроля допуска в HTTP-ответах."""
+
+from __future__ import annotations
+
+import math
+
+from fastapi import HTTPException
+from starlette import status
+
+from infrastructure.admission import AdmissionController, ShedReason
+from infrastructure.circuit_breaker import CircuitOpenError
+
+
+def retry_after(seconds: float) -> dict[str, str]:
+    # Retry-After принимает только целые секунды
+    return {"Retry-After": str(max(math.ceil(seconds), 1))}
+
+
+def admit_or_raise(controller: AdmissionController, source: str = "http") -> None:
+    """429, если переполнена очередь заказов, 503 — если не справляются БД или geo."""
+    rejection = controller.admit(source)
+    if rejection is None:
+        return
+    if rejection.reason is ShedReason.BACKLOG:
+        raise HTTPException(
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            "Слишком много заказов ждут назначения, повторите позже",
+            headers=retry_after(rejection.retry_after_seconds),
+        )
+    raise HTTPException(
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "Сервис перегружен, повторите позже",
+        headers=retry_after(rejection.retry_after_seconds),
+    )
+
+
+def service_unavailable(error: CircuitOpenError) -> HTTPException:
+    return HTTPException(
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        str(error),
+        headers=retry_after(error.retry_after_seconds),
+    )
@@ -0,0 +1,188 @@
+"""Повтор ответов на POST-запросы с заголовком Idempotency-Key."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from fastapi import HTTPException, Request, Response
+from pydantic import BaseModel
+from starlette import status
+
+from infrastructure.adapters.postgres.idempotency import (
+    IdempotencyStore,
+    StoredResponse,
+)
+from infrastructure.metrics import IDEMPOTENCY_REQUESTS
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+type Key = tuple[str, str]
+
+
+class IdempotencyKeyReused(Exception):
+    """Ключ уже использован запросом с другим телом."""
+
+
+class IdempotentRequestInProgress(Exception):
+    """Запрос с тем же ключом ещё выполняется другим процессом."""
+
+
+@dataclass(frozen=True)
+class _Remembered:
+    request_hash: str
+    response: StoredResponse
+    expires_at: float
+
+
+@dataclass
+class _KeyLock:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+class IdempotentResponses:
+    """Выполняет запрос один раз на ключ и повторяет сохранённый ответ.
+
+    Ответы хранятся в IdempotencyStore, последние max_entries — ещё и в
+    памяти процесса: повтор, пришедший в тот же процесс, не идёт в базу.
+    Одновременные запросы с одним ключом в процессе ждут первый; запрос,
+    занятый другим процессом, получает IdempotentRequestInProgress.
+    Сохраняются только успешные ответы: после ошибки ключ освобождается,
+    и повтор выполнится заново.
+    """
+
+    def __init__(self, store: IdempotencyStore, max_entries: int = 10_000) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries должен быть больше 0")
+        self._store = store
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Key, _Remembered] = OrderedDict()
+        self._locks: dict[Key, _KeyLock] = {}
+
+    async def execute(
+        self,
+        scope: str,
+        key: str,
+        request_hash: str,
+        run: Callable[[], Awaitable[StoredResponse]],
+    ) -> tuple[StoredResponse, bool]:
+        """Ответ на запрос и признак того, что он повторён, а не выполнен."""
+        entry_key = (scope, key)
+        key_lock = self._locks.setdefault(entry_key, _KeyLock())
+        key_lock.users += 1
+        try:
+            async with key_lock.lock:
+                return await self._execute(entry_key, request_hash, run)
+        finally:
+            key_lock.users -= 1
+            if key_lock.users == 0:
+                del self._locks[entry_key]
+
+    async def _execute(
+        self,
+        entry_key: Key,
+        request_hash: str,
+        run: Callable[[], Awaitable[StoredResponse]],
+    ) -> tuple[StoredResponse, bool]:
+        scope, key = entry_key
+        remembered = self._fresh(entry_key)
+        if remembered is not None:
+            self._check_hash(scope, remembered.request_hash, request_hash)
+            IDEMPOTENCY_REQUESTS.labels(scope, "replayed_memory").inc()
+            return remembered.response, True
+
+        record = await self._store.claim(scope, key, request_hash)
+        if record is not None:
+            self._check_hash(scope, record.request_hash, request_hash)
+            if record.response is None:
+                IDEMPOTENCY_REQUESTS.labels(scope, "in_progress").inc()
+                raise IdempotentRequestInProgress
+            IDEMPOTENCY_REQUESTS.labels(scope, "replayed_db").inc()
+            self._remember(entry_key, request_hash, record.response)
+            return record.response, True
+
+        try:
+            response = await run()
+        except BaseException:
+            await self._store.release(scope, key)
+            raise
+        await self._store.complete(scope, key, response)
+        IDEMPOTENCY_REQUESTS.labels(scope, "executed").inc()
+        self._remember(entry_key, request_hash, response)
+        return response, False
+
+    @staticmethod
+    def _check_hash(scope: str, stored: str, request_hash: str) -> None:
+        if stored != request_hash:
+            IDEMPOTENCY_REQUESTS.labels(scope, "key_reused").inc()
+            raise IdempotencyKeyReused
+
+    def _remember(
+        self, entry_key: Key, request_hash: str, response: StoredResponse
+    ) -> None:
+        expires_at = time.monotonic() + self._store.ttl.total_seconds()
+        self._entries[entry_key] = _Remembered(request_hash, response, expires_at)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _fresh(self, entry_key: Key) -> _Remembered | None:
+        remembered = self._entries.get(entry_key)
+        if remembered is None:
+            return None
+        if time.monotonic() >= remembered.expires_at:
+            del self._entries[entry_key]
+            return None
+        self._entries.move_to_end(entry_key)
+        return remembered
+
+
+async def idempotent_json(
+    request: Request,
+    responses: IdempotentResponses,
+    scope: str,
+    key: str | None,
+    status_code: int,
+    run: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """JSON-ответ run(); с ключом повтор запроса не выполняет run() заново."""
+
+    async def execute() -> StoredResponse:
+        model = await run()
+        return StoredResponse(
+            status_code, model.model_dump_json(by_alias=True).encode()
+        )
+
+    if key is None:
+        stored, replayed = await execute(), False
+    else:
+        request_hash = hashlib.sha256(await request.body()).hexdigest()
+        try:
+            stored, replayed = await responses.execute(
+                scope, key, request_hash, execute
+            )
+        except IdempotencyKeyReused:
+            # Числом: имя константы 422 различается между версиями starlette
+            raise HTTPException(
+                422,
+                "Idempotency-Key уже использован с другим телом запроса",
+            ) from None
+        except IdempotentRequestInProgress:
+            raise HTTPException(
+                status.HTTP_409_CONFLICT,
+                "Запрос с этим Idempotency-Key ещё выполняется",
+                headers={"Retry-After": "1"},
+            ) from None
+
+    headers = {REPLAYED_HEADER: "true"} if replayed else None
+    return Response(
+        stored.body,
+        status_code=stored.status_code,
+        media_type="application/json",
+        headers=headers,
+    )
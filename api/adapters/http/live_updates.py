@@ -0,0 +1,176 @@
+"""Рассылка изменений карты подписчикам потока GET /api/v1/live."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+from pydantic_core import to_json
+
+from core.application.use_cases.commands.assign_order import AssignResult
+from core.application.use_cases.commands.create_order import CreateOrderResult
+from core.application.use_cases.commands.move_couriers import MoveResult
+from infrastructure.adapters.postgres.notifications import MAX_PAYLOAD_BYTES
+from infrastructure.metrics import (
+    LIVE_MESSAGES_PUBLISHED,
+    LIVE_SLOW_CLIENTS_DROPPED,
+    LIVE_SUBSCRIBERS,
+)
+
+type Delta = dict[str, Any]
+
+
+class Subscription:
+    """Очередь сообщений одного клиента. None в очереди — конец потока."""
+
+    def __init__(self, queue_size: int) -> None:
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue(queue_size)
+
+    async def get(self) -> bytes | None:
+        return await self._queue.get()
+
+    def offer(self, message: bytes) -> bool:
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def close(self) -> None:
+        # Непрочитанные сообщения больше не нужны: клиент переподключится
+        # и заново загрузит списки
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+
+class Broadcaster:
+    """Рассылает каждое сообщение всем подписчикам процесса.
+
+    Сообщение сериализуется один раз, клиенты получают одни и те же байты.
+    Очередь клиента ограничена: клиент, не успевающий её разбирать,
+    отключается, а не копит память и не задерживает остальных. Пропуск
+    отдельных сообщений испортил бы состояние карты у клиента.
+
+    С relay изменения этого процесса пересылаются остальным репликам:
+    такты выполняет только ведущий, а клиенты подключены ко всем.
+    """
+
+    def __init__(
+        self, queue_size: int = 64, relay: Callable[[str], None] | None = None
+    ) -> None:
+        if queue_size <= 0:
+            raise ValueError("queue_size должен быть больше 0")
+        self._queue_size = queue_size
+        self._relay = relay
+        self._subscriptions: set[Subscription] = set()
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscriptions)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[Subscription]:
+        subscription = Subscription(self._queue_size)
+        self._subscriptions.add(subscription)
+        LIVE_SUBSCRIBERS.inc()
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+            LIVE_SUBSCRIBERS.dec()
+
+    def publish(self, message: bytes) -> None:
+        for subscription in list(self._subscriptions):
+            if not subscription.offer(message):
+                LIVE_SLOW_CLIENTS_DROPPED.inc()
+                self._subscriptions.discard(subscription)
+                subscription.close()
+        LIVE_MESSAGES_PUBLISHED.inc()
+
+    def publish_deltas(self, deltas: Sequence[Delta]) -> None:
+        if not deltas:
+            return
+        if self._relay is not None:
+            for payload in relay_payloads(deltas):
+                self._relay(payload)
+        # Без подписчиков не тратим время на сериализацию
+        if self._subscriptions:
+            self.publish(encode_event("delta", deltas))
+
+    def receive_deltas(self, payload: str) -> None:
+        """Разослать изменения, пересланные другой репликой."""
+        if self._subscriptions:
+            self.publish(_frame("delta", payload.encode()))
+
+    def disconnect_all(self) -> None:
+        """Отключить всех: клиенты переподключатся и загрузят карту заново."""
+        for subscription in list(self._subscriptions):
+            self._subscriptions.discard(subscription)
+            subscription.close()
+
+
+def encode_event(event: str, data: Any) -> bytes:
+    return _frame(event, to_json(data))
+
+
+def _frame(event: str, data: bytes) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+def relay_payloads(
+    deltas: Sequence[Delta], limit: int = MAX_PAYLOAD_BYTES
+) -> Iterator[str]:
+    """JSON-массивы изменений, каждый не длиннее limit байт."""
+    chunk: list[bytes] = []
+    size = 2
+    for delta in deltas:
+        encoded = to_json(delta)
+        if chunk and size + len(encoded) + 1 > limit:
+            yield (b"[" + b",".join(chunk) + b"]").decode()
+            chunk, size = [], 2
+        chunk.append(encoded)
+        size += len(encoded) + 1
+    if chunk:
+        yield (b"[" + b",".join(chunk) + b"]").decode()
+
+
+def _location(x: int, y: int) -> dict[str, int]:
+    return {"x": x, "y": y}
+
+
+def order_created(result: CreateOrderResult) -> Delta:
+    return {
+        "type": "order_created",
+        "orderId": str(result.order_id),
+        "location": _location(result.location.x, result.location.y),
+    }
+
+
+def order_assigned(result: AssignResult) -> Delta:
+    return {
+        "type": "order_assigned",
+        "orderId": str(result.order_id),
+        "courierId": str(result.courier_id),
+    }
+
+
+def courier_moved(result: MoveResult) -> list[Delta]:
+    deltas: list[Delta] = [
+        {
+            "type": "courier_moved",
+            "courierId": str(result.courier_id),
+            "location": _location(*result.new_location),
+        }
+    ]
+    deltas.extend(
+        {
+            "type": "order_completed",
+            "orderId": str(order_id),
+            "courierId": str(result.courier_id),
+        }
+        for order_id in result.completed_order_ids
+    )
+    return deltas
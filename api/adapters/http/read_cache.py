@@ -0,0 +1,124 @@
+"""Кеш готовых JSON-ответов для часто опрашиваемых списков."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+
+from fastapi import Request, Response
+from starlette import status
+
+from infrastructure.metrics import HTTP_NOT_MODIFIED, READ_CACHE_REQUESTS
+from infrastructure.state_version import StateVersion
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    body: bytes
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    headers: Mapping[str, str]
+    etag: str
+    version: int
+    loaded_at: float
+
+
+type Loader = Callable[[], Awaitable[CachedBody]]
+
+
+class ReadCache:
+    """Сериализованные ответы, привязанные к версии состояния.
+
+    Запись действительна, пока не изменилась версия и не истёк ttl: ttl
+    ограничивает устаревание из-за коммитов других процессов и отставания
+    реплики. Одновременные промахи по одному ключу ждут одну загрузку.
+    Ключ — имя списка и параметры запроса; число записей ограничено
+    max_entries, вытесняются давно не запрошенные.
+    """
+
+    def __init__(
+        self, state_version: StateVersion, ttl_seconds: float, max_entries: int = 256
+    ) -> None:
+        if ttl_seconds < 0:
+            raise ValueError("ttl_seconds не может быть отрицательным")
+        if max_entries <= 0:
+            raise ValueError("max_entries должен быть больше 0")
+        self._state_version = state_version
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    async def get_or_load(
+        self, name: str, load: Loader, params: Hashable = ()
+    ) -> CachedResponse:
+        key = (name, params)
+        entry = self._fresh(key)
+        if entry is None:
+            lock = self._locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                entry = self._fresh(key)
+                if entry is None:
+                    READ_CACHE_REQUESTS.labels(name, "miss").inc()
+                    return await self._load(key, load)
+        READ_CACHE_REQUESTS.labels(name, "hit").inc()
+        return entry
+
+    async def _load(self, key: Hashable, load: Loader) -> CachedResponse:
+        # Версия берётся до запроса: коммит во время загрузки сделает запись
+        # устаревшей сразу
+        version = self._state_version.value
+        loaded = await load()
+        entry = CachedResponse(
+            body=loaded.body,
+            headers=loaded.headers,
+            etag=f'"{hashlib.blake2b(loaded.body, digest_size=12).hexdigest()}"',
+            version=version,
+            loaded_at=time.monotonic(),
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            lock = self._locks.get(evicted)
+            if lock is not None and not lock.locked():
+                del self._locks[evicted]
+        return entry
+
+    def _fresh(self, key: Hashable) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if (
+            entry is None
+            or entry.version != self._state_version.value
+            or time.monotonic() - entry.loaded_at >= self._ttl_seconds
+        ):
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def cached_json_response(
+    request: Request, name: str, entry: CachedResponse
+) -> Response:
+    """Ответ 304, если клиент прислал актуальный ETag, иначе готовый JSON."""
+    # no-cache: клиент может хранить ответ, но обязан перепроверять ETag
+    headers = {**entry.headers, "ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        HTTP_NOT_MODIFIED.labels(name).inc()
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
@@ -1,22 +1,55 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Request, Response
+from pydantic import TypeAdapter
 from starlette import status
 
+from api.adapters.http.idempotency import IdempotentResponses, idempotent_json
+from api.adapters.http.read_cache import CachedBody, ReadCache, cached_json_response
+from api.adapters.http.v1.pagination import (
+    area_filter,
+    next_cursor_headers,
+    page_request,
+)
 from api.adapters.http.v1.schemas import (
+    BulkAddStoragePlacesResponse,
+    BulkAddStoragePlacesSchema,
+    BulkCourierResultSchema,
+    BulkCreateCouriersResponse,
+    BulkCreateCouriersSchema,
+    BulkStoragePlaceResultSchema,
     CourierSchema,
     CreateCourierResponse,
     ErrorSchema,
     LocationSchema,
     NewCourierSchema,
 )
-from api.dependencies import get_create_courier_handler, get_get_couriers_handler
+from api.dependencies import (
+    get_bulk_add_storage_places_handler,
+    get_bulk_create_couriers_handler,
+    get_create_courier_handler,
+    get_get_couriers_handler,
+    get_idempotent_responses,
+    get_read_cache,
+)
+from core.application.use_cases.commands.add_storage_place import (
+    AddStoragePlaceCommand,
+)
+from core.application.use_cases.commands.bulk_add_storage_places import (
+    BulkAddStoragePlacesHandler,
+)
+from core.application.use_cases.commands.bulk_create_couriers import (
+    BulkCreateCouriersHandler,
+)
 from core.application.use_cases.commands.create_courier import (
     CreateCourierCommand,
     CreateCourierHandler,
 )
 from core.application.use_cases.queries.get_couriers import GetCouriersHandler
+from core.ports.pagination import Area, PageRequest
 
 router = APIRouter(prefix="/couriers", tags=["couriers"])
 
+_couriers_adapter = TypeAdapter(list[CourierSchema])
+
 
 @router.post(
     "",
@@ -25,32 +58,127 @@ router = APIRouter(prefix="/couriers", tags=["couriers"])
     responses={
         400: {"model": ErrorSchema},
         409: {"model": ErrorSchema},
+        422: {"model": ErrorSchema},
         500: {"model": ErrorSchema},
     },
 )
 async def create_courier(
+    request: Request,
     body: NewCourierSchema,
+    idempotency_key: str | None = Header(
+        default=None, alias="Idempotency-Key", min_length=1, max_length=255
+    ),
     handler: CreateCourierHandler = Depends(get_create_courier_handler),
-) -> CreateCourierResponse:
-    command = CreateCourierCommand(name=body.name, speed=body.speed)
-    courier_id = await handler.handle(command)
-    return CreateCourierResponse(courierId=courier_id)
+    responses: IdempotentResponses = Depends(get_idempotent_responses),
+) -> Response:
+    """Создать курьера.
+
+    Повтор с тем же Idempotency-Key и телом возвращает первый ответ;
+    тот же ключ с другим телом отклоняется с 422.
+    """
+
+    async def run() -> CreateCourierResponse:
+        command = CreateCourierCommand(name=body.name, speed=body.speed)
+        courier_id = await handler.handle(command)
+        return CreateCourierResponse(courierId=courier_id)
+
+    return await idempotent_json(
+        request,
+        responses,
+        "couriers",
+        idempotency_key,
+        status.HTTP_201_CREATED,
+        run,
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkCreateCouriersResponse,
+    responses={422: {"model": ErrorSchema}, 500: {"model": ErrorSchema}},
+)
+async def bulk_create_couriers(
+    body: BulkCreateCouriersSchema,
+    handler: BulkCreateCouriersHandler = Depends(get_bulk_create_couriers_handler),
+) -> BulkCreateCouriersResponse:
+    """Создать курьеров пачкой одной транзакцией.
+
+    Результаты идут в порядке элементов запроса; некорректные элементы
+    получают текст ошибки и не создаются.
+    """
+    results = await handler.handle(
+        [CreateCourierCommand(name=c.name, speed=c.speed) for c in body.couriers]
+    )
+    return BulkCreateCouriersResponse(
+        results=[
+            BulkCourierResultSchema(index=r.index, courierId=r.id, error=r.error)
+            for r in results
+        ]
+    )
+
+
+@router.post(
+    "/storage-places/bulk",
+    response_model=BulkAddStoragePlacesResponse,
+    responses={422: {"model": ErrorSchema}, 500: {"model": ErrorSchema}},
+)
+async def bulk_add_storage_places(
+    body: BulkAddStoragePlacesSchema,
+    handler: BulkAddStoragePlacesHandler = Depends(get_bulk_add_storage_places_handler),
+) -> BulkAddStoragePlacesResponse:
+    """Добавить места хранения курьерам пачкой одной транзакцией."""
+    results = await handler.handle(
+        [
+            AddStoragePlaceCommand(
+                courier_id=p.courier_id, name=p.name, total_volume=p.total_volume
+            )
+            for p in body.storage_places
+        ]
+    )
+    return BulkAddStoragePlacesResponse(
+        results=[
+            BulkStoragePlaceResultSchema(
+                index=r.index, storagePlaceId=r.id, error=r.error
+            )
+            for r in results
+        ]
+    )
 
 
 @router.get(
     "",
     response_model=list[CourierSchema],
-    responses={"default": {"model": ErrorSchema}},
+    responses={
+        304: {"description": "Список не изменился"},
+        "default": {"model": ErrorSchema},
+    },
 )
 async def get_couriers(
+    request: Request,
+    page: PageRequest = Depends(page_request),
+    area: Area | None = Depends(area_filter),
     handler: GetCouriersHandler = Depends(get_get_couriers_handler),
-) -> list[CourierSchema]:
-    couriers = await handler.handle()
-    return [
-        CourierSchema(
-            id=c.id,
-            name=c.name,
-            location=LocationSchema(x=c.location.x, y=c.location.y),
+    cache: ReadCache = Depends(get_read_cache),
+) -> Response:
+    """Страница курьеров по возрастанию id.
+
+    Курсор следующей страницы приходит в заголовке X-Next-Cursor.
+    """
+
+    async def load() -> CachedBody:
+        couriers = await handler.handle(page, area)
+        body = _couriers_adapter.dump_json(
+            [
+                CourierSchema(
+                    id=c.id,
+                    name=c.name,
+                    location=LocationSchema(x=c.location.x, y=c.location.y),
+                )
+                for c in couriers.items
+            ],
+            by_alias=True,
         )
-        for c in couriers
-    ]
+        return CachedBody(body, next_cursor_headers(couriers.next_cursor))
+
+    entry = await cache.get_or_load("couriers", load, params=(page, area))
+    return cached_json_response(request, "couriers", entry)
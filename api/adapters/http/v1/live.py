@@ -0,0 +1,50 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from api.adapters.http.live_updates import Broadcaster
+from api.dependencies import get_live_broadcaster
+from config.config import settings
+
+router = APIRouter(prefix="/live", tags=["live"])
+
+# Комментарий SSE: держит соединение живым через прокси
+KEEPALIVE = b": keepalive\n\n"
+
+
+@router.get("", response_class=StreamingResponse)
+async def stream_live_updates(
+    broadcaster: Broadcaster = Depends(get_live_broadcaster),
+) -> StreamingResponse:
+    """Поток изменений карты в формате Server-Sent Events.
+
+    Каждый такт приходит одним событием delta со списком изменений:
+    courier_moved, order_created, order_assigned, order_completed.
+    Клиенту следует подписаться до загрузки списков, чтобы не пропустить
+    изменения между ними. Отключённый за медленное чтение клиент
+    переподключается и загружает списки заново.
+    """
+    return StreamingResponse(
+        _stream(broadcaster, settings.live_keepalive_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream(
+    broadcaster: Broadcaster, keepalive_seconds: float
+) -> AsyncIterator[bytes]:
+    with broadcaster.subscribe() as subscription:
+        yield KEEPALIVE
+        while True:
+            try:
+                async with asyncio.timeout(keepalive_seconds):
+                    message = await subscription.get()
+            except TimeoutError:
+                yield KEEPALIVE
+                continue
+            if message is None:
+                return
+            yield message
@@ -1,23 +1,52 @@
+from dataclasses import asdict
+from datetime import timedelta
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from pydantic import TypeAdapter
 from starlette import status
 
+from api.adapters.http.admission import admit_or_raise, service_unavailable
+from api.adapters.http.idempotency import IdempotentResponses, idempotent_json
+from api.adapters.http.live_updates import Broadcaster, order_created
+from api.adapters.http.read_cache import CachedBody, ReadCache, cached_json_response
+from api.adapters.http.v1.pagination import (
+    area_filter,
+    next_cursor_headers,
+    page_request,
+)
 from api.adapters.http.v1.schemas import (
     CreateOrderResponse,
     ErrorSchema,
     LocationSchema,
+    OrderLatenciesSchema,
     OrderSchema,
 )
-from api.dependencies import get_create_order_handler, get_get_active_orders_handler
+from api.dependencies import (
+    get_admission_controller,
+    get_create_order_handler,
+    get_get_active_orders_handler,
+    get_get_order_latencies_handler,
+    get_idempotent_responses,
+    get_live_broadcaster,
+    get_read_cache,
+)
 from core.application.use_cases.commands.create_order import (
     CreateOrderCommand,
     CreateOrderHandler,
 )
 from core.application.use_cases.queries.get_active_orders import GetActiveOrdersHandler
+from core.application.use_cases.queries.get_order_latencies import (
+    GetOrderLatenciesHandler,
+)
+from core.ports.pagination import Area, PageRequest
+from infrastructure.admission import AdmissionController
+from infrastructure.circuit_breaker import CircuitOpenError
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
+_orders_adapter = TypeAdapter(list[OrderSchema])
+
 
 @router.post(
     "",
@@ -26,35 +55,103 @@ router = APIRouter(prefix="/orders", tags=["orders"])
     responses={
         400: {"model": ErrorSchema},
         409: {"model": ErrorSchema},
+        422: {"model": ErrorSchema},
+        429: {"model": ErrorSchema},
         500: {"model": ErrorSchema},
+        503: {"model": ErrorSchema},
     },
 )
 async def create_order(
+    request: Request,
+    idempotency_key: str | None = Header(
+        default=None, alias="Idempotency-Key", min_length=1, max_length=255
+    ),
     handler: CreateOrderHandler = Depends(get_create_order_handler),
-) -> CreateOrderResponse:
-    order_id = uuid4()
-    command = CreateOrderCommand(
-        order_id=order_id,
-        street="Несуществующая",
-        volume=5,
+    broadcaster: Broadcaster = Depends(get_live_broadcaster),
+    responses: IdempotentResponses = Depends(get_idempotent_responses),
+    admission: AdmissionController = Depends(get_admission_controller),
+) -> Response:
+    """Создать заказ.
+
+    Повтор с тем же Idempotency-Key возвращает первый ответ без создания
+    нового заказа. При перегрузке новые заказы отклоняются с 429 или 503
+    и заголовком Retry-After; повторы уже созданных отвечаются как обычно.
+    """
+
+    async def run() -> CreateOrderResponse:
+        admit_or_raise(admission)
+        order_id = uuid4()
+        command = CreateOrderCommand(
+            order_id=order_id,
+            street="Несуществующая",
+            volume=5,
+        )
+        try:
+            result = await handler.handle(command)
+        except CircuitOpenError as exc:
+            raise service_unavailable(exc) from None
+        broadcaster.publish_deltas([order_created(result)])
+        return CreateOrderResponse(orderId=order_id)
+
+    return await idempotent_json(
+        request,
+        responses,
+        "orders",
+        idempotency_key,
+        status.HTTP_201_CREATED,
+        run,
     )
-    await handler.handle(command)
-    return CreateOrderResponse(orderId=order_id)
 
 
 @router.get(
     "/active",
     response_model=list[OrderSchema],
-    responses={"default": {"model": ErrorSchema}},
+    responses={
+        304: {"description": "Список не изменился"},
+        "default": {"model": ErrorSchema},
+    },
 )
 async def get_active_orders(
+    request: Request,
+    page: PageRequest = Depends(page_request),
+    area: Area | None = Depends(area_filter),
     handler: GetActiveOrdersHandler = Depends(get_get_active_orders_handler),
-) -> list[OrderSchema]:
-    orders = await handler.handle()
-    return [
-        OrderSchema(
-            id=o.id,
-            location=LocationSchema(x=o.location.x, y=o.location.y),
+    cache: ReadCache = Depends(get_read_cache),
+) -> Response:
+    """Страница незавершённых заказов по возрастанию id.
+
+    Курсор следующей страницы приходит в заголовке X-Next-Cursor.
+    """
+
+    async def load() -> CachedBody:
+        orders = await handler.handle(page, area)
+        body = _orders_adapter.dump_json(
+            [
+                OrderSchema(
+                    id=o.id,
+                    location=LocationSchema(x=o.location.x, y=o.location.y),
+                )
+                for o in orders.items
+            ],
+            by_alias=True,
         )
-        for o in orders
-    ]
+        return CachedBody(body, next_cursor_headers(orders.next_cursor))
+
+    entry = await cache.get_or_load("active_orders", load, params=(page, area))
+    return cached_json_response(request, "active_orders", entry)
+
+
+@router.get(
+    "/latencies",
+    response_model=OrderLatenciesSchema,
+    responses={"default": {"model": ErrorSchema}},
+)
+async def get_order_latencies(
+    window_minutes: int = Query(default=60, ge=1, le=7 * 24 * 60),
+    handler: GetOrderLatenciesHandler = Depends(get_get_order_latencies_handler),
+) -> OrderLatenciesSchema:
+    window = timedelta(minutes=window_minutes)
+    stats = await handler.handle(window)
+    return OrderLatenciesSchema(
+        windowSeconds=int(window.total_seconds()), **asdict(stats)
+    )
@@ -0,0 +1,46 @@
+from uuid import UUID
+
+from fastapi import Query
+from fastapi.exceptions import RequestValidationError
+
+from core.ports.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Area, PageRequest
+
+# Курсор следующей страницы: передаётся обратно в параметре after
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def page_request(
+    after: UUID | None = Query(
+        default=None, description="Курсор: id последнего элемента предыдущей страницы"
+    ),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> PageRequest:
+    return PageRequest(after=after, limit=limit)
+
+
+def area_filter(
+    min_x: int | None = Query(default=None),
+    min_y: int | None = Query(default=None),
+    max_x: int | None = Query(default=None),
+    max_y: int | None = Query(default=None),
+) -> Area | None:
+    bounds = (min_x, min_y, max_x, max_y)
+    if all(bound is None for bound in bounds):
+        return None
+    if min_x is None or min_y is None or max_x is None or max_y is None:
+        raise _invalid_area("Область задаётся всеми четырьмя границами")
+    try:
+        return Area(min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y)
+    except ValueError as e:
+        raise _invalid_area(str(e)) from e
+
+
+def _invalid_area(message: str) -> RequestValidationError:
+    # 422, как и для остальных неверных параметров запроса
+    return RequestValidationError(
+        [{"type": "value_error", "loc": ("query", "min_x"), "msg": message}]
+    )
+
+
+def next_cursor_headers(next_cursor: UUID | None) -> dict[str, str]:
+    return {NEXT_CURSOR_HEADER: str(next_cursor)} if next_cursor else {}
@@ -2,10 +2,14 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from core.application.use_cases.commands.bulk import MAX_BULK_ITEMS
+
 
 class LocationSchema(BaseModel):
-    x: int = Field(ge=0)
-    y: int = Field(ge=0)
+    # Только для ответов: границы сетки проверяет Location на входе, а
+    # сохранённые точки могут оказаться вне сетки после её сужения
+    x: int
+    y: int
 
 
 class OrderSchema(BaseModel):
@@ -18,6 +22,32 @@ class NewCourierSchema(BaseModel):
     speed: int = Field(ge=1)
 
 
+# Элементы пачек проверяет домен: ошибка одного элемента не отклоняет пачку
+class BulkCourierItemSchema(BaseModel):
+    name: str
+    speed: int
+
+
+class BulkCreateCouriersSchema(BaseModel):
+    couriers: list[BulkCourierItemSchema] = Field(max_length=MAX_BULK_ITEMS)
+
+
+class BulkStoragePlaceItemSchema(BaseModel):
+    courier_id: UUID = Field(alias="courierId")
+    name: str
+    total_volume: int = Field(alias="totalVolume")
+
+    model_config = {"populate_by_name": True}
+
+
+class BulkAddStoragePlacesSchema(BaseModel):
+    storage_places: list[BulkStoragePlaceItemSchema] = Field(
+        alias="storagePlaces", max_length=MAX_BULK_ITEMS
+    )
+
+    model_config = {"populate_by_name": True}
+
+
 class CourierSchema(BaseModel):
     id: UUID
     name: str
@@ -36,6 +66,46 @@ class CreateCourierResponse(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class BulkCourierResultSchema(BaseModel):
+    index: int
+    courier_id: UUID | None = Field(alias="courierId")
+    error: str | None
+
+    model_config = {"populate_by_name": True}
+
+
+class BulkCreateCouriersResponse(BaseModel):
+    results: list[BulkCourierResultSchema]
+
+
+class BulkStoragePlaceResultSchema(BaseModel):
+    index: int
+    storage_place_id: UUID | None = Field(alias="storagePlaceId")
+    error: str | None
+
+    model_config = {"populate_by_name": True}
+
+
+class BulkAddStoragePlacesResponse(BaseModel):
+    results: list[BulkStoragePlaceResultSchema]
+
+
+class LatencyPercentilesSchema(BaseModel):
+    p50: float
+    p95: float
+    p99: float
+
+
+class OrderLatenciesSchema(BaseModel):
+    window_seconds: int = Field(alias="windowSeconds")
+    completed: int
+    wait: LatencyPercentilesSchema | None
+    delivery: LatencyPercentilesSchema | None
+    total: LatencyPercentilesSchema | None
+
+    model_config = {"populate_by_name": True}
+
+
 class ErrorSchema(BaseModel):
     code: int
     message: str
@@ -3,13 +3,17 @@ from __future__ import annotations
 import logging
 from uuid import UUID
 
+from api.adapters.http.live_updates import order_created
+from api.dependencies import get_live_broadcaster
 from core.application.use_cases.commands.create_order import (
     CreateOrderCommand,
     CreateOrderHandler,
+    CreateOrderResult,
 )
 from infrastructure.adapters.grpc.geo_service_client import GeoServiceClient
 from infrastructure.adapters.kafka import basket_events_pb2
-from infrastructure.adapters.kafka.base_consumer import BaseKafkaConsumer
+from infrastructure.adapters.kafka.base_consumer import BaseKafkaConsumer, RetryLater
+from infrastructure.adapters.kafka.transport import ConsumerTransport
 from infrastructure.adapters.postgres.repositories.base import RepositoryTracker
 from infrastructure.adapters.postgres.repositories.order_repository import (
     OrderRepository,
@@ -17,11 +21,25 @@ from infrastructure.adapters.postgres.repositories.order_repository import (
 from infrastructure.adapters.postgres.repositories.outbox_repository import (
     OutboxRepository,
 )
+from infrastructure.admission import AdmissionController
+from infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError
 from infrastructure.db import async_session_maker
+from infrastructure.metrics import HANDLER_DURATION, ORDERS_CREATED
 
 logger = logging.getLogger(__name__)
 
 
+def parse_basket_confirmed(data: bytes) -> CreateOrderCommand:
+    event = basket_events_pb2.BasketConfirmedIntegrationEvent()  # type: ignore[attr-defined]
+    event.ParseFromString(data)
+
+    return CreateOrderCommand(
+        order_id=UUID(event.basket_id),
+        street=event.address.street,
+        volume=event.volume,
+    )
+
+
 class BasketConfirmedConsumer(BaseKafkaConsumer):
     def __init__(
         self,
@@ -29,35 +47,60 @@ class BasketConfirmedConsumer(BaseKafkaConsumer):
         topic: str,
         consumer_group: str,
         geo_service_host: str,
+        transport: ConsumerTransport | None = None,
+        admission: AdmissionController | None = None,
+        geo_breaker: CircuitBreaker | None = None,
+        geo_timeout_seconds: float | None = None,
     ) -> None:
         super().__init__(
-            kafka_host=kafka_host, topic=topic, consumer_group=consumer_group
+            kafka_host=kafka_host,
+            topic=topic,
+            consumer_group=consumer_group,
+            transport=transport,
+            admission=admission,
         )
         self._geo_service_host = geo_service_host
+        self._geo_breaker = geo_breaker
+        self._geo_timeout_seconds = geo_timeout_seconds
 
     async def _process_message(self, data: bytes) -> None:
-        event = basket_events_pb2.BasketConfirmedIntegrationEvent()  # type: ignore[attr-defined]
-        event.ParseFromString(data)
+        command = parse_basket_confirmed(data)
+
+        try:
+            result = await self._create_order(command)
+        except CircuitOpenError as exc:
+            # Сообщение не пропускаем, но и не ждём посреди пачки: консьюмер
+            # перечитает его, а до тех пор контроль допуска приостановит чтение
+            raise RetryLater(exc.retry_after_seconds) from exc
+        if not result.created:
+            logger.info(
+                "Basket event redelivered, order already exists: order_id=%s",
+                command.order_id,
+            )
+            return
+        ORDERS_CREATED.inc()
+        get_live_broadcaster().publish_deltas([order_created(result)])
 
-        command = CreateOrderCommand(
-            order_id=UUID(event.basket_id),
-            street=event.address.street,
-            volume=event.volume,
+        logger.info(
+            "Order created from basket event: order_id=%s, street=%s, volume=%s",
+            command.order_id,
+            command.street,
+            command.volume,
         )
 
+    async def _create_order(self, command: CreateOrderCommand) -> CreateOrderResult:
         async with async_session_maker() as session:
             tracker = RepositoryTracker(session)
             handler = CreateOrderHandler(
                 order_repository=OrderRepository(tracker),
                 tracker=tracker,
-                geo_service_client=GeoServiceClient(self._geo_service_host),
+                geo_service_client=GeoServiceClient(
+                    self._geo_service_host,
+                    breaker=self._geo_breaker,
+                    timeout_seconds=self._geo_timeout_seconds,
+                ),
                 outbox_repository=OutboxRepository(tracker),
+                check_existing=True,
             )
-            await handler.handle(command)
-
-        logger.info(
-            "Order created from basket event: order_id=%s, street=%s, volume=%s",
-            command.order_id,
-            command.street,
-            command.volume,
-        )
+            with HANDLER_DURATION.labels("CreateOrderHandler").time():
+                return await handler.handle(command)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from api.adapters.kafka.basket_consumer import BasketConfirmedConsumer
+from api.dependencies import get_admission_controller, get_geo_breaker
 from config.config import Settings
 from infrastructure.adapters.kafka.base_consumer import BaseKafkaConsumer
 
@@ -12,5 +13,8 @@ def build_consumers(settings: Settings) -> list[BaseKafkaConsumer]:
             topic=settings.kafka_basket_confirmed_topic,
             consumer_group=settings.kafka_consumer_group,
             geo_service_host=settings.geo_service_grpc_host,
+            admission=get_admission_controller(),
+            geo_breaker=get_geo_breaker(),
+            geo_timeout_seconds=settings.geo_timeout_seconds,
         ),
     ]
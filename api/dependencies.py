@@ -1,22 +1,46 @@
+from datetime import timedelta
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.adapters.http.idempotency import IdempotentResponses
+from api.adapters.http.live_updates import Broadcaster
+from api.adapters.http.read_cache import ReadCache
 from config.config import settings
 from core.application.event_handlers.order_events import OrderEventsHandler
 from core.application.use_cases.commands.add_storage_place import AddStoragePlaceHandler
 from core.application.use_cases.commands.assign_order import AssignOrderHandler
+from core.application.use_cases.commands.bulk_add_storage_places import (
+    BulkAddStoragePlacesHandler,
+)
+from core.application.use_cases.commands.bulk_create_couriers import (
+    BulkCreateCouriersHandler,
+)
 from core.application.use_cases.commands.create_courier import CreateCourierHandler
 from core.application.use_cases.commands.create_order import CreateOrderHandler
 from core.application.use_cases.commands.move_couriers import MoveCouriersHandler
 from core.application.use_cases.queries.get_active_orders import GetActiveOrdersHandler
 from core.application.use_cases.queries.get_couriers import GetCouriersHandler
-from core.domain.services import OrderDispatcher
-from core.ports import GeoServiceClientInterface, OrderDispatcherInterface
+from core.application.use_cases.queries.get_order_latencies import (
+    GetOrderLatenciesHandler,
+)
+from core.domain.services import OrderDispatcher, RoutePlanner
+from core.ports import (
+    GeoServiceClientInterface,
+    OrderDispatcherInterface,
+    RoutePlannerInterface,
+)
 from core.ports.order_events_dispatcher import OrderEventsDispatcherInterface
 from core.ports.order_events_publisher import OrderEventsPublisherInterface
 from core.ports.outbox_repository import OutboxRepositoryInterface
 from infrastructure.adapters.grpc.geo_service_client import GeoServiceClient
 from infrastructure.adapters.kafka.order_events_producer import KafkaOrderEventsProducer
+from infrastructure.adapters.postgres.idempotency import IdempotencyStore
+from infrastructure.adapters.postgres.notifications import NotificationChannel
+from infrastructure.adapters.postgres.repositories.asyncpg_reads import (
+    AsyncpgCourierRepository,
+    AsyncpgOrderRepository,
+)
 from infrastructure.adapters.postgres.repositories.base import RepositoryTracker
 from infrastructure.adapters.postgres.repositories.courier_repository import (
     CourierRepository,
@@ -28,15 +52,131 @@ from infrastructure.adapters.postgres.repositories.outbox_repository import (
     OutboxRepository,
 )
 from infrastructure.adapters.postgres.repositories.tracker import Tracker
-from infrastructure.db import get_session
+from infrastructure.admission import AdmissionController, AdmissionLimits
+from infrastructure.circuit_breaker import CircuitBreaker
+from infrastructure.db import (
+    async_session_maker,
+    get_read_session,
+    get_session,
+    leader_engine,
+)
+from infrastructure.state_version import STATE_VERSION
+
+_route_planner = RoutePlanner()
+_read_cache = ReadCache(STATE_VERSION, ttl_seconds=settings.read_cache_ttl_seconds)
+
+
+def _receive_live_deltas(payload: str) -> None:
+    # Агрегаты изменила другая реплика: кеши чтения этого процесса устарели
+    STATE_VERSION.bump()
+    _live_broadcaster.receive_deltas(payload)
+
+
+def _live_gap() -> None:
+    # Изменения, пришедшие без соединения, потеряны
+    STATE_VERSION.bump()
+    _live_broadcaster.disconnect_all()
+
+
+# Такты выполняет только ведущий, поэтому при выборе ведущего изменения
+# пересылаются всем репликам; без выбора каждый процесс выполняет их сам
+_live_channel = (
+    NotificationChannel(
+        leader_engine,
+        settings.live_channel,
+        on_notification=_receive_live_deltas,
+        on_gap=_live_gap,
+    )
+    if settings.leader_election_enabled
+    else None
+)
+_live_broadcaster = Broadcaster(
+    queue_size=settings.live_queue_size,
+    relay=_live_channel.send if _live_channel is not None else None,
+)
+_geo_breaker = CircuitBreaker(
+    "geo",
+    failure_threshold=settings.geo_breaker_failure_threshold,
+    reset_timeout_seconds=settings.geo_breaker_reset_seconds,
+)
+_admission_controller = AdmissionController(
+    AdmissionLimits(
+        backlog_high=settings.admission_backlog_high,
+        backlog_low=settings.admission_backlog_low,
+        pool_wait_high_seconds=settings.admission_pool_wait_high_seconds,
+        pool_wait_low_seconds=settings.admission_pool_wait_low_seconds,
+        retry_after_seconds=settings.admission_retry_after_seconds,
+    ),
+    geo_breaker=_geo_breaker,
+)
+
+
+def create_idempotency_store() -> IdempotencyStore:
+    return IdempotencyStore(
+        async_session_maker,
+        ttl=timedelta(seconds=settings.idempotency_ttl_seconds),
+        pending_timeout=timedelta(seconds=settings.idempotency_pending_timeout_seconds),
+    )
+
+
+_idempotent_responses = IdempotentResponses(
+    create_idempotency_store(), max_entries=settings.idempotency_cache_size
+)
+
+
+def create_order_repository(tracker: Tracker) -> OrderRepository:
+    if settings.db_fast_reads:
+        return AsyncpgOrderRepository(tracker)
+    return OrderRepository(tracker)
+
+
+def create_courier_repository(tracker: Tracker) -> CourierRepository:
+    if settings.db_fast_reads:
+        return AsyncpgCourierRepository(tracker)
+    return CourierRepository(tracker)
 
 
 def get_order_dispatcher() -> OrderDispatcherInterface:
     return OrderDispatcher()
 
 
+def get_route_planner() -> RoutePlannerInterface:
+    # Один планировщик на процесс: маршруты курьеров кешируются между тактами
+    return _route_planner
+
+
+def get_read_cache() -> ReadCache:
+    return _read_cache
+
+
+def get_idempotent_responses() -> IdempotentResponses:
+    return _idempotent_responses
+
+
+def get_live_broadcaster() -> Broadcaster:
+    # Один рассыльщик на процесс: его наполняют такты и команды
+    return _live_broadcaster
+
+
+def get_live_channel() -> NotificationChannel | None:
+    return _live_channel
+
+
+def get_geo_breaker() -> CircuitBreaker:
+    # Один автомат на процесс: его разделяют HTTP-запросы и консьюмер
+    return _geo_breaker
+
+
+def get_admission_controller() -> AdmissionController:
+    return _admission_controller
+
+
 def get_geo_service_client() -> GeoServiceClientInterface:
-    return GeoServiceClient(settings.geo_service_grpc_host)
+    return GeoServiceClient(
+        settings.geo_service_grpc_host,
+        breaker=_geo_breaker,
+        timeout_seconds=settings.geo_timeout_seconds,
+    )
 
 
 def get_order_events_publisher() -> OrderEventsPublisherInterface:
@@ -56,6 +196,13 @@ async def get_tracker(session: AsyncSession = Depends(get_session)) -> Tracker:
     return RepositoryTracker(session)
 
 
+async def get_read_tracker(
+    session: AsyncSession = Depends(get_read_session),
+) -> Tracker:
+    # Запросы на чтение не конкурируют с транзакциями тактов на основном сервере
+    return RepositoryTracker(session)
+
+
 async def get_outbox_repository(
     tracker: Tracker = Depends(get_tracker),
 ) -> OutboxRepositoryInterface:
@@ -68,7 +215,7 @@ async def get_create_order_handler(
     outbox_repository: OutboxRepositoryInterface = Depends(get_outbox_repository),
 ) -> CreateOrderHandler:
     return CreateOrderHandler(
-        order_repository=OrderRepository(tracker),
+        order_repository=create_order_repository(tracker),
         tracker=tracker,
         geo_service_client=geo_client,
         outbox_repository=outbox_repository,
@@ -79,7 +226,23 @@ async def get_create_courier_handler(
     tracker: Tracker = Depends(get_tracker),
 ) -> CreateCourierHandler:
     return CreateCourierHandler(
-        courier_repository=CourierRepository(tracker), tracker=tracker
+        courier_repository=create_courier_repository(tracker), tracker=tracker
+    )
+
+
+async def get_bulk_create_couriers_handler(
+    tracker: Tracker = Depends(get_tracker),
+) -> BulkCreateCouriersHandler:
+    return BulkCreateCouriersHandler(
+        courier_repository=create_courier_repository(tracker), tracker=tracker
+    )
+
+
+async def get_bulk_add_storage_places_handler(
+    tracker: Tracker = Depends(get_tracker),
+) -> BulkAddStoragePlacesHandler:
+    return BulkAddStoragePlacesHandler(
+        courier_repository=create_courier_repository(tracker), tracker=tracker
     )
 
 
@@ -87,7 +250,7 @@ async def get_add_storage_place_handler(
     tracker: Tracker = Depends(get_tracker),
 ) -> AddStoragePlaceHandler:
     return AddStoragePlaceHandler(
-        courier_repository=CourierRepository(tracker), tracker=tracker
+        courier_repository=create_courier_repository(tracker), tracker=tracker
     )
 
 
@@ -96,8 +259,8 @@ async def get_assign_order_handler(
     dispatcher: OrderDispatcherInterface = Depends(get_order_dispatcher),
 ) -> AssignOrderHandler:
     return AssignOrderHandler(
-        order_repository=OrderRepository(tracker),
-        courier_repository=CourierRepository(tracker),
+        order_repository=create_order_repository(tracker),
+        courier_repository=create_courier_repository(tracker),
         dispatcher=dispatcher,
         tracker=tracker,
     )
@@ -106,22 +269,30 @@ async def get_assign_order_handler(
 async def get_move_couriers_handler(
     tracker: Tracker = Depends(get_tracker),
     outbox_repository: OutboxRepositoryInterface = Depends(get_outbox_repository),
+    route_planner: RoutePlannerInterface = Depends(get_route_planner),
 ) -> MoveCouriersHandler:
     return MoveCouriersHandler(
-        order_repository=OrderRepository(tracker),
-        courier_repository=CourierRepository(tracker),
+        order_repository=create_order_repository(tracker),
+        courier_repository=create_courier_repository(tracker),
         tracker=tracker,
         outbox_repository=outbox_repository,
+        route_planner=route_planner,
     )
 
 
 async def get_get_couriers_handler(
-    tracker: Tracker = Depends(get_tracker),
+    tracker: Tracker = Depends(get_read_tracker),
 ) -> GetCouriersHandler:
-    return GetCouriersHandler(courier_repository=CourierRepository(tracker))
+    return GetCouriersHandler(courier_repository=create_courier_repository(tracker))
 
 
 async def get_get_active_orders_handler(
-    tracker: Tracker = Depends(get_tracker),
+    tracker: Tracker = Depends(get_read_tracker),
 ) -> GetActiveOrdersHandler:
-    return GetActiveOrdersHandler(order_repository=OrderRepository(tracker))
+    return GetActiveOrdersHandler(order_repository=create_order_repository(tracker))
+
+
+async def get_get_order_latencies_handler(
+    tracker: Tracker = Depends(get_read_tracker),
+) -> GetOrderLatenciesHandler:
+    return GetOrderLatenciesHandler(order_repository=create_order_repository(tracker))
@@ -6,11 +6,28 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from api.adapters.http import metrics
 from api.adapters.http.router import router as v1_router
 from api.adapters.kafka.consumers import build_consumers
-from api.tasks import assign_orders, move_couriers, process_outbox_events, run_periodic
+from api.dependencies import get_live_channel
+from api.tasks import (
+    archive_orders,
+    assign_orders,
+    move_couriers,
+    process_outbox_events,
+    purge_idempotency_keys,
+    run_periodic,
+    sample_admission,
+)
 from config.config import settings
+from core.domain.model.kernel.grid import Grid
+from core.domain.model.kernel.location import configure_grid
 from infrastructure.adapters.kafka.order_events_producer import KafkaOrderEventsProducer
+from infrastructure.adapters.postgres.leader import LeaderElection
+from infrastructure.adapters.postgres.metrics import postgres_collector
+from infrastructure.adapters.postgres.pool import warm_up_pool
+from infrastructure.db import async_engine, async_session_maker, leader_engine
+from infrastructure.metrics import REGISTRY
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,18 +38,81 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    configure_grid(
+        Grid(
+            min_coordinate=settings.grid_min_coordinate,
+            max_coordinate=settings.grid_max_coordinate,
+        )
+    )
+
+    REGISTRY.add_collector(postgres_collector(async_engine, async_session_maker))
+    try:
+        await warm_up_pool(async_engine, settings.db_pool_size)
+    except Exception:
+        # Без прогрева соединения откроются по первому запросу
+        logger.exception("Failed to warm up the database connection pool")
+
+    # Такты над общим состоянием выполняет одна реплика; без выборов их
+    # выполняет каждый процесс, как при единственной реплике
+    leader = (
+        LeaderElection(
+            leader_engine,
+            lock_id=settings.leader_lock_id,
+            renew_interval_seconds=settings.leader_renew_interval_seconds,
+            lease_seconds=settings.leader_lease_seconds,
+        )
+        if settings.leader_election_enabled
+        else None
+    )
+    leader_task = asyncio.create_task(leader.run()) if leader is not None else None
+    live_channel = get_live_channel()
+    live_task = (
+        asyncio.create_task(live_channel.run()) if live_channel is not None else None
+    )
+
     logger.info("Starting periodic tasks...")
     assign_task = asyncio.create_task(
-        run_periodic(assign_orders, interval=1, name="assign_orders")
+        run_periodic(assign_orders, interval=1, name="assign_orders", leader=leader)
     )
     move_task = asyncio.create_task(
-        run_periodic(move_couriers, interval=1, name="move_couriers")
+        run_periodic(move_couriers, interval=1, name="move_couriers", leader=leader)
     )
     outbox_task = asyncio.create_task(
-        run_periodic(process_outbox_events, interval=1, name="process_outbox_events")
+        run_periodic(
+            process_outbox_events,
+            interval=1,
+            name="process_outbox_events",
+            leader=leader,
+        )
+    )
+    archive_task = asyncio.create_task(
+        run_periodic(
+            archive_orders,
+            interval=settings.order_archive_interval_seconds,
+            name="archive_orders",
+            leader=leader,
+        )
+    )
+    idempotency_task = asyncio.create_task(
+        run_periodic(
+            purge_idempotency_keys,
+            interval=settings.idempotency_purge_interval_seconds,
+            name="purge_idempotency_keys",
+            leader=leader,
+        )
+    )
+    # Допуск решает каждая реплика по своему пулу, поэтому без выборов
+    admission_task = asyncio.create_task(
+        run_periodic(
+            sample_admission,
+            interval=settings.admission_sample_interval_seconds,
+            name="sample_admission",
+        )
     )
     logger.info(
-        "Periodic tasks started (assign_orders, move_couriers, process_outbox_events)"
+        "Periodic tasks started (assign_orders, move_couriers, "
+        "process_outbox_events, archive_orders, purge_idempotency_keys, "
+        "sample_admission)"
     )
 
     consumers = build_consumers(settings)
@@ -45,6 +125,27 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     assign_task.cancel()
     move_task.cancel()
     outbox_task.cancel()
+    archive_task.cancel()
+    idempotency_task.cancel()
+    admission_task.cancel()
+    if leader is not None and leader_task is not None:
+        leader_task.cancel()
+        # Блокировку отпускаем после остановки тактов, чтобы следующий
+        # ведущий не начал их, пока здесь ещё идёт такт
+        await asyncio.gather(
+            assign_task,
+            move_task,
+            outbox_task,
+            archive_task,
+            idempotency_task,
+            leader_task,
+            return_exceptions=True,
+        )
+        await leader.release()
+    if live_channel is not None and live_task is not None:
+        live_task.cancel()
+        await asyncio.gather(live_task, return_exceptions=True)
+        await live_channel.close()
     for consumer in consumers:
         await consumer.stop()
     await KafkaOrderEventsProducer.close_all()
@@ -70,9 +171,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Заголовки, которые читает клиент: условные запросы, пагинация,
+    # признак повторённого ответа и пауза перед повтором при перегрузке
+    expose_headers=["ETag", "X-Next-Cursor", "Idempotent-Replayed", "Retry-After"],
 )
 
 app.include_router(v1_router, prefix="/api/v1")
+# Prometheus ожидает метрики по стандартному пути, без версии API
+app.include_router(metrics.router, tags=["metrics"])
 
 if __name__ == "__main__":
     import uvicorn
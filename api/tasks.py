@@ -1,42 +1,72 @@
 import asyncio
 import logging
 from collections.abc import Callable, Coroutine
+from datetime import timedelta
 from typing import Any
 
+from api.adapters.http.live_updates import courier_moved, order_assigned
+from api.dependencies import (
+    create_courier_repository,
+    create_idempotency_store,
+    create_order_repository,
+    get_admission_controller,
+    get_live_broadcaster,
+    get_route_planner,
+)
 from config.config import settings
 from core.application.event_handlers.order_events import OrderEventsHandler
 from core.application.use_cases.commands.assign_order import AssignOrderHandler
 from core.application.use_cases.commands.move_couriers import MoveCouriersHandler
 from core.domain.services import OrderDispatcher
 from infrastructure.adapters.kafka.order_events_producer import KafkaOrderEventsProducer
+from infrastructure.adapters.postgres.archive import OrderArchiver
+from infrastructure.adapters.postgres.leader import LeaderElection
+from infrastructure.adapters.postgres.metrics import created_backlog
 from infrastructure.adapters.postgres.repositories.base import RepositoryTracker
-from infrastructure.adapters.postgres.repositories.courier_repository import (
-    CourierRepository,
-)
-from infrastructure.adapters.postgres.repositories.order_repository import (
-    OrderRepository,
-)
 from infrastructure.adapters.postgres.repositories.outbox_repository import (
     OutboxRepository,
 )
+from infrastructure.admission import HistogramWindow
 from infrastructure.db import async_session_maker
+from infrastructure.metrics import (
+    DB_POOL_CHECKOUT_DURATION,
+    HANDLER_DURATION,
+    ORDER_DELIVERY_TIME,
+    ORDER_WAIT_TIME,
+    ORDERS_ARCHIVED,
+    ORDERS_ASSIGNED,
+    ORDERS_COMPLETED,
+    OUTBOX_RELAY_FAILURES,
+    OUTBOX_RELAYED,
+    TICK_DURATION,
+    TICK_FAILURES,
+)
 
 logger = logging.getLogger(__name__)
 OUTBOX_BATCH_SIZE = 100
 
+_pool_wait = HistogramWindow(DB_POOL_CHECKOUT_DURATION.labels())
+
 
 async def run_periodic(
     task: Callable[[], Coroutine[Any, Any, None]],
     interval: float,
     name: str,
+    leader: LeaderElection | None = None,
 ) -> None:
+    """Выполнять task раз в interval секунд; с leader — только на ведущем."""
+    duration = TICK_DURATION.labels(name)
+    failures = TICK_FAILURES.labels(name)
     while True:
-        try:
-            await task()
-        except asyncio.CancelledError:
-            raise
-        except Exception:
-            logger.exception("Error in periodic task %s", name)
+        if leader is None or leader.is_leader:
+            try:
+                with duration.time():
+                    await task()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                failures.inc()
+                logger.exception("Error in periodic task %s", name)
         await asyncio.sleep(interval)
 
 
@@ -44,13 +74,18 @@ async def assign_orders() -> None:
     async with async_session_maker() as session:
         tracker = RepositoryTracker(session)
         handler = AssignOrderHandler(
-            order_repository=OrderRepository(tracker),
-            courier_repository=CourierRepository(tracker),
+            order_repository=create_order_repository(tracker),
+            courier_repository=create_courier_repository(tracker),
             dispatcher=OrderDispatcher(),
             tracker=tracker,
         )
-        result = await handler.handle()
+        with HANDLER_DURATION.labels("AssignOrderHandler").time():
+            result = await handler.handle()
         if result:
+            ORDERS_ASSIGNED.inc()
+            if result.wait_time is not None:
+                ORDER_WAIT_TIME.observe(result.wait_time.total_seconds())
+            get_live_broadcaster().publish_deltas([order_assigned(result)])
             logger.info(
                 "Order %s assigned to courier %s",
                 result.order_id,
@@ -62,14 +97,23 @@ async def move_couriers() -> None:
     async with async_session_maker() as session:
         tracker = RepositoryTracker(session)
         handler = MoveCouriersHandler(
-            order_repository=OrderRepository(tracker),
-            courier_repository=CourierRepository(tracker),
+            order_repository=create_order_repository(tracker),
+            courier_repository=create_courier_repository(tracker),
             tracker=tracker,
             outbox_repository=OutboxRepository(tracker),
+            route_planner=get_route_planner(),
+        )
+        with HANDLER_DURATION.labels("MoveCouriersHandler").time():
+            results = await handler.handle()
+        get_live_broadcaster().publish_deltas(
+            [delta for r in results for delta in courier_moved(r)]
         )
-        results = await handler.handle()
         for r in results:
+            for delivery_time in r.delivery_times:
+                ORDER_DELIVERY_TIME.observe(delivery_time.total_seconds())
             if r.order_completed:
+                # За один шаг курьер может доставить несколько заказов в точке
+                ORDERS_COMPLETED.inc(len(r.completed_order_ids))
                 logger.info(
                     "Courier '%s' (%s) completed delivery at %s",
                     r.courier_name,
@@ -102,6 +146,7 @@ async def process_outbox_events() -> None:
                 try:
                     await order_events_handler.handle(message.event)
                 except Exception:
+                    OUTBOX_RELAY_FAILURES.inc()
                     logger.exception(
                         "Failed to dispatch outbox event: message_id=%s event_name=%s",
                         message.id,
@@ -110,3 +155,31 @@ async def process_outbox_events() -> None:
                     continue
 
                 await outbox_repository.mark_processed(message.id)
+                OUTBOX_RELAYED.inc()
+
+
+async def archive_orders() -> None:
+    archiver = OrderArchiver(
+        async_session_maker,
+        retention=timedelta(days=settings.order_archive_after_days),
+        batch_size=settings.order_archive_batch_size,
+        lock_timeout_ms=settings.order_archive_lock_timeout_ms,
+    )
+    archived = await archiver.run()
+    if archived:
+        ORDERS_ARCHIVED.inc(archived)
+        logger.info("Archived %d completed orders", archived)
+
+
+async def purge_idempotency_keys() -> None:
+    purged = await create_idempotency_store().purge_expired()
+    if purged:
+        logger.info("Purged %d expired idempotency keys", purged)
+
+
+async def sample_admission() -> None:
+    # Ожидание пула берётся до собственного запроса задачи
+    pool_wait = _pool_wait.mean()
+    async with async_session_maker() as session:
+        backlog = await created_backlog(session)
+    get_admission_controller().observe(backlog=backlog, pool_wait_seconds=pool_wait)
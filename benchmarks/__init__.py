@@ -0,0 +1,21 @@
+from benchmarks.harness import (
+    BenchmarkContext,
+    BenchmarkReport,
+    Measurement,
+    Scenario,
+    ScenarioSkipped,
+    compare,
+    run_suite,
+)
+from benchmarks.scenarios import SCENARIOS
+
+__all__ = [
+    "SCENARIOS",
+    "BenchmarkContext",
+    "BenchmarkReport",
+    "Measurement",
+    "Scenario",
+    "ScenarioSkipped",
+    "compare",
+    "run_suite",
+]
@@ -0,0 +1,153 @@
+"""Запуск бенчмарков и сравнение результатов между коммитами.
+
+Примеры:
+    python -m benchmarks run --fleet 10,100,1000 --backlog 10,1000 -o head.json
+    python -m benchmarks compare main.json head.json --threshold 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from benchmarks.harness import (
+    BenchmarkContext,
+    BenchmarkReport,
+    Measurement,
+    compare,
+    regressions,
+    run_suite,
+)
+from benchmarks.scenarios import SCENARIOS, close_fixtures
+from config.config import settings
+from core.domain.model.kernel.grid import Grid
+from core.domain.model.kernel.location import configure_grid
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",")]
+
+
+def _names(value: str) -> list[str]:
+    names = value.split(",")
+    unknown = set(names) - SCENARIOS.keys()
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"неизвестные сценарии: {', '.join(sorted(unknown))}"
+        )
+    return names
+
+
+def _print_measurement(measurement: Measurement) -> None:
+    if measurement.skipped is not None:
+        print(f"{measurement.key:<50} пропущен: {measurement.skipped}")
+        return
+    print(
+        f"{measurement.key:<50} p50={measurement.p50_ms:10.3f} мс  "
+        f"p95={measurement.p95_ms:10.3f} мс  {measurement.ops_per_second:>12.1f} оп/с"
+    )
+
+
+async def _run(args: argparse.Namespace) -> int:
+    configure_grid(Grid(min_coordinate=1, max_coordinate=args.grid_max))
+    database_url = args.database_url or settings.database_url.replace(
+        f"/{settings.db_name}", f"/{settings.db_name}_bench"
+    )
+    try:
+        report = await run_suite(
+            scenarios=[SCENARIOS[name] for name in args.scenarios],
+            values={"fleet": args.fleet, "backlog": args.backlog},
+            context=BenchmarkContext(
+                database_url=database_url,
+                geo_address=args.geo_address,
+                geo_latency=args.geo_latency,
+            ),
+            repeats=args.repeats,
+            on_result=_print_measurement,
+        )
+    finally:
+        await close_fixtures()
+
+    if args.output is not None:
+        args.output.write_text(
+            json.dumps(report.to_dict(), ensure_ascii=False, indent=2) + "\n",
+            encoding="utf-8",
+        )
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline, current = (
+        BenchmarkReport.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        for path in (args.baseline, args.current)
+    )
+    comparisons = compare(baseline, current)
+    print(f"{baseline.commit} -> {current.commit}")
+    for item in comparisons:
+        print(
+            f"{item.key:<50} {item.baseline_ms:10.3f} -> {item.current_ms:10.3f} мс"
+            f"  x{item.ratio:.2f}"
+        )
+    slower = regressions(comparisons, args.threshold)
+    for item in slower:
+        print(f"Регрессия: {item.key} медленнее в {item.ratio:.2f} раза")
+    return 1 if slower else 0
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Бенчмарки горячих путей сервиса доставки.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="выполнить сценарии")
+    run.add_argument(
+        "--scenarios", type=_names, default=list(SCENARIOS), help="через запятую"
+    )
+    run.add_argument("--fleet", type=_int_list, default=[10, 100, 1000])
+    run.add_argument("--backlog", type=_int_list, default=[10, 1000])
+    run.add_argument("--repeats", type=int, default=10)
+    run.add_argument("--grid-max", type=int, default=1000)
+    run.add_argument(
+        "--database-url",
+        default=None,
+        help="Postgres для сценариев репозиториев (по умолчанию <DB_NAME>_bench)",
+    )
+    run.add_argument(
+        "--geo-address",
+        default=None,
+        help="внешний геосервис; по умолчанию GeoStubServer в процессе",
+    )
+    run.add_argument(
+        "--geo-latency",
+        default="fixed:0",
+        help="задержка встроенного геосервиса: fixed:5, uniform:1,10, lognormal:20,0.5",
+    )
+    run.add_argument("-o", "--output", type=Path, default=None, help="файл JSON")
+
+    diff = commands.add_parser("compare", help="сравнить два прогона")
+    diff.add_argument("baseline", type=Path)
+    diff.add_argument("current", type=Path)
+    diff.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="допустимое замедление медианы (0.1 = 10%%)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.command == "run":
+        return asyncio.run(_run(args))
+    return _compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
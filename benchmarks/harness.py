@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import platform
+import subprocess
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from simulation.report import percentile
+
+# Подготовленный прогон: возвращает число обработанных единиц
+# (заказов, курьеров, сообщений), по нему считается пропускная способность.
+type Run = Callable[[], Awaitable[int]]
+
+
+class ScenarioSkipped(Exception):
+    """Сценарий нельзя выполнить в текущем окружении (например, нет БД)."""
+
+
+@dataclass(frozen=True)
+class BenchmarkContext:
+    database_url: str | None = None
+    # Адрес внешнего геосервиса; без него поднимается GeoStubServer в процессе
+    geo_address: str | None = None
+    # Задержка встроенного геосервиса, например lognormal:20,0.5
+    geo_latency: str = "fixed:0"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Сценарий нагрузки.
+
+    prepare вызывается перед каждым повтором и не входит в замер:
+    он готовит состояние и возвращает измеряемый прогон.
+    """
+
+    name: str
+    axes: tuple[str, ...]
+    prepare: Callable[..., Awaitable[Run]]
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class Measurement:
+    scenario: str
+    params: dict[str, int]
+    repeats: int
+    units: int = 0
+    min_ms: float = 0.0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    max_ms: float = 0.0
+    ops_per_second: float = 0.0
+    skipped: str | None = None
+
+    @property
+    def key(self) -> str:
+        params = ",".join(f"{name}={value}" for name, value in self.params.items())
+        return f"{self.scenario}[{params}]"
+
+
+@dataclass
+class BenchmarkReport:
+    commit: str
+    created_at: str
+    python: str
+    measurements: list[Measurement] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BenchmarkReport:
+        return cls(
+            commit=data["commit"],
+            created_at=data["created_at"],
+            python=data["python"],
+            measurements=[Measurement(**item) for item in data["measurements"]],
+        )
+
+
+def current_commit() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return result.stdout.strip()
+
+
+def new_report() -> BenchmarkReport:
+    return BenchmarkReport(
+        commit=current_commit(),
+        created_at=datetime.now(UTC).isoformat(timespec="seconds"),
+        python=platform.python_version(),
+    )
+
+
+async def measure(
+    scenario: Scenario,
+    params: dict[str, int],
+    context: BenchmarkContext,
+    repeats: int,
+    warmup: int = 1,
+) -> Measurement:
+    samples: list[float] = []
+    units = 0
+    try:
+        for attempt in range(warmup + repeats):
+            run = await scenario.prepare(context, **params)
+            started = time.perf_counter()
+            units = await run()
+            elapsed = time.perf_counter() - started
+            if attempt >= warmup:
+                samples.append(elapsed * 1000)
+    except ScenarioSkipped as exc:
+        return Measurement(
+            scenario=scenario.name, params=params, repeats=0, skipped=str(exc)
+        )
+
+    samples.sort()
+    mean_ms = sum(samples) / len(samples)
+    return Measurement(
+        scenario=scenario.name,
+        params=params,
+        repeats=repeats,
+        units=units,
+        min_ms=round(samples[0], 4),
+        mean_ms=round(mean_ms, 4),
+        p50_ms=round(percentile(samples, 50), 4),
+        p95_ms=round(percentile(samples, 95), 4),
+        max_ms=round(samples[-1], 4),
+        ops_per_second=round(units * 1000 / mean_ms, 1) if mean_ms > 0 else 0.0,
+    )
+
+
+@dataclass(frozen=True)
+class Comparison:
+    key: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ms / self.baseline_ms if self.baseline_ms > 0 else 1.0
+
+
+def compare(baseline: BenchmarkReport, current: BenchmarkReport) -> list[Comparison]:
+    """Сопоставить медианы одинаковых сценариев двух прогонов."""
+    previous = {
+        m.key: m for m in baseline.measurements if m.skipped is None and m.repeats
+    }
+    return [
+        Comparison(key=m.key, baseline_ms=previous[m.key].p50_ms, current_ms=m.p50_ms)
+        for m in current.measurements
+        if m.skipped is None and m.key in previous
+    ]
+
+
+def regressions(
+    comparisons: Sequence[Comparison], threshold: float
+) -> list[Comparison]:
+    return [c for c in comparisons if c.ratio > 1 + threshold]
+
+
+def parameter_grid(
+    scenario: Scenario, values: dict[str, Sequence[int]]
+) -> list[dict[str, int]]:
+    """Все сочетания значений осей сценария."""
+    grid: list[dict[str, int]] = [{}]
+    for axis in scenario.axes:
+        grid = [{**params, axis: value} for params in grid for value in values[axis]]
+    return grid
+
+
+async def run_suite(
+    scenarios: Sequence[Scenario],
+    values: dict[str, Sequence[int]],
+    context: BenchmarkContext,
+    repeats: int,
+    on_result: Callable[[Measurement], None] | None = None,
+) -> BenchmarkReport:
+    report = new_report()
+    for scenario in scenarios:
+        for params in parameter_grid(scenario, values):
+            measurement = await measure(scenario, params, context, repeats)
+            report.measurements.append(measurement)
+            if on_result is not None:
+                on_result(measurement)
+    return report
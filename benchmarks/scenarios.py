@@ -0,0 +1,508 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import socket
+from urllib.parse import urlsplit
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from api.adapters.kafka.basket_consumer import parse_basket_confirmed
+from benchmarks.harness import BenchmarkContext, Run, Scenario, ScenarioSkipped
+from benchmarks.standins import StreetGeoServiceClient
+from core.application.event_handlers.order_events import OrderEventsHandler
+from core.application.use_cases.commands.assign_order import AssignOrderHandler
+from core.application.use_cases.commands.create_order import CreateOrderHandler
+from core.application.use_cases.commands.move_couriers import MoveCouriersHandler
+from core.domain.model.courier.courier import Courier
+from core.domain.model.kernel.location import Location, current_grid
+from core.domain.model.order.order import Order
+from core.domain.services import OrderDispatcher, RoutePlanner
+from infrastructure.adapters.grpc.geo_service_client import GeoServiceClient
+from infrastructure.adapters.grpc.geo_stub import (
+    GeoStubServer,
+    GeoStubServicer,
+    parse_latency,
+)
+from infrastructure.adapters.kafka import basket_events_pb2
+from infrastructure.adapters.kafka.memory_broker import InMemoryBroker
+from infrastructure.adapters.kafka.order_events_producer import KafkaOrderEventsProducer
+from infrastructure.adapters.memory import (
+    InMemoryCourierRepository,
+    InMemoryOrderRepository,
+    InMemoryOutboxRepository,
+    InMemoryStore,
+    InMemoryTracker,
+)
+from infrastructure.adapters.postgres.models.base import Base
+from infrastructure.adapters.postgres.repositories.asyncpg_reads import (
+    AsyncpgCourierRepository,
+)
+from infrastructure.adapters.postgres.repositories.base import RepositoryTracker
+from infrastructure.adapters.postgres.repositories.courier_repository import (
+    CourierRepository,
+)
+
+# Размер пачки outbox, как в api.tasks.process_outbox_events
+OUTBOX_BATCH_SIZE: int = 100
+# Размер пачки консьюмера, как в BaseKafkaConsumer
+CONSUME_BATCH_SIZE: int = 100
+BASKET_TOPIC: str = "basket.confirmed"
+ORDER_TOPIC: str = "order.changed"
+PARTITIONS: int = 4
+# Одновременных запросов к геосервису в сценарии geo_lookup
+GEO_CONCURRENCY: int = 32
+SEED: int = 42
+
+
+def _random_location(rng: random.Random) -> Location:
+    grid = current_grid()
+    return Location(
+        x=rng.randint(grid.min_coordinate, grid.max_coordinate),
+        y=rng.randint(grid.min_coordinate, grid.max_coordinate),
+    )
+
+
+def _new_id(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _make_couriers(rng: random.Random, count: int) -> list[Courier]:
+    return [
+        Courier.create(
+            name=f"Курьер {i + 1}",
+            speed=rng.randint(1, 3),
+            location=_random_location(rng),
+        )
+        for i in range(count)
+    ]
+
+
+def _make_orders(rng: random.Random, count: int) -> list[Order]:
+    orders = [
+        Order.create(id=_new_id(rng), location=_random_location(rng), volume=1)
+        for _ in range(count)
+    ]
+    for order in orders:
+        order.pull_events()
+    return orders
+
+
+async def _memory_state(
+    fleet: int, backlog: int, assigned: bool
+) -> tuple[InMemoryTracker, list[Courier], list[Order]]:
+    """Заполнить in-memory хранилище курьерами и заказами.
+
+    При assigned=True заказы раздаются курьерам по кругу, пока у них
+    есть место; остальные заказы остаются в статусе CREATED.
+    """
+    rng = random.Random(SEED)
+    tracker = InMemoryTracker(InMemoryStore())
+    couriers = _make_couriers(rng, fleet)
+    orders = _make_orders(rng, backlog)
+    if assigned and couriers:
+        for i, order in enumerate(orders):
+            courier = couriers[i % len(couriers)]
+            if courier.can_take_order(order.volume):
+                courier.take_order(order_id=order.id, volume=order.volume)
+                order.assign(courier.id)
+
+    courier_repository = InMemoryCourierRepository(tracker)
+    order_repository = InMemoryOrderRepository(tracker)
+    async with tracker.transaction():
+        for courier in couriers:
+            await courier_repository.add(courier)
+        for order in orders:
+            await order_repository.add(order)
+    return tracker, couriers, orders
+
+
+async def prepare_dispatch(context: BenchmarkContext, fleet: int, backlog: int) -> Run:
+    tracker, _, _ = await _memory_state(fleet, backlog, assigned=False)
+    handler = AssignOrderHandler(
+        order_repository=InMemoryOrderRepository(tracker),
+        courier_repository=InMemoryCourierRepository(tracker),
+        dispatcher=OrderDispatcher(),
+        tracker=tracker,
+    )
+
+    async def run() -> int:
+        result = await handler.handle()
+        return 1 if result is not None else 0
+
+    return run
+
+
+async def prepare_move(context: BenchmarkContext, fleet: int, backlog: int) -> Run:
+    tracker, _, _ = await _memory_state(fleet, backlog, assigned=True)
+    handler = MoveCouriersHandler(
+        order_repository=InMemoryOrderRepository(tracker),
+        courier_repository=InMemoryCourierRepository(tracker),
+        tracker=tracker,
+        outbox_repository=InMemoryOutboxRepository(tracker),
+        route_planner=RoutePlanner(),
+    )
+
+    async def run() -> int:
+        return len(await handler.handle())
+
+    return run
+
+
+async def prepare_outbox_relay(context: BenchmarkContext, backlog: int) -> Run:
+    rng = random.Random(SEED)
+    tracker = InMemoryTracker(InMemoryStore())
+    outbox_repository = InMemoryOutboxRepository(tracker)
+    async with tracker.transaction():
+        for _ in range(backlog):
+            order = Order.create(
+                id=_new_id(rng), location=_random_location(rng), volume=1
+            )
+            for event in order.pull_events():
+                await outbox_repository.add(event)
+    handler = _order_events_handler(InMemoryBroker(default_partitions=PARTITIONS))
+
+    async def run() -> int:
+        return await _relay_outbox(tracker, handler)
+
+    return run
+
+
+def _order_events_handler(broker: InMemoryBroker) -> OrderEventsHandler:
+    return OrderEventsHandler(
+        publisher=KafkaOrderEventsProducer(
+            kafka_host="in-memory",
+            topic=ORDER_TOPIC,
+            transport=broker.producer(acks=1),
+        )
+    )
+
+
+async def _relay_outbox(tracker: InMemoryTracker, handler: OrderEventsHandler) -> int:
+    """Разбор outbox так же, как в api.tasks.process_outbox_events."""
+    outbox_repository = InMemoryOutboxRepository(tracker)
+    relayed = 0
+    while messages := await outbox_repository.get_unprocessed(limit=OUTBOX_BATCH_SIZE):
+        async with tracker.transaction():
+            for message in messages:
+                await handler.handle(message.event)
+                await outbox_repository.mark_processed(message.id)
+        relayed += len(messages)
+    return relayed
+
+
+def _basket_events(count: int) -> list[bytes]:
+    rng = random.Random(SEED)
+    messages = []
+    for i in range(count):
+        event = basket_events_pb2.BasketConfirmedIntegrationEvent()  # type: ignore[attr-defined]
+        event.basket_id = str(_new_id(rng))
+        event.address.street = f"Улица {i % 500}"
+        event.volume = rng.randint(1, 10)
+        messages.append(event.SerializeToString())
+    return messages
+
+
+async def prepare_consumer_ingest(context: BenchmarkContext, backlog: int) -> Run:
+    messages = _basket_events(backlog)
+    tracker = InMemoryTracker(InMemoryStore())
+    handler = CreateOrderHandler(
+        order_repository=InMemoryOrderRepository(tracker),
+        tracker=tracker,
+        geo_service_client=StreetGeoServiceClient(),
+        outbox_repository=InMemoryOutboxRepository(tracker),
+    )
+
+    async def run() -> int:
+        for data in messages:
+            await handler.handle(parse_basket_confirmed(data))
+        return len(messages)
+
+    return run
+
+
+async def prepare_pipeline(context: BenchmarkContext, backlog: int) -> Run:
+    """Корзина -> заказ -> outbox -> событие заказа через брокер в памяти."""
+    broker = InMemoryBroker(default_partitions=PARTITIONS)
+    await broker.producer().send_batch(BASKET_TOPIC, _basket_events(backlog))
+    consumer = broker.consumer(
+        BASKET_TOPIC, group_id="delivery", auto_offset_reset="earliest"
+    )
+    await consumer.start()
+
+    tracker = InMemoryTracker(InMemoryStore())
+    create_order = CreateOrderHandler(
+        order_repository=InMemoryOrderRepository(tracker),
+        tracker=tracker,
+        geo_service_client=StreetGeoServiceClient(),
+        outbox_repository=InMemoryOutboxRepository(tracker),
+    )
+    order_events = _order_events_handler(broker)
+
+    async def run() -> int:
+        consumed = 0
+        while consumed < backlog:
+            batch = await consumer.getmany(max_records=CONSUME_BATCH_SIZE)
+            for records in batch.values():
+                for record in records:
+                    # Как BaseKafkaConsumer: сообщение без тела — пустое событие
+                    command = parse_basket_confirmed(record.value or b"")
+                    await create_order.handle(command)
+                consumed += len(records)
+            await _relay_outbox(tracker, order_events)
+        await consumer.stop()
+        return consumed
+
+    return run
+
+
+class PostgresFixture:
+    """Подключение к локальному Postgres и засев таблиц курьерами."""
+
+    def __init__(self, database_url: str | None) -> None:
+        self._database_url = database_url
+        self._engine: AsyncEngine | None = None
+        self._seeded_fleet: int | None = None
+
+    async def engine(self) -> AsyncEngine:
+        if self._engine is not None:
+            return self._engine
+        if not self._database_url:
+            raise ScenarioSkipped("не задан адрес базы данных")
+
+        url = urlsplit(self._database_url)
+        try:
+            socket.create_connection(
+                (url.hostname or "localhost", url.port or 5432), timeout=1
+            ).close()
+        except OSError as exc:
+            raise ScenarioSkipped(f"база данных недоступна: {exc}") from exc
+
+        engine = create_async_engine(self._database_url)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+        except (OSError, SQLAlchemyError) as exc:
+            await engine.dispose()
+            raise ScenarioSkipped(f"база данных недоступна: {exc}") from exc
+        self._engine = engine
+        return engine
+
+    async def seed_couriers(self, fleet: int) -> AsyncEngine:
+        engine = await self.engine()
+        if self._seeded_fleet == fleet:
+            return engine
+
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("TRUNCATE TABLE orders, storage_places, couriers CASCADE")
+            )
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            tracker = RepositoryTracker(session)
+            repository = CourierRepository(tracker)
+            async with tracker.transaction():
+                for courier in _make_couriers(random.Random(SEED), fleet):
+                    await repository.add(courier)
+        self._seeded_fleet = fleet
+        return engine
+
+    async def close(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+
+_postgres_fixtures: dict[str | None, PostgresFixture] = {}
+
+
+def postgres_fixture(context: BenchmarkContext) -> PostgresFixture:
+    fixture = _postgres_fixtures.get(context.database_url)
+    if fixture is None:
+        fixture = PostgresFixture(context.database_url)
+        _postgres_fixtures[context.database_url] = fixture
+    return fixture
+
+
+_geo_stubs: dict[str, GeoStubServer] = {}
+
+
+async def geo_address(context: BenchmarkContext) -> str:
+    if context.geo_address is not None:
+        return context.geo_address
+
+    server = _geo_stubs.get(context.geo_latency)
+    if server is None:
+        grid = current_grid()
+        server = GeoStubServer(
+            GeoStubServicer(
+                latency=parse_latency(context.geo_latency),
+                min_coordinate=grid.min_coordinate,
+                max_coordinate=grid.max_coordinate,
+                seed=SEED,
+            )
+        )
+        await server.start()
+        _geo_stubs[context.geo_latency] = server
+    return server.address
+
+
+async def close_fixtures() -> None:
+    for fixture in _postgres_fixtures.values():
+        await fixture.close()
+    _postgres_fixtures.clear()
+    for server in _geo_stubs.values():
+        await server.stop()
+    _geo_stubs.clear()
+
+
+async def prepare_repository_hydration(context: BenchmarkContext, fleet: int) -> Run:
+    engine = await postgres_fixture(context).seed_couriers(fleet)
+
+    async def run() -> int:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            couriers = await CourierRepository(RepositoryTracker(session)).get_all()
+        return len(couriers)
+
+    return run
+
+
+async def prepare_repository_hydration_asyncpg(
+    context: BenchmarkContext, fleet: int
+) -> Run:
+    engine = await postgres_fixture(context).seed_couriers(fleet)
+
+    async def run() -> int:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repository = AsyncpgCourierRepository(RepositoryTracker(session))
+            couriers = await repository.get_all()
+        return len(couriers)
+
+    return run
+
+
+async def prepare_repository_writes(context: BenchmarkContext, fleet: int) -> Run:
+    engine = await postgres_fixture(context).seed_couriers(fleet)
+    rng = random.Random(SEED)
+    session = AsyncSession(engine, expire_on_commit=False)
+    tracker = RepositoryTracker(session)
+    repository = CourierRepository(tracker)
+    couriers = await repository.get_all()
+    await session.commit()
+    targets = [_random_location(rng) for _ in couriers]
+
+    async def run() -> int:
+        try:
+            async with tracker.transaction():
+                for courier, target in zip(couriers, targets, strict=True):
+                    courier.move(target)
+                    await repository.update(courier)
+        finally:
+            await session.close()
+        return len(couriers)
+
+    return run
+
+
+async def prepare_repository_tick_asyncpg(context: BenchmarkContext, fleet: int) -> Run:
+    engine = await postgres_fixture(context).seed_couriers(fleet)
+    rng = random.Random(SEED)
+
+    async def run() -> int:
+        # Чтение и запись в одной сессии, как в такте move_couriers
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            tracker = RepositoryTracker(session)
+            repository = AsyncpgCourierRepository(tracker)
+            couriers = await repository.get_all()
+            async with tracker.transaction():
+                for courier in couriers:
+                    courier.move(_random_location(rng))
+                    await repository.update(courier)
+        return len(couriers)
+
+    return run
+
+
+async def prepare_geo_lookup(context: BenchmarkContext, backlog: int) -> Run:
+    client = GeoServiceClient(await geo_address(context))
+    streets = [f"Улица {i % 500}" for i in range(backlog)]
+    semaphore = asyncio.Semaphore(GEO_CONCURRENCY)
+
+    async def lookup(street: str) -> None:
+        async with semaphore:
+            await client.get_location(street)
+
+    async def run() -> int:
+        await asyncio.gather(*(lookup(street) for street in streets))
+        return len(streets)
+
+    return run
+
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            name="dispatch",
+            axes=("fleet", "backlog"),
+            prepare=prepare_dispatch,
+            description="AssignOrderHandler: один такт назначения",
+        ),
+        Scenario(
+            name="move",
+            axes=("fleet", "backlog"),
+            prepare=prepare_move,
+            description="MoveCouriersHandler: один такт движения",
+        ),
+        Scenario(
+            name="repository_hydration",
+            axes=("fleet",),
+            prepare=prepare_repository_hydration,
+            description="CourierRepository.get_all в Postgres",
+        ),
+        Scenario(
+            name="repository_hydration_asyncpg",
+            axes=("fleet",),
+            prepare=prepare_repository_hydration_asyncpg,
+            description="AsyncpgCourierRepository.get_all: тот же флот мимо ORM",
+        ),
+        Scenario(
+            name="repository_tick_asyncpg",
+            axes=("fleet",),
+            prepare=prepare_repository_tick_asyncpg,
+            description="AsyncpgCourierRepository: get_all и update флота за такт",
+        ),
+        Scenario(
+            name="repository_writes",
+            axes=("fleet",),
+            prepare=prepare_repository_writes,
+            description="CourierRepository.update всего флота в одной транзакции",
+        ),
+        Scenario(
+            name="outbox_relay",
+            axes=("backlog",),
+            prepare=prepare_outbox_relay,
+            description="Разбор outbox и публикация событий пачками",
+        ),
+        Scenario(
+            name="consumer_ingest",
+            axes=("backlog",),
+            prepare=prepare_consumer_ingest,
+            description="Разбор BasketConfirmed и CreateOrderHandler",
+        ),
+        Scenario(
+            name="pipeline",
+            axes=("backlog",),
+            prepare=prepare_pipeline,
+            description="Корзина -> заказ -> outbox -> order.changed в памяти",
+        ),
+        Scenario(
+            name="geo_lookup",
+            axes=("backlog",),
+            prepare=prepare_geo_lookup,
+            description="GeoServiceClient.get_location через gRPC",
+        ),
+    )
+}
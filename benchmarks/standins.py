@@ -0,0 +1,16 @@
+"""Внутрипроцессные заменители внешних систем для бенчмарков."""
+
+from __future__ import annotations
+
+from core.domain.model.kernel.location import Location, current_grid
+from core.ports.geo_service_client import GeoServiceClientInterface
+from infrastructure.adapters.grpc.geo_stub import street_location
+
+
+class StreetGeoServiceClient(GeoServiceClientInterface):
+    """Отображает улицу в точку сетки так же, как GeoStubServer, без gRPC."""
+
+    async def get_location(self, street: str) -> Location:
+        grid = current_grid()
+        x, y = street_location(street, grid.min_coordinate, grid.max_coordinate)
+        return Location(x=x, y=y)
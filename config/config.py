@@ -28,9 +28,105 @@ class Settings(BaseSettings):
     db_password: str = Field(alias="DB_PASSWORD")
     db_name: str = Field(alias="DB_NAME")
     db_sslmode: str = Field(default="disable", alias="DB_SSLMODE")
+    # Пул соединений: периодические задачи, HTTP и консьюмеры делят один пул
+    db_pool_size: int = Field(default=10, alias="DB_POOL_SIZE")
+    db_pool_max_overflow: int = Field(default=10, alias="DB_POOL_MAX_OVERFLOW")
+    db_pool_timeout_seconds: float = Field(default=10, alias="DB_POOL_TIMEOUT_SECONDS")
+    db_pool_recycle_seconds: int = Field(default=1800, alias="DB_POOL_RECYCLE_SECONDS")
+    # Соединение, простоявшее в пуле дольше, проверяется перед выдачей
+    db_pool_ping_idle_seconds: float = Field(
+        default=30, alias="DB_POOL_PING_IDLE_SECONDS"
+    )
+    db_statement_cache_size: int = Field(default=100, alias="DB_STATEMENT_CACHE_SIZE")
+    # Реплика для запросов на чтение; без DB_REPLICA_HOST читаем с основного
+    db_replica_host: str = Field(default="", alias="DB_REPLICA_HOST")
+    db_replica_port: str = Field(default="", alias="DB_REPLICA_PORT")
+    # Если задано, реплика с большим отставанием не используется
+    db_replica_max_lag_seconds: float | None = Field(
+        default=None, alias="DB_REPLICA_MAX_LAG_SECONDS"
+    )
+    db_replica_lag_check_interval_seconds: float = Field(
+        default=1, alias="DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS"
+    )
+    # Горячие чтения репозиториев через asyncpg мимо ORM
+    db_fast_reads: bool = Field(default=False, alias="DB_FAST_READS")
+
+    # HTTP-кеш списков курьеров и активных заказов: сбрасывается коммитами
+    # этого процесса, ttl ограничивает устаревание от остальных
+    read_cache_ttl_seconds: float = Field(default=1, alias="READ_CACHE_TTL_SECONDS")
+
+    # Ответы на POST-запросы с Idempotency-Key
+    idempotency_ttl_seconds: float = Field(
+        default=86400, alias="IDEMPOTENCY_TTL_SECONDS"
+    )
+    idempotency_pending_timeout_seconds: float = Field(
+        default=30, alias="IDEMPOTENCY_PENDING_TIMEOUT_SECONDS"
+    )
+    idempotency_cache_size: int = Field(default=10000, alias="IDEMPOTENCY_CACHE_SIZE")
+    idempotency_purge_interval_seconds: float = Field(
+        default=600, alias="IDEMPOTENCY_PURGE_INTERVAL_SECONDS"
+    )
+
+    # Поток изменений карты GET /api/v1/live
+    live_queue_size: int = Field(default=64, alias="LIVE_QUEUE_SIZE")
+    live_keepalive_seconds: float = Field(default=15, alias="LIVE_KEEPALIVE_SECONDS")
+    # Канал LISTEN/NOTIFY, через который реплики пересылают друг другу
+    # изменения; используется только при выборе ведущего
+    live_channel: str = Field(default="delivery_live", alias="LIVE_CHANNEL")
+
+    # Grid
+    grid_min_coordinate: int = Field(default=1, alias="GRID_MIN_COORDINATE")
+    grid_max_coordinate: int = Field(default=10, alias="GRID_MAX_COORDINATE")
+
+    # Архив доставленных заказов
+    order_archive_after_days: int = Field(default=7, alias="ORDER_ARCHIVE_AFTER_DAYS")
+    order_archive_batch_size: int = Field(default=500, alias="ORDER_ARCHIVE_BATCH_SIZE")
+    order_archive_lock_timeout_ms: int = Field(
+        default=200, alias="ORDER_ARCHIVE_LOCK_TIMEOUT_MS"
+    )
+    order_archive_interval_seconds: float = Field(
+        default=300, alias="ORDER_ARCHIVE_INTERVAL_SECONDS"
+    )
 
     # gRPC
     geo_service_grpc_host: str = Field(alias="GEO_SERVICE_GRPC_HOST")
+    geo_timeout_seconds: float = Field(default=2, alias="GEO_TIMEOUT_SECONDS")
+    # Автомат защиты geo: размыкается после серии сбоев подряд
+    geo_breaker_failure_threshold: int = Field(
+        default=5, alias="GEO_BREAKER_FAILURE_THRESHOLD"
+    )
+    geo_breaker_reset_seconds: float = Field(
+        default=10, alias="GEO_BREAKER_RESET_SECONDS"
+    )
+
+    # Контроль допуска новых заказов: сброс включается на high и
+    # выключается на low
+    admission_backlog_high: int = Field(default=5000, alias="ADMISSION_BACKLOG_HIGH")
+    admission_backlog_low: int = Field(default=4000, alias="ADMISSION_BACKLOG_LOW")
+    admission_pool_wait_high_seconds: float = Field(
+        default=0.5, alias="ADMISSION_POOL_WAIT_HIGH_SECONDS"
+    )
+    admission_pool_wait_low_seconds: float = Field(
+        default=0.1, alias="ADMISSION_POOL_WAIT_LOW_SECONDS"
+    )
+    admission_retry_after_seconds: float = Field(
+        default=5, alias="ADMISSION_RETRY_AFTER_SECONDS"
+    )
+    admission_sample_interval_seconds: float = Field(
+        default=1, alias="ADMISSION_SAMPLE_INTERVAL_SECONDS"
+    )
+
+    # Периодические такты выполняет одна реплика, взявшая advisory-блокировку
+    leader_election_enabled: bool = Field(default=True, alias="LEADER_ELECTION_ENABLED")
+    leader_lock_id: int = Field(
+        # "delivery" в ASCII
+        default=7234307576654295673,
+        alias="LEADER_LOCK_ID",
+    )
+    leader_renew_interval_seconds: float = Field(
+        default=2, alias="LEADER_RENEW_INTERVAL_SECONDS"
+    )
+    leader_lease_seconds: float = Field(default=6, alias="LEADER_LEASE_SECONDS")
 
     # Kafka
     kafka_host: str = Field(alias="KAFKA_HOST")
@@ -51,6 +147,22 @@ class Settings(BaseSettings):
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
         )
 
+    @property
+    def replica_database_url(self) -> str | None:
+        """
+        Формирует URL для подключения к реплике PostgreSQL.
+
+        Returns:
+            Строка подключения к реплике или None, если реплика не задана.
+        """
+        if not self.db_replica_host:
+            return None
+        return (
+            f"postgresql+asyncpg://{self.db_user}:{self.db_password}"
+            f"@{self.db_replica_host}:{self.db_replica_port or self.db_port}"
+            f"/{self.db_name}"
+        )
+
     @property
     def database_url_sync(self) -> str:
         """
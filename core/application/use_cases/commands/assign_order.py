@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -16,6 +17,7 @@ if TYPE_CHECKING:
 class AssignResult:
     order_id: UUID
     courier_id: UUID
+    wait_time: timedelta | None
 
 
 class AssignOrderHandler:
@@ -48,4 +50,8 @@ class AssignOrderHandler:
             await self._order_repository.update(order)
             await self._courier_repository.update(courier)
 
-        return AssignResult(order_id=order.id, courier_id=courier.id)
+        return AssignResult(
+            order_id=order.id,
+            courier_id=courier.id,
+            wait_time=order.wait_time,
+        )
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+# Ограничение размера пачки: вся пачка пишется одной транзакцией
+MAX_BULK_ITEMS = 5000
+
+
+@dataclass(frozen=True)
+class BulkItemResult:
+    """Результат элемента пачки: id созданной сущности или текст ошибки."""
+
+    index: int
+    id: UUID | None = None
+    error: str | None = None
+
+
+def check_bulk_size(size: int) -> None:
+    if size > MAX_BULK_ITEMS:
+        raise ValueError(f"В пачке не больше {MAX_BULK_ITEMS} элементов")
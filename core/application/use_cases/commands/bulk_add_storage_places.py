@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from core.application.use_cases.commands.add_storage_place import (
+    AddStoragePlaceCommand,
+)
+from core.application.use_cases.commands.bulk import BulkItemResult, check_bulk_size
+from core.domain.exceptions.storage_place import (
+    StoragePlaceNameIncorrect,
+    StoragePlaceTotalValueIncorrect,
+)
+from core.domain.model.courier.storage_place import StoragePlace
+from core.ports.courier_repository import CourierRepositoryInterface
+
+if TYPE_CHECKING:
+    from infrastructure.adapters.postgres.repositories.tracker import Tracker
+
+
+class BulkAddStoragePlacesHandler:
+    """Добавляет места хранения курьерам пачкой.
+
+    Курьеры не загружаются целиком: добавление места хранения не зависит
+    от остального состояния агрегата, поэтому достаточно проверить, что
+    курьер существует, и вставить новые строки.
+    """
+
+    def __init__(
+        self,
+        courier_repository: CourierRepositoryInterface,
+        tracker: Tracker,
+    ) -> None:
+        self._courier_repository = courier_repository
+        self._tracker = tracker
+
+    async def handle(
+        self, commands: Sequence[AddStoragePlaceCommand]
+    ) -> list[BulkItemResult]:
+        check_bulk_size(len(commands))
+        existing = await self._courier_repository.get_existing_ids(
+            {command.courier_id for command in commands}
+        )
+        results: list[BulkItemResult] = []
+        places: list[tuple[UUID, StoragePlace]] = []
+        for index, command in enumerate(commands):
+            if command.courier_id not in existing:
+                results.append(
+                    BulkItemResult(
+                        index=index,
+                        error=f"Курьер с id {command.courier_id} не найден.",
+                    )
+                )
+                continue
+            try:
+                place = StoragePlace.create(
+                    name=command.name, total_volume=command.total_volume
+                )
+            except (StoragePlaceNameIncorrect, StoragePlaceTotalValueIncorrect) as e:
+                results.append(BulkItemResult(index=index, error=str(e)))
+                continue
+            places.append((command.courier_id, place))
+            results.append(BulkItemResult(index=index, id=place.id))
+
+        if places:
+            async with self._tracker.transaction():
+                await self._courier_repository.add_storage_places(places)
+        return results
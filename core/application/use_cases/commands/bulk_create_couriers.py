@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from core.application.use_cases.commands.bulk import BulkItemResult, check_bulk_size
+from core.application.use_cases.commands.create_courier import CreateCourierCommand
+from core.domain.exceptions.courier import CourierNameIncorrect, CourierSpeedIncorrect
+from core.domain.model.courier.courier import Courier
+from core.domain.model.kernel.location import Location
+from core.ports.courier_repository import CourierRepositoryInterface
+
+if TYPE_CHECKING:
+    from infrastructure.adapters.postgres.repositories.tracker import Tracker
+
+
+class BulkCreateCouriersHandler:
+    """Создаёт курьеров пачкой.
+
+    Некорректные элементы получают ошибку и пропускаются, остальные
+    сохраняются одной транзакцией.
+    """
+
+    def __init__(
+        self,
+        courier_repository: CourierRepositoryInterface,
+        tracker: Tracker,
+    ) -> None:
+        self._courier_repository = courier_repository
+        self._tracker = tracker
+
+    async def handle(
+        self, commands: Sequence[CreateCourierCommand]
+    ) -> list[BulkItemResult]:
+        check_bulk_size(len(commands))
+        results: list[BulkItemResult] = []
+        couriers: list[Courier] = []
+        for index, command in enumerate(commands):
+            try:
+                courier = Courier.create(
+                    name=command.name,
+                    speed=command.speed,
+                    location=Location.new_random_location(),
+                )
+            except (CourierNameIncorrect, CourierSpeedIncorrect) as e:
+                results.append(BulkItemResult(index=index, error=str(e)))
+                continue
+            couriers.append(courier)
+            results.append(BulkItemResult(index=index, id=courier.id))
+
+        if couriers:
+            async with self._tracker.transaction():
+                await self._courier_repository.add_many(couriers)
+        return results
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from core.domain.model.kernel.location import Location
 from core.domain.model.order.order import Order
 from core.ports.geo_service_client import GeoServiceClientInterface
 from core.ports.order_repository import OrderRepositoryInterface
@@ -20,6 +21,14 @@ class CreateOrderCommand:
     volume: int
 
 
+@dataclass(frozen=True)
+class CreateOrderResult:
+    order_id: UUID
+    location: Location
+    # False, если заказ с этим id уже был создан повтором команды
+    created: bool = True
+
+
 class CreateOrderHandler:
     def __init__(
         self,
@@ -27,20 +36,37 @@ class CreateOrderHandler:
         tracker: Tracker,
         geo_service_client: GeoServiceClientInterface,
         outbox_repository: OutboxRepositoryInterface,
+        check_existing: bool = False,
     ) -> None:
         self._order_repository = order_repository
         self._tracker = tracker
         self._geo_service_client = geo_service_client
         self._outbox_repository = outbox_repository
+        # Для источников с повторной доставкой: повтор не ходит в geo и
+        # находит заказ, уже перенесённый в архив
+        self._check_existing = check_existing
+
+    async def handle(self, command: CreateOrderCommand) -> CreateOrderResult:
+        if self._check_existing:
+            existing = await self._order_repository.get_by_id(str(command.order_id))
+            if existing is not None:
+                return CreateOrderResult(
+                    order_id=existing.id, location=existing.location, created=False
+                )
 
-    async def handle(self, command: CreateOrderCommand) -> None:
         location = await self._geo_service_client.get_location(command.street)
         order = Order.create(
             id=command.order_id,
             location=location,
             volume=command.volume,
         )
+        # Повтор команды отсекается при вставке: событие о создании уходит
+        # только вместе с новой строкой
         async with self._tracker.transaction():
-            await self._order_repository.add(order)
-            for event in order.pull_events():
-                await self._outbox_repository.add(event)
+            created = await self._order_repository.add_if_absent(order)
+            if created:
+                for event in order.pull_events():
+                    await self._outbox_repository.add(event)
+        return CreateOrderResult(
+            order_id=order.id, location=order.location, created=created
+        )
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import timedelta
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from core.ports.courier_repository import CourierRepositoryInterface
 from core.ports.order_repository import OrderRepositoryInterface
 from core.ports.outbox_repository import OutboxRepositoryInterface
+from core.ports.route_planner import RoutePlannerInterface
 
 if TYPE_CHECKING:
+    from core.domain.model.order.order import Order
     from infrastructure.adapters.postgres.repositories.tracker import Tracker
 
 
@@ -18,6 +21,9 @@ class MoveResult:
     courier_name: str
     new_location: tuple[int, int]
     order_completed: bool
+    # Время от назначения до доставки каждого доставленного заказа
+    delivery_times: list[timedelta] = field(default_factory=list)
+    completed_order_ids: list[UUID] = field(default_factory=list)
 
 
 class MoveCouriersHandler:
@@ -27,11 +33,13 @@ class MoveCouriersHandler:
         courier_repository: CourierRepositoryInterface,
         tracker: Tracker,
         outbox_repository: OutboxRepositoryInterface,
+        route_planner: RoutePlannerInterface,
     ) -> None:
         self._order_repository = order_repository
         self._courier_repository = courier_repository
         self._tracker = tracker
         self._outbox_repository = outbox_repository
+        self._route_planner = route_planner
 
     async def handle(self) -> list[MoveResult]:
         results: list[MoveResult] = []
@@ -44,22 +52,36 @@ class MoveCouriersHandler:
         if not couriers:
             return results
 
-        order_by_courier = {order.courier_id: order for order in orders}
+        orders_by_courier: dict[UUID, list[Order]] = {}
+        for order in orders:
+            if order.courier_id is not None:
+                orders_by_courier.setdefault(order.courier_id, []).append(order)
 
         async with self._tracker.transaction():
             for courier in couriers:
-                order = order_by_courier.get(courier.id)
-                if order is None:
+                courier_orders = orders_by_courier.get(courier.id)
+                if not courier_orders:
                     continue
 
-                courier.move(order.location)
-
-                order_completed = False
-                if courier.location == order.location:
-                    order.complete()
-                    courier.complete_order(order.id)
-                    await self._order_repository.update(order)
-                    order_completed = True
+                route = self._route_planner.plan(courier, courier_orders)
+                courier.move(route[0].location)
+
+                # В одной точке может лежать несколько заказов курьера
+                delivery_times: list[timedelta] = []
+                completed_order_ids: list[UUID] = []
+                for order in route:
+                    if courier.location == order.location:
+                        order.complete()
+                        courier.complete_order(order.id)
+                        await self._order_repository.update(order)
+                        completed_order_ids.append(order.id)
+                        # У заказов, назначенных до миграции 003, нет assigned_at
+                        delivery_time = order.delivery_time
+                        if delivery_time is not None:
+                            delivery_times.append(delivery_time)
+                order_completed = bool(completed_order_ids)
+                if len(completed_order_ids) == len(route):
+                    self._route_planner.invalidate(courier.id)
 
                 await self._courier_repository.update(courier)
 
@@ -69,6 +91,8 @@ class MoveCouriersHandler:
                         courier_name=courier.name,
                         new_location=(courier.location.x, courier.location.y),
                         order_completed=order_completed,
+                        delivery_times=delivery_times,
+                        completed_order_ids=completed_order_ids,
                     )
                 )
 
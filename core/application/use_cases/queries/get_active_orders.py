@@ -5,6 +5,7 @@ from uuid import UUID
 
 from core.domain.model.kernel.location import Location
 from core.ports.order_repository import OrderRepositoryInterface
+from core.ports.pagination import Area, Page, PageRequest
 
 
 @dataclass(frozen=True)
@@ -17,6 +18,11 @@ class GetActiveOrdersHandler:
     def __init__(self, order_repository: OrderRepositoryInterface) -> None:
         self._order_repository = order_repository
 
-    async def handle(self) -> list[OrderDTO]:
-        orders = await self._order_repository.get_all_not_completed()
-        return [OrderDTO(id=o.id, location=o.location) for o in orders]
+    async def handle(
+        self, page: PageRequest | None = None, area: Area | None = None
+    ) -> Page[OrderDTO]:
+        page = page or PageRequest()
+        orders = await self._order_repository.get_active_summaries(page, area)
+        items = [OrderDTO(id=o.id, location=o.location) for o in orders]
+        next_cursor = items[-1].id if len(items) == page.limit else None
+        return Page(items=items, next_cursor=next_cursor)
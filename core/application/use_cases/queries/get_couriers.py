@@ -5,6 +5,7 @@ from uuid import UUID
 
 from core.domain.model.kernel.location import Location
 from core.ports.courier_repository import CourierRepositoryInterface
+from core.ports.pagination import Area, Page, PageRequest
 
 
 @dataclass(frozen=True)
@@ -18,6 +19,15 @@ class GetCouriersHandler:
     def __init__(self, courier_repository: CourierRepositoryInterface) -> None:
         self._courier_repository = courier_repository
 
-    async def handle(self) -> list[CourierDTO]:
-        couriers = await self._courier_repository.get_all()
-        return [CourierDTO(id=c.id, name=c.name, location=c.location) for c in couriers]
+    async def handle(
+        self, page: PageRequest | None = None, area: Area | None = None
+    ) -> Page[CourierDTO]:
+        page = page or PageRequest()
+        couriers = await self._courier_repository.get_summaries(page, area)
+        items = [
+            CourierDTO(id=c.id, name=c.name, location=c.location) for c in couriers
+        ]
+        # Неполная страница — последняя; полная может оказаться последней,
+        # тогда следующая придёт пустой
+        next_cursor = items[-1].id if len(items) == page.limit else None
+        return Page(items=items, next_cursor=next_cursor)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from core.ports.order_repository import OrderLatencyStats, OrderRepositoryInterface
+
+
+class GetOrderLatenciesHandler:
+    def __init__(self, order_repository: OrderRepositoryInterface) -> None:
+        self._order_repository = order_repository
+
+    async def handle(self, window: timedelta) -> OrderLatencyStats:
+        since = datetime.now(UTC) - window
+        return await self._order_repository.get_latency_stats(since)
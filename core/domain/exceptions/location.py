@@ -1,2 +1,6 @@
 class LocationCoordinateIncorrect(BaseException):
     pass
+
+
+class GridBoundsIncorrect(BaseException):
+    pass
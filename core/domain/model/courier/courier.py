@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from dataclasses import field
+from collections.abc import Iterator
 from uuid import UUID, uuid4
 
 from core.domain.exceptions.courier import (
@@ -18,11 +18,14 @@ DEFAULT_BAG_VOLUME: int = 10
 
 
 class Courier:
-    id: UUID = field(default_factory=uuid4, init=False)
+    # Имена с двойным подчёркиванием манглируются и в __slots__
+    __slots__ = ("id", "__name", "__speed", "__location", "__storage_places")
+
+    id: UUID
     __name: str
     __speed: int
     __location: Location
-    __storage_places: list[StoragePlace] = field(default_factory=list)
+    __storage_places: list[StoragePlace]
 
     @classmethod
     def create(
@@ -53,12 +56,33 @@ class Courier:
         location: Location,
         storage_places: list[StoragePlace],
     ) -> Courier:
+        return cls._restore(
+            id=uuid4(),
+            name=name,
+            speed=speed,
+            location=location,
+            storage_places=list(storage_places),
+        )
+
+    @classmethod
+    def _restore(
+        cls,
+        id: UUID,
+        name: str,
+        speed: int,
+        location: Location,
+        storage_places: list[StoragePlace],
+    ) -> Courier:
+        """Восстановить курьера из сохранённого состояния.
+
+        Список мест хранения передаётся агрегату во владение без копирования.
+        """
         instance = object.__new__(cls)
-        instance.id = uuid4()
+        instance.id = id
         instance.__name = name
         instance.__speed = speed
         instance.__location = location
-        instance.__storage_places = list(storage_places)
+        instance.__storage_places = storage_places
         return instance
 
     def __init__(
@@ -80,6 +104,10 @@ class Courier:
         """Получить места хранения курьера."""
         return list(self.__storage_places)
 
+    def iter_storage_places(self) -> Iterator[StoragePlace]:
+        """Обойти места хранения курьера без копирования списка."""
+        return iter(self.__storage_places)
+
     @property
     def speed(self) -> int:
         """Получить скорость курьера."""
@@ -143,4 +171,5 @@ class Courier:
         new_x = self.__location.x + int(dx)
         new_y = self.__location.y + int(dy)
 
-        self.__location = Location(x=new_x, y=new_y)
+        # Точка лежит между текущей и целевой локациями, обе уже проверены
+        self.__location = Location._new(new_x, new_y)
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from uuid import UUID
+
+from core.domain.exceptions.courier import (
+    CourierCannotTakeOrder,
+    CourierNotFound,
+    OrderVolumeIncorrect,
+)
+from core.domain.exceptions.storage_place import CourierHasNoSuchOrder
+from core.domain.model.courier.courier import Courier
+from core.domain.model.courier.storage_place import StoragePlace
+from core.domain.model.kernel.location import Location
+
+
+class CourierFleet:
+    """Флот курьеров в виде структуры массивов.
+
+    Координаты, скорости и места хранения всех курьеров лежат в плоских
+    массивах, поэтому массовые операции (фильтр по вместимости, расчёт
+    шагов, движение) проходят по непрерывной памяти без обращения к
+    отдельным агрегатам. Места хранения i-го курьера занимают диапазон
+    [place_offsets[i], place_offsets[i + 1]) в массивах мест хранения.
+    Семантика операций совпадает с методами Courier.
+    """
+
+    __slots__ = (
+        "_ids",
+        "_index",
+        "_names",
+        "_x",
+        "_y",
+        "_speed",
+        "_max_free_volume",
+        "_place_offsets",
+        "_place_ids",
+        "_place_names",
+        "_place_volume",
+        "_place_order_ids",
+    )
+
+    def __init__(self) -> None:
+        self._ids: list[UUID] = []
+        self._index: dict[UUID, int] = {}
+        self._names: list[str] = []
+        self._x = array("q")
+        self._y = array("q")
+        self._speed = array("q")
+        # Объём самого большого свободного места хранения курьера, 0 если мест нет
+        self._max_free_volume = array("q")
+        self._place_offsets = array("q", [0])
+        self._place_ids: list[UUID] = []
+        self._place_names: list[str] = []
+        self._place_volume = array("q")
+        self._place_order_ids: list[UUID | None] = []
+
+    @classmethod
+    def from_couriers(cls, couriers: Iterable[Courier]) -> CourierFleet:
+        fleet = cls()
+        for courier in couriers:
+            fleet._append(courier)
+        return fleet
+
+    def to_couriers(self) -> list[Courier]:
+        couriers = []
+        for i, courier_id in enumerate(self._ids):
+            start, end = self._place_offsets[i], self._place_offsets[i + 1]
+            couriers.append(
+                Courier._restore(
+                    id=courier_id,
+                    name=self._names[i],
+                    speed=self._speed[i],
+                    location=Location._new(self._x[i], self._y[i]),
+                    storage_places=[
+                        StoragePlace._restore(
+                            id=self._place_ids[p],
+                            name=self._place_names[p],
+                            total_volume=self._place_volume[p],
+                            order_id=self._place_order_ids[p],
+                        )
+                        for p in range(start, end)
+                    ],
+                )
+            )
+        return couriers
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def ids(self) -> list[UUID]:
+        return list(self._ids)
+
+    def index_of(self, courier_id: UUID) -> int:
+        index = self._index.get(courier_id)
+        if index is None:
+            raise CourierNotFound(f"Курьер с id {courier_id} не найден во флоте.")
+        return index
+
+    def location_of(self, courier_id: UUID) -> Location:
+        i = self.index_of(courier_id)
+        return Location._new(self._x[i], self._y[i])
+
+    def eligible_mask(self, volume: int) -> list[bool]:
+        """Для каждого курьера: может ли он взять заказ указанного объёма."""
+        if volume <= 0:
+            raise OrderVolumeIncorrect("Объём заказа должен быть больше 0.")
+        return [free >= volume for free in self._max_free_volume]
+
+    def steps_to(self, location: Location) -> list[int]:
+        """Число тактов, за которое каждый курьер доберётся до точки."""
+        tx, ty = location.x, location.y
+        return [
+            -(-(abs(x - tx) + abs(y - ty)) // speed)
+            for x, y, speed in zip(self._x, self._y, self._speed, strict=True)
+        ]
+
+    def nearest_eligible(self, location: Location, volume: int) -> UUID | None:
+        """Курьер, который быстрее всех доставит заказ, или None.
+
+        При равенстве шагов выбирается курьер, стоящий во флоте раньше,
+        как и в OrderDispatcher.
+        """
+        if volume <= 0:
+            raise OrderVolumeIncorrect("Объём заказа должен быть больше 0.")
+        tx, ty = location.x, location.y
+        best_index = -1
+        best_steps = 0
+        for i, free in enumerate(self._max_free_volume):
+            if free < volume:
+                continue
+            distance = abs(self._x[i] - tx) + abs(self._y[i] - ty)
+            steps = -(-distance // self._speed[i])
+            if best_index < 0 or steps < best_steps:
+                best_index, best_steps = i, steps
+        return self._ids[best_index] if best_index >= 0 else None
+
+    def move_toward(self, targets: Sequence[Location | None]) -> None:
+        """Сдвинуть каждого курьера к его цели (None — остаться на месте)."""
+        if len(targets) != len(self._ids):
+            raise ValueError("Число целей должно совпадать с размером флота.")
+        xs, ys, speeds = self._x, self._y, self._speed
+        for i, target in enumerate(targets):
+            if target is None:
+                continue
+            remaining = speeds[i]
+            dx = target.x - xs[i]
+            if abs(dx) > remaining:
+                dx = remaining if dx > 0 else -remaining
+            remaining -= abs(dx)
+            dy = target.y - ys[i]
+            if abs(dy) > remaining:
+                dy = remaining if dy > 0 else -remaining
+            xs[i] += dx
+            ys[i] += dy
+
+    def take_order(self, courier_id: UUID, order_id: UUID, volume: int) -> None:
+        i = self.index_of(courier_id)
+        if volume <= 0:
+            raise OrderVolumeIncorrect("Объём заказа должен быть больше 0.")
+        for p in range(self._place_offsets[i], self._place_offsets[i + 1]):
+            if self._place_order_ids[p] is None and volume <= self._place_volume[p]:
+                self._place_order_ids[p] = order_id
+                self._refresh_max_free_volume(i)
+                return
+
+        raise CourierCannotTakeOrder(
+            "Курьер не может взять заказ: нет свободного места хранения."
+        )
+
+    def complete_order(self, courier_id: UUID, order_id: UUID) -> None:
+        i = self.index_of(courier_id)
+        for p in range(self._place_offsets[i], self._place_offsets[i + 1]):
+            if self._place_order_ids[p] == order_id:
+                self._place_order_ids[p] = None
+                self._refresh_max_free_volume(i)
+                return
+
+        raise CourierHasNoSuchOrder(
+            "У курьера нет активного заказа с указанным идентификатором."
+        )
+
+    def _append(self, courier: Courier) -> None:
+        self._index[courier.id] = len(self._ids)
+        self._ids.append(courier.id)
+        self._names.append(courier.name)
+        self._x.append(courier.location.x)
+        self._y.append(courier.location.y)
+        self._speed.append(courier.speed)
+        for place in courier.iter_storage_places():
+            self._place_ids.append(place.id)
+            self._place_names.append(place.name)
+            self._place_volume.append(place.total_volume)
+            self._place_order_ids.append(place.order_id)
+        self._place_offsets.append(len(self._place_ids))
+        self._max_free_volume.append(0)
+        self._refresh_max_free_volume(len(self._ids) - 1)
+
+    def _refresh_max_free_volume(self, i: int) -> None:
+        self._max_free_volume[i] = max(
+            (
+                self._place_volume[p]
+                for p in range(self._place_offsets[i], self._place_offsets[i + 1])
+                if self._place_order_ids[p] is None
+            ),
+            default=0,
+        )
@@ -11,10 +11,12 @@ from core.domain.exceptions.storage_place import (
 
 
 class StoragePlace:
+    __slots__ = ("id", "__name", "__total_volume", "__order_id")
+
     id: UUID
     __name: str
     __total_volume: int
-    __order_id: UUID | None = None
+    __order_id: UUID | None
 
     @classmethod
     def create(
@@ -40,8 +42,21 @@ class StoragePlace:
         total_volume: int,
         order_id: UUID | None = None,
     ) -> StoragePlace:
+        return cls._restore(
+            id=uuid4(), name=name, total_volume=total_volume, order_id=order_id
+        )
+
+    @classmethod
+    def _restore(
+        cls,
+        id: UUID,
+        name: str,
+        total_volume: int,
+        order_id: UUID | None,
+    ) -> StoragePlace:
+        """Восстановить место хранения из сохранённого состояния."""
         instance = object.__new__(cls)
-        instance.id = uuid4()
+        instance.id = id
         instance.__name = name
         instance.__total_volume = total_volume
         instance.__order_id = order_id
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+from core.domain.exceptions.location import GridBoundsIncorrect
+
+MIN_COORDINATE: int = 1
+MAX_COORDINATE: int = 10
+
+
+@dataclass(frozen=True)
+class Grid:
+    """Границы городской сетки, общие для обеих осей."""
+
+    min_coordinate: int = MIN_COORDINATE
+    max_coordinate: int = MAX_COORDINATE
+
+    def __post_init__(self) -> None:
+        if self.min_coordinate > self.max_coordinate:
+            raise GridBoundsIncorrect(
+                f"Некорректные границы сетки: "
+                f"{self.min_coordinate} > {self.max_coordinate}"
+            )
+
+    @property
+    def size(self) -> int:
+        """Число клеток вдоль одной оси."""
+        return self.max_coordinate - self.min_coordinate + 1
+
+    def contains(self, coordinate: int) -> bool:
+        return self.min_coordinate <= coordinate <= self.max_coordinate
@@ -1,48 +1,117 @@
+from __future__ import annotations
+
 import random
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
+from typing import Any
 
 from core.domain.exceptions.location import LocationCoordinateIncorrect
+from core.domain.model.kernel.grid import MAX_COORDINATE, MIN_COORDINATE, Grid
+
+# Сколько различных точек держим в кеше интернирования. Малая сетка
+# помещается целиком, на большой кешируются первые встреченные точки.
+INTERN_LIMIT: int = 1 << 16
+
+# Границы задаются один раз при старте приложения (см. Settings.grid_*).
+_grid: Grid = Grid(min_coordinate=MIN_COORDINATE, max_coordinate=MAX_COORDINATE)
+_interned: dict[tuple[int, int], Location] = {}
+
+
+def configure_grid(grid: Grid) -> None:
+    """Установить границы сетки, в которых допустимы локации."""
+    global _grid
+    _grid = grid
+    # Закешированные точки проверялись по старым границам
+    _interned.clear()
 
-MIN_COORDINATE: int = 1
-MAX_COORDINATE: int = 10
+
+def current_grid() -> Grid:
+    return _grid
 
 
-@dataclass(frozen=True)
 class Location:
+    """Неизменяемая координата на сетке (value object).
+
+    Экземпляры интернируются: одинаковые координаты разделяют один объект,
+    поэтому повторное создание горячих точек не аллоцирует память и не
+    повторяет проверку границ. Равенство и хеш остаются покоординатными.
+    """
+
+    __slots__ = ("x", "y")
+
     x: int
     y: int
 
-    # MagicMethod для валидации после инициализации объекта
-    def __post_init__(self) -> None:
-        if self.x < MIN_COORDINATE or self.x > MAX_COORDINATE:
+    def __new__(cls, x: int, y: int) -> Location:
+        location = _interned.get((x, y))
+        if location is not None:
+            return location
+
+        if not _grid.contains(x):
             raise LocationCoordinateIncorrect(
-                f"Координата x имеет некорректное значение {self.x}"
+                f"Координата x имеет некорректное значение {x}"
             )
-        if self.y < MIN_COORDINATE or self.y > MAX_COORDINATE:
+        if not _grid.contains(y):
             raise LocationCoordinateIncorrect(
-                f"Координата y имеет некорректное значение {self.y}"
+                f"Координата y имеет некорректное значение {y}"
             )
+        return cls._new(x, y)
+
+    @classmethod
+    def _new(cls, x: int, y: int) -> Location:
+        """Создать локацию без проверки границ.
+
+        Только для заведомо корректных координат: строк из БД и точек,
+        полученных движением между двумя валидными локациями.
+        """
+        location = _interned.get((x, y))
+        if location is not None:
+            return location
+
+        location = object.__new__(cls)
+        object.__setattr__(location, "x", x)
+        object.__setattr__(location, "y", y)
+        # Кеш читает и проверяющий конструктор: точка вне сетки (строка,
+        # сохранённая до сужения границ) попав в него, прошла бы проверку
+        if len(_interned) < INTERN_LIMIT and _grid.contains(x) and _grid.contains(y):
+            _interned[(x, y)] = location
+        return location
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Location):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
 
-    # Так как используем @dataclass(frozen=True), то сеттеры и эквивалентность уже работают из коробки.
-    # Если бы делали руками, то можно было бы реализовать следующим образом
+    def __reduce__(self) -> tuple[type[Location], tuple[int, int]]:
+        return Location, (self.x, self.y)
 
-    # def x(self) -> int:
-    #     return self.x
+    def __copy__(self) -> Location:
+        return self
 
-    # def y(self) -> int:
-    #     return self.y
+    def __deepcopy__(self, memo: dict[int, Any]) -> Location:
+        return self
 
-    # def __eq__(self, other: "Location") -> bool:
-    #     return self.x == other.x and self.y == other.y
+    def __repr__(self) -> str:
+        return f"Location(x={self.x}, y={self.y})"
 
-    def distance_to(self, target: "Location") -> int:
+    def distance_to(self, target: Location) -> int:
         return abs(self.x - target.x) + abs(self.y - target.y)
 
     def __str__(self) -> str:
         return f"({self.x}, {self.y})"
 
     @staticmethod
-    def new_random_location() -> "Location":
-        random_x = random.randint(MIN_COORDINATE, MAX_COORDINATE)
-        random_y = random.randint(MIN_COORDINATE, MAX_COORDINATE)
+    def new_random_location() -> Location:
+        random_x = random.randint(_grid.min_coordinate, _grid.max_coordinate)
+        random_y = random.randint(_grid.min_coordinate, _grid.max_coordinate)
         return Location(x=random_x, y=random_y)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from uuid import UUID
 
@@ -23,12 +24,31 @@ class OrderStatus(Enum):
     COMPLETED = "COMPLETED"
 
 
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
 class Order:
+    __slots__ = (
+        "__id",
+        "__location",
+        "__volume",
+        "__courier_id",
+        "__status",
+        "__created_at",
+        "__assigned_at",
+        "__completed_at",
+        "__events",
+    )
+
     __id: UUID
     __location: Location
     __volume: int
     __courier_id: UUID | None
     __status: OrderStatus
+    __created_at: datetime
+    __assigned_at: datetime | None
+    __completed_at: datetime | None
     __events: list[OrderDomainEvent]
 
     @classmethod
@@ -37,6 +57,7 @@ class Order:
         id: UUID,
         location: Location,
         volume: int,
+        created_at: datetime | None = None,
     ) -> Order:
         if volume <= 0:
             raise OrderVolumeIncorrect("Объём заказа должен быть больше 0.")
@@ -46,6 +67,7 @@ class Order:
             volume=volume,
             courier_id=None,
             status=OrderStatus.CREATED,
+            created_at=created_at or _now(),
         )
         order.__events.append(OrderCreatedDomainEvent(order_id=order.id))
         return order
@@ -58,6 +80,9 @@ class Order:
         volume: int,
         courier_id: UUID | None,
         status: OrderStatus,
+        created_at: datetime,
+        assigned_at: datetime | None = None,
+        completed_at: datetime | None = None,
     ) -> Order:
         instance = object.__new__(cls)
         instance.__id = id
@@ -65,6 +90,9 @@ class Order:
         instance.__volume = volume
         instance.__courier_id = courier_id
         instance.__status = status
+        instance.__created_at = created_at
+        instance.__assigned_at = assigned_at
+        instance.__completed_at = completed_at
         instance.__events = []
         return instance
 
@@ -98,12 +126,38 @@ class Order:
     def id(self) -> UUID:
         return self.__id
 
+    @property
+    def created_at(self) -> datetime:
+        return self.__created_at
+
+    @property
+    def assigned_at(self) -> datetime | None:
+        return self.__assigned_at
+
+    @property
+    def completed_at(self) -> datetime | None:
+        return self.__completed_at
+
+    @property
+    def wait_time(self) -> timedelta | None:
+        """Время от создания заказа до назначения курьера."""
+        if self.__assigned_at is None:
+            return None
+        return self.__assigned_at - self.__created_at
+
+    @property
+    def delivery_time(self) -> timedelta | None:
+        """Время от назначения курьера до доставки."""
+        if self.__assigned_at is None or self.__completed_at is None:
+            return None
+        return self.__completed_at - self.__assigned_at
+
     def pull_events(self) -> list[OrderDomainEvent]:
         events = self.__events.copy()
         self.__events.clear()
         return events
 
-    def assign(self, courier_id: UUID) -> None:
+    def assign(self, courier_id: UUID, at: datetime | None = None) -> None:
         if self.__status is OrderStatus.ASSIGNED:
             raise OrderAlreadyAssigned("Заказ уже назначен на курьера.")
         if self.__status is OrderStatus.COMPLETED:
@@ -111,14 +165,16 @@ class Order:
 
         self.__courier_id = courier_id
         self.__status = OrderStatus.ASSIGNED
+        self.__assigned_at = at or _now()
 
-    def complete(self) -> None:
+    def complete(self, at: datetime | None = None) -> None:
         if self.__status is not OrderStatus.ASSIGNED:
             raise OrderCannotBeCompleted("Завершить можно только назначенный заказ.")
         if self.__courier_id is None:
             raise OrderCannotBeCompleted("У заказа отсутствует назначенный курьер.")
 
         self.__status = OrderStatus.COMPLETED
+        self.__completed_at = at or _now()
         self.__events.append(
             OrderCompletedDomainEvent(
                 order_id=self.__id,
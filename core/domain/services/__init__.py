@@ -1,3 +1,4 @@
 from core.domain.services.order_dispatcher import OrderDispatcher
+from core.domain.services.route_planner import RoutePlanner
 
-__all__ = ["OrderDispatcher"]
+__all__ = ["OrderDispatcher", "RoutePlanner"]
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from core.domain.model.courier.courier import Courier
+from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order
+from core.ports.route_planner import RoutePlannerInterface
+
+# Ограничение числа проходов 2-opt: на маршрутах из нескольких точек
+# улучшения заканчиваются за 2-3 прохода, лимит страхует от зацикливания.
+MAX_TWO_OPT_PASSES: int = 10
+
+
+def route_length(start: Location, stops: list[Location]) -> int:
+    """Длина открытого маршрута от start через все точки (в шагах по сетке)."""
+    length = 0
+    current = start
+    for stop in stops:
+        length += current.distance_to(stop)
+        current = stop
+    return length
+
+
+def _nearest_neighbour(start: Location, orders: list[Order]) -> list[Order]:
+    remaining = list(orders)
+    route: list[Order] = []
+    current = start
+    while remaining:
+        nearest = min(remaining, key=lambda o: current.distance_to(o.location))
+        remaining.remove(nearest)
+        route.append(nearest)
+        current = nearest.location
+    return route
+
+
+def _two_opt(start: Location, route: list[Order]) -> list[Order]:
+    # Маршрут открытый: курьер не возвращается в исходную точку,
+    # поэтому у последнего отрезка нет «следующего» ребра.
+    points = [start] + [order.location for order in route]
+    orders = list(route)
+    for _ in range(MAX_TWO_OPT_PASSES):
+        improved = False
+        for i in range(1, len(points) - 1):
+            for j in range(i + 1, len(points)):
+                before = points[i - 1].distance_to(points[i])
+                after = points[i - 1].distance_to(points[j])
+                if j + 1 < len(points):
+                    before += points[j].distance_to(points[j + 1])
+                    after += points[i].distance_to(points[j + 1])
+                if after < before:
+                    points[i : j + 1] = reversed(points[i : j + 1])
+                    orders[i - 1 : j] = reversed(orders[i - 1 : j])
+                    improved = True
+        if not improved:
+            break
+    return orders
+
+
+class RoutePlanner(RoutePlannerInterface):
+    """Планирует порядок объезда заказов курьера и кеширует маршрут.
+
+    Маршрут строится жадно (ближайший сосед) и улучшается 2-opt по
+    манхэттенскому расстоянию. Сохранённый маршрут переиспользуется, пока
+    набор заказов курьера не пополнится: доставленные заказы просто
+    выпадают из последовательности, новое назначение строит маршрут заново.
+    """
+
+    def __init__(self) -> None:
+        self._routes: dict[UUID, list[UUID]] = {}
+
+    def plan(self, courier: Courier, orders: list[Order]) -> list[Order]:
+        if not orders:
+            self.invalidate(courier.id)
+            return []
+
+        order_by_id = {order.id: order for order in orders}
+        cached = self._routes.get(courier.id)
+        if cached is not None and order_by_id.keys() <= set(cached):
+            route = [
+                order_by_id[order_id] for order_id in cached if order_id in order_by_id
+            ]
+            if len(route) != len(cached):
+                self._routes[courier.id] = [order.id for order in route]
+            return route
+
+        route = _two_opt(courier.location, _nearest_neighbour(courier.location, orders))
+        self._routes[courier.id] = [order.id for order in route]
+        return route
+
+    def invalidate(self, courier_id: UUID) -> None:
+        self._routes.pop(courier_id, None)
@@ -5,6 +5,7 @@ from core.ports.order_events_dispatcher import OrderEventsDispatcherInterface
 from core.ports.order_events_publisher import OrderEventsPublisherInterface
 from core.ports.order_repository import OrderRepositoryInterface
 from core.ports.outbox_repository import OutboxRepositoryInterface
+from core.ports.route_planner import RoutePlannerInterface
 
 __all__ = [
     "OrderDispatcherInterface",
@@ -14,4 +15,5 @@ __all__ = [
     "OrderEventsDispatcherInterface",
     "OrderEventsPublisherInterface",
     "OutboxRepositoryInterface",
+    "RoutePlannerInterface",
 ]
@@ -1,8 +1,24 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from uuid import UUID
+
+from core.domain.model.kernel.location import Location
+from core.ports.pagination import Area, PageRequest
 
 if TYPE_CHECKING:
     from core.domain.model.courier.courier import Courier
+    from core.domain.model.courier.storage_place import StoragePlace
+
+
+@dataclass(frozen=True)
+class CourierSummary:
+    """Проекция курьера для списков: без мест хранения."""
+
+    id: UUID
+    name: str
+    location: Location
 
 
 class CourierRepositoryInterface(ABC):
@@ -10,6 +26,26 @@ class CourierRepositoryInterface(ABC):
     async def add(self, courier: "Courier") -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_many(self, couriers: Sequence["Courier"]) -> None:
+        """Добавить новых курьеров вместе с местами хранения пачкой."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_storage_places(
+        self, places: Sequence[tuple[UUID, "StoragePlace"]]
+    ) -> None:
+        """Добавить места хранения существующим курьерам без загрузки агрегатов.
+
+        Args:
+            places: Пары (id курьера, новое место хранения).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_existing_ids(self, courier_ids: Collection[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
     @abstractmethod
     async def update(self, courier: "Courier") -> None:
         raise NotImplementedError
@@ -29,3 +65,10 @@ class CourierRepositoryInterface(ABC):
     @abstractmethod
     async def get_all_free(self) -> list["Courier"]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_summaries(
+        self, page: PageRequest, area: Area | None = None
+    ) -> list[CourierSummary]:
+        """Не больше page.limit курьеров с id после page.after по возрастанию id."""
+        raise NotImplementedError
@@ -1,9 +1,49 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
 from typing import TYPE_CHECKING
+from uuid import UUID
+
+from core.domain.model.kernel.location import Location
+from core.ports.pagination import Area, PageRequest
 
 if TYPE_CHECKING:
     from core.domain.model.order.order import Order
 
+# Перцентили, которые считает аналитика задержек
+LATENCY_QUANTILES: tuple[float, ...] = (0.5, 0.95, 0.99)
+
+
+@dataclass(frozen=True)
+class LatencyPercentiles:
+    """Перцентили длительности в секундах."""
+
+    p50: float
+    p95: float
+    p99: float
+
+
+@dataclass(frozen=True)
+class OrderLatencyStats:
+    """Задержки заказов, доставленных за окно.
+
+    wait — от создания до назначения, delivery — от назначения до
+    доставки, total — от создания до доставки. None, если доставок не было.
+    """
+
+    completed: int
+    wait: LatencyPercentiles | None
+    delivery: LatencyPercentiles | None
+    total: LatencyPercentiles | None
+
+
+@dataclass(frozen=True)
+class OrderSummary:
+    """Проекция заказа для списков."""
+
+    id: UUID
+    location: Location
+
 
 class OrderRepositoryInterface(ABC):
     @abstractmethod
@@ -15,6 +55,15 @@ class OrderRepositoryInterface(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_if_absent(self, order: "Order") -> bool:
+        """Добавить заказ, если заказа с таким id ещё нет.
+
+        Returns:
+            False, если заказ с этим id уже существует.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update(self, order: "Order") -> None:
         raise NotImplementedError
@@ -34,3 +83,15 @@ class OrderRepositoryInterface(ABC):
     @abstractmethod
     async def get_all_not_completed(self) -> list["Order"]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_active_summaries(
+        self, page: PageRequest, area: Area | None = None
+    ) -> list[OrderSummary]:
+        """Не больше page.limit незавершённых заказов с id после page.after."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_latency_stats(self, since: datetime) -> OrderLatencyStats:
+        """Перцентили задержек заказов, доставленных начиная с since."""
+        raise NotImplementedError
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from core.domain.model.kernel.location import Location
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class Area:
+    """Прямоугольная область карты, границы включены."""
+
+    min_x: int
+    min_y: int
+    max_x: int
+    max_y: int
+
+    def __post_init__(self) -> None:
+        if self.min_x > self.max_x or self.min_y > self.max_y:
+            raise ValueError("Нижняя граница области больше верхней")
+
+    def contains(self, location: Location) -> bool:
+        return (
+            self.min_x <= location.x <= self.max_x
+            and self.min_y <= location.y <= self.max_y
+        )
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """Страница выборки по возрастанию id, начиная после курсора after."""
+
+    after: UUID | None = None
+    limit: int = DEFAULT_PAGE_SIZE
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit должен быть от 1 до {MAX_PAGE_SIZE}")
+
+
+@dataclass(frozen=True)
+class Page[T]:
+    """Элементы страницы и курсор следующей; None — страница последняя."""
+
+    items: list[T]
+    next_cursor: UUID | None
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from core.domain.model.courier.courier import Courier
+    from core.domain.model.order.order import Order
+
+
+class RoutePlannerInterface(ABC):
+    @abstractmethod
+    def plan(self, courier: Courier, orders: list[Order]) -> list[Order]:
+        """Вернуть заказы курьера в порядке их посещения."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, courier_id: UUID) -> None:
+        """Сбросить сохранённый маршрут курьера."""
+        raise NotImplementedError
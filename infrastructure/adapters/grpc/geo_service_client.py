@@ -3,15 +3,53 @@ import grpc
 from core.domain.model.kernel.location import Location
 from core.ports.geo_service_client import GeoServiceClientInterface
 from infrastructure.adapters.grpc import geo_pb2, geo_pb2_grpc
+from infrastructure.circuit_breaker import CircuitBreaker
+from infrastructure.metrics import GEO_REQUEST_DURATION, GEO_REQUEST_FAILURES
+
+# Коды, означающие, что сервис не справляется, а не что запрос неверен
+UNAVAILABILITY_CODES = frozenset(
+    {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.INTERNAL,
+        grpc.StatusCode.UNKNOWN,
+    }
+)
+
+
+def is_unavailability(exc: Exception) -> bool:
+    """Сбой, который размыкает автомат: всё, кроме ответа сервиса на неверный запрос."""
+    return (
+        not isinstance(exc, grpc.aio.AioRpcError) or exc.code() in UNAVAILABILITY_CODES
+    )
 
 
 class GeoServiceClient(GeoServiceClientInterface):
-    def __init__(self, host: str) -> None:
+    def __init__(
+        self,
+        host: str,
+        breaker: CircuitBreaker | None = None,
+        timeout_seconds: float | None = None,
+    ) -> None:
         self._host = host
+        self._breaker = breaker
+        self._timeout = timeout_seconds
 
     async def get_location(self, street: str) -> Location:
+        if self._breaker is None:
+            return await self._request(street)
+        with self._breaker.call(is_failure=is_unavailability):
+            return await self._request(street)
+
+    async def _request(self, street: str) -> Location:
         async with grpc.aio.insecure_channel(self._host) as channel:
             stub = geo_pb2_grpc.GeoStub(channel)
             request = geo_pb2.GetGeolocationRequest(street=street)  # type: ignore[attr-defined]
-            response = await stub.GetGeolocation(request)
+            try:
+                with GEO_REQUEST_DURATION.time():
+                    response = await stub.GetGeolocation(request, timeout=self._timeout)
+            except grpc.aio.AioRpcError as exc:
+                GEO_REQUEST_FAILURES.labels(exc.code().name).inc()
+                raise
             return Location(x=response.location.x, y=response.location.y)
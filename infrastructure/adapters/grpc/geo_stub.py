@@ -0,0 +1,261 @@
+"""Локальная замена внешнего геосервиса для бенчмарков и тестов.
+
+Сервер реализует geo.Geo: улица детерминированно отображается в точку
+сетки, а задержка ответа, доля ошибок и число одновременных запросов
+настраиваются. Запускается внутри процесса (GeoStubServer) или отдельно:
+
+    python -m infrastructure.adapters.grpc.geo_stub --port 5004 \\
+        --latency lognormal:20,0.5 --error-rate 0.01 --max-concurrency 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import random
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+import grpc
+
+from core.domain.model.kernel.grid import MAX_COORDINATE, MIN_COORDINATE
+from infrastructure.adapters.grpc import geo_pb2, geo_pb2_grpc
+
+
+def street_location(
+    street: str,
+    min_coordinate: int = MIN_COORDINATE,
+    max_coordinate: int = MAX_COORDINATE,
+) -> tuple[int, int]:
+    """Точка сетки для улицы; одна и та же улица всегда даёт одну точку."""
+    size = max_coordinate - min_coordinate + 1
+    digest = zlib.crc32(street.encode())
+    return min_coordinate + digest % size, min_coordinate + (digest >> 16) % size
+
+
+class LatencyDistribution(ABC):
+    @abstractmethod
+    def sample(self, rng: random.Random) -> float:
+        """Задержка в секундах."""
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class FixedLatency(LatencyDistribution):
+    ms: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        return self.ms / 1000
+
+
+@dataclass(frozen=True)
+class UniformLatency(LatencyDistribution):
+    low_ms: float
+    high_ms: float
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.uniform(self.low_ms, self.high_ms) / 1000
+
+
+@dataclass(frozen=True)
+class LogNormalLatency(LatencyDistribution):
+    """Логнормальная задержка: типичная медиана и длинный хвост."""
+
+    median_ms: float
+    sigma: float
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.lognormvariate(math.log(self.median_ms), self.sigma) / 1000
+
+
+def parse_latency(value: str) -> LatencyDistribution:
+    """Разобрать задержку вида fixed:5, uniform:1,10 или lognormal:20,0.5."""
+    kind, _, raw = value.partition(":")
+    args = [float(item) for item in raw.split(",")] if raw else []
+    if kind == "fixed" and len(args) <= 1:
+        return FixedLatency(*args)
+    if kind == "uniform" and len(args) == 2:
+        return UniformLatency(*args)
+    if kind == "lognormal" and len(args) == 2:
+        return LogNormalLatency(*args)
+    raise ValueError(f"Некорректное описание задержки: {value}")
+
+
+@dataclass
+class GeoStubStats:
+    requests: int = 0
+    errors: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+
+class GeoStubServicer(geo_pb2_grpc.GeoServicer):
+    """Реализация geo.Geo с внедрением задержек и ошибок.
+
+    max_concurrency ограничивает число одновременно обслуживаемых
+    запросов: лишние ждут очереди или, при reject_when_busy, сразу
+    получают RESOURCE_EXHAUSTED. Доля error_rate запросов завершается
+    UNAVAILABLE после задержки, как при сбое на стороне сервиса.
+    """
+
+    def __init__(
+        self,
+        latency: LatencyDistribution | None = None,
+        error_rate: float = 0.0,
+        max_concurrency: int | None = None,
+        reject_when_busy: bool = False,
+        min_coordinate: int = MIN_COORDINATE,
+        max_coordinate: int = MAX_COORDINATE,
+        seed: int = 0,
+    ) -> None:
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("Доля ошибок должна лежать в пределах 0..1.")
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("Лимит одновременных запросов должен быть больше 0.")
+        self._latency = latency or FixedLatency()
+        self._error_rate = error_rate
+        self._max_concurrency = max_concurrency
+        self._reject_when_busy = reject_when_busy
+        self._min_coordinate = min_coordinate
+        self._max_coordinate = max_coordinate
+        self._rng = random.Random(seed)
+        self._semaphore: asyncio.Semaphore | None = None
+        self.stats = GeoStubStats()
+
+    async def GetGeolocation(
+        self, request: Any, context: grpc.aio.ServicerContext
+    ) -> Any:
+        self.stats.requests += 1
+        if not request.street:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "street is empty")
+
+        semaphore = self._get_semaphore()
+        if semaphore is not None and semaphore.locked() and self._reject_when_busy:
+            self.stats.rejected += 1
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "too many requests")
+
+        if semaphore is None:
+            return await self._serve(request, context)
+        async with semaphore:
+            return await self._serve(request, context)
+
+    async def _serve(self, request: Any, context: grpc.aio.ServicerContext) -> Any:
+        self.stats.in_flight += 1
+        self.stats.max_in_flight = max(self.stats.max_in_flight, self.stats.in_flight)
+        try:
+            delay = self._latency.sample(self._rng)
+            failed = self._rng.random() < self._error_rate
+            if delay > 0:
+                await asyncio.sleep(delay)
+        finally:
+            self.stats.in_flight -= 1
+
+        if failed:
+            self.stats.errors += 1
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "injected failure")
+
+        x, y = street_location(
+            request.street, self._min_coordinate, self._max_coordinate
+        )
+        return geo_pb2.GetGeolocationResponse(  # type: ignore[attr-defined]
+            location=geo_pb2.Location(x=x, y=y)  # type: ignore[attr-defined]
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore | None:
+        # Семафор создаётся в цикле событий сервера, а не в конструкторе
+        if self._max_concurrency is None:
+            return None
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+
+class GeoStubServer:
+    """gRPC-сервер с GeoStubServicer в текущем цикле событий."""
+
+    def __init__(
+        self, servicer: GeoStubServicer | None = None, host: str = "127.0.0.1"
+    ) -> None:
+        self.servicer = servicer or GeoStubServicer()
+        self._host = host
+        self._server: grpc.aio.Server | None = None
+        self._port = 0
+
+    @property
+    def address(self) -> str:
+        return f"{self._host}:{self._port}"
+
+    async def start(self, port: int = 0) -> str:
+        """Запустить сервер; port=0 выбирает свободный порт. Возвращает адрес."""
+        server = grpc.aio.server()
+        geo_pb2_grpc.add_GeoServicer_to_server(self.servicer, server)
+        self._port = server.add_insecure_port(f"{self._host}:{port}")
+        await server.start()
+        self._server = server
+        return self.address
+
+    async def stop(self, grace: float | None = None) -> None:
+        if self._server is not None:
+            await self._server.stop(grace)
+            self._server = None
+
+    async def wait_for_termination(self) -> None:
+        if self._server is not None:
+            await self._server.wait_for_termination()
+
+    async def __aenter__(self) -> GeoStubServer:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m infrastructure.adapters.grpc.geo_stub",
+        description="Локальная замена геосервиса с внедрением задержек.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5004)
+    parser.add_argument("--latency", type=parse_latency, default=FixedLatency())
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-concurrency", type=int, default=None)
+    parser.add_argument("--reject-when-busy", action="store_true")
+    parser.add_argument("--min-coordinate", type=int, default=MIN_COORDINATE)
+    parser.add_argument("--max-coordinate", type=int, default=MAX_COORDINATE)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server = GeoStubServer(
+        GeoStubServicer(
+            latency=args.latency,
+            error_rate=args.error_rate,
+            max_concurrency=args.max_concurrency,
+            reject_when_busy=args.reject_when_busy,
+            min_coordinate=args.min_coordinate,
+            max_coordinate=args.max_coordinate,
+            seed=args.seed,
+        ),
+        host=args.host,
+    )
+    address = await server.start(args.port)
+    print(f"Geo stub listening on {address}", flush=True)
+    await server.wait_for_termination()
+
+
+if __name__ == "__main__":
+    asyncio.run(serve(parse_args()))
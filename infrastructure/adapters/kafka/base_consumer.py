@@ -3,11 +3,33 @@ from __future__ import annotations
 import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
 
 from aiokafka import AIOKafkaConsumer
 
+from infrastructure.adapters.kafka.transport import ConsumerTransport, Record
+from infrastructure.admission import AdmissionController
+from infrastructure.metrics import (
+    KAFKA_CONSUME_FAILURES,
+    KAFKA_CONSUMED,
+    KAFKA_CONSUMER_LAG,
+    KAFKA_CONSUMER_PAUSED,
+)
+
 logger = logging.getLogger(__name__)
 
+CONSUME_BATCH_SIZE: int = 100
+CONSUME_TIMEOUT_MS: int = 1000
+
+
+class RetryLater(Exception):
+    """Сообщение нельзя обработать сейчас, но и пропускать нельзя."""
+
+    def __init__(self, retry_after_seconds: float) -> None:
+        super().__init__(f"Повтор через {retry_after_seconds} с")
+        self.retry_after_seconds = retry_after_seconds
+
 
 class BaseKafkaConsumer(ABC):
     def __init__(
@@ -15,9 +37,13 @@ class BaseKafkaConsumer(ABC):
         kafka_host: str,
         topic: str,
         consumer_group: str,
+        transport: ConsumerTransport | None = None,
+        admission: AdmissionController | None = None,
     ) -> None:
         self._topic = topic
-        self._consumer = AIOKafkaConsumer(
+        self._admission = admission
+        self._paused = False
+        self._consumer: ConsumerTransport = transport or AIOKafkaConsumer(
             topic,
             bootstrap_servers=kafka_host,
             group_id=consumer_group,
@@ -40,15 +66,84 @@ class BaseKafkaConsumer(ABC):
         logger.info("%s stopped", self.__class__.__name__)
 
     async def _consume(self) -> None:
-        async for msg in self._consumer:
+        while True:
+            self._apply_admission()
+            batch = await self._consumer.getmany(
+                timeout_ms=CONSUME_TIMEOUT_MS, max_records=CONSUME_BATCH_SIZE
+            )
             try:
-                await self._process_message(msg.value)
-            except Exception:
-                logger.exception(
-                    "%s: error processing message from topic %s",
+                await self._process_batch(batch)
+            except RetryLater as exc:
+                # Ждём не дольше обычного опроса: дальше паузу держит контроль
+                # допуска, а getmany продолжает вызываться
+                await asyncio.sleep(
+                    min(exc.retry_after_seconds, CONSUME_TIMEOUT_MS / 1000)
+                )
+
+    async def _process_batch(self, batch: dict[Any, Sequence[Record]]) -> None:
+        partitions = list(batch.items())
+        for index, (partition, records) in enumerate(partitions):
+            for msg in records:
+                try:
+                    await self._handle(msg.value)
+                except RetryLater:
+                    # Сообщение и необработанный остаток пачки прочитаются
+                    # заново следующим getmany
+                    self._consumer.seek(partition, msg.offset)
+                    for rest, rest_records in partitions[index + 1 :]:
+                        self._consumer.seek(rest, rest_records[0].offset)
+                    raise
+            self._observe_lag(partition, records[-1].offset)
+
+    def _apply_admission(self) -> None:
+        """Приостановить чтение партиций, пока контроль допуска отклоняет заказы.
+
+        getmany продолжает вызываться и без партиций: так консьюмер не
+        превышает max_poll_interval и не выпадает из группы.
+        """
+        if self._admission is None:
+            return
+        rejection = self._admission.rejection()
+        if rejection is not None:
+            # Приостанавливаем заново: перераспределение снимает паузу
+            unpaused = self._consumer.assignment() - self._consumer.paused()
+            if unpaused:
+                self._consumer.pause(*unpaused)
+            if not self._paused:
+                self._paused = True
+                KAFKA_CONSUMER_PAUSED.labels(self._topic).set(1)
+                logger.warning(
+                    "%s paused (topic=%s, reason=%s)",
                     self.__class__.__name__,
                     self._topic,
+                    rejection.reason,
                 )
+        elif self._paused:
+            self._consumer.resume(*self._consumer.paused())
+            self._paused = False
+            KAFKA_CONSUMER_PAUSED.labels(self._topic).set(0)
+            logger.info("%s resumed (topic=%s)", self.__class__.__name__, self._topic)
+
+    async def _handle(self, data: bytes | None) -> None:
+        KAFKA_CONSUMED.labels(self._topic).inc()
+        try:
+            await self._process_message(data or b"")
+        except RetryLater:
+            raise
+        except Exception:
+            KAFKA_CONSUME_FAILURES.labels(self._topic).inc()
+            logger.exception(
+                "%s: error processing message from topic %s",
+                self.__class__.__name__,
+                self._topic,
+            )
 
     @abstractmethod
     async def _process_message(self, data: bytes) -> None: ...
+
+    def _observe_lag(self, partition: Any, last_offset: int) -> None:
+        highwater = self._consumer.highwater(partition)
+        if highwater is not None:
+            KAFKA_CONSUMER_LAG.labels(partition.topic, str(partition.partition)).set(
+                highwater - last_offset - 1
+            )
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Literal, NamedTuple
+
+from infrastructure.adapters.kafka.transport import TopicPartition
+
+type Acks = Literal[0, 1, "all"]
+type OffsetReset = Literal["earliest", "latest"]
+
+
+@dataclass(frozen=True, slots=True)
+class InMemoryRecord:
+    topic: str
+    partition: int
+    offset: int
+    key: bytes | None
+    value: bytes | None
+    timestamp: int
+
+
+class RecordMetadata(NamedTuple):
+    topic: str
+    partition: int
+    offset: int
+
+
+class InMemoryBroker:
+    """Брокер в памяти процесса: партиции, оффсеты и группы консьюмеров.
+
+    Сообщение с ключом попадает в партицию по хешу ключа, без ключа —
+    по кругу. Партиции топика делятся между участниками группы, при
+    входе и выходе участника группа перебалансируется, позиции новых
+    владельцев берутся из закоммиченных оффсетов группы.
+    """
+
+    def __init__(self, default_partitions: int = 1) -> None:
+        if default_partitions <= 0:
+            raise ValueError("Число партиций должно быть больше 0.")
+        self._default_partitions = default_partitions
+        self._topics: dict[str, list[list[InMemoryRecord]]] = {}
+        self._round_robin: dict[str, itertools.cycle[int]] = {}
+        self._committed: dict[str, dict[TopicPartition, int]] = {}
+        self._members: dict[str, list[InMemoryConsumer]] = {}
+        self._waiters: set[asyncio.Future[None]] = set()
+
+    def create_topic(self, topic: str, partitions: int | None = None) -> None:
+        if topic in self._topics:
+            return
+        count = partitions or self._default_partitions
+        if count <= 0:
+            raise ValueError("Число партиций должно быть больше 0.")
+        self._topics[topic] = [[] for _ in range(count)]
+        self._round_robin[topic] = itertools.cycle(range(count))
+
+    def partitions_for(self, topic: str) -> list[TopicPartition]:
+        self.create_topic(topic)
+        return [TopicPartition(topic, p) for p in range(len(self._topics[topic]))]
+
+    def end_offset(self, partition: TopicPartition) -> int:
+        self.create_topic(partition.topic)
+        return len(self._topics[partition.topic][partition.partition])
+
+    def append(
+        self, topic: str, value: bytes | None, key: bytes | None = None
+    ) -> RecordMetadata:
+        self.create_topic(topic)
+        partitions = self._topics[topic]
+        if key is not None:
+            partition = zlib.crc32(key) % len(partitions)
+        else:
+            partition = next(self._round_robin[topic])
+        log = partitions[partition]
+        record = InMemoryRecord(
+            topic=topic,
+            partition=partition,
+            offset=len(log),
+            key=key,
+            value=value,
+            timestamp=int(time.time() * 1000),
+        )
+        log.append(record)
+        self._wake_up()
+        return RecordMetadata(topic, partition, record.offset)
+
+    def read(
+        self, partition: TopicPartition, offset: int, limit: int
+    ) -> list[InMemoryRecord]:
+        return self._topics[partition.topic][partition.partition][
+            offset : offset + limit
+        ]
+
+    def committed(self, group_id: str, partition: TopicPartition) -> int | None:
+        return self._committed.get(group_id, {}).get(partition)
+
+    def commit(self, group_id: str, offsets: dict[TopicPartition, int]) -> None:
+        self._committed.setdefault(group_id, {}).update(offsets)
+
+    def lag(self, group_id: str, topic: str) -> int:
+        """Сколько сообщений топика группа ещё не закоммитила."""
+        return sum(
+            self.end_offset(partition) - (self.committed(group_id, partition) or 0)
+            for partition in self.partitions_for(topic)
+        )
+
+    def producer(self, acks: Acks = 1) -> InMemoryProducer:
+        return InMemoryProducer(self, acks=acks)
+
+    def consumer(
+        self,
+        *topics: str,
+        group_id: str,
+        auto_offset_reset: OffsetReset = "latest",
+        enable_auto_commit: bool = True,
+    ) -> InMemoryConsumer:
+        return InMemoryConsumer(
+            self,
+            topics,
+            group_id=group_id,
+            auto_offset_reset=auto_offset_reset,
+            enable_auto_commit=enable_auto_commit,
+        )
+
+    def _join(self, consumer: InMemoryConsumer) -> None:
+        self._members.setdefault(consumer.group_id, []).append(consumer)
+        self._rebalance(consumer.group_id)
+
+    def _leave(self, consumer: InMemoryConsumer) -> None:
+        members = self._members.get(consumer.group_id, [])
+        if consumer in members:
+            members.remove(consumer)
+            consumer._assign([])
+            self._rebalance(consumer.group_id)
+
+    def _rebalance(self, group_id: str) -> None:
+        members = self._members[group_id]
+        # Как и в Kafka, перед перебалансировкой фиксируем выданные позиции,
+        # чтобы новый владелец партиции не получил сообщения повторно.
+        for member in members:
+            if member._enable_auto_commit:
+                self.commit(group_id, member._positions)
+        assignments: dict[InMemoryConsumer, list[TopicPartition]] = {
+            member: [] for member in members
+        }
+        topics = sorted({topic for member in members for topic in member.topics})
+        for topic in topics:
+            subscribers = [m for m in members if topic in m.topics]
+            for i, partition in enumerate(self.partitions_for(topic)):
+                assignments[subscribers[i % len(subscribers)]].append(partition)
+        for member, partitions in assignments.items():
+            member._assign(partitions)
+
+    async def _wait_for_records(self, timeout: float) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except TimeoutError:
+            pass
+        finally:
+            self._waiters.discard(waiter)
+
+    def _wake_up(self) -> None:
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+
+class InMemoryProducer:
+    """Продюсер брокера в памяти с интерфейсом AIOKafkaProducer.
+
+    При acks=0 подтверждение не ждётся и оффсет не возвращается (-1),
+    как у aiokafka; при acks=1 и "all" возвращаются партиция и оффсет
+    записанного сообщения.
+    """
+
+    def __init__(self, broker: InMemoryBroker, acks: Acks = 1) -> None:
+        self._broker = broker
+        self._acks = acks
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send_and_wait(
+        self, topic: str, value: bytes | None = None, key: bytes | None = None
+    ) -> RecordMetadata:
+        metadata = self._broker.append(topic, value, key=key)
+        if self._acks == 0:
+            return RecordMetadata(metadata.topic, metadata.partition, -1)
+        return metadata
+
+    async def send_batch(
+        self, topic: str, values: Iterable[bytes], key: bytes | None = None
+    ) -> int:
+        count = 0
+        for value in values:
+            self._broker.append(topic, value, key=key)
+            count += 1
+        return count
+
+
+class InMemoryConsumer:
+    """Консьюмер группы с интерфейсом AIOKafkaConsumer.
+
+    При включённом автокоммите позиции, выданные предыдущим getmany,
+    коммитятся в начале следующего вызова и при остановке: сообщение
+    считается обработанным, когда консьюмер пришёл за следующей пачкой.
+    """
+
+    def __init__(
+        self,
+        broker: InMemoryBroker,
+        topics: Iterable[str],
+        group_id: str,
+        auto_offset_reset: OffsetReset = "latest",
+        enable_auto_commit: bool = True,
+    ) -> None:
+        self._broker = broker
+        self.topics = frozenset(topics)
+        self.group_id = group_id
+        self._auto_offset_reset = auto_offset_reset
+        self._enable_auto_commit = enable_auto_commit
+        self._positions: dict[TopicPartition, int] = {}
+        self._paused: set[TopicPartition] = set()
+        self._started = False
+        # Партиция, с которой начнётся следующая выборка: без ротации
+        # при max_records первые партиции вытесняли бы остальные.
+        self._fetch_cursor = 0
+
+    async def start(self) -> None:
+        if not self._started:
+            self._started = True
+            self._broker._join(self)
+
+    async def stop(self) -> None:
+        if self._started:
+            if self._enable_auto_commit:
+                await self.commit()
+            self._started = False
+            self._broker._leave(self)
+
+    def assignment(self) -> set[TopicPartition]:
+        return set(self._positions)
+
+    def paused(self) -> set[TopicPartition]:
+        return set(self._paused)
+
+    def pause(self, *partitions: TopicPartition) -> None:
+        """Не выдавать сообщения партиций, пока они не возобновлены."""
+        self._paused.update(p for p in partitions if p in self._positions)
+
+    def resume(self, *partitions: TopicPartition) -> None:
+        self._paused.difference_update(partitions)
+
+    def position(self, partition: TopicPartition) -> int:
+        return self._positions[partition]
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        """Следующий getmany выдаст партицию начиная с offset."""
+        if partition not in self._positions:
+            raise ValueError(f"Партиция {partition} не назначена консьюмеру.")
+        self._positions[partition] = offset
+
+    def highwater(self, partition: TopicPartition) -> int | None:
+        """Оффсет, который получит следующее сообщение партиции."""
+        return self._broker.end_offset(partition)
+
+    async def commit(self, offsets: dict[TopicPartition, int] | None = None) -> None:
+        self._broker.commit(self.group_id, offsets or dict(self._positions))
+
+    async def getmany(
+        self,
+        *partitions: TopicPartition,
+        timeout_ms: int = 0,
+        max_records: int | None = None,
+    ) -> dict[TopicPartition, list[InMemoryRecord]]:
+        if not self._started:
+            raise RuntimeError("Консьюмер не запущен.")
+        if self._enable_auto_commit:
+            await self.commit()
+
+        deadline = asyncio.get_running_loop().time() + timeout_ms / 1000
+        while True:
+            batch = self._fetch(partitions or tuple(self._positions), max_records)
+            remaining = deadline - asyncio.get_running_loop().time()
+            if batch or remaining <= 0:
+                return batch
+            await self._broker._wait_for_records(remaining)
+
+    def __aiter__(self) -> InMemoryConsumer:
+        return self
+
+    async def __anext__(self) -> InMemoryRecord:
+        while True:
+            batch = await self.getmany(timeout_ms=1000, max_records=1)
+            for records in batch.values():
+                return records[0]
+
+    def _fetch(
+        self, partitions: Iterable[TopicPartition], max_records: int | None
+    ) -> dict[TopicPartition, list[InMemoryRecord]]:
+        ordered = [p for p in partitions if p not in self._paused]
+        if ordered:
+            shift = self._fetch_cursor % len(ordered)
+            ordered = ordered[shift:] + ordered[:shift]
+            self._fetch_cursor += 1
+
+        batch: dict[TopicPartition, list[InMemoryRecord]] = {}
+        budget = max_records if max_records is not None else float("inf")
+        for partition in ordered:
+            if budget <= 0:
+                break
+            position = self._positions[partition]
+            limit = self._broker.end_offset(partition) - position
+            records = self._broker.read(partition, position, int(min(limit, budget)))
+            if records:
+                batch[partition] = records
+                self._positions[partition] = position + len(records)
+                budget -= len(records)
+        return batch
+
+    def _assign(self, partitions: list[TopicPartition]) -> None:
+        positions: dict[TopicPartition, int] = {}
+        for partition in partitions:
+            position = self._positions.get(partition)
+            if position is None:
+                position = self._broker.committed(self.group_id, partition)
+            if position is None:
+                position = (
+                    0
+                    if self._auto_offset_reset == "earliest"
+                    else self._broker.end_offset(partition)
+                )
+            positions[partition] = position
+        self._positions = positions
+        # Как в aiokafka: после перераспределения партиции не приостановлены
+        self._paused.clear()
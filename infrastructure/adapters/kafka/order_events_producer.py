@@ -9,17 +9,27 @@ from aiokafka import AIOKafkaProducer
 
 from core.ports.order_events_publisher import OrderEventsPublisherInterface
 from infrastructure.adapters.kafka import order_events_pb2
+from infrastructure.adapters.kafka.transport import ProducerTransport
+from infrastructure.metrics import KAFKA_PUBLISH_DURATION, KAFKA_PUBLISH_FAILURES
 
 logger = logging.getLogger(__name__)
 
 
 class KafkaOrderEventsProducer(OrderEventsPublisherInterface):
-    _producers: ClassVar[dict[str, AIOKafkaProducer]] = {}
+    _producers: ClassVar[dict[str, ProducerTransport]] = {}
     _locks: ClassVar[dict[str, asyncio.Lock]] = {}
 
-    def __init__(self, kafka_host: str, topic: str) -> None:
+    def __init__(
+        self,
+        kafka_host: str,
+        topic: str,
+        transport: ProducerTransport | None = None,
+    ) -> None:
         self._kafka_host = kafka_host
         self._topic = topic
+        # Переданным транспортом (например, брокером в памяти) управляет
+        # вызывающий; иначе используется общий AIOKafkaProducer на хост.
+        self._transport = transport
 
     async def publish_order_created(self, order_id: UUID) -> None:
         event = order_events_pb2.OrderCreatedIntegrationEvent()  # type: ignore[attr-defined]
@@ -40,8 +50,10 @@ class KafkaOrderEventsProducer(OrderEventsPublisherInterface):
 
     async def _send(self, payload: bytes) -> None:
         try:
-            await self._send_once(payload)
+            with KAFKA_PUBLISH_DURATION.labels(self._topic).time():
+                await self._send_once(payload)
         except Exception:
+            KAFKA_PUBLISH_FAILURES.labels(self._topic).inc()
             logger.exception("Failed to publish event to Kafka: topic=%s", self._topic)
             raise
 
@@ -63,7 +75,10 @@ class KafkaOrderEventsProducer(OrderEventsPublisherInterface):
             cls._locks[kafka_host] = lock
         return lock
 
-    async def _get_producer(self) -> AIOKafkaProducer:
+    async def _get_producer(self) -> ProducerTransport:
+        if self._transport is not None:
+            return self._transport
+
         lock = self._get_lock(self._kafka_host)
         async with lock:
             producer = self._producers.get(self._kafka_host)
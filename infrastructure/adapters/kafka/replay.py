@@ -0,0 +1,68 @@
+"""Запись и воспроизведение потоков сообщений из файла.
+
+Формат — JSON Lines: в каждой строке value (и необязательный key)
+в base64. Так можно сохранить реальный поток BasketConfirmedIntegrationEvent
+и прогонять его через консьюмер с заданной интенсивностью.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from infrastructure.adapters.kafka.transport import ProducerTransport
+
+
+def record_stream(path: Path, values: Iterable[bytes]) -> int:
+    """Сохранить сообщения в файл; возвращает их число."""
+    count = 0
+    with path.open("w", encoding="utf-8") as file:
+        for value in values:
+            line = {"value": base64.b64encode(value).decode("ascii")}
+            file.write(json.dumps(line) + "\n")
+            count += 1
+    return count
+
+
+class FileReplaySource:
+    """Источник сообщений из файла с заданной интенсивностью.
+
+    rate — сообщений в секунду; None — без пауз, с максимальной
+    скоростью. При отставании от графика сообщения отправляются подряд,
+    пока источник не догонит расписание.
+    """
+
+    def __init__(self, path: Path, rate: float | None = None) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("Интенсивность воспроизведения должна быть больше 0.")
+        self._path = path
+        self._rate = rate
+
+    def __iter__(self) -> Iterator[tuple[bytes | None, bytes]]:
+        with self._path.open(encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                key = item.get("key")
+                yield (
+                    base64.b64decode(key) if key is not None else None,
+                    base64.b64decode(item["value"]),
+                )
+
+    async def replay(self, producer: ProducerTransport, topic: str) -> int:
+        """Отправить все сообщения файла в топик; возвращает их число."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        sent = 0
+        for key, value in self:
+            if self._rate is not None:
+                delay = started + sent / self._rate - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await producer.send_and_wait(topic, value, key=key)
+            sent += 1
+        return sent
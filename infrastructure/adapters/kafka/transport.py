@@ -0,0 +1,62 @@
+"""Транспорт Kafka, от которого зависят продюсер и консьюмеры сервиса.
+
+Интерфейсы повторяют используемое подмножество API aiokafka, поэтому
+AIOKafkaProducer и AIOKafkaConsumer подходят без обёрток, а для
+бенчмарков и тестов есть внутрипроцессный брокер (memory_broker).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, NamedTuple, Protocol
+
+
+class TopicPartition(NamedTuple):
+    topic: str
+    partition: int
+
+
+class Record(Protocol):
+    @property
+    def topic(self) -> str: ...
+
+    @property
+    def partition(self) -> int: ...
+
+    @property
+    def offset(self) -> int: ...
+
+    @property
+    def value(self) -> bytes | None: ...
+
+
+class ProducerTransport(Protocol):
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def send_and_wait(
+        self, topic: str, value: bytes | None = None, key: bytes | None = None
+    ) -> Any: ...
+
+
+class ConsumerTransport(Protocol):
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def getmany(
+        self, *partitions: Any, timeout_ms: int = 0, max_records: int | None = None
+    ) -> dict[Any, Sequence[Record]]: ...
+
+    def highwater(self, partition: Any) -> int | None: ...
+
+    def seek(self, partition: Any, offset: int) -> None: ...
+
+    def assignment(self) -> set[Any]: ...
+
+    def paused(self) -> set[Any]: ...
+
+    def pause(self, *partitions: Any) -> None: ...
+
+    def resume(self, *partitions: Any) -> None: ...
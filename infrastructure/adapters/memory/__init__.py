@@ -0,0 +1,15 @@
+from infrastructure.adapters.memory.courier_repository import (
+    InMemoryCourierRepository,
+)
+from infrastructure.adapters.memory.order_repository import InMemoryOrderRepository
+from infrastructure.adapters.memory.outbox_repository import InMemoryOutboxRepository
+from infrastructure.adapters.memory.store import InMemoryStore
+from infrastructure.adapters.memory.tracker import InMemoryTracker
+
+__all__ = [
+    "InMemoryStore",
+    "InMemoryTracker",
+    "InMemoryCourierRepository",
+    "InMemoryOrderRepository",
+    "InMemoryOutboxRepository",
+]
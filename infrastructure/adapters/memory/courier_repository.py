@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import heapq
+import uuid
+from collections.abc import Callable, Collection, Iterator, Sequence
+from dataclasses import replace
+
+from core.domain.model.courier.courier import Courier
+from core.domain.model.courier.storage_place import StoragePlace
+from core.domain.model.kernel.location import Location
+from core.ports.courier_repository import CourierRepositoryInterface, CourierSummary
+from core.ports.pagination import Area, PageRequest
+from infrastructure.adapters.memory.store import (
+    CourierRecord,
+    StoragePlaceRecord,
+    courier_to_record,
+    record_to_courier,
+)
+from infrastructure.adapters.memory.tracker import InMemoryTracker
+
+
+class InMemoryCourierRepository(CourierRepositoryInterface):
+    def __init__(self, tracker: InMemoryTracker) -> None:
+        if tracker is None:
+            raise ValueError("tracker не может быть None")
+        self._tracker = tracker
+
+    async def add(self, courier: Courier) -> None:
+        await self._save(courier)
+
+    async def add_many(self, couriers: Sequence[Courier]) -> None:
+        await self._in_tx(
+            lambda: self._tracker.staged_couriers.update(
+                (courier.id, courier_to_record(courier)) for courier in couriers
+            ),
+            couriers,
+        )
+
+    async def add_storage_places(
+        self, places: Sequence[tuple[uuid.UUID, StoragePlace]]
+    ) -> None:
+        def stage() -> None:
+            staged = self._tracker.staged_couriers
+            for courier_id, place in places:
+                record = staged.get(courier_id) or self._tracker.store.couriers.get(
+                    courier_id
+                )
+                if record is None:
+                    raise ValueError(f"Курьер с id {courier_id} не найден")
+                staged[courier_id] = replace(
+                    record,
+                    storage_places=(
+                        *record.storage_places,
+                        StoragePlaceRecord(
+                            id=place.id,
+                            name=place.name,
+                            total_volume=place.total_volume,
+                            order_id=place.order_id,
+                        ),
+                    ),
+                )
+
+        await self._in_tx(stage, [place for _, place in places])
+
+    async def get_existing_ids(
+        self, courier_ids: Collection[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        staged = self._tracker.staged_couriers
+        couriers = self._tracker.store.couriers
+        return {cid for cid in courier_ids if cid in staged or cid in couriers}
+
+    async def update(self, courier: Courier) -> None:
+        await self._save(courier)
+
+    async def get_by_id(self, courier_id: str) -> Courier | None:
+        key = uuid.UUID(courier_id)
+        record = self._tracker.staged_couriers.get(
+            key
+        ) or self._tracker.store.couriers.get(key)
+        if record is None:
+            return None
+        return record_to_courier(record)
+
+    async def get_first_free(self) -> Courier | None:
+        for record in self._visible(self._tracker.store.free_courier_ids):
+            if record.is_free:
+                return record_to_courier(record)
+        return None
+
+    async def get_all(self) -> list[Courier]:
+        return [
+            record_to_courier(record)
+            for record in self._visible(self._tracker.store.couriers)
+        ]
+
+    async def get_all_free(self) -> list[Courier]:
+        return [
+            record_to_courier(record)
+            for record in self._visible(self._tracker.store.free_courier_ids)
+            if record.is_free
+        ]
+
+    async def get_all_with_free_capacity(self, volume: int) -> list[Courier]:
+        """Курьеры, у которых есть свободное место под заказ указанного объёма."""
+        buckets = self._tracker.store.courier_ids_by_free_volume
+        candidate_ids: dict[uuid.UUID, None] = {}
+        for free_volume, courier_ids in buckets.items():
+            if free_volume >= volume:
+                candidate_ids.update(courier_ids)
+        return [
+            record_to_courier(record)
+            for record in self._visible(candidate_ids)
+            if record.max_free_volume >= volume
+        ]
+
+    async def get_summaries(
+        self, page: PageRequest, area: Area | None = None
+    ) -> list[CourierSummary]:
+        summaries = (
+            CourierSummary(
+                id=record.id,
+                name=record.name,
+                location=Location._new(record.location_x, record.location_y),
+            )
+            for record in self._visible(self._tracker.store.couriers)
+            if page.after is None or record.id > page.after
+        )
+        return heapq.nsmallest(
+            page.limit,
+            (s for s in summaries if area is None or area.contains(s.location)),
+            key=lambda s: s.id,
+        )
+
+    def _visible(self, committed_ids: Collection[uuid.UUID]) -> Iterator[CourierRecord]:
+        # Строки транзакции перекрывают зафиксированные, остальные строки
+        # транзакции идут следом. Вызывающий перепроверяет условие выборки.
+        staged = self._tracker.staged_couriers
+        couriers = self._tracker.store.couriers
+        for courier_id in committed_ids:
+            yield staged.get(courier_id) or couriers[courier_id]
+        for courier_id, record in staged.items():
+            if courier_id not in committed_ids:
+                yield record
+
+    async def _save(self, courier: Courier) -> None:
+        def stage() -> None:
+            self._tracker.staged_couriers[courier.id] = courier_to_record(courier)
+
+        await self._in_tx(stage, [courier])
+
+    async def _in_tx(
+        self, stage: Callable[[], None], tracked: Sequence[object]
+    ) -> None:
+        for aggregate in tracked:
+            self._tracker.track(aggregate)
+
+        is_in_transaction = self._tracker.in_tx()
+        if not is_in_transaction:
+            await self._tracker.begin()
+
+        try:
+            stage()
+            if not is_in_transaction:
+                await self._tracker.commit()
+        except Exception:
+            if not is_in_transaction:
+                await self._tracker.rollback()
+            raise
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import heapq
+import uuid
+from collections.abc import Iterator
+from datetime import datetime
+
+from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order, OrderStatus
+from core.ports.order_repository import (
+    LATENCY_QUANTILES,
+    LatencyPercentiles,
+    OrderLatencyStats,
+    OrderRepositoryInterface,
+    OrderSummary,
+)
+from core.ports.pagination import Area, PageRequest
+from infrastructure.adapters.memory.store import (
+    OrderRecord,
+    order_to_record,
+    record_to_order,
+)
+from infrastructure.adapters.memory.tracker import InMemoryTracker
+
+
+def _percentile_cont(ordered: list[float], quantile: float) -> float:
+    # Линейная интерполяция, как у percentile_cont в Postgres
+    position = quantile * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _percentiles(values: list[float]) -> LatencyPercentiles | None:
+    if not values:
+        return None
+    values.sort()
+    p50, p95, p99 = (_percentile_cont(values, q) for q in LATENCY_QUANTILES)
+    return LatencyPercentiles(p50=p50, p95=p95, p99=p99)
+
+
+class InMemoryOrderRepository(OrderRepositoryInterface):
+    def __init__(self, tracker: InMemoryTracker) -> None:
+        if tracker is None:
+            raise ValueError("tracker не может быть None")
+        self._tracker = tracker
+
+    async def add(self, order: Order) -> None:
+        await self._save(order)
+
+    async def add_if_absent(self, order: Order) -> bool:
+        if (
+            order.id in self._tracker.staged_orders
+            or order.id in self._tracker.store.orders
+        ):
+            return False
+        await self._save(order)
+        return True
+
+    async def update(self, order: Order) -> None:
+        await self._save(order)
+
+    async def get_by_id(self, order_id: str) -> Order | None:
+        key = uuid.UUID(order_id)
+        record = self._tracker.staged_orders.get(key) or self._tracker.store.orders.get(
+            key
+        )
+        if record is None:
+            return None
+        return record_to_order(record)
+
+    async def get_first_created(self) -> Order | None:
+        for record in self._with_status(OrderStatus.CREATED):
+            return record_to_order(record)
+        return None
+
+    async def get_all_assigned(self) -> list[Order]:
+        return [
+            record_to_order(record)
+            for record in self._with_status(OrderStatus.ASSIGNED)
+        ]
+
+    async def get_all_not_completed(self) -> list[Order]:
+        return [
+            record_to_order(record)
+            for status in (OrderStatus.CREATED, OrderStatus.ASSIGNED)
+            for record in self._with_status(status)
+        ]
+
+    async def get_active_summaries(
+        self, page: PageRequest, area: Area | None = None
+    ) -> list[OrderSummary]:
+        summaries = (
+            OrderSummary(
+                id=record.id,
+                location=Location._new(record.location_x, record.location_y),
+            )
+            for status in (OrderStatus.CREATED, OrderStatus.ASSIGNED)
+            for record in self._with_status(status)
+            if page.after is None or record.id > page.after
+        )
+        return heapq.nsmallest(
+            page.limit,
+            (s for s in summaries if area is None or area.contains(s.location)),
+            key=lambda s: s.id,
+        )
+
+    async def get_latency_stats(self, since: datetime) -> OrderLatencyStats:
+        wait: list[float] = []
+        delivery: list[float] = []
+        total: list[float] = []
+        for record in self._with_status(OrderStatus.COMPLETED):
+            if record.completed_at is None or record.completed_at < since:
+                continue
+            if record.assigned_at is not None:
+                wait.append((record.assigned_at - record.created_at).total_seconds())
+                delivery.append(
+                    (record.completed_at - record.assigned_at).total_seconds()
+                )
+            total.append((record.completed_at - record.created_at).total_seconds())
+        return OrderLatencyStats(
+            completed=len(total),
+            wait=_percentiles(wait),
+            delivery=_percentiles(delivery),
+            total=_percentiles(total),
+        )
+
+    def _with_status(self, status: OrderStatus) -> Iterator[OrderRecord]:
+        # Индекс статусов хранит только зафиксированное состояние: строки
+        # транзакции перекрывают его и добавляются в конец выборки.
+        staged = self._tracker.staged_orders
+        orders = self._tracker.store.orders
+        committed_ids = self._tracker.store.order_ids_by_status[status]
+        for order_id in committed_ids:
+            record = staged.get(order_id) or orders[order_id]
+            if record.status is status:
+                yield record
+        for order_id, record in staged.items():
+            if record.status is status and order_id not in committed_ids:
+                yield record
+
+    async def _save(self, order: Order) -> None:
+        self._tracker.track(order)
+
+        is_in_transaction = self._tracker.in_tx()
+        if not is_in_transaction:
+            await self._tracker.begin()
+
+        try:
+            self._tracker.staged_orders[order.id] = order_to_record(order)
+            if not is_in_transaction:
+                await self._tracker.commit()
+        except Exception:
+            if not is_in_transaction:
+                await self._tracker.rollback()
+            raise
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from uuid import UUID, uuid4
+
+from core.domain.events.order import OrderDomainEvent
+from core.ports.outbox_repository import OutboxMessage, OutboxRepositoryInterface
+from infrastructure.adapters.memory.store import OutboxRecord
+from infrastructure.adapters.memory.tracker import InMemoryTracker
+
+
+class InMemoryOutboxRepository(OutboxRepositoryInterface):
+    def __init__(self, tracker: InMemoryTracker) -> None:
+        if tracker is None:
+            raise ValueError("tracker не может быть None")
+        self._tracker = tracker
+
+    async def add(self, event: OrderDomainEvent) -> None:
+        record = OutboxRecord(id=uuid4(), event=event)
+        is_in_transaction = self._tracker.in_tx()
+
+        if not is_in_transaction:
+            await self._tracker.begin()
+
+        try:
+            self._tracker.staged_outbox[record.id] = record
+            if not is_in_transaction:
+                await self._tracker.commit()
+        except Exception:
+            if not is_in_transaction:
+                await self._tracker.rollback()
+            raise
+
+    async def get_unprocessed(self, limit: int) -> list[OutboxMessage]:
+        store = self._tracker.store
+        processed = self._tracker.staged_processed_outbox_ids
+        messages: list[OutboxMessage] = []
+        for message_id in store.unprocessed_outbox_ids:
+            if len(messages) >= limit:
+                break
+            if message_id not in processed:
+                record = store.outbox[message_id]
+                messages.append(OutboxMessage(id=record.id, event=record.event))
+        return messages
+
+    async def mark_processed(self, message_id: UUID) -> None:
+        is_in_transaction = self._tracker.in_tx()
+
+        if not is_in_transaction:
+            await self._tracker.begin()
+
+        try:
+            if message_id in self._tracker.store.outbox:
+                self._tracker.staged_processed_outbox_ids.add(message_id)
+            if not is_in_transaction:
+                await self._tracker.commit()
+        except Exception:
+            if not is_in_transaction:
+                await self._tracker.rollback()
+            raise
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from core.domain.events.order import OrderDomainEvent
+from core.domain.model.courier.courier import Courier
+from core.domain.model.courier.storage_place import StoragePlace
+from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order, OrderStatus
+
+
+@dataclass(frozen=True, slots=True)
+class StoragePlaceRecord:
+    id: UUID
+    name: str
+    total_volume: int
+    order_id: UUID | None
+
+
+@dataclass(frozen=True, slots=True)
+class CourierRecord:
+    id: UUID
+    name: str
+    speed: int
+    location_x: int
+    location_y: int
+    storage_places: tuple[StoragePlaceRecord, ...]
+
+    @property
+    def is_free(self) -> bool:
+        return all(sp.order_id is None for sp in self.storage_places)
+
+    @property
+    def max_free_volume(self) -> int:
+        return max(
+            (sp.total_volume for sp in self.storage_places if sp.order_id is None),
+            default=0,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class OrderRecord:
+    id: UUID
+    location_x: int
+    location_y: int
+    volume: int
+    courier_id: UUID | None
+    status: OrderStatus
+    created_at: datetime
+    assigned_at: datetime | None
+    completed_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxRecord:
+    id: UUID
+    event: OrderDomainEvent
+
+
+def courier_to_record(courier: Courier) -> CourierRecord:
+    return CourierRecord(
+        id=courier.id,
+        name=courier.name,
+        speed=courier.speed,
+        location_x=courier.location.x,
+        location_y=courier.location.y,
+        storage_places=tuple(
+            StoragePlaceRecord(
+                id=sp.id,
+                name=sp.name,
+                total_volume=sp.total_volume,
+                order_id=sp.order_id,
+            )
+            for sp in courier.iter_storage_places()
+        ),
+    )
+
+
+def record_to_courier(record: CourierRecord) -> Courier:
+    return Courier._restore(
+        id=record.id,
+        name=record.name,
+        speed=record.speed,
+        location=Location._new(record.location_x, record.location_y),
+        storage_places=[
+            StoragePlace._restore(
+                id=sp.id,
+                name=sp.name,
+                total_volume=sp.total_volume,
+                order_id=sp.order_id,
+            )
+            for sp in record.storage_places
+        ],
+    )
+
+
+def order_to_record(order: Order) -> OrderRecord:
+    return OrderRecord(
+        id=order.id,
+        location_x=order.location.x,
+        location_y=order.location.y,
+        volume=order.volume,
+        courier_id=order.courier_id,
+        status=order.status,
+        created_at=order.created_at,
+        assigned_at=order.assigned_at,
+        completed_at=order.completed_at,
+    )
+
+
+def record_to_order(record: OrderRecord) -> Order:
+    return Order._new(
+        id=record.id,
+        location=Location._new(record.location_x, record.location_y),
+        volume=record.volume,
+        courier_id=record.courier_id,
+        status=record.status,
+        created_at=record.created_at,
+        assigned_at=record.assigned_at,
+        completed_at=record.completed_at,
+    )
+
+
+class InMemoryStore:
+    """Зафиксированное состояние in-memory хранилища с индексами.
+
+    Строки неизменяемы: агрегаты восстанавливаются из них при каждом чтении,
+    а изменения попадают в хранилище только при коммите транзакции
+    (см. InMemoryTracker). Порядок выборок — порядок добавления строк.
+    """
+
+    def __init__(self) -> None:
+        self.couriers: dict[UUID, CourierRecord] = {}
+        self.orders: dict[UUID, OrderRecord] = {}
+        self.outbox: dict[UUID, OutboxRecord] = {}
+
+        # Индексы. Словари с пустыми значениями — упорядоченные множества.
+        self.order_ids_by_status: dict[OrderStatus, dict[UUID, None]] = {
+            status: {} for status in OrderStatus
+        }
+        self.free_courier_ids: dict[UUID, None] = {}
+        # Наибольший свободный объём курьера -> идентификаторы курьеров
+        self.courier_ids_by_free_volume: dict[int, dict[UUID, None]] = {}
+        self.unprocessed_outbox_ids: dict[UUID, None] = {}
+
+    def apply(
+        self,
+        couriers: Iterable[CourierRecord],
+        orders: Iterable[OrderRecord],
+        outbox: Iterable[OutboxRecord],
+        processed_outbox_ids: Iterable[UUID],
+    ) -> None:
+        for courier in couriers:
+            self._put_courier(courier)
+        for order in orders:
+            self._put_order(order)
+        for message in outbox:
+            self.outbox[message.id] = message
+            self.unprocessed_outbox_ids[message.id] = None
+        for message_id in processed_outbox_ids:
+            self.unprocessed_outbox_ids.pop(message_id, None)
+
+    def _put_courier(self, record: CourierRecord) -> None:
+        previous = self.couriers.get(record.id)
+        if previous is not None:
+            self.free_courier_ids.pop(record.id, None)
+            bucket = self.courier_ids_by_free_volume[previous.max_free_volume]
+            bucket.pop(record.id, None)
+            if not bucket:
+                del self.courier_ids_by_free_volume[previous.max_free_volume]
+
+        self.couriers[record.id] = record
+        if record.is_free:
+            self.free_courier_ids[record.id] = None
+        self.courier_ids_by_free_volume.setdefault(record.max_free_volume, {})[
+            record.id
+        ] = None
+
+    def _put_order(self, record: OrderRecord) -> None:
+        previous = self.orders.get(record.id)
+        if previous is not None:
+            self.order_ids_by_status[previous.status].pop(record.id, None)
+        self.orders[record.id] = record
+        self.order_ids_by_status[record.status][record.id] = None
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.adapters.memory.store import (
+    CourierRecord,
+    InMemoryStore,
+    OrderRecord,
+    OutboxRecord,
+)
+from infrastructure.adapters.postgres.repositories.tracker import Tracker
+
+
+class InMemoryTracker(Tracker):
+    """Транзакции поверх InMemoryStore по принципу copy-on-write.
+
+    Внутри транзакции изменённые строки копятся в собственном слое трекера
+    и видны только его репозиториям. Коммит атомарно переносит их в
+    хранилище вместе с индексами, откат просто отбрасывает слой.
+    """
+
+    def __init__(self, store: InMemoryStore) -> None:
+        self.store = store
+        self._in_transaction = False
+        self._tracked: set[object] = set()
+        self.staged_couriers: dict[UUID, CourierRecord] = {}
+        self.staged_orders: dict[UUID, OrderRecord] = {}
+        self.staged_outbox: dict[UUID, OutboxRecord] = {}
+        self.staged_processed_outbox_ids: set[UUID] = set()
+
+    def tx(self) -> AsyncSession | None:
+        """Сессии БД нет: изменения хранятся в слое трекера."""
+        return None
+
+    def db(self) -> AsyncSession:
+        raise NotImplementedError("InMemoryTracker не использует сессию БД.")
+
+    def in_tx(self) -> bool:
+        """Проверить, открыта ли транзакция."""
+        return self._in_transaction
+
+    def track(self, aggregate: object) -> None:
+        """Отследить изменения агрегата."""
+        self._tracked.add(aggregate)
+
+    async def begin(self) -> None:
+        """Начать транзакцию."""
+        self._in_transaction = True
+
+    async def commit(self) -> None:
+        """Зафиксировать транзакцию."""
+        if self._in_transaction:
+            self.store.apply(
+                couriers=self.staged_couriers.values(),
+                orders=self.staged_orders.values(),
+                outbox=self.staged_outbox.values(),
+                processed_outbox_ids=self.staged_processed_outbox_ids,
+            )
+            self._reset()
+
+    async def rollback(self) -> None:
+        """Откатить транзакцию."""
+        if self._in_transaction:
+            self._reset()
+
+    def _reset(self) -> None:
+        self._in_transaction = False
+        self._tracked.clear()
+        self.staged_couriers.clear()
+        self.staged_orders.clear()
+        self.staged_outbox.clear()
+        self.staged_processed_outbox_ids.clear()
@@ -0,0 +1,44 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Существующим заказам время поступления неизвестно — берём момент миграции
+    op.add_column(
+        "orders",
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.add_column(
+        "orders", sa.Column("assigned_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.add_column(
+        "orders", sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_index(
+        "ix_orders_created_queue",
+        "orders",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'CREATED'"),
+    )
+    op.create_index("ix_orders_completed_at", "orders", ["completed_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_orders_completed_at", table_name="orders")
+    op.drop_index("ix_orders_created_queue", table_name="orders")
+    op.drop_column("orders", "completed_at")
+    op.drop_column("orders", "assigned_at")
+    op.drop_column("orders", "created_at")
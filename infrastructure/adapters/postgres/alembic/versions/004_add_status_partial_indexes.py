@@ -0,0 +1,43 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Очередь CREATED покрыта индексом ix_orders_created_queue из 003
+    op.create_index(
+        "ix_orders_assigned",
+        "orders",
+        ["courier_id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'ASSIGNED'"),
+    )
+    op.create_index(
+        "ix_orders_not_completed",
+        "orders",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('CREATED', 'ASSIGNED')"),
+    )
+    op.create_index(
+        "ix_outbox_unprocessed",
+        "outbox",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("processed_at IS NULL"),
+    )
+    # Полный индекс по processed_at почти целиком состоит из обработанных строк
+    op.drop_index("ix_outbox_processed_at", table_name="outbox")
+
+
+def downgrade() -> None:
+    op.create_index("ix_outbox_processed_at", "outbox", ["processed_at"], unique=False)
+    op.drop_index("ix_outbox_unprocessed", table_name="outbox")
+    op.drop_index("ix_orders_not_completed", table_name="orders")
+    op.drop_index("ix_orders_assigned", table_name="orders")
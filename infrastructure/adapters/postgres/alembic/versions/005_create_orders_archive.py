@@ -0,0 +1,43 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Помесячные секции создаёт архиватор (OrderArchiver) перед переносом
+    op.create_table(
+        "orders_archive",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("courier_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("location_x", sa.Integer(), nullable=False),
+        sa.Column("location_y", sa.Integer(), nullable=False),
+        sa.Column("volume", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(name="order_status", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("assigned_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id", "completed_at"),
+        postgresql_partition_by="RANGE (completed_at)",
+    )
+
+
+def downgrade() -> None:
+    # Возвращаем архивные заказы, секции удаляются вместе с родительской таблицей
+    op.execute(
+        "INSERT INTO orders (id, courier_id, location_x, location_y, volume, "
+        "status, created_at, assigned_at, completed_at) "
+        "SELECT id, courier_id, location_x, location_y, volume, "
+        "status, created_at, assigned_at, completed_at FROM orders_archive"
+    )
+    op.drop_table("orders_archive")
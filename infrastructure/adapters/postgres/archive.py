@@ -0,0 +1,154 @@
+"""Перенос доставленных заказов из orders в секционированный orders_archive."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.domain.model.order.order import OrderStatus
+from infrastructure.adapters.postgres.models.order import OrderDTO
+from infrastructure.adapters.postgres.models.order_archive import ArchivedOrderDTO
+from infrastructure.adapters.postgres.repositories.order_repository import status_in
+
+logger = logging.getLogger(__name__)
+
+# SQLSTATE lock_not_available: истёк lock_timeout
+LOCK_NOT_AVAILABLE = "55P03"
+
+ARCHIVED_COLUMNS: tuple[str, ...] = (
+    "id",
+    "courier_id",
+    "location_x",
+    "location_y",
+    "volume",
+    "status",
+    "created_at",
+    "assigned_at",
+    "completed_at",
+)
+
+
+@dataclass(frozen=True)
+class ArchivePartition:
+    """Помесячная секция orders_archive: [start, end) по completed_at."""
+
+    name: str
+    start: datetime
+    end: datetime
+
+
+def month_partition(moment: datetime) -> ArchivePartition:
+    moment = moment.astimezone(UTC)
+    start = datetime(moment.year, moment.month, 1, tzinfo=UTC)
+    end = datetime(
+        moment.year + moment.month // 12, moment.month % 12 + 1, 1, tzinfo=UTC
+    )
+    return ArchivePartition(name=f"orders_archive_{start:%Y_%m}", start=start, end=end)
+
+
+class OrderArchiver:
+    """Переносит доставленные заказы старше retention в orders_archive.
+
+    Каждая пачка — отдельная короткая транзакция: строки выбираются
+    FOR UPDATE SKIP LOCKED, удаляются из orders и вставляются в архив одним
+    запросом. lock_timeout ограничивает ожидание блокировок, поэтому пачка,
+    упёршаяся в чужую транзакцию, откатывается, а не стопорит такты сервиса.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        retention: timedelta,
+        batch_size: int = 500,
+        lock_timeout_ms: int = 200,
+    ) -> None:
+        if retention <= timedelta(0):
+            raise ValueError("retention должен быть положительным")
+        if batch_size <= 0:
+            raise ValueError("batch_size должен быть больше 0")
+        if lock_timeout_ms <= 0:
+            raise ValueError("lock_timeout_ms должен быть больше 0")
+        self._session_maker = session_maker
+        self._retention = retention
+        self._batch_size = batch_size
+        self._lock_timeout_ms = lock_timeout_ms
+
+    async def run(self, now: datetime | None = None) -> int:
+        """Перенести все подходящие заказы пачками, вернуть их число.
+
+        Если пачка не дождалась блокировки, прогон завершается досрочно:
+        оставшиеся заказы перенесёт следующий запуск.
+        """
+        cutoff = (now or datetime.now(UTC)) - self._retention
+        archived = 0
+        while True:
+            try:
+                moved = await self.archive_batch(cutoff)
+            except DBAPIError as exc:
+                if getattr(exc.orig, "sqlstate", None) != LOCK_NOT_AVAILABLE:
+                    raise
+                logger.warning(
+                    "Order archiving stopped on lock timeout after %d orders",
+                    archived,
+                )
+                return archived
+            archived += moved
+            if moved < self._batch_size:
+                return archived
+
+    async def archive_batch(self, cutoff: datetime) -> int:
+        async with self._session_maker() as session, session.begin():
+            await session.execute(
+                select(
+                    func.set_config("lock_timeout", f"{self._lock_timeout_ms}ms", True)
+                )
+            )
+            rows = (
+                await session.execute(
+                    select(OrderDTO.id, OrderDTO.completed_at)
+                    .where(
+                        status_in(OrderStatus.COMPLETED),
+                        OrderDTO.completed_at < cutoff,
+                    )
+                    .order_by(OrderDTO.completed_at)
+                    .limit(self._batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+            if not rows:
+                return 0
+
+            for partition in {month_partition(row.completed_at) for row in rows}:
+                await self._ensure_partition(session, partition)
+
+            moved = (
+                delete(OrderDTO)
+                .where(OrderDTO.id.in_([row.id for row in rows]))
+                .returning(*(OrderDTO.__table__.c[c] for c in ARCHIVED_COLUMNS))
+                .cte("moved")
+            )
+            await session.execute(
+                insert(ArchivedOrderDTO).from_select(
+                    ARCHIVED_COLUMNS, select(*(moved.c[c] for c in ARCHIVED_COLUMNS))
+                )
+            )
+            return len(rows)
+
+    @staticmethod
+    async def _ensure_partition(
+        session: AsyncSession, partition: ArchivePartition
+    ) -> None:
+        # DDL не принимает параметров; имя и границы формируются из datetime
+        await session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {partition.name} "
+                f"PARTITION OF {ArchivedOrderDTO.__tablename__} "
+                f"FOR VALUES FROM ('{partition.start.isoformat()}') "
+                f"TO ('{partition.end.isoformat()}')"
+            )
+        )
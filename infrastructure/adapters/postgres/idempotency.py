@@ -0,0 +1,137 @@
+"""Хранилище ответов на запросы с заголовком Idempotency-Key."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, delete, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructure.adapters.postgres.models.idempotency_key import IdempotencyKeyDTO
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    status_code: int
+    body: bytes
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    """Запись чужого запроса с тем же ключом; response пуст, пока он идёт."""
+
+    request_hash: str
+    response: StoredResponse | None
+
+
+class IdempotencyStore:
+    """Резервирует ключи и хранит ответы в таблице idempotency_keys.
+
+    Каждая операция — отдельная короткая транзакция, независимая от
+    транзакции обработчика. Ключ занимает первый запрос; запись, которая
+    истекла или осталась незавершённой дольше pending_timeout (процесс упал
+    посреди запроса), перезанимается тем же запросом.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        ttl: timedelta,
+        pending_timeout: timedelta = timedelta(seconds=30),
+    ) -> None:
+        if ttl <= timedelta(0):
+            raise ValueError("ttl должен быть положительным")
+        if pending_timeout <= timedelta(0):
+            raise ValueError("pending_timeout должен быть положительным")
+        self._session_maker = session_maker
+        self._ttl = ttl
+        self._pending_timeout = pending_timeout
+
+    @property
+    def ttl(self) -> timedelta:
+        return self._ttl
+
+    async def claim(
+        self, scope: str, key: str, request_hash: str, now: datetime | None = None
+    ) -> IdempotencyRecord | None:
+        """Занять ключ. None — ключ наш, иначе запись предыдущего запроса."""
+        now = now or datetime.now(UTC)
+        table = IdempotencyKeyDTO.__table__
+        new_key = insert(IdempotencyKeyDTO).values(
+            scope=scope,
+            key=key,
+            request_hash=request_hash,
+            created_at=now,
+            expires_at=now + self._ttl,
+        )
+        stmt = new_key.on_conflict_do_update(
+            index_elements=[table.c.scope, table.c.key],
+            set_={
+                "request_hash": new_key.excluded.request_hash,
+                "status_code": None,
+                "body": None,
+                "created_at": new_key.excluded.created_at,
+                "expires_at": new_key.excluded.expires_at,
+            },
+            where=or_(
+                table.c.expires_at <= now,
+                (table.c.status_code.is_(None))
+                & (table.c.created_at <= now - self._pending_timeout),
+            ),
+        ).returning(table.c.key)
+
+        async with self._session_maker() as session, session.begin():
+            if (await session.execute(stmt)).first() is not None:
+                return None
+            row = (
+                await session.execute(
+                    select(
+                        IdempotencyKeyDTO.request_hash,
+                        IdempotencyKeyDTO.status_code,
+                        IdempotencyKeyDTO.body,
+                    ).where(
+                        IdempotencyKeyDTO.scope == scope, IdempotencyKeyDTO.key == key
+                    )
+                )
+            ).one_or_none()
+        if row is None:
+            # Запись удалили между запросами: владелец запроса упал
+            return await self.claim(scope, key, request_hash, now)
+        response = (
+            StoredResponse(row.status_code, row.body)
+            if row.status_code is not None
+            else None
+        )
+        return IdempotencyRecord(request_hash=row.request_hash, response=response)
+
+    async def complete(self, scope: str, key: str, response: StoredResponse) -> None:
+        async with self._session_maker() as session, session.begin():
+            await session.execute(
+                update(IdempotencyKeyDTO)
+                .where(IdempotencyKeyDTO.scope == scope, IdempotencyKeyDTO.key == key)
+                .values(status_code=response.status_code, body=response.body)
+            )
+
+    async def release(self, scope: str, key: str) -> None:
+        """Освободить ключ запроса, завершившегося ошибкой: повтор выполнится."""
+        async with self._session_maker() as session, session.begin():
+            await session.execute(
+                delete(IdempotencyKeyDTO).where(
+                    IdempotencyKeyDTO.scope == scope,
+                    IdempotencyKeyDTO.key == key,
+                    IdempotencyKeyDTO.status_code.is_(None),
+                )
+            )
+
+    async def purge_expired(self, now: datetime | None = None) -> int:
+        async with self._session_maker() as session, session.begin():
+            result = await session.execute(
+                delete(IdempotencyKeyDTO).where(
+                    IdempotencyKeyDTO.expires_at <= (now or datetime.now(UTC))
+                )
+            )
+        # DELETE возвращает CursorResult, у которого есть rowcount
+        return cast(CursorResult[Any], result).rowcount
@@ -0,0 +1,123 @@
+"""Выбор процесса, выполняющего периодические такты."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from infrastructure.metrics import TICK_LEADER, TICK_LEADER_CHANGES
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection:
+    """Ведущий — процесс, взявший advisory-блокировку lock_id.
+
+    Блокировка сессионная и живёт на отдельном соединении: если процесс
+    падает или теряет связь с базой, Postgres снимает её и блокировку
+    берёт другая реплика. Раз в renew_interval_seconds ведущий проверяет
+    соединение; без успешной проверки дольше lease_seconds процесс сам
+    перестаёт считать себя ведущим — зависший процесс не будет выполнять
+    такты одновременно с новым ведущим дольше аренды.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        lock_id: int,
+        renew_interval_seconds: float = 2.0,
+        lease_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if renew_interval_seconds <= 0:
+            raise ValueError("renew_interval_seconds должен быть больше 0")
+        lease = 3 * renew_interval_seconds if lease_seconds is None else lease_seconds
+        if lease <= renew_interval_seconds:
+            raise ValueError("lease_seconds должен быть больше renew_interval_seconds")
+        self._engine = engine
+        self._lock_id = lock_id
+        self._renew_interval = renew_interval_seconds
+        self._lease = lease
+        self._clock = clock
+        self._connection: AsyncConnection | None = None
+        self._leader = False
+        self._renewed_at = 0.0
+        TICK_LEADER.set(0)
+
+    @property
+    def is_leader(self) -> bool:
+        return self._leader and self._clock() - self._renewed_at < self._lease
+
+    async def run(self) -> None:
+        while True:
+            await self.renew()
+            await asyncio.sleep(self._renew_interval)
+
+    async def renew(self) -> None:
+        """Взять блокировку или подтвердить, что она всё ещё удерживается."""
+        try:
+            if self._connection is None:
+                self._connection = await self._engine.connect()
+            if self._leader:
+                await self._connection.execute(select(1))
+                acquired = True
+            else:
+                acquired = bool(
+                    await self._connection.scalar(
+                        select(func.pg_try_advisory_lock(self._lock_id))
+                    )
+                )
+            # Блокировка сессионная и переживает фиксацию; без неё соединение
+            # висело бы в состоянии idle in transaction
+            await self._connection.commit()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Leader lock check failed, stepping down")
+            self._set_leader(False)
+            await self._drop_connection()
+            return
+        if acquired:
+            self._renewed_at = self._clock()
+            self._set_leader(True)
+
+    async def release(self) -> None:
+        """Отпустить блокировку при остановке, не дожидаясь разрыва соединения."""
+        connection = self._connection
+        if connection is None:
+            return
+        try:
+            if self._leader:
+                await connection.scalar(select(func.pg_advisory_unlock(self._lock_id)))
+                await connection.commit()
+        except Exception:
+            # Закрытое соединение всё равно снимет блокировку
+            logger.exception("Failed to release leader lock")
+        finally:
+            self._set_leader(False)
+            await self._drop_connection()
+
+    def _set_leader(self, leader: bool) -> None:
+        if leader == self._leader:
+            return
+        self._leader = leader
+        TICK_LEADER.set(int(leader))
+        TICK_LEADER_CHANGES.inc()
+        if leader:
+            logger.info("Became tick leader (lock %d)", self._lock_id)
+        else:
+            logger.warning("Lost tick leadership (lock %d)", self._lock_id)
+
+    async def _drop_connection(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            await connection.close()
+        except Exception:
+            logger.debug("Failed to close leader connection", exc_info=True)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from core.domain.model.order.order import OrderStatus
+from infrastructure.adapters.postgres.models.order import OrderDTO
+from infrastructure.adapters.postgres.models.outbox import OutboxDTO
+from infrastructure.adapters.postgres.repositories.order_repository import status_in
+from infrastructure.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_QUERY_DURATION,
+    ORDERS_BACKLOG,
+    OUTBOX_LAG,
+    OUTBOX_PENDING,
+)
+
+_QUERY_STARTED = "delivery_query_started"
+
+
+def _before_cursor_execute(conn: Any, *args: Any) -> None:
+    conn.info.setdefault(_QUERY_STARTED, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    started = conn.info[_QUERY_STARTED].pop()
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+    DB_QUERY_DURATION.labels(operation).observe(time.perf_counter() - started)
+
+
+def _handle_error(context: Any) -> None:
+    # after_cursor_execute не вызывается для упавшего запроса
+    connection = context.connection
+    if connection is not None and connection.info.get(_QUERY_STARTED):
+        connection.info[_QUERY_STARTED].pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Замерять каждый SQL-запрос движка, в том числе запросы репозиториев."""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(sync_engine, "handle_error", _handle_error)
+
+
+async def created_backlog(session: AsyncSession) -> int:
+    """Число заказов, ждущих назначения курьера."""
+    backlog = await session.scalar(
+        select(func.count()).select_from(OrderDTO).where(status_in(OrderStatus.CREATED))
+    )
+    return backlog or 0
+
+
+def postgres_collector(
+    engine: AsyncEngine, session_maker: async_sessionmaker[AsyncSession]
+) -> Callable[[], Awaitable[None]]:
+    """Сборщик гаужей, которые считаются запросом в момент выгрузки метрик."""
+
+    async def collect() -> None:
+        pool: Any = engine.pool
+        if hasattr(pool, "checkedout"):
+            DB_POOL_SIZE.set(pool.size())
+            DB_POOL_CHECKED_OUT.set(pool.checkedout())
+            DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+        async with session_maker() as session:
+            backlog = await created_backlog(session)
+            pending, oldest = (
+                await session.execute(
+                    select(func.count(), func.min(OutboxDTO.created_at)).where(
+                        OutboxDTO.processed_at.is_(None)
+                    )
+                )
+            ).one()
+            now = await session.scalar(select(func.now()))
+
+        ORDERS_BACKLOG.set(backlog)
+        OUTBOX_PENDING.set(pending)
+        OUTBOX_LAG.set((now - oldest).total_seconds() if oldest and now else 0)
+
+    return collect
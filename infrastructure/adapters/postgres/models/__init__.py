@@ -1,7 +1,17 @@
 from infrastructure.adapters.postgres.models.base import Base
 from infrastructure.adapters.postgres.models.courier import CourierDTO
+from infrastructure.adapters.postgres.models.idempotency_key import IdempotencyKeyDTO
 from infrastructure.adapters.postgres.models.order import OrderDTO
+from infrastructure.adapters.postgres.models.order_archive import ArchivedOrderDTO
 from infrastructure.adapters.postgres.models.outbox import OutboxDTO
 from infrastructure.adapters.postgres.models.storage_place import StoragePlaceDTO
 
-__all__ = ["Base", "OrderDTO", "CourierDTO", "StoragePlaceDTO", "OutboxDTO"]
+__all__ = [
+    "Base",
+    "OrderDTO",
+    "ArchivedOrderDTO",
+    "CourierDTO",
+    "StoragePlaceDTO",
+    "OutboxDTO",
+    "IdempotencyKeyDTO",
+]
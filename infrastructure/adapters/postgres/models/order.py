@@ -1,6 +1,7 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import Enum, ForeignKey, Integer
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,6 +11,25 @@ from infrastructure.adapters.postgres.models.base import Base
 
 class OrderDTO(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Очередь CREATED разбирается по времени поступления (FIFO)
+        Index(
+            "ix_orders_created_queue",
+            "created_at",
+            postgresql_where=text("status = 'CREATED'"),
+        ),
+        Index(
+            "ix_orders_assigned",
+            "courier_id",
+            postgresql_where=text("status = 'ASSIGNED'"),
+        ),
+        Index(
+            "ix_orders_not_completed",
+            "id",
+            postgresql_where=text("status IN ('CREATED', 'ASSIGNED')"),
+        ),
+        Index("ix_orders_completed_at", "completed_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -32,3 +52,14 @@ class OrderDTO(Base):
         nullable=False,
         default=OrderStatus.CREATED,
     )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    assigned_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -0,0 +1,46 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.domain.model.order.order import OrderStatus
+from infrastructure.adapters.postgres.models.base import Base
+
+
+class ArchivedOrderDTO(Base):
+    """Доставленный заказ, перенесённый из orders архиватором.
+
+    Таблица секционирована по месяцам completed_at; секции создаёт
+    OrderArchiver по мере необходимости. Внешнего ключа на курьера нет:
+    архив не должен мешать удалению курьеров.
+    """
+
+    __tablename__ = "orders_archive"
+    __table_args__ = {"postgresql_partition_by": "RANGE (completed_at)"}
+
+    # Ключ секционирования обязан входить в первичный ключ; поиск по id
+    # идёт по его индексу в каждой секции
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    completed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    courier_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    location_x: Mapped[int] = mapped_column(Integer, nullable=False)
+    location_y: Mapped[int] = mapped_column(Integer, nullable=False)
+    volume: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[OrderStatus] = mapped_column(
+        Enum(
+            OrderStatus, name="order_status", create_constraint=True, native_enum=False
+        ),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    assigned_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Index, String, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -12,6 +12,15 @@ from infrastructure.adapters.postgres.models.base import Base
 
 class OutboxDTO(Base):
     __tablename__ = "outbox"
+    __table_args__ = (
+        # Очередь на отправку: только необработанные сообщения в порядке записи
+        Index(
+            "ix_outbox_unprocessed",
+            "created_at",
+            "id",
+            postgresql_where=text("processed_at IS NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -26,7 +35,5 @@ class OutboxDTO(Base):
         server_default=func.now(),
     )
     processed_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True),
-        nullable=True,
-        index=True,
+        DateTime(timezone=True), nullable=True
     )
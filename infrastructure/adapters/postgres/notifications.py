@@ -0,0 +1,117 @@
+"""Рассылка сообщений между репликами через LISTEN/NOTIFY."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from infrastructure.metrics import NOTIFICATIONS_DROPPED, NOTIFICATIONS_RECEIVED
+
+logger = logging.getLogger(__name__)
+
+# Postgres отклоняет payload от 8000 байт
+MAX_PAYLOAD_BYTES = 7900
+
+
+class NotificationChannel:
+    """Канал Postgres, общий для всех реплик.
+
+    send() ставит сообщение в очередь, run() отправляет его через
+    pg_notify и слушает канал на отдельном соединении. Postgres доставляет
+    уведомление только после фиксации, и каждое соединение получает
+    собственные уведомления, поэтому on_notification вызывается только для
+    сообщений других реплик. Пока соединения нет, уведомления других
+    реплик теряются: после переподключения вызывается on_gap.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        channel: str,
+        on_notification: Callable[[str], None],
+        on_gap: Callable[[], None] = lambda: None,
+        queue_size: int = 1024,
+        reconnect_interval_seconds: float = 2.0,
+    ) -> None:
+        if reconnect_interval_seconds <= 0:
+            raise ValueError("reconnect_interval_seconds должен быть больше 0")
+        self._engine = engine
+        self._channel = channel
+        self._on_notification = on_notification
+        self._on_gap = on_gap
+        self._outbox: asyncio.Queue[str] = asyncio.Queue(queue_size)
+        self._reconnect_interval = reconnect_interval_seconds
+        self._connection: AsyncConnection | None = None
+        self._listened = False
+
+    def send(self, payload: str) -> None:
+        """Отправить сообщение остальным репликам, не дожидаясь отправки."""
+        if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+            raise ValueError(f"Сообщение длиннее {MAX_PAYLOAD_BYTES} байт")
+        try:
+            self._outbox.put_nowait(payload)
+        except asyncio.QueueFull:
+            NOTIFICATIONS_DROPPED.labels(self._channel).inc()
+            logger.warning("Notification queue is full, dropping: %s", self._channel)
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self._serve()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Notification channel %s failed", self._channel)
+            await self.close()
+            await asyncio.sleep(self._reconnect_interval)
+
+    async def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            await connection.close()
+        except Exception:
+            logger.debug("Failed to close notification connection", exc_info=True)
+
+    async def _serve(self) -> None:
+        self._connection = await self._engine.connect()
+        raw = await self._connection.get_raw_connection()
+        driver_connection: Any = raw.driver_connection
+        if driver_connection is None:
+            raise RuntimeError("Соединение с базой закрыто")
+        await driver_connection.add_listener(self._channel, self._receive)
+        if self._listened:
+            self._on_gap()
+        self._listened = True
+
+        while True:
+            try:
+                payload = await asyncio.wait_for(
+                    self._outbox.get(), self._reconnect_interval
+                )
+            except TimeoutError:
+                # Без проверки оборванное соединение молча перестало бы
+                # получать уведомления
+                await driver_connection.execute("SELECT 1")
+                continue
+            try:
+                await driver_connection.execute(
+                    "SELECT pg_notify($1, $2)", self._channel, payload
+                )
+            except Exception:
+                NOTIFICATIONS_DROPPED.labels(self._channel).inc()
+                raise
+
+    def _receive(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        if pid == connection.get_server_pid():
+            return
+        NOTIFICATIONS_RECEIVED.labels(channel).inc()
+        try:
+            self._on_notification(payload)
+        except Exception:
+            logger.exception("Failed to handle notification on %s", channel)
@@ -0,0 +1,83 @@
+"""Маршрутизация чтений на реплику Postgres."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructure.metrics import DB_READS_ROUTED, DB_REPLICA_LAG
+
+logger = logging.getLogger(__name__)
+
+# Реплика, проигравшая весь полученный WAL, не отстаёт, даже если последняя
+# транзакция на основном сервере была давно
+REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+class ReadRouter:
+    """Выбирает фабрику сессий для запросов на чтение.
+
+    Без реплики все чтения идут на основной сервер. С max_lag_seconds
+    отставание реплики проверяется не чаще раза в check_interval_seconds;
+    пока реплика отстаёт сильнее или недоступна, чтения уходят на основной.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replica: async_sessionmaker[AsyncSession] | None = None,
+        max_lag_seconds: float | None = None,
+        check_interval_seconds: float = 1.0,
+    ) -> None:
+        if max_lag_seconds is not None and max_lag_seconds < 0:
+            raise ValueError("max_lag_seconds не может быть отрицательным")
+        if check_interval_seconds < 0:
+            raise ValueError("check_interval_seconds не может быть отрицательным")
+        self._primary = primary
+        self._replica = replica
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self._checked_at: float | None = None
+        self._replica_fresh = False
+
+    async def session_maker(self) -> async_sessionmaker[AsyncSession]:
+        replica = self._replica
+        if replica is not None and (
+            self._max_lag_seconds is None
+            or await self._is_fresh(replica, self._max_lag_seconds)
+        ):
+            DB_READS_ROUTED.labels("replica").inc()
+            return replica
+        DB_READS_ROUTED.labels("primary").inc()
+        return self._primary
+
+    async def _is_fresh(
+        self, replica: async_sessionmaker[AsyncSession], max_lag_seconds: float
+    ) -> bool:
+        now = time.monotonic()
+        if (
+            self._checked_at is not None
+            and now - self._checked_at < self._check_interval_seconds
+        ):
+            return self._replica_fresh
+        # Параллельные запросы на время проверки получают прошлый результат
+        self._checked_at = now
+        try:
+            async with replica() as session:
+                lag = float(await session.scalar(REPLICA_LAG_SQL) or 0)
+        except (OSError, SQLAlchemyError):
+            logger.warning("Replica lag check failed, reading from primary")
+            self._replica_fresh = False
+        else:
+            DB_REPLICA_LAG.set(lag)
+            self._replica_fresh = lag <= max_lag_seconds
+        return self._replica_fresh
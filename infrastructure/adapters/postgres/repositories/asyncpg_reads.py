@@ -0,0 +1,212 @@
+"""Горячие чтения репозиториев напрямую через asyncpg.
+
+Запросы выполняются на соединении текущей сессии трекера мимо ORM: без
+компиляции выражений, identity map и промежуточных DTO. asyncpg кеширует
+подготовленные выражения на соединении, поэтому повторные такты не
+разбирают SQL заново. Места хранения курьера приходят в той же строке
+параллельными массивами.
+
+Прочитанных так агрегатов нет в identity map, и merge() перед записью
+перечитал бы каждую строку. Поэтому update() пишет изменения по
+первичному ключу без чтения: UPDATE строки агрегата и upsert мест
+хранения курьера.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Executable
+
+from core.domain.model.courier.courier import Courier
+from core.domain.model.courier.storage_place import StoragePlace
+from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order, OrderStatus
+from infrastructure.adapters.postgres.models.courier import CourierDTO
+from infrastructure.adapters.postgres.models.order import OrderDTO
+from infrastructure.adapters.postgres.models.storage_place import StoragePlaceDTO
+from infrastructure.adapters.postgres.repositories.courier_repository import (
+    CourierRepository,
+    courier_row,
+    storage_place_row,
+)
+from infrastructure.adapters.postgres.repositories.order_repository import (
+    OrderRepository,
+    order_row,
+)
+
+if TYPE_CHECKING:
+    from infrastructure.adapters.postgres.repositories.tracker import Tracker
+
+# Записи asyncpg поддерживают доступ по имени колонки, как Mapping
+type Row = Mapping[str, Any]
+
+# Все четыре массива упорядочены по id, поэтому их элементы совпадают
+# по позициям
+COURIERS_SQL = """
+SELECT c.id, c.name, c.speed, c.location_x, c.location_y,
+       sp.ids, sp.names, sp.volumes, sp.order_ids
+FROM couriers c
+CROSS JOIN LATERAL (
+    SELECT array_agg(id ORDER BY id) AS ids,
+           array_agg(name ORDER BY id) AS names,
+           array_agg(total_volume ORDER BY id) AS volumes,
+           array_agg(order_id ORDER BY id) AS order_ids
+    FROM storage_places
+    WHERE courier_id = c.id
+) sp
+{where}
+ORDER BY c.id
+"""
+
+ALL_COURIERS_SQL = COURIERS_SQL.format(where="")
+FREE_COURIERS_SQL = COURIERS_SQL.format(
+    where="WHERE NOT EXISTS (SELECT 1 FROM storage_places busy "
+    "WHERE busy.courier_id = c.id AND busy.order_id IS NOT NULL)"
+)
+
+_insert_storage_place = insert(StoragePlaceDTO)
+# Место хранения, добавленное курьеру после чтения, вставляется
+UPSERT_STORAGE_PLACES = _insert_storage_place.on_conflict_do_update(
+    index_elements=[StoragePlaceDTO.id],
+    set_={
+        "name": _insert_storage_place.excluded.name,
+        "total_volume": _insert_storage_place.excluded.total_volume,
+        "order_id": _insert_storage_place.excluded.order_id,
+    },
+)
+
+ORDER_COLUMNS = (
+    "id, courier_id, location_x, location_y, volume, status, "
+    "created_at, assigned_at, completed_at"
+)
+FIRST_CREATED_SQL = (
+    f"SELECT {ORDER_COLUMNS} FROM orders WHERE status = 'CREATED' "
+    "ORDER BY created_at, id LIMIT 1"
+)
+ASSIGNED_SQL = f"SELECT {ORDER_COLUMNS} FROM orders WHERE status = 'ASSIGNED'"
+NOT_COMPLETED_SQL = (
+    f"SELECT {ORDER_COLUMNS} FROM orders WHERE status IN ('CREATED', 'ASSIGNED')"
+)
+
+
+def record_to_courier(row: Row) -> Courier:
+    # Без мест хранения array_agg возвращает NULL во всех четырёх колонках
+    places = (
+        zip(row["ids"], row["names"], row["volumes"], row["order_ids"], strict=True)
+        if row["ids"] is not None
+        else ()
+    )
+    return Courier._restore(
+        id=row["id"],
+        name=row["name"],
+        speed=row["speed"],
+        location=Location._new(row["location_x"], row["location_y"]),
+        storage_places=[
+            StoragePlace._restore(
+                id=place_id, name=name, total_volume=volume, order_id=order_id
+            )
+            for place_id, name, volume, order_id in places
+        ],
+    )
+
+
+def record_to_order(row: Row) -> Order:
+    return Order._new(
+        id=row["id"],
+        location=Location._new(row["location_x"], row["location_y"]),
+        volume=row["volume"],
+        courier_id=row["courier_id"],
+        status=OrderStatus(row["status"]),
+        created_at=row["created_at"],
+        assigned_at=row["assigned_at"],
+        completed_at=row["completed_at"],
+    )
+
+
+class AsyncpgReadsMixin:
+    # Реализованы в репозиториях ORM, с которыми смешивается класс
+    _tracker: Tracker
+    _get_tx_or_db: Callable[[], AsyncSession]
+
+    async def _fetch(self, sql: str) -> list[Row]:
+        session = self._get_tx_or_db()
+        # Несброшенные изменения сессии не видны мимо ORM
+        await session.flush()
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        driver_connection = raw.driver_connection
+        if driver_connection is None:
+            raise RuntimeError("Соединение с базой закрыто")
+        rows: list[Row] = await driver_connection.fetch(sql)
+        return rows
+
+    async def _write(
+        self,
+        aggregate: object,
+        statements: Sequence[tuple[Executable, list[dict[str, Any]]]],
+    ) -> None:
+        self._tracker.track(aggregate)
+
+        session = self._tracker.db()
+
+        is_in_transaction = self._tracker.in_tx()
+        if not is_in_transaction:
+            await self._tracker.begin()
+
+        tx = self._tracker.tx() or session
+
+        try:
+            for statement, rows in statements:
+                if rows:
+                    # Список словарей с первичным ключом — UPDATE по ключу
+                    # без загрузки строк в сессию
+                    await tx.execute(statement, rows)
+            if not is_in_transaction:
+                await self._tracker.commit()
+        except Exception:
+            if not is_in_transaction:
+                await self._tracker.rollback()
+            raise
+
+
+class AsyncpgCourierRepository(AsyncpgReadsMixin, CourierRepository):
+    async def update(self, courier: Courier) -> None:
+        await self._write(
+            courier,
+            [
+                (update(CourierDTO), [courier_row(courier)]),
+                (
+                    UPSERT_STORAGE_PLACES,
+                    [
+                        storage_place_row(sp, courier.id)
+                        for sp in courier.iter_storage_places()
+                    ],
+                ),
+            ],
+        )
+
+    async def get_all(self) -> list[Courier]:
+        return [record_to_courier(row) for row in await self._fetch(ALL_COURIERS_SQL)]
+
+    async def get_all_free(self) -> list[Courier]:
+        return [record_to_courier(row) for row in await self._fetch(FREE_COURIERS_SQL)]
+
+
+class AsyncpgOrderRepository(AsyncpgReadsMixin, OrderRepository):
+    async def update(self, order: Order) -> None:
+        await self._write(order, [(update(OrderDTO), [order_row(order)])])
+
+    async def get_first_created(self) -> Order | None:
+        rows = await self._fetch(FIRST_CREATED_SQL)
+        return record_to_order(rows[0]) if rows else None
+
+    async def get_all_assigned(self) -> list[Order]:
+        return [record_to_order(row) for row in await self._fetch(ASSIGNED_SQL)]
+
+    async def get_all_not_completed(self) -> list[Order]:
+        return [record_to_order(row) for row in await self._fetch(NOT_COMPLETED_SQL)]
@@ -3,11 +3,15 @@ from __future__ import annotations
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrastructure.adapters.postgres.repositories.tracker import Tracker
+from infrastructure.state_version import STATE_VERSION, StateVersion
 
 
 class RepositoryTracker(Tracker):
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self, session: AsyncSession, state_version: StateVersion = STATE_VERSION
+    ) -> None:
         self._session = session
+        self._state_version = state_version
         self._in_transaction = False
         self._tracked: set[object] = set()
 
@@ -41,6 +45,8 @@ class RepositoryTracker(Tracker):
         if self._in_transaction:
             await self._session.commit()
             self._in_transaction = False
+            if self._tracked:
+                self._state_version.bump()
             self._tracked.clear()
 
     async def rollback(self) -> None:
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import uuid
-from typing import TYPE_CHECKING
+from collections.abc import Collection, Sequence
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from core.domain.model.courier.courier import Courier
 from core.domain.model.courier.storage_place import StoragePlace
 from core.domain.model.kernel.location import Location
-from core.ports.courier_repository import CourierRepositoryInterface
+from core.ports.courier_repository import CourierRepositoryInterface, CourierSummary
+from core.ports.pagination import Area, PageRequest
 from infrastructure.adapters.postgres.models.courier import CourierDTO
 from infrastructure.adapters.postgres.models.storage_place import StoragePlaceDTO
+from infrastructure.adapters.postgres.repositories.pagination import keyset_page
 
 if TYPE_CHECKING:
     from infrastructure.adapters.postgres.repositories.tracker import Tracker
@@ -26,7 +29,8 @@ def domain_to_dto(courier: Courier) -> CourierDTO:
         location_x=courier.location.x,
         location_y=courier.location.y,
         storage_places=[
-            storage_place_domain_to_dto(sp, courier.id) for sp in courier.storage_places
+            storage_place_domain_to_dto(sp, courier.id)
+            for sp in courier.iter_storage_places()
         ],
     )
 
@@ -43,32 +47,45 @@ def storage_place_domain_to_dto(
     )
 
 
-def dto_to_domain(dto: CourierDTO) -> Courier:
-    location = Location(x=dto.location_x, y=dto.location_y)
-
-    # Преобразуем storage_places из DTO в доменные модели
-    storage_places = []
-    for sp_dto in dto.storage_places:
-        # Используем _new для восстановления из БД
-        sp = StoragePlace._new(
-            name=sp_dto.name,
-            total_volume=sp_dto.total_volume,
-            order_id=sp_dto.order_id,
-        )
-        # Подменяем id на тот, что из БД (вместо сгенерированного в _new)
-        sp.id = sp_dto.id
-        storage_places.append(sp)
+def courier_row(courier: Courier) -> dict[str, Any]:
+    return {
+        "id": courier.id,
+        "name": courier.name,
+        "speed": courier.speed,
+        "location_x": courier.location.x,
+        "location_y": courier.location.y,
+    }
+
+
+def storage_place_row(
+    storage_place: StoragePlace, courier_id: uuid.UUID
+) -> dict[str, Any]:
+    return {
+        "id": storage_place.id,
+        "courier_id": courier_id,
+        "name": storage_place.name,
+        "total_volume": storage_place.total_volume,
+        "order_id": storage_place.order_id,
+    }
 
-    # Используем _new для восстановления из БД
-    courier = Courier._new(
+
+def dto_to_domain(dto: CourierDTO) -> Courier:
+    # Восстанавливаем агрегат с идентификаторами из БД, без генерации новых
+    return Courier._restore(
+        id=dto.id,
         name=dto.name,
         speed=dto.speed,
-        location=location,
-        storage_places=storage_places,
+        location=Location._new(dto.location_x, dto.location_y),
+        storage_places=[
+            StoragePlace._restore(
+                id=sp_dto.id,
+                name=sp_dto.name,
+                total_volume=sp_dto.total_volume,
+                order_id=sp_dto.order_id,
+            )
+            for sp_dto in dto.storage_places
+        ],
     )
-    # Подменяем id на тот, что из БД
-    courier.id = dto.id
-    return courier
 
 
 class CourierRepository(CourierRepositoryInterface):
@@ -99,6 +116,38 @@ class CourierRepository(CourierRepositoryInterface):
                 await self._tracker.rollback()
             raise
 
+    async def add_many(self, couriers: Sequence[Courier]) -> None:
+        # Словари вместо DTO: SQLAlchemy отправляет пачку многострочными
+        # INSERT ... VALUES без unit of work и identity map
+        await self._insert_many(
+            couriers,
+            [courier_row(courier) for courier in couriers],
+            [
+                storage_place_row(sp, courier.id)
+                for courier in couriers
+                for sp in courier.iter_storage_places()
+            ],
+        )
+
+    async def add_storage_places(
+        self, places: Sequence[tuple[uuid.UUID, StoragePlace]]
+    ) -> None:
+        await self._insert_many(
+            [place for _, place in places],
+            [],
+            [storage_place_row(place, courier_id) for courier_id, place in places],
+        )
+
+    async def get_existing_ids(
+        self, courier_ids: Collection[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        if not courier_ids:
+            return set()
+        session = self._get_tx_or_db()
+        stmt = select(CourierDTO.id).where(CourierDTO.id.in_(courier_ids))
+        result = await session.execute(stmt)
+        return set(result.scalars())
+
     async def update(self, courier: Courier) -> None:
         self._tracker.track(courier)
 
@@ -186,6 +235,65 @@ class CourierRepository(CourierRepositoryInterface):
 
         return free_couriers
 
+    async def get_summaries(
+        self, page: PageRequest, area: Area | None = None
+    ) -> list[CourierSummary]:
+        session = self._get_tx_or_db()
+
+        # Только колонки курьера: места хранения списку не нужны
+        stmt = keyset_page(
+            select(
+                CourierDTO.id,
+                CourierDTO.name,
+                CourierDTO.location_x,
+                CourierDTO.location_y,
+            ),
+            CourierDTO.id,
+            CourierDTO.location_x,
+            CourierDTO.location_y,
+            page,
+            area,
+        )
+        result = await session.execute(stmt)
+
+        return [
+            CourierSummary(
+                id=row.id,
+                name=row.name,
+                location=Location._new(row.location_x, row.location_y),
+            )
+            for row in result
+        ]
+
+    async def _insert_many(
+        self,
+        tracked: Sequence[object],
+        courier_rows: list[dict[str, Any]],
+        storage_place_rows: list[dict[str, Any]],
+    ) -> None:
+        for aggregate in tracked:
+            self._tracker.track(aggregate)
+
+        session = self._tracker.db()
+
+        is_in_transaction = self._tracker.in_tx()
+        if not is_in_transaction:
+            await self._tracker.begin()
+
+        tx = self._tracker.tx() or session
+
+        try:
+            if courier_rows:
+                await tx.execute(insert(CourierDTO), courier_rows)
+            if storage_place_rows:
+                await tx.execute(insert(StoragePlaceDTO), storage_place_rows)
+            if not is_in_transaction:
+                await self._tracker.commit()
+        except Exception:
+            if not is_in_transaction:
+                await self._tracker.rollback()
+            raise
+
     def _get_tx_or_db(self) -> AsyncSession:
         if tx := self._tracker.tx():
             return tx
@@ -1,20 +1,60 @@
 from __future__ import annotations
 
 import uuid
-from typing import TYPE_CHECKING
-
-from sqlalchemy import select
+from collections.abc import Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    bindparam,
+    cast,
+    func,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import array, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from core.domain.model.kernel.location import Location
 from core.domain.model.order.order import Order, OrderStatus
-from core.ports.order_repository import OrderRepositoryInterface
+from core.ports.order_repository import (
+    LATENCY_QUANTILES,
+    LatencyPercentiles,
+    OrderLatencyStats,
+    OrderRepositoryInterface,
+    OrderSummary,
+)
+from core.ports.pagination import Area, PageRequest
 from infrastructure.adapters.postgres.models.order import OrderDTO
+from infrastructure.adapters.postgres.models.order_archive import ArchivedOrderDTO
+from infrastructure.adapters.postgres.repositories.pagination import keyset_page
 
 if TYPE_CHECKING:
     from infrastructure.adapters.postgres.repositories.tracker import Tracker
 
 
+def status_in(*statuses: OrderStatus) -> ColumnElement[bool]:
+    """Фильтр по статусу заказа со статусами, подставленными литералами.
+
+    Частичные индексы по статусу планировщик берёт, только когда видит
+    значение: в generic-плане подготовленного запроса с параметром вместо
+    статуса они не применяются.
+    """
+    return OrderDTO.status.in_(
+        bindparam(
+            "status",
+            list(statuses),
+            type_=OrderDTO.status.type,
+            expanding=True,
+            literal_execute=True,
+            unique=True,
+        )
+    )
+
+
 def domain_to_dto(order: Order) -> OrderDTO:
     return OrderDTO(
         id=order.id,
@@ -23,11 +63,28 @@ def domain_to_dto(order: Order) -> OrderDTO:
         location_y=order.location.y,
         volume=order.volume,
         status=order.status,
+        created_at=order.created_at,
+        assigned_at=order.assigned_at,
+        completed_at=order.completed_at,
     )
 
 
-def dto_to_domain(dto: OrderDTO) -> Order:
-    location = Location(x=dto.location_x, y=dto.location_y)
+def order_row(order: Order) -> dict[str, Any]:
+    return {
+        "id": order.id,
+        "courier_id": order.courier_id,
+        "location_x": order.location.x,
+        "location_y": order.location.y,
+        "volume": order.volume,
+        "status": order.status,
+        "created_at": order.created_at,
+        "assigned_at": order.assigned_at,
+        "completed_at": order.completed_at,
+    }
+
+
+def dto_to_domain(dto: OrderDTO | ArchivedOrderDTO) -> Order:
+    location = Location._new(dto.location_x, dto.location_y)
     # Используем _new для восстановления из БД
     return Order._new(
         id=dto.id,
@@ -35,9 +92,27 @@ def dto_to_domain(dto: OrderDTO) -> Order:
         volume=dto.volume,
         courier_id=dto.courier_id,
         status=dto.status,
+        created_at=dto.created_at,
+        assigned_at=dto.assigned_at,
+        completed_at=dto.completed_at,
     )
 
 
+def _latency_percentiles(
+    start: ColumnElement[Any] | InstrumentedAttribute[Any],
+    end: ColumnElement[Any] | InstrumentedAttribute[Any],
+) -> ColumnElement[list[float]]:
+    seconds = cast(func.extract("epoch", end - start), Float)
+    return func.percentile_cont(array(LATENCY_QUANTILES)).within_group(seconds)
+
+
+def _percentiles(values: Sequence[float] | None) -> LatencyPercentiles | None:
+    if values is None:
+        return None
+    p50, p95, p99 = values
+    return LatencyPercentiles(p50=p50, p95=p95, p99=p99)
+
+
 class OrderRepository(OrderRepositoryInterface):
     def __init__(self, tracker: Tracker) -> None:
         if tracker is None:
@@ -66,6 +141,34 @@ class OrderRepository(OrderRepositoryInterface):
                 await self._tracker.rollback()
             raise
 
+    async def add_if_absent(self, order: Order) -> bool:
+        session = self._tracker.db()
+
+        is_in_transaction = self._tracker.in_tx()
+        if not is_in_transaction:
+            await self._tracker.begin()
+
+        tx = self._tracker.tx() or session
+
+        try:
+            # Повтор с тем же id не нарушает ключ и не обрывает транзакцию,
+            # в том числе при одновременных повторах
+            inserted = await tx.scalar(
+                insert(OrderDTO)
+                .values(order_row(order))
+                .on_conflict_do_nothing(index_elements=[OrderDTO.id])
+                .returning(OrderDTO.id)
+            )
+            if inserted is not None:
+                self._tracker.track(order)
+            if not is_in_transaction:
+                await self._tracker.commit()
+        except Exception:
+            if not is_in_transaction:
+                await self._tracker.rollback()
+            raise
+        return inserted is not None
+
     async def update(self, order: Order) -> None:
         self._tracker.track(order)
 
@@ -90,12 +193,21 @@ class OrderRepository(OrderRepositoryInterface):
     async def get_by_id(self, order_id: str) -> Order | None:
         session = self._get_tx_or_db()
 
-        stmt = select(OrderDTO).where(OrderDTO.id == uuid.UUID(order_id))
+        key = uuid.UUID(order_id)
+
+        stmt = select(OrderDTO).where(OrderDTO.id == key)
         result = await session.execute(stmt)
         dto = result.scalar_one_or_none()
 
         if dto is None:
-            return None
+            # Доставленные заказы со временем переносятся в архив
+            archived = await session.execute(
+                select(ArchivedOrderDTO).where(ArchivedOrderDTO.id == key)
+            )
+            archived_dto = archived.scalar_one_or_none()
+            if archived_dto is None:
+                return None
+            return dto_to_domain(archived_dto)
 
         return dto_to_domain(dto)
 
@@ -104,8 +216,8 @@ class OrderRepository(OrderRepositoryInterface):
 
         stmt = (
             select(OrderDTO)
-            .where(OrderDTO.status == OrderStatus.CREATED)
-            .order_by(OrderDTO.id)
+            .where(status_in(OrderStatus.CREATED))
+            .order_by(OrderDTO.created_at, OrderDTO.id)
             .limit(1)
         )
         result = await session.execute(stmt)
@@ -119,7 +231,7 @@ class OrderRepository(OrderRepositoryInterface):
     async def get_all_assigned(self) -> list[Order]:
         session = self._get_tx_or_db()
 
-        stmt = select(OrderDTO).where(OrderDTO.status == OrderStatus.ASSIGNED)
+        stmt = select(OrderDTO).where(status_in(OrderStatus.ASSIGNED))
         result = await session.execute(stmt)
         dtos = result.scalars().all()
 
@@ -129,13 +241,67 @@ class OrderRepository(OrderRepositoryInterface):
         session = self._get_tx_or_db()
 
         stmt = select(OrderDTO).where(
-            OrderDTO.status.in_([OrderStatus.CREATED, OrderStatus.ASSIGNED])
+            status_in(OrderStatus.CREATED, OrderStatus.ASSIGNED)
         )
         result = await session.execute(stmt)
         dtos = result.scalars().all()
 
         return [dto_to_domain(dto) for dto in dtos]
 
+    async def get_active_summaries(
+        self, page: PageRequest, area: Area | None = None
+    ) -> list[OrderSummary]:
+        session = self._get_tx_or_db()
+
+        # Курсор идёт по частичному индексу ix_orders_not_completed
+        stmt = keyset_page(
+            select(OrderDTO.id, OrderDTO.location_x, OrderDTO.location_y).where(
+                status_in(OrderStatus.CREATED, OrderStatus.ASSIGNED)
+            ),
+            OrderDTO.id,
+            OrderDTO.location_x,
+            OrderDTO.location_y,
+            page,
+            area,
+        )
+        result = await session.execute(stmt)
+
+        return [
+            OrderSummary(
+                id=row.id, location=Location._new(row.location_x, row.location_y)
+            )
+            for row in result
+        ]
+
+    async def get_latency_stats(self, since: datetime) -> OrderLatencyStats:
+        session = self._get_tx_or_db()
+
+        # Окно может быть длиннее срока хранения в orders: доставленные
+        # заказы добираем из архива, секции которого отсекаются по since
+        delivered = union_all(
+            *(
+                select(dto.created_at, dto.assigned_at, dto.completed_at).where(
+                    dto.completed_at >= since
+                )
+                for dto in (OrderDTO, ArchivedOrderDTO)
+            )
+        ).subquery()
+        stmt = select(
+            func.count(),
+            _latency_percentiles(delivered.c.created_at, delivered.c.assigned_at),
+            _latency_percentiles(delivered.c.assigned_at, delivered.c.completed_at),
+            _latency_percentiles(delivered.c.created_at, delivered.c.completed_at),
+        )
+        result = await session.execute(stmt)
+        completed, wait, delivery, total = result.one()
+
+        return OrderLatencyStats(
+            completed=completed,
+            wait=_percentiles(wait),
+            delivery=_percentiles(delivery),
+            total=_percentiles(total),
+        )
+
     def _get_tx_or_db(self) -> AsyncSession:
         if tx := self._tracker.tx():
             return tx
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Select
+from sqlalchemy.orm import InstrumentedAttribute
+
+from core.ports.pagination import Area, PageRequest
+
+
+def keyset_page(
+    stmt: Select,
+    id_column: InstrumentedAttribute[Any],
+    x_column: InstrumentedAttribute[int],
+    y_column: InstrumentedAttribute[int],
+    page: PageRequest,
+    area: Area | None,
+) -> Select:
+    """Страница по возрастанию id: курсор отсекает строки через индекс по id,
+    поэтому стоимость не растёт с номером страницы, в отличие от OFFSET.
+
+    Select без параметров: число и типы колонок у вызывающих разные, а
+    запись параметров Select различается между SQLAlchemy 2.0 и 2.1."""
+    if page.after is not None:
+        stmt = stmt.where(id_column > page.after)
+    if area is not None:
+        stmt = stmt.where(
+            x_column.between(area.min_x, area.max_x),
+            y_column.between(area.min_y, area.max_y),
+        )
+    return stmt.order_by(id_column).limit(page.limit)
@@ -0,0 +1,130 @@
+"""Допуск новых заказов по нагрузке на сервис."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from enum import StrEnum
+
+from infrastructure.circuit_breaker import CircuitBreaker, CircuitState
+from infrastructure.metrics import ADMISSION_REJECTED, ADMISSION_SHEDDING
+from infrastructure.metrics.registry import HistogramSeries
+
+logger = logging.getLogger(__name__)
+
+
+class ShedReason(StrEnum):
+    BACKLOG = "backlog"
+    DB_POOL = "db_pool"
+    GEO = "geo"
+
+
+@dataclass(frozen=True)
+class AdmissionLimits:
+    """Пороги включения и выключения сброса нагрузки.
+
+    Сброс по сигналу включается при значении не ниже high и выключается,
+    только когда значение опустится до low: без зазора между порогами
+    допуск дребезжал бы на границе.
+    """
+
+    backlog_high: int
+    backlog_low: int
+    pool_wait_high_seconds: float
+    pool_wait_low_seconds: float
+    retry_after_seconds: float = 5.0
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.backlog_low <= self.backlog_high:
+            raise ValueError("Нужно 0 <= backlog_low <= backlog_high")
+        if not 0 <= self.pool_wait_low_seconds <= self.pool_wait_high_seconds:
+            raise ValueError("Нужно 0 <= pool_wait_low <= pool_wait_high")
+        if self.retry_after_seconds <= 0:
+            raise ValueError("retry_after_seconds должен быть больше 0")
+
+
+@dataclass(frozen=True)
+class Rejection:
+    reason: ShedReason
+    retry_after_seconds: float
+
+
+class HistogramWindow:
+    """Среднее значение гистограммы с предыдущего обращения."""
+
+    def __init__(self, series: HistogramSeries) -> None:
+        self._series = series
+        self._count = series.count
+        self._sum = series.sum
+
+    def mean(self) -> float:
+        count = self._series.count - self._count
+        total = self._series.sum - self._sum
+        self._count, self._sum = self._series.count, self._series.sum
+        return total / count if count else 0.0
+
+
+class AdmissionController:
+    """Решает, принимать ли новые заказы.
+
+    Очередь CREATED и ожидание соединения из пула передаёт observe()
+    периодическая задача; состояние geo-автомата читается при каждом
+    решении. Пока сброс включён хотя бы по одному сигналу, admit()
+    возвращает отказ с рекомендуемой паузой перед повтором.
+    """
+
+    def __init__(
+        self, limits: AdmissionLimits, geo_breaker: CircuitBreaker | None = None
+    ) -> None:
+        self._limits = limits
+        self._geo_breaker = geo_breaker
+        self._shedding: set[ShedReason] = set()
+        for reason in ShedReason:
+            ADMISSION_SHEDDING.labels(reason).set(0)
+
+    @property
+    def shedding(self) -> frozenset[ShedReason]:
+        return frozenset(self._shedding)
+
+    def observe(self, backlog: int, pool_wait_seconds: float) -> None:
+        limits = self._limits
+        self._apply(
+            ShedReason.BACKLOG,
+            backlog,
+            limits.backlog_high,
+            limits.backlog_low,
+        )
+        self._apply(
+            ShedReason.DB_POOL,
+            pool_wait_seconds,
+            limits.pool_wait_high_seconds,
+            limits.pool_wait_low_seconds,
+        )
+
+    def admit(self, source: str) -> Rejection | None:
+        """Решение по одному заказу; отказы считаются по источнику."""
+        rejection = self.rejection()
+        if rejection is not None:
+            ADMISSION_REJECTED.labels(source, rejection.reason).inc()
+        return rejection
+
+    def rejection(self) -> Rejection | None:
+        """Текущий отказ, если новые заказы сейчас не принимаются."""
+        breaker = self._geo_breaker
+        # Полуоткрытый автомат пропускает пробный вызов: заказ должен дойти до geo
+        if breaker is not None and breaker.state is CircuitState.OPEN:
+            return Rejection(ShedReason.GEO, max(breaker.retry_after(), 1.0))
+        for reason in (ShedReason.BACKLOG, ShedReason.DB_POOL):
+            if reason in self._shedding:
+                return Rejection(reason, self._limits.retry_after_seconds)
+        return None
+
+    def _apply(self, reason: ShedReason, value: float, high: float, low: float) -> None:
+        if reason not in self._shedding and value >= high:
+            self._shedding.add(reason)
+            ADMISSION_SHEDDING.labels(reason).set(1)
+            logger.warning("Load shedding started: %s=%s", reason, value)
+        elif reason in self._shedding and value <= low:
+            self._shedding.discard(reason)
+            ADMISSION_SHEDDING.labels(reason).set(0)
+            logger.info("Load shedding stopped: %s=%s", reason, value)
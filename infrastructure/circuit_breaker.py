@@ -0,0 +1,125 @@
+"""Автомат защиты вызовов внешнего сервиса."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from enum import StrEnum
+
+from infrastructure.metrics import CIRCUIT_BREAKER_REJECTED, CIRCUIT_BREAKER_STATE
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# Значение гаужа состояния: чем больше, тем хуже
+_STATE_LEVEL = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str, retry_after_seconds: float) -> None:
+        super().__init__(f"Сервис {name} временно недоступен")
+        self.name = name
+        self.retry_after_seconds = retry_after_seconds
+
+
+class CircuitBreaker:
+    """Размыкается после failure_threshold сбоев подряд.
+
+    Разомкнутый автомат сразу отклоняет вызовы CircuitOpenError. Через
+    reset_timeout_seconds он пропускает один пробный вызов: успех замыкает
+    автомат, сбой снова размыкает его на reset_timeout_seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold должен быть больше 0")
+        if reset_timeout_seconds <= 0:
+            raise ValueError("reset_timeout_seconds должен быть больше 0")
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self._state_gauge = CIRCUIT_BREAKER_STATE.labels(name)
+        self._rejected = CIRCUIT_BREAKER_REJECTED.labels(name)
+        self._state_gauge.set(_STATE_LEVEL[CircuitState.CLOSED])
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at < self._reset_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def retry_after(self) -> float:
+        """Секунды до пробного вызова; 0, если автомат не разомкнут."""
+        if self._opened_at is None:
+            return 0.0
+        return max(self._reset_timeout - (self._clock() - self._opened_at), 0.0)
+
+    def before_call(self) -> None:
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            self._state_gauge.set(_STATE_LEVEL[state])
+            return
+        self._rejected.inc()
+        # Пока идёт пробный вызов, остальные ждут его исхода
+        raise CircuitOpenError(self._name, self.retry_after() or self._reset_timeout)
+
+    @contextmanager
+    def call(
+        self, is_failure: Callable[[Exception], bool] = lambda _: True
+    ) -> Iterator[None]:
+        """Защищённый вызов: исход фиксируется при любом завершении блока.
+
+        Исключение, для которого is_failure ложно, считается успехом: сервис
+        ответил, неверен сам запрос. Отмена исхода не даёт и только
+        освобождает пробный вызов, иначе автомат остался бы без пробы навсегда.
+        """
+        self.before_call()
+        try:
+            yield
+        except Exception as exc:
+            if is_failure(exc):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        except BaseException:
+            self._trial_in_flight = False
+            raise
+        self.record_success()
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._state_gauge.set(_STATE_LEVEL[CircuitState.CLOSED])
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self._failure_threshold:
+            self._opened_at = self._clock()
+            self._trial_in_flight = False
+            self._state_gauge.set(_STATE_LEVEL[CircuitState.OPEN])
@@ -1,18 +1,43 @@
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import NullPool
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 
 from config.config import settings
-
-async_engine = create_async_engine(
-    settings.database_url,
-    echo=False,
-    pool_pre_ping=True,
+from infrastructure.adapters.postgres.metrics import instrument_engine
+from infrastructure.adapters.postgres.pool import (
+    InstrumentedAsyncPool,
+    install_liveness_check,
 )
+from infrastructure.adapters.postgres.replica import ReadRouter
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_pool_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        connect_args={
+            # Кеш подготовленных выражений SQLAlchemy и самого asyncpg
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "statement_cache_size": settings.db_statement_cache_size,
+        },
+    )
+    instrument_engine(engine)
+    install_liveness_check(engine, idle_seconds=settings.db_pool_ping_idle_seconds)
+    return engine
+
+
+async_engine = _create_engine(settings.database_url)
 
 async_session_maker = async_sessionmaker(
     async_engine,
@@ -20,7 +45,36 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Соединения ведущего (блокировка) и канала изменений (LISTEN) живут всё
+# время работы процесса и не должны занимать место в пуле тактов и запросов
+leader_engine = create_async_engine(settings.database_url, poolclass=NullPool)
+
+replica_engine = (
+    _create_engine(settings.replica_database_url)
+    if settings.replica_database_url
+    else None
+)
+replica_session_maker = (
+    async_sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+    if replica_engine is not None
+    else None
+)
+
+read_router = ReadRouter(
+    primary=async_session_maker,
+    replica=replica_session_maker,
+    max_lag_seconds=settings.db_replica_max_lag_seconds,
+    check_interval_seconds=settings.db_replica_lag_check_interval_seconds,
+)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession]:
     async with async_session_maker() as session:
         yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession]:
+    """Сессия для запросов на чтение: реплика, если она задана и не отстаёт."""
+    session_maker = await read_router.session_maker()
+    async with session_maker() as session:
+        yield session
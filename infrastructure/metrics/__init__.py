@@ -0,0 +1,277 @@
+"""Метрики сервиса доставки, выгружаемые через GET /metrics."""
+
+from infrastructure.metrics.registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+)
+
+REGISTRY = Registry()
+
+# Периодические задачи и обработчики сценариев
+TICK_DURATION = REGISTRY.histogram(
+    "delivery_tick_duration_seconds",
+    "Длительность такта периодической задачи.",
+    ["task"],
+)
+TICK_FAILURES = REGISTRY.counter(
+    "delivery_tick_failures_total",
+    "Такты, завершившиеся исключением.",
+    ["task"],
+)
+TICK_LEADER = REGISTRY.gauge(
+    "delivery_tick_leader", "1, пока процесс выполняет периодические такты."
+)
+TICK_LEADER_CHANGES = REGISTRY.counter(
+    "delivery_tick_leader_changes_total",
+    "Переходы процесса между ведущим и ведомым.",
+)
+HANDLER_DURATION = REGISTRY.histogram(
+    "delivery_handler_duration_seconds",
+    "Длительность выполнения обработчика сценария.",
+    ["handler"],
+)
+ORDERS_CREATED = REGISTRY.counter("delivery_orders_created_total", "Созданные заказы.")
+ORDERS_ASSIGNED = REGISTRY.counter(
+    "delivery_orders_assigned_total", "Заказы, назначенные курьерам."
+)
+ORDERS_COMPLETED = REGISTRY.counter(
+    "delivery_orders_completed_total", "Доставленные заказы."
+)
+ORDERS_ARCHIVED = REGISTRY.counter(
+    "delivery_orders_archived_total", "Доставленные заказы, перенесённые в архив."
+)
+ORDERS_BACKLOG = REGISTRY.gauge(
+    "delivery_orders_created_backlog", "Заказы в статусе CREATED."
+)
+# Задержки заказов измеряются минутами, а не миллисекундами
+ORDER_LATENCY_BUCKETS: tuple[float, ...] = (
+    1,
+    5,
+    15,
+    30,
+    60,
+    120,
+    300,
+    600,
+    1200,
+    1800,
+    3600,
+    7200,
+)
+ADMISSION_SHEDDING = REGISTRY.gauge(
+    "delivery_admission_shedding",
+    "1, пока новые заказы отклоняются по указанной причине.",
+    ["reason"],
+)
+ADMISSION_REJECTED = REGISTRY.counter(
+    "delivery_admission_rejected_total",
+    "Новые заказы, отклонённые контролем допуска.",
+    ["source", "reason"],
+)
+ORDER_WAIT_TIME = REGISTRY.histogram(
+    "delivery_order_wait_seconds",
+    "Время от создания заказа до назначения курьера.",
+    buckets=ORDER_LATENCY_BUCKETS,
+)
+ORDER_DELIVERY_TIME = REGISTRY.histogram(
+    "delivery_order_delivery_seconds",
+    "Время от назначения курьера до доставки заказа.",
+    buckets=ORDER_LATENCY_BUCKETS,
+)
+
+# Outbox
+OUTBOX_RELAYED = REGISTRY.counter(
+    "delivery_outbox_relayed_total", "События outbox, отправленные в Kafka."
+)
+OUTBOX_RELAY_FAILURES = REGISTRY.counter(
+    "delivery_outbox_relay_failures_total", "Неудачные попытки отправки из outbox."
+)
+OUTBOX_PENDING = REGISTRY.gauge(
+    "delivery_outbox_pending_messages", "Необработанные сообщения outbox."
+)
+OUTBOX_LAG = REGISTRY.gauge(
+    "delivery_outbox_lag_seconds",
+    "Возраст самого старого необработанного сообщения outbox.",
+)
+
+# База данных
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "delivery_db_query_duration_seconds",
+    "Длительность SQL-запросов.",
+    ["operation"],
+)
+DB_POOL_SIZE = REGISTRY.gauge("delivery_db_pool_size", "Размер пула соединений.")
+DB_POOL_CHECKED_OUT = REGISTRY.gauge(
+    "delivery_db_pool_checked_out", "Соединения, выданные из пула."
+)
+DB_POOL_OVERFLOW = REGISTRY.gauge(
+    "delivery_db_pool_overflow", "Соединения сверх размера пула."
+)
+DB_POOL_CHECKOUT_DURATION = REGISTRY.histogram(
+    "delivery_db_pool_checkout_seconds",
+    "Ожидание соединения из пула, включая подключение и проверку живости.",
+)
+DB_POOL_OVERFLOW_CONNECTIONS = REGISTRY.counter(
+    "delivery_db_pool_overflow_connections_total",
+    "Соединения, открытые сверх размера пула.",
+)
+DB_POOL_TIMEOUTS = REGISTRY.counter(
+    "delivery_db_pool_timeouts_total",
+    "Запросы, не дождавшиеся соединения за pool_timeout.",
+)
+DB_POOL_LIVENESS_CHECKS = REGISTRY.counter(
+    "delivery_db_pool_liveness_checks_total",
+    "Проверки простаивавших соединений при выдаче из пула.",
+    ["result"],
+)
+DB_REPLICA_LAG = REGISTRY.gauge(
+    "delivery_db_replica_lag_seconds", "Отставание реплики при последней проверке."
+)
+DB_READS_ROUTED = REGISTRY.counter(
+    "delivery_db_reads_routed_total",
+    "Запросы на чтение по серверу, на который они направлены.",
+    ["target"],
+)
+NOTIFICATIONS_RECEIVED = REGISTRY.counter(
+    "delivery_db_notifications_received_total",
+    "Уведомления других реплик, полученные через LISTEN.",
+    ["channel"],
+)
+NOTIFICATIONS_DROPPED = REGISTRY.counter(
+    "delivery_db_notifications_dropped_total",
+    "Уведомления, не отправленные из-за переполненной очереди или сбоя.",
+    ["channel"],
+)
+
+# HTTP
+READ_CACHE_REQUESTS = REGISTRY.counter(
+    "delivery_read_cache_requests_total",
+    "Обращения к кешу ответов на чтение.",
+    ["key", "result"],
+)
+HTTP_NOT_MODIFIED = REGISTRY.counter(
+    "delivery_http_not_modified_total",
+    "Ответы 304 клиентам с актуальным ETag.",
+    ["key"],
+)
+IDEMPOTENCY_REQUESTS = REGISTRY.counter(
+    "delivery_idempotency_requests_total",
+    "POST-запросы с Idempotency-Key по исходу: выполнен или повторён ответ.",
+    ["scope", "result"],
+)
+LIVE_SUBSCRIBERS = REGISTRY.gauge(
+    "delivery_live_subscribers", "Клиенты, подписанные на поток изменений."
+)
+LIVE_MESSAGES_PUBLISHED = REGISTRY.counter(
+    "delivery_live_messages_published_total", "Сообщения потока изменений."
+)
+LIVE_SLOW_CLIENTS_DROPPED = REGISTRY.counter(
+    "delivery_live_slow_clients_dropped_total",
+    "Клиенты потока, отключённые из-за переполненной очереди.",
+)
+
+# Kafka
+KAFKA_PUBLISH_DURATION = REGISTRY.histogram(
+    "delivery_kafka_publish_duration_seconds",
+    "Длительность отправки сообщения в Kafka.",
+    ["topic"],
+)
+KAFKA_PUBLISH_FAILURES = REGISTRY.counter(
+    "delivery_kafka_publish_failures_total",
+    "Сообщения, которые не удалось отправить в Kafka.",
+    ["topic"],
+)
+KAFKA_CONSUMED = REGISTRY.counter(
+    "delivery_kafka_consumed_total", "Прочитанные сообщения Kafka.", ["topic"]
+)
+KAFKA_CONSUME_FAILURES = REGISTRY.counter(
+    "delivery_kafka_consume_failures_total",
+    "Сообщения Kafka, обработка которых завершилась ошибкой.",
+    ["topic"],
+)
+KAFKA_CONSUMER_LAG = REGISTRY.gauge(
+    "delivery_kafka_consumer_lag",
+    "Отставание консьюмера от конца партиции.",
+    ["topic", "partition"],
+)
+KAFKA_CONSUMER_PAUSED = REGISTRY.gauge(
+    "delivery_kafka_consumer_paused",
+    "1, пока консьюмер приостановил чтение партиций из-за нагрузки.",
+    ["topic"],
+)
+
+# gRPC
+GEO_REQUEST_DURATION = REGISTRY.histogram(
+    "delivery_geo_request_duration_seconds", "Длительность запроса к геосервису."
+)
+GEO_REQUEST_FAILURES = REGISTRY.counter(
+    "delivery_geo_request_failures_total",
+    "Неудачные запросы к геосервису.",
+    ["code"],
+)
+CIRCUIT_BREAKER_STATE = REGISTRY.gauge(
+    "delivery_circuit_breaker_state",
+    "Состояние автомата защиты: 0 — замкнут, 1 — пробный вызов, 2 — разомкнут.",
+    ["name"],
+)
+CIRCUIT_BREAKER_REJECTED = REGISTRY.counter(
+    "delivery_circuit_breaker_rejected_total",
+    "Вызовы, отклонённые разомкнутым автоматом защиты.",
+    ["name"],
+)
+
+__all__ = [
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Registry",
+    "TICK_DURATION",
+    "TICK_FAILURES",
+    "TICK_LEADER",
+    "TICK_LEADER_CHANGES",
+    "HANDLER_DURATION",
+    "ORDERS_CREATED",
+    "ORDERS_ASSIGNED",
+    "ORDERS_COMPLETED",
+    "ORDERS_ARCHIVED",
+    "ORDERS_BACKLOG",
+    "ADMISSION_SHEDDING",
+    "ADMISSION_REJECTED",
+    "ORDER_WAIT_TIME",
+    "ORDER_DELIVERY_TIME",
+    "OUTBOX_RELAYED",
+    "OUTBOX_RELAY_FAILURES",
+    "OUTBOX_PENDING",
+    "OUTBOX_LAG",
+    "DB_QUERY_DURATION",
+    "DB_POOL_SIZE",
+    "DB_POOL_CHECKED_OUT",
+    "DB_POOL_OVERFLOW",
+    "DB_POOL_CHECKOUT_DURATION",
+    "DB_POOL_OVERFLOW_CONNECTIONS",
+    "DB_POOL_TIMEOUTS",
+    "DB_POOL_LIVENESS_CHECKS",
+    "DB_REPLICA_LAG",
+    "DB_READS_ROUTED",
+    "NOTIFICATIONS_RECEIVED",
+    "NOTIFICATIONS_DROPPED",
+    "READ_CACHE_REQUESTS",
+    "HTTP_NOT_MODIFIED",
+    "IDEMPOTENCY_REQUESTS",
+    "LIVE_SUBSCRIBERS",
+    "LIVE_MESSAGES_PUBLISHED",
+    "LIVE_SLOW_CLIENTS_DROPPED",
+    "KAFKA_PUBLISH_DURATION",
+    "KAFKA_PUBLISH_FAILURES",
+    "KAFKA_CONSUMED",
+    "KAFKA_CONSUME_FAILURES",
+    "KAFKA_CONSUMER_LAG",
+    "KAFKA_CONSUMER_PAUSED",
+    "GEO_REQUEST_DURATION",
+    "GEO_REQUEST_FAILURES",
+    "CIRCUIT_BREAKER_STATE",
+    "CIRCUIT_BREAKER_REJECTED",
+]
@@ -0,0 +1,298 @@
+"""Минимальный реестр метрик в текстовом формате Prometheus.
+
+Счётчики, гаужи и гистограммы хранят значения в обычных полях объектов
+дочерних серий, поэтому запись метрики — это поиск серии в словаре и
+одно-два арифметических действия. Сервис работает в одном цикле событий,
+блокировки не нужны.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Sequence
+from types import TracebackType
+from typing import Any
+
+# Границы по умолчанию (секунды) — от миллисекунд до десятков секунд
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+logger = logging.getLogger(__name__)
+
+type Collector = Callable[[], Awaitable[None] | None]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric[S]:
+    type_name: str = ""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: dict[tuple[str, ...], S] = {}
+
+    def labels(self, *values: str) -> S:
+        """Серия с указанными значениями меток (в порядке labelnames)."""
+        series = self._series.get(values)
+        if series is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"Метрика {self.name} ожидает метки {self.labelnames}")
+            series = self._new_series()
+            self._series[values] = series
+        return series
+
+    def _new_series(self) -> S:
+        raise NotImplementedError
+
+    def _unlabelled(self) -> S:
+        if self.labelnames:
+            raise ValueError(f"Метрика {self.name} требует метки {self.labelnames}")
+        return self.labels()
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for values, series in self._series.items():
+            lines.extend(self._render_series(values, series))
+        return lines
+
+    def _render_series(self, values: tuple[str, ...], series: S) -> list[str]:
+        raise NotImplementedError
+
+
+class CounterSeries:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Счётчик не может уменьшаться.")
+        self.value += amount
+
+
+class Counter(Metric[CounterSeries]):
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def _new_series(self) -> CounterSeries:
+        return CounterSeries()
+
+    def _render_series(
+        self, values: tuple[str, ...], series: CounterSeries
+    ) -> list[str]:
+        labels = _format_labels(self.labelnames, values)
+        return [f"{self.name}{labels} {_format_value(series.value)}"]
+
+
+class GaugeSeries:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class Gauge(Metric[GaugeSeries]):
+    type_name = "gauge"
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabelled().dec(amount)
+
+    def _new_series(self) -> GaugeSeries:
+        return GaugeSeries()
+
+    def _render_series(self, values: tuple[str, ...], series: GaugeSeries) -> list[str]:
+        labels = _format_labels(self.labelnames, values)
+        return [f"{self.name}{labels} {_format_value(series.value)}"]
+
+
+class Timer:
+    """Контекстный менеджер, записывающий длительность блока в гистограмму."""
+
+    __slots__ = ("_series", "_started")
+
+    def __init__(self, series: HistogramSeries) -> None:
+        self._series = series
+        self._started = 0.0
+
+    def __enter__(self) -> Timer:
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._series.observe(time.perf_counter() - self._started)
+
+
+class HistogramSeries:
+    __slots__ = ("_bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        # Последняя ячейка — значения больше верхней границы (+Inf)
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self) -> Timer:
+        return Timer(self)
+
+
+class Histogram(Metric[HistogramSeries]):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def time(self) -> Timer:
+        return self._unlabelled().time()
+
+    def _new_series(self) -> HistogramSeries:
+        return HistogramSeries(self.buckets)
+
+    def _render_series(
+        self, values: tuple[str, ...], series: HistogramSeries
+    ) -> list[str]:
+        names = (*self.labelnames, "le")
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, math.inf), series.counts, strict=True):
+            cumulative += count
+            labels = _format_labels(names, (*values, _format_value(bound)))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(series.sum)}")
+        lines.append(f"{self.name}_count{labels} {series.count}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric[Any]] = {}
+        self._collectors: list[Collector] = []
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Collector) -> None:
+        """Функция, обновляющая гаужи непосредственно перед выгрузкой."""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    async def collect(self) -> None:
+        # Сбой одного сборщика (например, недоступна БД) не должен
+        # лишать выгрузку остальных метрик.
+        for collector in self._collectors:
+            try:
+                result = collector()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Metrics collector %r failed", collector)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register[M: Metric[Any]](self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Метрика {metric.name} уже зарегистрирована.")
+        self._metrics[metric.name] = metric
+        return metric
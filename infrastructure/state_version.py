@@ -0,0 +1,28 @@
+"""Версия состояния агрегатов, зафиксированного этим процессом."""
+
+from __future__ import annotations
+
+
+class StateVersion:
+    """Монотонный счётчик коммитов, изменивших агрегаты.
+
+    Трекер увеличивает версию после коммита транзакции, в которой были
+    отслежены агрегаты, поэтому кеши чтения могут сравнивать версию вместо
+    повторного запроса к базе. Изменения других процессов счётчик видит,
+    только если о них сообщает канал изменений карты.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self) -> None:
+        self._value = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def bump(self) -> None:
+        self._value += 1
+
+
+STATE_VERSION = StateVersion()
@@ -0,0 +1,11 @@
+from simulation.arrivals import PoissonArrivals
+from simulation.report import SimulationReport
+from simulation.simulator import SimulationConfig, Simulator, simulate
+
+__all__ = [
+    "PoissonArrivals",
+    "SimulationConfig",
+    "SimulationReport",
+    "Simulator",
+    "simulate",
+]
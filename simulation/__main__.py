@@ -0,0 +1,83 @@
+"""Прогон симуляции из командной строки.
+
+Пример: python -m simulation --couriers 20 --rate 120 --hours 24
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections.abc import Sequence
+
+from core.domain.model.courier.courier import DEFAULT_BAG_VOLUME
+from core.domain.model.kernel.grid import MAX_COORDINATE, MIN_COORDINATE, Grid
+from simulation.arrivals import PoissonArrivals
+from simulation.simulator import SimulationConfig, simulate
+
+
+def _int_list(value: str) -> tuple[int, ...]:
+    return tuple(int(item) for item in value.split(","))
+
+
+def _float_list(value: str) -> tuple[float, ...]:
+    return tuple(float(item) for item in value.split(","))
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m simulation",
+        description="Симуляция сервиса доставки быстрее реального времени.",
+    )
+    parser.add_argument("--couriers", type=int, default=10, help="размер флота")
+    parser.add_argument(
+        "--speeds",
+        type=_int_list,
+        default=(1, 2, 3),
+        help="скорости курьеров через запятую, раздаются по кругу",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=60.0, help="средний поток заказов в час"
+    )
+    parser.add_argument(
+        "--profile",
+        type=_float_list,
+        default=None,
+        help="24 почасовых множителя потока через запятую",
+    )
+    parser.add_argument("--hours", type=float, default=24.0, help="длительность")
+    parser.add_argument(
+        "--assignments-per-tick",
+        type=int,
+        default=1,
+        help="сколько заказов назначается за такт",
+    )
+    parser.add_argument("--min-volume", type=int, default=1)
+    parser.add_argument("--max-volume", type=int, default=DEFAULT_BAG_VOLUME)
+    parser.add_argument("--grid-min", type=int, default=MIN_COORDINATE)
+    parser.add_argument("--grid-max", type=int, default=MAX_COORDINATE)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="вывести отчёт в JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    config = SimulationConfig(
+        arrivals=PoissonArrivals(rate_per_hour=args.rate, hourly_profile=args.profile),
+        couriers=args.couriers,
+        courier_speeds=args.speeds,
+        duration_hours=args.hours,
+        assignments_per_tick=args.assignments_per_tick,
+        order_volume=(args.min_volume, args.max_volume),
+        grid=Grid(min_coordinate=args.grid_min, max_coordinate=args.grid_max),
+        seed=args.seed,
+    )
+    report = simulate(config)
+    if args.json:
+        print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    else:
+        print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+SECONDS_PER_HOUR: int = 3600
+
+
+@dataclass(frozen=True)
+class PoissonArrivals:
+    """Пуассоновский поток заказов с почасовым профилем нагрузки.
+
+    rate_per_hour — средняя интенсивность потока. hourly_profile задаёт
+    множитель интенсивности для каждого часа суток (24 значения), так
+    моделируются утренний и вечерний пики. Неоднородный поток строится
+    прореживанием однородного с максимальной интенсивностью.
+    """
+
+    rate_per_hour: float
+    hourly_profile: Sequence[float] | None = None
+
+    def __post_init__(self) -> None:
+        if self.rate_per_hour <= 0:
+            raise ValueError("Интенсивность потока заказов должна быть больше 0.")
+        if self.hourly_profile is not None:
+            if len(self.hourly_profile) != 24:
+                raise ValueError("Почасовой профиль должен содержать 24 значения.")
+            if min(self.hourly_profile) < 0 or max(self.hourly_profile) <= 0:
+                raise ValueError("Множители профиля должны быть неотрицательными.")
+
+    def rate_at(self, time: float) -> float:
+        """Интенсивность потока (заказов в секунду) в момент времени."""
+        rate = self.rate_per_hour / SECONDS_PER_HOUR
+        if self.hourly_profile is None:
+            return rate
+        hour = int(time // SECONDS_PER_HOUR) % 24
+        return rate * self.hourly_profile[hour]
+
+    def arrival_times(self, rng: random.Random, until: float) -> list[float]:
+        """Моменты поступления заказов на отрезке [0, until)."""
+        peak = self.rate_per_hour / SECONDS_PER_HOUR
+        if self.hourly_profile is not None:
+            peak *= max(self.hourly_profile)
+
+        times: list[float] = []
+        time = rng.expovariate(peak)
+        while time < until:
+            if rng.random() * peak < self.rate_at(time):
+                times.append(time)
+            time += rng.expovariate(peak)
+        return times
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import random
+
+from core.domain.model.kernel.location import Location, current_grid
+from core.ports.geo_service_client import GeoServiceClientInterface
+
+
+class RandomGeoServiceClient(GeoServiceClientInterface):
+    """Геосервис симуляции: случайная точка сетки из собственного генератора.
+
+    Улица игнорируется, поэтому адреса заказов распределены по сетке
+    равномерно, а прогон воспроизводим при одинаковом seed.
+    """
+
+    def __init__(self, rng: random.Random) -> None:
+        self._rng = rng
+
+    async def get_location(self, street: str) -> Location:
+        grid = current_grid()
+        return Location(
+            x=self._rng.randint(grid.min_coordinate, grid.max_coordinate),
+            y=self._rng.randint(grid.min_coordinate, grid.max_coordinate),
+        )
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+
+PERCENTILES: tuple[int, ...] = (50, 90, 95, 99)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Перцентиль по методу ближайшего ранга; для пустой выборки — 0."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return float(sorted_values[rank - 1])
+
+
+@dataclass(frozen=True)
+class SimulationReport:
+    simulated_seconds: float
+    wall_seconds: float
+    ticks: int
+    couriers: int
+    orders_created: int
+    orders_assigned: int
+    orders_delivered: int
+    # Заказы в статусе CREATED, ожидающие назначения курьера
+    backlog_final: int
+    backlog_max: int
+    backlog_mean: float
+    courier_utilization: float
+    wait_seconds: dict[str, float]
+    delivery_seconds: dict[str, float]
+
+    @property
+    def throughput_per_hour(self) -> float:
+        if self.simulated_seconds <= 0:
+            return 0.0
+        return self.orders_delivered * 3600 / self.simulated_seconds
+
+    @property
+    def speedup(self) -> float:
+        """Во сколько раз симуляция быстрее реального времени."""
+        if self.wall_seconds <= 0:
+            return math.inf
+        return self.simulated_seconds / self.wall_seconds
+
+    def to_dict(self) -> dict[str, object]:
+        data = asdict(self)
+        data["throughput_per_hour"] = round(self.throughput_per_hour, 2)
+        data["speedup"] = round(self.speedup, 1)
+        return data
+
+    def format(self) -> str:
+        def distribution(values: dict[str, float]) -> str:
+            return ", ".join(f"{name}={value:.0f}с" for name, value in values.items())
+
+        return "\n".join(
+            [
+                f"Смоделировано: {self.simulated_seconds / 3600:.1f} ч "
+                f"за {self.wall_seconds:.2f} с (x{self.speedup:.0f})",
+                f"Курьеров: {self.couriers}, загрузка: {self.courier_utilization:.1%}",
+                f"Заказы: создано {self.orders_created}, "
+                f"назначено {self.orders_assigned}, "
+                f"доставлено {self.orders_delivered}",
+                f"Пропускная способность: {self.throughput_per_hour:.1f} заказов/ч",
+                f"Очередь на назначение: в конце {self.backlog_final}, "
+                f"максимум {self.backlog_max}, в среднем {self.backlog_mean:.1f}",
+                f"Ожидание курьера: {distribution(self.wait_seconds)}",
+                f"Время доставки: {distribution(self.delivery_seconds)}",
+            ]
+        )
+
+
+def summarize(durations: list[float]) -> dict[str, float]:
+    values = sorted(durations)
+    summary = {f"p{q}": percentile(values, q) for q in PERCENTILES}
+    summary["max"] = float(values[-1]) if values else 0.0
+    return summary
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from core.application.use_cases.commands.assign_order import AssignOrderHandler
+from core.application.use_cases.commands.create_order import (
+    CreateOrderCommand,
+    CreateOrderHandler,
+)
+from core.application.use_cases.commands.move_couriers import MoveCouriersHandler
+from core.domain.events.order import OrderCompletedDomainEvent
+from core.domain.model.courier.courier import DEFAULT_BAG_VOLUME, Courier
+from core.domain.model.kernel.grid import Grid
+from core.domain.model.kernel.location import (
+    Location,
+    configure_grid,
+    current_grid,
+)
+from core.domain.model.order.order import OrderStatus
+from core.domain.services import OrderDispatcher, RoutePlanner
+from infrastructure.adapters.memory import (
+    InMemoryCourierRepository,
+    InMemoryOrderRepository,
+    InMemoryOutboxRepository,
+    InMemoryStore,
+    InMemoryTracker,
+)
+from simulation.arrivals import SECONDS_PER_HOUR, PoissonArrivals
+from simulation.geo import RandomGeoServiceClient
+from simulation.report import SimulationReport, summarize
+
+# Сколько событий outbox разбирается за один проход, как в process_outbox_events
+OUTBOX_BATCH_SIZE: int = 100
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """Параметры прогона.
+
+    По умолчанию такт и число назначений за такт совпадают с периодическими
+    задачами сервиса: раз в секунду назначается один заказ и делается
+    один шаг всеми курьерами.
+    """
+
+    arrivals: PoissonArrivals
+    couriers: int = 10
+    # Скорости раздаются курьерам по кругу
+    courier_speeds: tuple[int, ...] = (1, 2, 3)
+    duration_hours: float = 24.0
+    tick_seconds: float = 1.0
+    assignments_per_tick: int = 1
+    order_volume: tuple[int, int] = (1, DEFAULT_BAG_VOLUME)
+    grid: Grid = field(default_factory=Grid)
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.couriers <= 0:
+            raise ValueError("Число курьеров должно быть больше 0.")
+        if not self.courier_speeds or min(self.courier_speeds) <= 0:
+            raise ValueError("Скорости курьеров должны быть больше 0.")
+        if self.duration_hours <= 0 or self.tick_seconds <= 0:
+            raise ValueError("Длительность прогона и такта должны быть больше 0.")
+        if self.assignments_per_tick <= 0:
+            raise ValueError("Число назначений за такт должно быть больше 0.")
+        low, high = self.order_volume
+        if not 0 < low <= high <= DEFAULT_BAG_VOLUME:
+            raise ValueError(
+                f"Объём заказа должен лежать в пределах 1..{DEFAULT_BAG_VOLUME}."
+            )
+
+
+class Simulator:
+    """Дискретно-событийная симуляция сервиса на виртуальных часах.
+
+    Каждый такт выполняет ту же работу, что и периодические задачи сервиса:
+    CreateOrderHandler для поступивших заказов, AssignOrderHandler и
+    MoveCouriersHandler поверх in-memory репозиториев. Время доставки
+    снимается с событий OrderCompleted в outbox. Пока в системе нет
+    активных заказов, часы перескакивают сразу к следующему поступлению.
+    """
+
+    def __init__(self, config: SimulationConfig) -> None:
+        self._config = config
+        self._rng = random.Random(config.seed)
+        self._store = InMemoryStore()
+        self._tracker = InMemoryTracker(self._store)
+        self._couriers = InMemoryCourierRepository(self._tracker)
+        self._orders = InMemoryOrderRepository(self._tracker)
+        self._outbox = InMemoryOutboxRepository(self._tracker)
+
+        self._create_order = CreateOrderHandler(
+            order_repository=self._orders,
+            tracker=self._tracker,
+            geo_service_client=RandomGeoServiceClient(self._rng),
+            outbox_repository=self._outbox,
+        )
+        self._assign_order = AssignOrderHandler(
+            order_repository=self._orders,
+            courier_repository=self._couriers,
+            dispatcher=OrderDispatcher(),
+            tracker=self._tracker,
+        )
+        self._move_couriers = MoveCouriersHandler(
+            order_repository=self._orders,
+            courier_repository=self._couriers,
+            tracker=self._tracker,
+            outbox_repository=self._outbox,
+            route_planner=RoutePlanner(),
+        )
+
+        self._created_at: dict[UUID, float] = {}
+        self._wait_seconds: list[float] = []
+        self._delivery_seconds: list[float] = []
+
+    async def run(self) -> SimulationReport:
+        previous_grid = current_grid()
+        configure_grid(self._config.grid)
+        try:
+            return await self._run()
+        finally:
+            configure_grid(previous_grid)
+
+    async def _run(self) -> SimulationReport:
+        config = self._config
+        started = time.perf_counter()
+        await self._hire_couriers()
+
+        duration = config.duration_hours * SECONDS_PER_HOUR
+        total_ticks = math.ceil(duration / config.tick_seconds)
+        arrivals = config.arrivals.arrival_times(self._rng, until=duration)
+        next_arrival = 0
+
+        backlog_sum = backlog_max = busy_sum = 0
+        tick = 0
+        while tick < total_ticks:
+            now = tick * config.tick_seconds
+            while next_arrival < len(arrivals) and arrivals[next_arrival] <= now:
+                await self._create(arrivals[next_arrival])
+                next_arrival += 1
+
+            if not self._has_active_orders():
+                # Курьеры свободны и стоят на месте: до следующего заказа
+                # такты ничего не меняют, кроме нулевых вкладов в статистику.
+                if next_arrival == len(arrivals):
+                    break
+                tick = max(
+                    tick + 1, math.ceil(arrivals[next_arrival] / config.tick_seconds)
+                )
+                continue
+
+            for _ in range(config.assignments_per_tick):
+                result = await self._assign_order.handle()
+                if result is None:
+                    break
+                self._wait_seconds.append(now - self._created_at[result.order_id])
+
+            await self._move_couriers.handle()
+            await self._drain_outbox(now)
+
+            backlog = len(self._store.order_ids_by_status[OrderStatus.CREATED])
+            backlog_sum += backlog
+            backlog_max = max(backlog_max, backlog)
+            busy_sum += config.couriers - len(self._store.free_courier_ids)
+            tick += 1
+
+        return SimulationReport(
+            simulated_seconds=duration,
+            wall_seconds=time.perf_counter() - started,
+            ticks=total_ticks,
+            couriers=config.couriers,
+            orders_created=len(self._created_at),
+            orders_assigned=len(self._wait_seconds),
+            orders_delivered=len(self._delivery_seconds),
+            backlog_final=len(self._store.order_ids_by_status[OrderStatus.CREATED]),
+            backlog_max=backlog_max,
+            backlog_mean=backlog_sum / total_ticks,
+            courier_utilization=busy_sum / (total_ticks * config.couriers),
+            wait_seconds=summarize(self._wait_seconds),
+            delivery_seconds=summarize(self._delivery_seconds),
+        )
+
+    async def _hire_couriers(self) -> None:
+        grid = self._config.grid
+        speeds = self._config.courier_speeds
+        async with self._tracker.transaction():
+            for i in range(self._config.couriers):
+                courier = Courier.create(
+                    name=f"Курьер {i + 1}",
+                    speed=speeds[i % len(speeds)],
+                    location=Location(
+                        x=self._rng.randint(grid.min_coordinate, grid.max_coordinate),
+                        y=self._rng.randint(grid.min_coordinate, grid.max_coordinate),
+                    ),
+                )
+                await self._couriers.add(courier)
+
+    async def _create(self, arrived_at: float) -> None:
+        order_id = UUID(int=self._rng.getrandbits(128), version=4)
+        await self._create_order.handle(
+            CreateOrderCommand(
+                order_id=order_id,
+                street="",
+                volume=self._rng.randint(*self._config.order_volume),
+            )
+        )
+        self._created_at[order_id] = arrived_at
+
+    def _has_active_orders(self) -> bool:
+        statuses = self._store.order_ids_by_status
+        return bool(statuses[OrderStatus.CREATED] or statuses[OrderStatus.ASSIGNED])
+
+    async def _drain_outbox(self, now: float) -> None:
+        while messages := await self._outbox.get_unprocessed(limit=OUTBOX_BATCH_SIZE):
+            async with self._tracker.transaction():
+                for message in messages:
+                    if isinstance(message.event, OrderCompletedDomainEvent):
+                        created_at = self._created_at[message.event.order_id]
+                        self._delivery_seconds.append(now - created_at)
+                    await self._outbox.mark_processed(message.id)
+
+
+def simulate(config: SimulationConfig) -> SimulationReport:
+    return asyncio.run(Simulator(config).run())
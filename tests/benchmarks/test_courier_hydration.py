@@ -0,0 +1,120 @@
+"""Загрузка курьеров из строк БД без генерации лишних UUID и копий списков."""
+
+import time
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from core.domain.model.courier.courier import Courier
+from core.domain.model.courier.storage_place import StoragePlace
+from core.domain.model.kernel.location import Location
+from infrastructure.adapters.postgres.models.courier import CourierDTO
+from infrastructure.adapters.postgres.models.storage_place import StoragePlaceDTO
+from infrastructure.adapters.postgres.repositories.courier_repository import (
+    dto_to_domain,
+)
+
+COURIERS = 10_000
+REPEATS = 3
+
+
+def _make_dtos(count: int) -> list[CourierDTO]:
+    dtos = []
+    for i in range(count):
+        courier_id = uuid.uuid4()
+        dtos.append(
+            CourierDTO(
+                id=courier_id,
+                name=f"Курьер {i}",
+                speed=1 + i % 3,
+                location_x=1 + i % 10,
+                location_y=1 + i // 10 % 10,
+                storage_places=[
+                    StoragePlaceDTO(
+                        id=uuid.uuid4(),
+                        courier_id=courier_id,
+                        name=name,
+                        total_volume=10,
+                        order_id=None,
+                    )
+                    for name in ("Сумка", "Багажник")
+                ],
+            )
+        )
+    return dtos
+
+
+def _legacy_dto_to_domain(dto: CourierDTO) -> Courier:
+    # Прежний путь: _new генерирует uuid4, который тут же перезаписывается
+    storage_places = []
+    for sp_dto in dto.storage_places:
+        sp = StoragePlace._new(
+            name=sp_dto.name,
+            total_volume=sp_dto.total_volume,
+            order_id=sp_dto.order_id,
+        )
+        sp.id = sp_dto.id
+        storage_places.append(sp)
+    courier = Courier._new(
+        name=dto.name,
+        speed=dto.speed,
+        location=Location(x=dto.location_x, y=dto.location_y),
+        storage_places=storage_places,
+    )
+    courier.id = dto.id
+    return courier
+
+
+def _best_time(dtos: list[CourierDTO], mapper: object) -> float:
+    assert callable(mapper)
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        for dto in dtos:
+            mapper(dto)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@pytest.mark.benchmark
+def test_rehydration_is_faster_than_legacy_path() -> None:
+    dtos = _make_dtos(COURIERS)
+
+    legacy = _best_time(dtos, _legacy_dto_to_domain)
+    restored = _best_time(dtos, dto_to_domain)
+
+    assert restored < legacy
+
+
+def test_rehydration_does_not_generate_ids() -> None:
+    # Проверка по числу операций, а не по времени: она не зависит от шума CI
+    dtos = _make_dtos(10)
+
+    with (
+        patch(
+            "core.domain.model.courier.courier.uuid4", wraps=uuid.uuid4
+        ) as courier_ids,
+        patch(
+            "core.domain.model.courier.storage_place.uuid4", wraps=uuid.uuid4
+        ) as storage_place_ids,
+    ):
+        for dto in dtos:
+            dto_to_domain(dto)
+        restored_calls = courier_ids.call_count + storage_place_ids.call_count
+        for dto in dtos:
+            _legacy_dto_to_domain(dto)
+
+    assert restored_calls == 0
+    assert courier_ids.call_count + storage_place_ids.call_count == 30
+
+
+def test_rehydration_keeps_database_ids() -> None:
+    dto = _make_dtos(1)[0]
+
+    courier = dto_to_domain(dto)
+
+    assert courier.id == dto.id
+    assert [sp.id for sp in courier.iter_storage_places()] == [
+        sp.id for sp in dto.storage_places
+    ]
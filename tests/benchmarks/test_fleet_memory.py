@@ -0,0 +1,55 @@
+"""Бюджет памяти на курьера в синтетическом флоте."""
+
+import tracemalloc
+from uuid import uuid4
+
+import pytest
+
+from core.domain.model.courier.courier import Courier
+from core.domain.model.courier.storage_place import StoragePlace
+from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order
+
+FLEET_SIZE = 10_000
+# Курьер с сумкой по умолчанию: два объекта на __slots__, два UUID и список.
+# С __dict__ у агрегатов выходило около 500 байт.
+MAX_BYTES_PER_COURIER = 450
+
+
+@pytest.mark.benchmark
+def test_fleet_memory_per_courier_within_budget() -> None:
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        fleet = [
+            Courier.create(
+                name="Курьер",
+                speed=2,
+                location=Location._new(1 + i % 10, 1 + i // 10 % 10),
+            )
+            for i in range(FLEET_SIZE)
+        ]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(fleet) == FLEET_SIZE
+    assert (after - before) / FLEET_SIZE < MAX_BYTES_PER_COURIER
+
+
+@pytest.mark.parametrize(
+    "aggregate",
+    [
+        lambda: Courier.create(name="Иван", speed=1, location=Location(x=1, y=1)),
+        lambda: StoragePlace.create(name="Сумка", total_volume=10),
+        lambda: Order.create(id=uuid4(), location=Location(x=1, y=1), volume=1),
+    ],
+    ids=["courier", "storage_place", "order"],
+)
+def test_aggregates_have_no_instance_dict(aggregate: object) -> None:
+    assert callable(aggregate)
+    instance = aggregate()
+
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.unexpected = 1
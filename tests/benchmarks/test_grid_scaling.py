@@ -0,0 +1,74 @@
+"""Стоимость такта не должна зависеть от размера сетки.
+
+Такт воспроизводит доменную работу задач assign_orders и move_couriers:
+распределение заказов диспетчером и шаг каждого курьера по маршруту.
+"""
+
+import random
+import time
+from uuid import uuid4
+
+import pytest
+
+from core.domain.model.courier.courier import Courier
+from core.domain.model.kernel.grid import Grid
+from core.domain.model.kernel.location import Location, configure_grid
+from core.domain.model.order.order import Order
+from core.domain.services import OrderDispatcher, RoutePlanner
+
+FLEET_SIZE = 200
+ORDERS_PER_TICK = 50
+REPEATS = 5
+# Допуск на шум измерений; зависимость от площади сетки дала бы разницу
+# в тысячи раз между 10 × 10 и 100 000 × 100 000.
+MAX_SLOWDOWN = 2.0
+
+
+def _random_location(rng: random.Random, grid: Grid) -> Location:
+    return Location(
+        x=rng.randint(grid.min_coordinate, grid.max_coordinate),
+        y=rng.randint(grid.min_coordinate, grid.max_coordinate),
+    )
+
+
+def _measure_tick(grid: Grid) -> float:
+    configure_grid(grid)
+    best = float("inf")
+    for repeat in range(REPEATS):
+        rng = random.Random(repeat)
+        couriers = [
+            Courier.create(
+                name=f"Курьер {i}", speed=3, location=_random_location(rng, grid)
+            )
+            for i in range(FLEET_SIZE)
+        ]
+        orders = [
+            Order.create(id=uuid4(), location=_random_location(rng, grid), volume=1)
+            for _ in range(ORDERS_PER_TICK)
+        ]
+        dispatcher = OrderDispatcher()
+        planner = RoutePlanner()
+
+        started = time.perf_counter()
+        assigned: dict[object, list[Order]] = {}
+        for order in orders:
+            courier = dispatcher.dispatch(order, couriers)
+            if courier is not None:
+                assigned.setdefault(courier.id, []).append(order)
+        for courier in couriers:
+            courier_orders = assigned.get(courier.id)
+            if courier_orders:
+                route = planner.plan(courier, courier_orders)
+                courier.move(route[0].location)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@pytest.mark.benchmark
+def test_tick_cost_is_independent_of_grid_size() -> None:
+    small = _measure_tick(Grid(min_coordinate=1, max_coordinate=10))
+    city = _measure_tick(Grid(min_coordinate=1, max_coordinate=10_000))
+    huge = _measure_tick(Grid(min_coordinate=1, max_coordinate=100_000))
+
+    assert city < small * MAX_SLOWDOWN
+    assert huge < small * MAX_SLOWDOWN
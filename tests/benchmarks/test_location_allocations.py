@@ -0,0 +1,51 @@
+"""Интернирование Location: повторное создание точек не аллоцирует память."""
+
+import random
+import sys
+import tracemalloc
+from collections.abc import Callable
+
+import pytest
+
+from core.domain.model.kernel.grid import Grid
+from core.domain.model.kernel.location import Location, configure_grid
+
+LOCATIONS = 100_000
+
+
+def _traced_bytes(
+    build: Callable[[int, int], Location], coordinates: list[tuple[int, int]]
+) -> int:
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        locations = [build(x, y) for x, y in coordinates]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return after - before - sys.getsizeof(locations)
+
+
+@pytest.mark.benchmark
+def test_hot_locations_are_not_reallocated() -> None:
+    configure_grid(Grid(min_coordinate=1, max_coordinate=10))
+    rng = random.Random(0)
+    coordinates = [(rng.randint(1, 10), rng.randint(1, 10)) for _ in range(LOCATIONS)]
+
+    allocated = _traced_bytes(Location, coordinates)
+
+    # Вся сетка 10 × 10 — это 100 объектов; без интернирования было бы
+    # LOCATIONS объектов по ~50 байт.
+    assert allocated < 100 * 256
+
+
+@pytest.mark.benchmark
+def test_trusted_constructor_reuses_interned_locations() -> None:
+    configure_grid(Grid(min_coordinate=1, max_coordinate=10_000))
+    rng = random.Random(0)
+    hot = [(rng.randint(1, 10_000), rng.randint(1, 10_000)) for _ in range(100)]
+    coordinates = [rng.choice(hot) for _ in range(LOCATIONS)]
+
+    allocated = _traced_bytes(Location._new, coordinates)
+
+    assert allocated < 100 * 256
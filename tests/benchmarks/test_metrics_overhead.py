@@ -0,0 +1,32 @@
+"""Запись метрик не должна заметно утяжелять горячие пути.
+
+Такт сервиса длится миллисекунды, а запросы к БД — сотни микросекунд;
+замер одной операции с меткой должен стоить единицы микросекунд.
+"""
+
+import time
+
+import pytest
+
+from infrastructure.metrics.registry import Registry
+
+OPERATIONS = 100_000
+# С большим запасом на медленные машины CI
+MAX_MICROSECONDS_PER_OPERATION = 5.0
+
+
+@pytest.mark.benchmark
+def test_timed_observation_with_labels_is_cheap() -> None:
+    registry = Registry()
+    histogram = registry.histogram("tick_seconds", "Такт.", ["task"])
+    counter = registry.counter("ticks_total", "Такты.", ["task"])
+
+    started = time.perf_counter()
+    for _ in range(OPERATIONS):
+        with histogram.labels("assign_orders").time():
+            pass
+        counter.labels("assign_orders").inc()
+    elapsed = time.perf_counter() - started
+
+    assert elapsed / OPERATIONS * 1_000_000 < MAX_MICROSECONDS_PER_OPERATION
+    assert histogram.labels("assign_orders").count == OPERATIONS
@@ -1,4 +1,4 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
 from typing import Any
 
 import pytest
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from config.config import settings
+from core.domain.model.kernel.location import configure_grid, current_grid
 from infrastructure.adapters.postgres.models.base import Base
 
 # Тестовый движок с отдельной базой данных
@@ -62,7 +63,11 @@ async def _clean_tables() -> None:
         await conn.execute(text("SET session_replication_role = 'replica'"))
         # Очищаем все таблицы в правильном порядке
         await conn.execute(
-            text("TRUNCATE TABLE orders, storage_places, couriers CASCADE")
+            text(
+                "TRUNCATE TABLE orders, orders_archive, storage_places, couriers, "
+                "idempotency_keys "
+                "CASCADE"
+            )
         )
         # Включаем проверки обратно
         await conn.execute(text("SET session_replication_role = 'origin'"))
@@ -114,3 +119,11 @@ def mock_tracker() -> Any:
     mock_session.begin.return_value.__aexit__ = AsyncMock()
 
     return RepositoryTracker(mock_session)
+
+
+@pytest.fixture(autouse=True)
+def restore_grid() -> Iterator[None]:
+    """Вернуть границы сетки, если тест их переопределил."""
+    grid = current_grid()
+    yield
+    configure_grid(grid)
@@ -0,0 +1,111 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from core.domain.model.courier.courier import Courier
+from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order
+from infrastructure.adapters.postgres.repositories.asyncpg_reads import (
+    AsyncpgCourierRepository,
+    AsyncpgOrderRepository,
+)
+from infrastructure.adapters.postgres.repositories.courier_repository import (
+    CourierRepository,
+)
+from infrastructure.adapters.postgres.repositories.order_repository import (
+    OrderRepository,
+)
+
+
+def snapshot_courier(courier: Courier) -> tuple[Any, ...]:
+    return (
+        courier.id,
+        courier.name,
+        courier.speed,
+        courier.location,
+        sorted(
+            (sp.id, sp.name, sp.total_volume, sp.order_id)
+            for sp in courier.storage_places
+        ),
+    )
+
+
+def snapshot_order(order: Order) -> tuple[Any, ...]:
+    return (
+        order.id,
+        order.courier_id,
+        order.location,
+        order.volume,
+        order.status,
+        order.created_at,
+        order.assigned_at,
+    )
+
+
+class TestAsyncpgRepositories:
+    @pytest.mark.asyncio
+    async def test_reads_match_orm(self, tracker: Any) -> None:
+        orm_couriers = CourierRepository(tracker)
+        orm_orders = OrderRepository(tracker)
+
+        busy = Courier.create(name="Занят", speed=2, location=Location(x=1, y=1))
+        busy.add_storage_place(name="Багажник", total_volume=30)
+        free = Courier.create(name="Свободен", speed=1, location=Location(x=5, y=5))
+        await orm_couriers.add(busy)
+        await orm_couriers.add(free)
+
+        created = Order.create(id=uuid4(), location=Location(x=2, y=2), volume=1)
+        assigned = Order.create(id=uuid4(), location=Location(x=3, y=3), volume=5)
+        assigned.assign(busy.id)
+        busy.take_order(order_id=assigned.id, volume=assigned.volume)
+        await orm_orders.add(created)
+        await orm_orders.add(assigned)
+        await orm_couriers.update(busy)
+
+        fast_couriers = AsyncpgCourierRepository(tracker)
+        fast_orders = AsyncpgOrderRepository(tracker)
+
+        assert [snapshot_courier(c) for c in await fast_couriers.get_all()] == [
+            snapshot_courier(c) for c in await orm_couriers.get_all()
+        ]
+        assert [c.id for c in await fast_couriers.get_all_free()] == [free.id]
+        assert [snapshot_order(o) for o in await fast_orders.get_all_assigned()] == [
+            snapshot_order(assigned)
+        ]
+        first = await fast_orders.get_first_created()
+        assert first is not None
+        assert snapshot_order(first) == snapshot_order(created)
+        assert {o.id for o in await fast_orders.get_all_not_completed()} == {
+            created.id,
+            assigned.id,
+        }
+
+    @pytest.mark.asyncio
+    async def test_updates_without_loading_rows(self, tracker: Any) -> None:
+        courier = Courier.create(name="Иван", speed=2, location=Location(x=1, y=1))
+        courier.add_storage_place(name="Багажник", total_volume=30)
+        order = Order.create(id=uuid4(), location=Location(x=3, y=3), volume=5)
+        await CourierRepository(tracker).add(courier)
+        await OrderRepository(tracker).add(order)
+
+        fast_couriers = AsyncpgCourierRepository(tracker)
+        fast_orders = AsyncpgOrderRepository(tracker)
+        (loaded,) = await fast_couriers.get_all()
+        first = await fast_orders.get_first_created()
+        assert first is not None
+
+        first.assign(loaded.id)
+        loaded.take_order(order_id=first.id, volume=first.volume)
+        loaded.move(Location(x=2, y=2))
+        loaded.add_storage_place(name="Сумка", total_volume=10)
+        async with tracker.transaction():
+            await fast_orders.update(first)
+            await fast_couriers.update(loaded)
+
+        assert [snapshot_courier(c) for c in await fast_couriers.get_all()] == [
+            snapshot_courier(loaded)
+        ]
+        assert [snapshot_order(o) for o in await fast_orders.get_all_assigned()] == [
+            snapshot_order(first)
+        ]
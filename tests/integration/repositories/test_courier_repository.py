@@ -1,10 +1,12 @@
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 
 from core.domain.model.courier.courier import Courier
+from core.domain.model.courier.storage_place import StoragePlace
 from core.domain.model.kernel.location import Location
+from core.ports.pagination import Area, PageRequest
 from infrastructure.adapters.postgres.repositories.courier_repository import (
     CourierRepository,
 )
@@ -233,6 +235,53 @@ class TestCourierRepository:
             c.name in ["Свободный", "Занятый1", "Занятый2"] for c in all_couriers
         )
 
+    @pytest.mark.asyncio
+    async def test_get_summaries_pages_and_filters(self, tracker: Any) -> None:
+        """Тест постраничной проекции курьеров с фильтром по области."""
+        repository = CourierRepository(tracker)
+        couriers = [
+            Courier.create(name=f"Курьер {i}", speed=2, location=Location(x=i, y=i))
+            for i in range(1, 6)
+        ]
+        for courier in couriers:
+            await repository.add(courier)
+        ids = sorted(c.id for c in couriers)
+
+        first = await repository.get_summaries(PageRequest(limit=3))
+        rest = await repository.get_summaries(PageRequest(after=first[-1].id))
+        nearby = await repository.get_summaries(PageRequest(), Area(1, 1, 2, 2))
+
+        assert [s.id for s in first] == ids[:3]
+        assert [s.id for s in rest] == ids[3:]
+        assert {(s.name, s.location) for s in nearby} == {
+            ("Курьер 1", Location(x=1, y=1)),
+            ("Курьер 2", Location(x=2, y=2)),
+        }
+
+    @pytest.mark.asyncio
+    async def test_add_many_and_add_storage_places(self, tracker: Any) -> None:
+        """Тест пакетной вставки курьеров и мест хранения."""
+        repository = CourierRepository(tracker)
+        couriers = [
+            Courier.create(name=f"Курьер {i}", speed=2, location=Location(x=i, y=i))
+            for i in range(1, 4)
+        ]
+
+        await repository.add_many(couriers)
+        places = [
+            (courier.id, StoragePlace.create(name="Багажник", total_volume=20))
+            for courier in couriers[:2]
+        ]
+        await repository.add_storage_places(places)
+
+        ids = {c.id for c in couriers}
+        assert await repository.get_existing_ids(ids | {uuid4()}) == ids
+        for courier_id, place in places:
+            restored = await repository.get_by_id(str(courier_id))
+            assert restored is not None
+            assert place.id in {p.id for p in restored.storage_places}
+            assert len(restored.storage_places) == 2
+
     @pytest.mark.asyncio
     async def test_get_all_when_empty(self, tracker: Any) -> None:
         """Тест получения всех курьеров когда их нет."""
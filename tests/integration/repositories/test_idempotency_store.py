@@ -0,0 +1,64 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructure.adapters.postgres.idempotency import (
+    IdempotencyStore,
+    StoredResponse,
+)
+
+
+def make_store(db_session: AsyncSession) -> IdempotencyStore:
+    return IdempotencyStore(
+        async_sessionmaker(db_session.bind),
+        ttl=timedelta(hours=1),
+        pending_timeout=timedelta(seconds=30),
+    )
+
+
+class TestIdempotencyStore:
+    @pytest.mark.asyncio
+    async def test_claim_complete_and_replay(self, db_session: AsyncSession) -> None:
+        store = make_store(db_session)
+        now = datetime.now(UTC)
+
+        assert await store.claim("orders", "k", "h", now) is None
+        pending = await store.claim("orders", "k", "h", now)
+        await store.complete("orders", "k", StoredResponse(201, b"{}"))
+        done = await store.claim("orders", "k", "h", now)
+
+        assert pending is not None and pending.response is None
+        assert done is not None
+        assert done.response == StoredResponse(201, b"{}")
+
+    @pytest.mark.asyncio
+    async def test_expired_and_abandoned_keys_are_reclaimed(
+        self, db_session: AsyncSession
+    ) -> None:
+        store = make_store(db_session)
+        now = datetime.now(UTC)
+        await store.claim("orders", "done", "h", now)
+        await store.complete("orders", "done", StoredResponse(201, b"{}"))
+        await store.claim("orders", "abandoned", "h", now)
+
+        later = now + timedelta(minutes=5)
+        assert await store.claim("orders", "abandoned", "h", later) is None
+        assert await store.claim("orders", "done", "h", later) is not None
+        assert (
+            await store.claim("orders", "done", "h2", now + timedelta(hours=2)) is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_release_and_purge(self, db_session: AsyncSession) -> None:
+        store = make_store(db_session)
+        now = datetime.now(UTC)
+        await store.claim("couriers", "failed", "h", now)
+        await store.claim("couriers", "old", "h", now)
+        await store.complete("couriers", "old", StoredResponse(201, b"{}"))
+
+        await store.release("couriers", "failed")
+        purged = await store.purge_expired(now + timedelta(hours=2))
+
+        assert purged == 1
+        assert await store.claim("couriers", "failed", "h", now) is None
@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.adapters.postgres.leader import LeaderElection
+
+LOCK_ID = 4242
+
+
+class TestLeaderElection:
+    @pytest.mark.asyncio
+    async def test_single_leader_and_failover(self, db_session: AsyncSession) -> None:
+        first = LeaderElection(db_session.bind, lock_id=LOCK_ID)
+        second = LeaderElection(db_session.bind, lock_id=LOCK_ID)
+        try:
+            await first.renew()
+            await second.renew()
+
+            assert first.is_leader
+            assert not second.is_leader
+
+            await first.release()
+            await second.renew()
+
+            assert second.is_leader
+            await first.renew()
+            assert not first.is_leader
+        finally:
+            await first.release()
+            await second.release()
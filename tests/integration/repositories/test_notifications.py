@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.adapters.postgres.notifications import NotificationChannel
+
+
+class TestNotificationChannel:
+    @pytest.mark.asyncio
+    async def test_delivers_to_other_replicas_only(
+        self, db_session: AsyncSession
+    ) -> None:
+        sent: list[str] = []
+        received: list[str] = []
+        sender = NotificationChannel(db_session.bind, "test_live", sent.append)
+        receiver = NotificationChannel(db_session.bind, "test_live", received.append)
+        tasks = [asyncio.create_task(c.run()) for c in (sender, receiver)]
+        try:
+            # Уведомления до LISTEN не доставляются
+            await asyncio.sleep(0.2)
+            sender.send('[{"type":"courier_moved"}]')
+            for _ in range(100):
+                if received:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert received == ['[{"type":"courier_moved"}]']
+            assert sent == []
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await sender.close()
+            await receiver.close()
@@ -0,0 +1,88 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.domain.model.courier.courier import Courier
+from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order, OrderStatus
+from infrastructure.adapters.postgres.archive import OrderArchiver
+from infrastructure.adapters.postgres.models.order import OrderDTO
+from infrastructure.adapters.postgres.models.order_archive import ArchivedOrderDTO
+from infrastructure.adapters.postgres.repositories.courier_repository import (
+    CourierRepository,
+)
+from infrastructure.adapters.postgres.repositories.order_repository import (
+    OrderRepository,
+)
+
+
+async def add_completed(
+    repository: OrderRepository, courier: Courier, completed_at: datetime
+) -> Order:
+    created_at = completed_at - timedelta(minutes=30)
+    order = Order.create(
+        id=uuid4(), location=Location(x=2, y=2), volume=1, created_at=created_at
+    )
+    order.assign(courier.id, at=created_at + timedelta(minutes=5))
+    order.complete(at=completed_at)
+    await repository.add(order)
+    return order
+
+
+class TestOrderArchiver:
+    @pytest.mark.asyncio
+    async def test_moves_old_completed_orders(
+        self, tracker: Any, db_session: AsyncSession
+    ) -> None:
+        courier = Courier.create(name="Тест", speed=2, location=Location(x=1, y=1))
+        await CourierRepository(tracker).add(courier)
+        repository = OrderRepository(tracker)
+        now = datetime.now(UTC)
+        # Заказы в двух разных месяцах попадают в разные секции
+        old = [
+            await add_completed(repository, courier, now - timedelta(days=days))
+            for days in (10, 40, 45)
+        ]
+        recent = await add_completed(repository, courier, now - timedelta(hours=1))
+        active = Order.create(id=uuid4(), location=Location(x=3, y=3), volume=1)
+        await repository.add(active)
+        await db_session.commit()
+
+        archiver = OrderArchiver(
+            async_sessionmaker(db_session.bind, expire_on_commit=False),
+            retention=timedelta(days=7),
+            batch_size=2,
+        )
+        archived = await archiver.run(now=now)
+
+        assert archived == 3
+        remaining = await db_session.scalars(select(OrderDTO.id))
+        assert set(remaining) == {recent.id, active.id}
+        assert (
+            await db_session.scalar(select(func.count()).select_from(ArchivedOrderDTO))
+            == 3
+        )
+
+        restored = await repository.get_by_id(str(old[1].id))
+        assert restored is not None
+        assert restored.status is OrderStatus.COMPLETED
+        assert restored.courier_id == courier.id
+        assert restored.completed_at == old[1].completed_at
+
+        # Статистика за окно длиннее срока хранения учитывает архив
+        stats = await repository.get_latency_stats(now - timedelta(days=14))
+        assert stats.completed == 2
+        assert stats.wait is not None
+        assert stats.wait.p50 == pytest.approx(300)
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_archive(self, db_session: AsyncSession) -> None:
+        archiver = OrderArchiver(
+            async_sessionmaker(db_session.bind), retention=timedelta(days=7)
+        )
+
+        assert await archiver.run() == 0
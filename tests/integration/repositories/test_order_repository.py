@@ -1,3 +1,4 @@
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
@@ -5,6 +6,7 @@ import pytest
 
 from core.domain.model.kernel.location import Location
 from core.domain.model.order.order import Order, OrderStatus
+from core.ports.pagination import Area, PageRequest
 from infrastructure.adapters.postgres.repositories.order_repository import (
     OrderRepository,
 )
@@ -99,6 +101,29 @@ class TestOrderRepository:
         assert found_order is not None
         assert found_order.status == OrderStatus.CREATED
 
+    @pytest.mark.asyncio
+    async def test_get_first_created_returns_oldest(self, tracker: Any) -> None:
+        repository = OrderRepository(tracker)
+        now = datetime.now(UTC)
+
+        newer = Order.create(
+            id=uuid4(), location=Location(x=1, y=1), volume=1, created_at=now
+        )
+        await repository.add(newer)
+        older = Order.create(
+            id=uuid4(),
+            location=Location(x=2, y=2),
+            volume=1,
+            created_at=now - timedelta(minutes=5),
+        )
+        await repository.add(older)
+
+        found_order = await repository.get_first_created()
+
+        assert found_order is not None
+        assert found_order.id == older.id
+        assert found_order.created_at == older.created_at
+
     @pytest.mark.asyncio
     async def test_get_first_created_when_none(self, tracker: Any) -> None:
         repository = OrderRepository(tracker)
@@ -165,6 +190,58 @@ class TestOrderRepository:
         assert found_order is not None
         assert found_order.status == OrderStatus.COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_get_latency_stats(self, tracker: Any) -> None:
+        from core.domain.model.courier.courier import Courier
+        from infrastructure.adapters.postgres.repositories.courier_repository import (
+            CourierRepository,
+        )
+
+        courier_repo = CourierRepository(tracker)
+        order_repo = OrderRepository(tracker)
+
+        courier = Courier.create(name="Тест", speed=2, location=Location(x=1, y=1))
+        await courier_repo.add(courier)
+
+        now = datetime.now(UTC)
+        for wait, delivery in ((10, 100), (20, 200), (30, 300)):
+            created_at = now - timedelta(hours=1)
+            order = Order.create(
+                id=uuid4(), location=Location(x=2, y=2), volume=1, created_at=created_at
+            )
+            assigned_at = created_at + timedelta(seconds=wait)
+            order.assign(courier.id, at=assigned_at)
+            order.complete(at=assigned_at + timedelta(seconds=delivery))
+            await order_repo.add(order)
+
+        stats = await order_repo.get_latency_stats(now - timedelta(hours=2))
+        empty = await order_repo.get_latency_stats(now)
+
+        assert stats.completed == 3
+        assert stats.wait is not None
+        assert stats.wait.p50 == pytest.approx(20)
+        assert stats.delivery is not None
+        assert stats.delivery.p50 == pytest.approx(200)
+        assert stats.total is not None
+        assert stats.total.p99 == pytest.approx(327.8)
+        assert empty.completed == 0
+        assert empty.wait is None
+
+    @pytest.mark.asyncio
+    async def test_add_if_absent_skips_existing_id(self, tracker: Any) -> None:
+        repository = OrderRepository(tracker)
+        order = Order.create(id=uuid4(), location=Location(x=2, y=2), volume=1)
+        duplicate = Order.create(id=order.id, location=Location(x=9, y=9), volume=1)
+
+        assert await repository.add_if_absent(order) is True
+        async with tracker.transaction():
+            # Конфликт не обрывает транзакцию: следующие запросы выполняются
+            assert await repository.add_if_absent(duplicate) is False
+            stored = await repository.get_by_id(str(order.id))
+
+        assert stored is not None
+        assert stored.location == Location(x=2, y=2)
+
     @pytest.mark.asyncio
     async def test_add_multiple_orders(self, tracker: Any) -> None:
         repository = OrderRepository(tracker)
@@ -201,3 +278,25 @@ class TestOrderRepository:
         found_order = await repository.get_by_id(str(order.id))
         assert found_order is not None
         assert found_order.volume == 5
+
+    @pytest.mark.asyncio
+    async def test_get_active_summaries(self, tracker: Any) -> None:
+        repository = OrderRepository(tracker)
+        active = [
+            Order.create(id=uuid4(), location=Location(x=i, y=1), volume=1)
+            for i in range(1, 5)
+        ]
+        completed = Order.create(id=uuid4(), location=Location(x=1, y=1), volume=1)
+        completed.assign(uuid4())
+        completed.complete()
+        for order in (*active, completed):
+            await repository.add(order)
+        ids = sorted(o.id for o in active)
+
+        first = await repository.get_active_summaries(PageRequest(limit=2))
+        rest = await repository.get_active_summaries(PageRequest(after=first[-1].id))
+        nearby = await repository.get_active_summaries(PageRequest(), Area(1, 1, 2, 1))
+
+        assert [s.id for s in first] == ids[:2]
+        assert [s.id for s in rest] == ids[2:]
+        assert sorted(s.location.x for s in nearby) == [1, 2]
@@ -0,0 +1,169 @@
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.model.order.order import OrderStatus
+from core.ports.pagination import PageRequest
+from infrastructure.adapters.postgres.models.order import OrderDTO
+from infrastructure.adapters.postgres.models.outbox import OutboxDTO
+from infrastructure.adapters.postgres.repositories.order_repository import (
+    OrderRepository,
+)
+from infrastructure.adapters.postgres.repositories.outbox_repository import (
+    OutboxRepository,
+)
+
+# Доставленных заказов на порядки больше активных — так выглядит таблица
+# через несколько недель работы
+COMPLETED_ROWS = 20_000
+ACTIVE_ROWS = 20
+
+
+@contextmanager
+def captured_statements(session: AsyncSession) -> Iterator[list[tuple[str, Any]]]:
+    statements: list[tuple[str, Any]] = []
+
+    def capture(
+        conn: Any, cursor: Any, statement: str, parameters: Any, *_: Any
+    ) -> None:
+        statements.append((statement, parameters))
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def index_names(plan: Any) -> set[str]:
+    names: set[str] = set()
+    if isinstance(plan, dict):
+        if "Index Name" in plan:
+            names.add(plan["Index Name"])
+        for value in plan.values():
+            names |= index_names(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            names |= index_names(item)
+    return names
+
+
+async def plan_of(
+    session: AsyncSession, query: Callable[[], Awaitable[Any]]
+) -> tuple[set[str], str]:
+    """Индексы из плана запроса, который выполняет репозиторий."""
+    with captured_statements(session) as statements:
+        await query()
+    statement, parameters = statements[-1]
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    )
+    plan = result.scalar_one()
+    return index_names(plan), str(plan)
+
+
+@pytest.fixture
+async def filled_tables(db_session: AsyncSession) -> AsyncIterator[None]:
+    now = datetime.now(UTC)
+    statuses = [OrderStatus.COMPLETED] * COMPLETED_ROWS + [
+        OrderStatus.CREATED,
+        OrderStatus.ASSIGNED,
+    ] * (ACTIVE_ROWS // 2)
+    await db_session.execute(
+        insert(OrderDTO),
+        [
+            {
+                "id": uuid4(),
+                "location_x": 1,
+                "location_y": 1,
+                "volume": 1,
+                "status": status,
+                "created_at": now,
+            }
+            for status in statuses
+        ],
+    )
+    await db_session.execute(
+        insert(OutboxDTO),
+        [
+            {
+                "id": uuid4(),
+                "event_name": "OrderCompletedDomainEvent",
+                "payload": {},
+                "processed_at": now if i >= ACTIVE_ROWS else None,
+            }
+            for i in range(COMPLETED_ROWS)
+        ],
+    )
+    await db_session.commit()
+    await db_session.execute(text("ANALYZE orders"))
+    await db_session.execute(text("ANALYZE outbox"))
+    yield
+    await db_session.execute(text("TRUNCATE TABLE outbox"))
+    await db_session.commit()
+
+
+@pytest.mark.usefixtures("filled_tables")
+class TestQueryPlans:
+    @pytest.mark.asyncio
+    async def test_get_first_created_uses_created_queue_index(
+        self, tracker: Any, db_session: AsyncSession
+    ) -> None:
+        repository = OrderRepository(tracker)
+
+        indexes, plan = await plan_of(db_session, repository.get_first_created)
+
+        assert "ix_orders_created_queue" in indexes, plan
+
+    @pytest.mark.asyncio
+    async def test_get_all_assigned_uses_partial_index(
+        self, tracker: Any, db_session: AsyncSession
+    ) -> None:
+        repository = OrderRepository(tracker)
+
+        indexes, plan = await plan_of(db_session, repository.get_all_assigned)
+
+        assert "ix_orders_assigned" in indexes, plan
+
+    @pytest.mark.asyncio
+    async def test_get_all_not_completed_uses_partial_index(
+        self, tracker: Any, db_session: AsyncSession
+    ) -> None:
+        repository = OrderRepository(tracker)
+
+        indexes, plan = await plan_of(db_session, repository.get_all_not_completed)
+
+        assert "ix_orders_not_completed" in indexes, plan
+
+    @pytest.mark.asyncio
+    async def test_active_summaries_page_uses_partial_index(
+        self, tracker: Any, db_session: AsyncSession
+    ) -> None:
+        repository = OrderRepository(tracker)
+
+        indexes, plan = await plan_of(
+            db_session,
+            lambda: repository.get_active_summaries(PageRequest(after=uuid4())),
+        )
+
+        assert "ix_orders_not_completed" in indexes, plan
+
+    @pytest.mark.asyncio
+    async def test_get_unprocessed_uses_partial_index(
+        self, tracker: Any, db_session: AsyncSession
+    ) -> None:
+        repository = OutboxRepository(tracker)
+
+        indexes, plan = await plan_of(
+            db_session, lambda: repository.get_unprocessed(limit=100)
+        )
+
+        assert "ix_outbox_unprocessed" in indexes, plan
@@ -0,0 +1,20 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructure.adapters.postgres.replica import REPLICA_LAG_SQL, ReadRouter
+
+
+class TestReadRouter:
+    @pytest.mark.asyncio
+    async def test_primary_reports_zero_lag(self, db_session: AsyncSession) -> None:
+        assert await db_session.scalar(REPLICA_LAG_SQL) == 0
+
+    @pytest.mark.asyncio
+    async def test_server_without_lag_is_used_as_replica(
+        self, db_session: AsyncSession
+    ) -> None:
+        primary = async_sessionmaker(db_session.bind)
+        replica = async_sessionmaker(db_session.bind)
+        router = ReadRouter(primary, replica, max_lag_seconds=0)
+
+        assert await router.session_maker() is replica
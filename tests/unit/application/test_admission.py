@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import asyncio
+
+import grpc
+import pytest
+from fastapi import HTTPException
+
+from api.adapters.http.admission import admit_or_raise
+from infrastructure.adapters.grpc.geo_service_client import GeoServiceClient
+from infrastructure.adapters.grpc.geo_stub import GeoStubServer, GeoStubServicer
+from infrastructure.adapters.kafka.base_consumer import BaseKafkaConsumer
+from infrastructure.adapters.kafka.memory_broker import InMemoryBroker
+from infrastructure.admission import (
+    AdmissionController,
+    AdmissionLimits,
+    HistogramWindow,
+    ShedReason,
+)
+from infrastructure.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from infrastructure.metrics import KAFKA_CONSUMER_PAUSED, Histogram
+
+LIMITS = AdmissionLimits(
+    backlog_high=100,
+    backlog_low=50,
+    pool_wait_high_seconds=0.5,
+    pool_wait_low_seconds=0.1,
+    retry_after_seconds=3,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def open_breaker(clock: FakeClock) -> CircuitBreaker:
+    breaker = CircuitBreaker(
+        "test", failure_threshold=2, reset_timeout_seconds=10, clock=clock
+    )
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=2, clock=clock)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_half_open_lets_single_trial_through(self) -> None:
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now = 10
+
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_trial_reopens(self) -> None:
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now = 10
+
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_after() == 10
+
+    def test_trial_ending_with_unexpected_error_reopens(self) -> None:
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now = 10
+
+        with pytest.raises(RuntimeError), breaker.call():
+            raise RuntimeError("канал не создан")
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_cancelled_trial_frees_the_slot(self) -> None:
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now = 10
+
+        with pytest.raises(asyncio.CancelledError), breaker.call():
+            raise asyncio.CancelledError
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        with breaker.call():
+            pass
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_rejected_request_counts_as_success(self) -> None:
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now = 10
+
+        with (
+            pytest.raises(ValueError),
+            breaker.call(is_failure=lambda exc: not isinstance(exc, ValueError)),
+        ):
+            raise ValueError
+
+        assert breaker.state is CircuitState.CLOSED
+
+
+class TestAdmissionController:
+    def test_backlog_shedding_has_hysteresis(self) -> None:
+        controller = AdmissionController(LIMITS)
+
+        controller.observe(backlog=100, pool_wait_seconds=0)
+        rejection = controller.admit("http")
+        controller.observe(backlog=70, pool_wait_seconds=0)
+        still_shedding = controller.admit("http")
+        controller.observe(backlog=50, pool_wait_seconds=0)
+
+        assert rejection is not None
+        assert rejection.reason is ShedReason.BACKLOG
+        assert rejection.retry_after_seconds == 3
+        assert still_shedding is not None
+        assert controller.admit("http") is None
+
+    def test_pool_wait_sheds_until_it_drops_to_low(self) -> None:
+        controller = AdmissionController(LIMITS)
+
+        controller.observe(backlog=0, pool_wait_seconds=0.6)
+        controller.observe(backlog=0, pool_wait_seconds=0.2)
+        assert controller.shedding == {ShedReason.DB_POOL}
+
+        controller.observe(backlog=0, pool_wait_seconds=0.05)
+        assert controller.shedding == set()
+
+    def test_open_geo_breaker_rejects_until_trial(self) -> None:
+        clock = FakeClock()
+        controller = AdmissionController(LIMITS, geo_breaker=open_breaker(clock))
+
+        rejection = controller.admit("kafka")
+        clock.now = 10
+
+        assert rejection is not None
+        assert rejection.reason is ShedReason.GEO
+        assert rejection.retry_after_seconds == 10
+        assert controller.admit("kafka") is None
+
+    def test_limits_require_low_not_above_high(self) -> None:
+        with pytest.raises(ValueError):
+            AdmissionLimits(
+                backlog_high=10,
+                backlog_low=20,
+                pool_wait_high_seconds=1,
+                pool_wait_low_seconds=0,
+            )
+
+    @pytest.mark.parametrize(
+        ("backlog", "pool_wait", "status_code"),
+        [(100, 0.0, 429), (0, 0.5, 503)],
+    )
+    def test_http_rejection_status(
+        self, backlog: int, pool_wait: float, status_code: int
+    ) -> None:
+        controller = AdmissionController(LIMITS)
+        controller.observe(backlog=backlog, pool_wait_seconds=pool_wait)
+
+        with pytest.raises(HTTPException) as error:
+            admit_or_raise(controller)
+
+        assert error.value.status_code == status_code
+        assert error.value.headers == {"Retry-After": "3"}
+
+
+def test_histogram_window_mean_covers_new_observations() -> None:
+    histogram = Histogram("test_wait_seconds", "Тест.")
+    histogram.observe(5)
+    window = HistogramWindow(histogram.labels())
+
+    histogram.observe(1)
+    histogram.observe(3)
+
+    assert window.mean() == 2
+    assert window.mean() == 0
+
+
+class IdleConsumer(BaseKafkaConsumer):
+    async def _process_message(self, data: bytes) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_consumer_pauses_partitions_while_shedding() -> None:
+    broker = InMemoryBroker(default_partitions=2)
+    controller = AdmissionController(LIMITS)
+    transport = broker.consumer("baskets", group_id="delivery")
+    consumer = IdleConsumer(
+        kafka_host="in-memory",
+        topic="baskets",
+        consumer_group="delivery",
+        transport=transport,
+        admission=controller,
+    )
+    await transport.start()
+
+    controller.observe(backlog=100, pool_wait_seconds=0)
+    consumer._apply_admission()
+    paused = transport.paused()
+    controller.observe(backlog=0, pool_wait_seconds=0)
+    consumer._apply_admission()
+
+    assert paused == transport.assignment()
+    assert transport.paused() == set()
+    assert KAFKA_CONSUMER_PAUSED.labels("baskets").value == 0
+    await transport.stop()
+
+
+@pytest.mark.asyncio
+async def test_geo_client_fails_fast_when_breaker_opens() -> None:
+    breaker = CircuitBreaker("geo-test", failure_threshold=2)
+    async with GeoStubServer(GeoStubServicer(error_rate=1.0)) as server:
+        client = GeoServiceClient(server.address, breaker=breaker)
+        for _ in range(2):
+            with pytest.raises(grpc.aio.AioRpcError):
+                await client.get_location("Ленина")
+        with pytest.raises(CircuitOpenError):
+            await client.get_location("Ленина")
+
+    assert server.servicer.stats.requests == 2
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from core.application.use_cases.commands.add_storage_place import (
+    AddStoragePlaceCommand,
+)
+from core.application.use_cases.commands.bulk import MAX_BULK_ITEMS
+from core.application.use_cases.commands.bulk_add_storage_places import (
+    BulkAddStoragePlacesHandler,
+)
+from core.application.use_cases.commands.bulk_create_couriers import (
+    BulkCreateCouriersHandler,
+)
+from core.application.use_cases.commands.create_courier import CreateCourierCommand
+from infrastructure.adapters.memory import (
+    InMemoryCourierRepository,
+    InMemoryStore,
+    InMemoryTracker,
+)
+
+
+@pytest.fixture
+def store() -> InMemoryStore:
+    return InMemoryStore()
+
+
+@pytest.fixture
+def tracker(store: InMemoryStore) -> InMemoryTracker:
+    return InMemoryTracker(store)
+
+
+@pytest.fixture
+def repository(tracker: InMemoryTracker) -> InMemoryCourierRepository:
+    return InMemoryCourierRepository(tracker)
+
+
+class TestBulkCreateCouriersHandler:
+    @pytest.mark.asyncio
+    async def test_creates_valid_items_and_reports_invalid(
+        self, tracker: InMemoryTracker, repository: InMemoryCourierRepository
+    ) -> None:
+        handler = BulkCreateCouriersHandler(repository, tracker)
+
+        results = await handler.handle(
+            [
+                CreateCourierCommand(name="Иван", speed=2),
+                CreateCourierCommand(name=" ", speed=2),
+                CreateCourierCommand(name="Пётр", speed=0),
+                CreateCourierCommand(name="Анна", speed=3),
+            ]
+        )
+
+        assert [r.index for r in results] == [0, 1, 2, 3]
+        assert [r.error is None for r in results] == [True, False, False, True]
+        assert results[1].error == "Имя курьера не может быть пустым."
+        couriers = await repository.get_all()
+        assert {c.id for c in couriers} == {results[0].id, results[3].id}
+        assert all(len(c.storage_places) == 1 for c in couriers)
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_batch(
+        self, tracker: InMemoryTracker, repository: InMemoryCourierRepository
+    ) -> None:
+        handler = BulkCreateCouriersHandler(repository, tracker)
+
+        with pytest.raises(ValueError):
+            await handler.handle(
+                [CreateCourierCommand(name="Иван", speed=1)] * (MAX_BULK_ITEMS + 1)
+            )
+
+        assert await repository.get_all() == []
+
+
+class TestBulkAddStoragePlacesHandler:
+    @pytest.mark.asyncio
+    async def test_adds_places_to_existing_couriers(
+        self, tracker: InMemoryTracker, repository: InMemoryCourierRepository
+    ) -> None:
+        created = await BulkCreateCouriersHandler(repository, tracker).handle(
+            [CreateCourierCommand(name="Иван", speed=2)]
+        )
+        courier_id = created[0].id
+        missing_id = uuid4()
+        handler = BulkAddStoragePlacesHandler(repository, tracker)
+
+        results = await handler.handle(
+            [
+                AddStoragePlaceCommand(courier_id, "Багажник", 20),
+                AddStoragePlaceCommand(missing_id, "Рюкзак", 5),
+                AddStoragePlaceCommand(courier_id, "Коробка", 0),
+                AddStoragePlaceCommand(courier_id, "Рюкзак", 5),
+            ]
+        )
+
+        assert results[1].error == f"Курьер с id {missing_id} не найден."
+        assert results[2].error is not None
+        courier = await repository.get_by_id(str(courier_id))
+        assert courier is not None
+        places = {p.id: p.name for p in courier.storage_places}
+        assert places[results[0].id] == "Багажник"
+        assert places[results[3].id] == "Рюкзак"
+        assert len(places) == 3
@@ -11,6 +11,7 @@ from core.application.use_cases.commands.create_order import (
 )
 from core.domain.events.order import OrderCreatedDomainEvent
 from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order
 from infrastructure.adapters.postgres.repositories.tracker import Tracker
 
 
@@ -39,7 +40,10 @@ class MockTracker(Tracker):
 
 @pytest.fixture
 def order_repository() -> AsyncMock:
-    return AsyncMock()
+    repository = AsyncMock()
+    repository.get_by_id.return_value = None
+    repository.add_if_absent.return_value = True
+    return repository
 
 
 @pytest.fixture
@@ -82,11 +86,13 @@ async def test_create_order_uses_geo_service(
     geo_service_client.get_location.return_value = Location(x=1, y=1)
     command = CreateOrderCommand(order_id=uuid4(), street="Тестировочная", volume=5)
 
-    await handler.handle(command)
+    result = await handler.handle(command)
 
+    assert result.order_id == command.order_id
+    assert result.location == Location(x=1, y=1)
     geo_service_client.get_location.assert_called_once_with("Тестировочная")
-    order_repository.add.assert_called_once()
-    added_order = order_repository.add.call_args[0][0]
+    order_repository.add_if_absent.assert_called_once()
+    added_order = order_repository.add_if_absent.call_args[0][0]
     assert added_order.location == Location(x=1, y=1)
     outbox_repository.add.assert_called_once()
     event = outbox_repository.add.call_args[0][0]
@@ -108,10 +114,10 @@ async def test_create_order_different_streets_give_different_locations(
     command_2 = CreateOrderCommand(order_id=uuid4(), street="Улица 2", volume=3)
 
     await handler.handle(command_1)
-    order_1 = order_repository.add.call_args_list[0][0][0]
+    order_1 = order_repository.add_if_absent.call_args_list[0][0][0]
 
     await handler.handle(command_2)
-    order_2 = order_repository.add.call_args_list[1][0][0]
+    order_2 = order_repository.add_if_absent.call_args_list[1][0][0]
 
     assert order_1.location == Location(x=3, y=4)
     assert order_2.location == Location(x=7, y=2)
@@ -129,5 +135,65 @@ async def test_create_order_passes_volume_to_order(
 
     await handler.handle(command)
 
-    added_order = order_repository.add.call_args[0][0]
+    added_order = order_repository.add_if_absent.call_args[0][0]
     assert added_order.volume == 8
+
+
+@pytest.mark.asyncio
+async def test_create_order_repeated_command_skips_geo_and_writes(
+    order_repository: AsyncMock,
+    geo_service_client: AsyncMock,
+    tracker: MockTracker,
+    outbox_repository: AsyncMock,
+) -> None:
+    handler = CreateOrderHandler(
+        order_repository=order_repository,
+        tracker=tracker,
+        geo_service_client=geo_service_client,
+        outbox_repository=outbox_repository,
+        check_existing=True,
+    )
+    existing = Order.create(id=uuid4(), location=Location(x=2, y=3), volume=5)
+    order_repository.get_by_id.return_value = existing
+    command = CreateOrderCommand(order_id=existing.id, street="Любая улица", volume=5)
+
+    result = await handler.handle(command)
+
+    assert result.created is False
+    assert result.location == Location(x=2, y=3)
+    geo_service_client.get_location.assert_not_called()
+    order_repository.add_if_absent.assert_not_called()
+    outbox_repository.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_order_does_not_look_up_order_by_default(
+    handler: CreateOrderHandler,
+    order_repository: AsyncMock,
+    geo_service_client: AsyncMock,
+) -> None:
+    geo_service_client.get_location.return_value = Location(x=1, y=1)
+
+    await handler.handle(
+        CreateOrderCommand(order_id=uuid4(), street="Любая улица", volume=1)
+    )
+
+    order_repository.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_order_duplicate_insert_writes_no_event(
+    handler: CreateOrderHandler,
+    order_repository: AsyncMock,
+    geo_service_client: AsyncMock,
+    outbox_repository: AsyncMock,
+) -> None:
+    geo_service_client.get_location.return_value = Location(x=1, y=1)
+    order_repository.add_if_absent.return_value = False
+
+    result = await handler.handle(
+        CreateOrderCommand(order_id=uuid4(), street="Любая улица", volume=1)
+    )
+
+    assert result.created is False
+    outbox_repository.add.assert_not_called()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import random
+
+import grpc
+import pytest
+
+from core.domain.model.kernel.location import Location
+from infrastructure.adapters.grpc.geo_service_client import GeoServiceClient
+from infrastructure.adapters.grpc.geo_stub import (
+    FixedLatency,
+    GeoStubServer,
+    GeoStubServicer,
+    LogNormalLatency,
+    UniformLatency,
+    parse_latency,
+    street_location,
+)
+
+
+def test_street_location_is_deterministic_and_within_bounds() -> None:
+    first = street_location("Ленина", 1, 10)
+
+    assert first == street_location("Ленина", 1, 10)
+    assert all(1 <= coordinate <= 10 for coordinate in first)
+
+
+def test_parse_latency() -> None:
+    assert parse_latency("fixed:5") == FixedLatency(5)
+    assert parse_latency("uniform:1,10") == UniformLatency(1, 10)
+    assert parse_latency("lognormal:20,0.5") == LogNormalLatency(20, 0.5)
+    with pytest.raises(ValueError):
+        parse_latency("gamma:1")
+
+
+def test_lognormal_latency_median() -> None:
+    rng = random.Random(1)
+    latency = LogNormalLatency(median_ms=20, sigma=0.5)
+
+    samples = sorted(latency.sample(rng) for _ in range(2001))
+
+    assert samples[1000] == pytest.approx(0.020, rel=0.1)
+
+
+@pytest.mark.asyncio
+async def test_client_receives_deterministic_location() -> None:
+    async with GeoStubServer() as server:
+        location = await GeoServiceClient(server.address).get_location("Ленина")
+
+    assert location == Location(*street_location("Ленина"))
+    assert server.servicer.stats.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_injected_errors_return_unavailable() -> None:
+    async with GeoStubServer(GeoStubServicer(error_rate=1.0)) as server:
+        with pytest.raises(grpc.aio.AioRpcError) as error:
+            await GeoServiceClient(server.address).get_location("Ленина")
+
+    assert error.value.code() is grpc.StatusCode.UNAVAILABLE
+    assert server.servicer.stats.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_queues_requests() -> None:
+    servicer = GeoStubServicer(latency=FixedLatency(20), max_concurrency=2)
+    async with GeoStubServer(servicer) as server:
+        client = GeoServiceClient(server.address)
+        await asyncio.gather(*(client.get_location(f"Улица {i}") for i in range(6)))
+
+    assert servicer.stats.max_in_flight == 2
+    assert servicer.stats.requests == 6
+
+
+@pytest.mark.asyncio
+async def test_busy_server_rejects_when_configured() -> None:
+    servicer = GeoStubServicer(
+        latency=FixedLatency(50), max_concurrency=1, reject_when_busy=True
+    )
+    async with GeoStubServer(servicer) as server:
+        client = GeoServiceClient(server.address)
+        results = await asyncio.gather(
+            client.get_location("Ленина"),
+            client.get_location("Мира"),
+            return_exceptions=True,
+        )
+
+    errors = [r for r in results if isinstance(r, grpc.aio.AioRpcError)]
+    assert [e.code() for e in errors] == [grpc.StatusCode.RESOURCE_EXHAUSTED]
+    assert servicer.stats.rejected == 1
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from api.adapters.http.idempotency import (
+    IdempotencyKeyReused,
+    IdempotentRequestInProgress,
+    IdempotentResponses,
+)
+from infrastructure.adapters.postgres.idempotency import (
+    IdempotencyRecord,
+    StoredResponse,
+)
+from infrastructure.metrics import IDEMPOTENCY_REQUESTS
+
+
+class FakeStore:
+    """IdempotencyStore без базы: ключи живут в словаре."""
+
+    ttl = timedelta(hours=1)
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str], IdempotencyRecord] = {}
+        self.claims = 0
+
+    async def claim(
+        self, scope: str, key: str, request_hash: str
+    ) -> IdempotencyRecord | None:
+        self.claims += 1
+        record = self.rows.get((scope, key))
+        if record is None:
+            self.rows[(scope, key)] = IdempotencyRecord(request_hash, None)
+        return record
+
+    async def complete(self, scope: str, key: str, response: StoredResponse) -> None:
+        record = self.rows[(scope, key)]
+        self.rows[(scope, key)] = IdempotencyRecord(record.request_hash, response)
+
+    async def release(self, scope: str, key: str) -> None:
+        del self.rows[(scope, key)]
+
+
+class Runner:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> StoredResponse:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return StoredResponse(201, f'{{"n": {self.calls}}}'.encode())
+
+
+@pytest.fixture
+def store() -> FakeStore:
+    return FakeStore()
+
+
+@pytest.fixture
+def responses(store: FakeStore) -> IdempotentResponses:
+    return IdempotentResponses(store)  # type: ignore[arg-type]
+
+
+class TestIdempotentResponses:
+    @pytest.mark.asyncio
+    async def test_repeat_is_answered_from_memory(
+        self, store: FakeStore, responses: IdempotentResponses
+    ) -> None:
+        run = Runner()
+        replays = IDEMPOTENCY_REQUESTS.labels("orders", "replayed_memory")
+        before = replays.value
+
+        first = await responses.execute("orders", "k", "h", run)
+        second = await responses.execute("orders", "k", "h", run)
+
+        assert first == (StoredResponse(201, b'{"n": 1}'), False)
+        assert second == (StoredResponse(201, b'{"n": 1}'), True)
+        assert run.calls == 1
+        assert store.claims == 1
+        assert replays.value == before + 1
+
+    @pytest.mark.asyncio
+    async def test_repeat_in_other_process_is_answered_from_store(
+        self, store: FakeStore, responses: IdempotentResponses
+    ) -> None:
+        run = Runner()
+        await responses.execute("orders", "k", "h", run)
+        other = IdempotentResponses(store)  # type: ignore[arg-type]
+
+        response, replayed = await other.execute("orders", "k", "h", run)
+
+        assert replayed
+        assert response.body == b'{"n": 1}'
+        assert run.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_run_once(
+        self, responses: IdempotentResponses
+    ) -> None:
+        run = Runner()
+
+        results = await asyncio.gather(
+            *(responses.execute("couriers", "k", "h", run) for _ in range(5))
+        )
+
+        assert run.calls == 1
+        assert [replayed for _, replayed in results].count(False) == 1
+
+    @pytest.mark.asyncio
+    async def test_key_reused_with_other_body_is_rejected(
+        self, responses: IdempotentResponses
+    ) -> None:
+        await responses.execute("couriers", "k", "h1", Runner())
+
+        with pytest.raises(IdempotencyKeyReused):
+            await responses.execute("couriers", "k", "h2", Runner())
+
+    @pytest.mark.asyncio
+    async def test_request_in_progress_elsewhere_is_rejected(
+        self, store: FakeStore, responses: IdempotentResponses
+    ) -> None:
+        store.rows[("orders", "k")] = IdempotencyRecord("h", None)
+
+        with pytest.raises(IdempotentRequestInProgress):
+            await responses.execute("orders", "k", "h", Runner())
+
+    @pytest.mark.asyncio
+    async def test_failed_request_releases_key(
+        self, store: FakeStore, responses: IdempotentResponses
+    ) -> None:
+        async def fail() -> StoredResponse:
+            raise RuntimeError("geo недоступен")
+
+        with pytest.raises(RuntimeError):
+            await responses.execute("orders", "k", "h", fail)
+        run = Runner()
+        _, replayed = await responses.execute("orders", "k", "h", run)
+
+        assert not replayed
+        assert run.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_is_bounded(self, store: FakeStore) -> None:
+        responses = IdempotentResponses(store, max_entries=2)  # type: ignore[arg-type]
+        for key in ("a", "b", "c"):
+            await responses.execute("orders", key, "h", Runner())
+
+        await responses.execute("orders", "a", "h", Runner())
+
+        # Вытесненный из памяти ключ повторяется из хранилища
+        assert store.claims == 4
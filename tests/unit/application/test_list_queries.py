@@ -0,0 +1,96 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+
+from api.adapters.http.v1.pagination import area_filter
+from api.adapters.http.v1.schemas import LocationSchema
+from core.application.use_cases.queries.get_active_orders import GetActiveOrdersHandler
+from core.application.use_cases.queries.get_couriers import GetCouriersHandler
+from core.domain.model.kernel.grid import Grid
+from core.domain.model.kernel.location import Location, configure_grid
+from core.ports.courier_repository import CourierSummary
+from core.ports.order_repository import OrderSummary
+from core.ports.pagination import Area, PageRequest
+
+
+def courier_summaries(count: int) -> list[CourierSummary]:
+    return [
+        CourierSummary(id=uuid4(), name="Пеший", location=Location(x=1, y=1))
+        for _ in range(count)
+    ]
+
+
+class TestGetCouriersHandler:
+    @pytest.mark.asyncio
+    async def test_full_page_returns_cursor(self) -> None:
+        repository = MagicMock()
+        summaries = courier_summaries(2)
+        repository.get_summaries = AsyncMock(return_value=summaries)
+        area = Area(1, 1, 5, 5)
+
+        page = await GetCouriersHandler(repository).handle(PageRequest(limit=2), area)
+
+        assert [c.id for c in page.items] == [s.id for s in summaries]
+        assert page.next_cursor == summaries[-1].id
+        repository.get_summaries.assert_awaited_once_with(PageRequest(limit=2), area)
+
+    @pytest.mark.asyncio
+    async def test_partial_page_is_last(self) -> None:
+        repository = MagicMock()
+        repository.get_summaries = AsyncMock(return_value=courier_summaries(1))
+
+        page = await GetCouriersHandler(repository).handle(PageRequest(limit=2))
+
+        assert page.next_cursor is None
+
+
+class TestGetActiveOrdersHandler:
+    @pytest.mark.asyncio
+    async def test_default_page(self) -> None:
+        repository = MagicMock()
+        summary = OrderSummary(id=uuid4(), location=Location(x=2, y=3))
+        repository.get_active_summaries = AsyncMock(return_value=[summary])
+
+        page = await GetActiveOrdersHandler(repository).handle()
+
+        assert [(o.id, o.location) for o in page.items] == [
+            (summary.id, summary.location)
+        ]
+        assert page.next_cursor is None
+        repository.get_active_summaries.assert_awaited_once_with(PageRequest(), None)
+
+
+class TestPaginationParams:
+    def test_page_limit_bounds(self) -> None:
+        with pytest.raises(ValueError):
+            PageRequest(limit=0)
+        with pytest.raises(ValueError):
+            PageRequest(limit=1001)
+
+    def test_area_is_optional(self) -> None:
+        assert area_filter(None, None, None, None) is None
+        assert area_filter(1, 2, 3, 4) == Area(1, 2, 3, 4)
+
+    def test_partial_or_inverted_area_rejected(self) -> None:
+        with pytest.raises(RequestValidationError):
+            area_filter(1, 2, None, None)
+        with pytest.raises(RequestValidationError):
+            area_filter(5, 1, 1, 5)
+
+    def test_area_bounds_are_inclusive(self) -> None:
+        area = Area(1, 1, 3, 3)
+
+        assert area.contains(Location(x=3, y=1))
+        assert not area.contains(Location(x=4, y=1))
+
+
+class TestLocationSchema:
+    def test_stored_point_outside_narrowed_grid_is_serialized(self) -> None:
+        configure_grid(Grid(min_coordinate=1, max_coordinate=5))
+        stored = Location._new(9, 9)
+
+        schema = LocationSchema(x=stored.x, y=stored.y)
+
+        assert schema.model_dump() == {"x": 9, "y": 9}
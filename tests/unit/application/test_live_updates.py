@@ -0,0 +1,217 @@
+import asyncio
+import json
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from api.adapters.http.live_updates import (
+    Broadcaster,
+    courier_moved,
+    encode_event,
+    order_assigned,
+    order_created,
+    relay_payloads,
+)
+from api.adapters.http.v1.live import KEEPALIVE, _stream
+from api.tasks import move_couriers
+from core.application.use_cases.commands.assign_order import AssignResult
+from core.application.use_cases.commands.create_order import CreateOrderResult
+from core.application.use_cases.commands.move_couriers import MoveResult
+from core.domain.model.kernel.location import Location
+from infrastructure.metrics import LIVE_SLOW_CLIENTS_DROPPED
+
+
+def decode(message: bytes) -> tuple[str, object]:
+    event, data = message.decode().removesuffix("\n\n").split("\n")
+    return event.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+class TestBroadcaster:
+    @pytest.mark.asyncio
+    async def test_every_subscriber_gets_the_same_bytes(self) -> None:
+        broadcaster = Broadcaster()
+
+        with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+            broadcaster.publish_deltas([{"type": "courier_moved"}])
+
+            assert await first.get() is await second.get()
+
+        assert broadcaster.subscribers == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_is_disconnected(self) -> None:
+        broadcaster = Broadcaster(queue_size=2)
+        dropped = LIVE_SLOW_CLIENTS_DROPPED.labels().value
+
+        with broadcaster.subscribe() as slow, broadcaster.subscribe() as fast:
+            for i in range(3):
+                broadcaster.publish(str(i).encode())
+                assert await fast.get() == str(i).encode()
+
+            # Очередь сброшена: медленный клиент получает только конец потока
+            assert await slow.get() is None
+            assert broadcaster.subscribers == 1
+
+        assert LIVE_SLOW_CLIENTS_DROPPED.labels().value == dropped + 1
+
+    def test_empty_deltas_are_not_published(self) -> None:
+        broadcaster = Broadcaster()
+
+        with broadcaster.subscribe() as subscription:
+            broadcaster.publish_deltas([])
+
+            assert subscription.offer(b"x")
+
+
+class TestRelay:
+    def test_deltas_are_relayed_without_local_subscribers(self) -> None:
+        relay = MagicMock()
+        broadcaster = Broadcaster(relay=relay)
+
+        broadcaster.publish_deltas([{"type": "courier_moved"}])
+
+        relay.assert_called_once_with('[{"type":"courier_moved"}]')
+
+    @pytest.mark.asyncio
+    async def test_received_deltas_reach_subscribers_but_are_not_relayed(
+        self,
+    ) -> None:
+        relay = MagicMock()
+        broadcaster = Broadcaster(relay=relay)
+
+        with broadcaster.subscribe() as subscription:
+            broadcaster.receive_deltas('[{"type":"order_assigned"}]')
+
+            assert decode(await subscription.get()) == (
+                "delta",
+                [{"type": "order_assigned"}],
+            )
+        relay.assert_not_called()
+
+    def test_payloads_are_split_under_limit(self) -> None:
+        deltas = [{"type": "courier_moved", "n": i} for i in range(50)]
+
+        payloads = list(relay_payloads(deltas, limit=200))
+
+        assert len(payloads) > 1
+        assert all(len(payload.encode()) <= 200 for payload in payloads)
+        assert [d for p in payloads for d in json.loads(p)] == deltas
+
+    @pytest.mark.asyncio
+    async def test_disconnect_all_ends_every_stream(self) -> None:
+        broadcaster = Broadcaster()
+
+        with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+            broadcaster.disconnect_all()
+
+            assert await first.get() is None
+            assert await second.get() is None
+            assert broadcaster.subscribers == 0
+
+
+class TestDeltas:
+    def test_event_encoding(self) -> None:
+        message = encode_event("delta", [{"type": "order_created"}])
+
+        assert message.endswith(b"\n\n")
+        assert decode(message) == ("delta", [{"type": "order_created"}])
+
+    def test_move_result_produces_completed_orders(self) -> None:
+        courier_id, order_id = uuid4(), uuid4()
+        result = MoveResult(
+            courier_id=courier_id,
+            courier_name="Пеший",
+            new_location=(3, 4),
+            order_completed=True,
+            delivery_times=[timedelta(seconds=5)],
+            completed_order_ids=[order_id],
+        )
+
+        assert courier_moved(result) == [
+            {
+                "type": "courier_moved",
+                "courierId": str(courier_id),
+                "location": {"x": 3, "y": 4},
+            },
+            {
+                "type": "order_completed",
+                "orderId": str(order_id),
+                "courierId": str(courier_id),
+            },
+        ]
+
+    def test_order_deltas(self) -> None:
+        order_id, courier_id = uuid4(), uuid4()
+
+        created = order_created(
+            CreateOrderResult(order_id=order_id, location=Location(x=2, y=5))
+        )
+        assigned = order_assigned(
+            AssignResult(
+                order_id=order_id, courier_id=courier_id, wait_time=timedelta()
+            )
+        )
+
+        assert created["location"] == {"x": 2, "y": 5}
+        assert assigned == {
+            "type": "order_assigned",
+            "orderId": str(order_id),
+            "courierId": str(courier_id),
+        }
+
+
+class TestStream:
+    @pytest.mark.asyncio
+    async def test_streams_messages_until_disconnected(self) -> None:
+        broadcaster = Broadcaster(queue_size=1)
+        stream = _stream(broadcaster, keepalive_seconds=60)
+
+        assert await anext(stream) == KEEPALIVE
+        broadcaster.publish(b"first")
+        assert await anext(stream) == b"first"
+        broadcaster.publish(b"second")
+        broadcaster.publish(b"overflow")
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
+        assert broadcaster.subscribers == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_stream_sends_keepalive(self) -> None:
+        broadcaster = Broadcaster()
+        stream = _stream(broadcaster, keepalive_seconds=0.01)
+
+        assert await anext(stream) == KEEPALIVE
+        assert await asyncio.wait_for(anext(stream), timeout=1) == KEEPALIVE
+        await stream.aclose()
+
+        assert broadcaster.subscribers == 0
+
+
+class TestMoveCouriersPublishes:
+    @pytest.mark.asyncio
+    async def test_tick_results_are_broadcast(self) -> None:
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__ = AsyncMock()
+        session_maker.return_value.__aexit__ = AsyncMock(return_value=False)
+        broadcaster = Broadcaster()
+        result = MoveResult(
+            courier_id=uuid4(),
+            courier_name="Пеший",
+            new_location=(1, 2),
+            order_completed=False,
+        )
+
+        with (
+            patch("api.tasks.async_session_maker", session_maker),
+            patch("api.tasks.MoveCouriersHandler") as MockHandler,
+            patch("api.tasks.get_live_broadcaster", return_value=broadcaster),
+            broadcaster.subscribe() as subscription,
+        ):
+            MockHandler.return_value.handle = AsyncMock(return_value=[result])
+
+            await move_couriers()
+
+            assert decode(await subscription.get()) == ("delta", courier_moved(result))
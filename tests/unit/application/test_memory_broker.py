@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from infrastructure.adapters.kafka import order_events_pb2
+from infrastructure.adapters.kafka.base_consumer import BaseKafkaConsumer, RetryLater
+from infrastructure.adapters.kafka.memory_broker import InMemoryBroker
+from infrastructure.adapters.kafka.order_events_producer import KafkaOrderEventsProducer
+from infrastructure.adapters.kafka.replay import FileReplaySource, record_stream
+from infrastructure.adapters.kafka.transport import TopicPartition
+
+
+class CollectingConsumer(BaseKafkaConsumer):
+    def __init__(self, broker: InMemoryBroker) -> None:
+        super().__init__(
+            kafka_host="in-memory",
+            topic="baskets",
+            consumer_group="delivery",
+            transport=broker.consumer(
+                "baskets", group_id="delivery", auto_offset_reset="earliest"
+            ),
+        )
+        self.received: list[bytes] = []
+
+    async def _process_message(self, data: bytes) -> None:
+        if data == b"broken":
+            raise ValueError("broken message")
+        self.received.append(data)
+
+
+class FlakyConsumer(CollectingConsumer):
+    """Первую попытку обработать b"retry" откладывает."""
+
+    def __init__(self, broker: InMemoryBroker) -> None:
+        super().__init__(broker)
+        self.postponed = 0
+
+    async def _process_message(self, data: bytes) -> None:
+        if data == b"retry" and not self.postponed:
+            self.postponed += 1
+            raise RetryLater(0)
+        await super()._process_message(data)
+
+
+class TestInMemoryBroker:
+    @pytest.mark.asyncio
+    async def test_same_key_goes_to_same_partition(self) -> None:
+        broker = InMemoryBroker(default_partitions=4)
+        producer = broker.producer()
+
+        first = await producer.send_and_wait("orders", b"1", key=b"order-1")
+        second = await producer.send_and_wait("orders", b"2", key=b"order-1")
+
+        assert first.partition == second.partition
+        assert (first.offset, second.offset) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_acks_zero_does_not_return_offset(self) -> None:
+        broker = InMemoryBroker()
+
+        metadata = await broker.producer(acks=0).send_and_wait("orders", b"1")
+
+        assert metadata.offset == -1
+        assert broker.end_offset(TopicPartition("orders", 0)) == 1
+
+    @pytest.mark.asyncio
+    async def test_group_members_split_partitions(self) -> None:
+        broker = InMemoryBroker(default_partitions=4)
+        first = broker.consumer("orders", group_id="g")
+        second = broker.consumer("orders", group_id="g")
+
+        await first.start()
+        await second.start()
+
+        assert len(first.assignment()) == len(second.assignment()) == 2
+        assert first.assignment().isdisjoint(second.assignment())
+
+    @pytest.mark.asyncio
+    async def test_getmany_respects_max_records_and_commits(self) -> None:
+        broker = InMemoryBroker(default_partitions=2)
+        await broker.producer().send_batch("orders", [b"1", b"2", b"3"])
+        consumer = broker.consumer("orders", group_id="g", auto_offset_reset="earliest")
+        await consumer.start()
+
+        batch = await consumer.getmany(max_records=2)
+        rest = await consumer.getmany(max_records=2)
+
+        assert sum(len(records) for records in batch.values()) == 2
+        assert sum(len(records) for records in rest.values()) == 1
+        await consumer.stop()
+        assert broker.lag("g", "orders") == 0
+
+    @pytest.mark.asyncio
+    async def test_paused_partitions_are_not_fetched(self) -> None:
+        broker = InMemoryBroker()
+        await broker.producer().send_batch("orders", [b"1"])
+        consumer = broker.consumer("orders", group_id="g", auto_offset_reset="earliest")
+        await consumer.start()
+
+        consumer.pause(*consumer.assignment())
+        paused = await consumer.getmany()
+        consumer.resume(*consumer.paused())
+        resumed = await consumer.getmany()
+
+        assert paused == {}
+        assert [r.value for records in resumed.values() for r in records] == [b"1"]
+
+    @pytest.mark.asyncio
+    async def test_partition_handed_over_from_committed_offset(self) -> None:
+        broker = InMemoryBroker()
+        await broker.producer().send_batch("orders", [b"1", b"2"])
+        first = broker.consumer("orders", group_id="g", auto_offset_reset="earliest")
+        await first.start()
+        await first.getmany(max_records=1)
+        second = broker.consumer("orders", group_id="g", auto_offset_reset="earliest")
+        await second.start()
+
+        await first.stop()
+        batch = await second.getmany()
+
+        assert [r.value for records in batch.values() for r in records] == [b"2"]
+
+    @pytest.mark.asyncio
+    async def test_getmany_waits_for_new_records(self) -> None:
+        broker = InMemoryBroker()
+        consumer = broker.consumer("orders", group_id="g")
+        await consumer.start()
+
+        async def produce_later() -> None:
+            await asyncio.sleep(0.01)
+            await broker.producer().send_and_wait("orders", b"late")
+
+        task = asyncio.create_task(produce_later())
+        batch = await consumer.getmany(timeout_ms=1000)
+        await task
+
+        assert [r.value for records in batch.values() for r in records] == [b"late"]
+
+
+@pytest.mark.asyncio
+async def test_order_events_producer_publishes_through_transport() -> None:
+    broker = InMemoryBroker()
+    producer = KafkaOrderEventsProducer(
+        kafka_host="in-memory", topic="orders", transport=broker.producer()
+    )
+    order_id = uuid4()
+
+    await producer.publish_order_created(order_id)
+
+    [record] = broker.read(TopicPartition("orders", 0), 0, 10)
+    event = order_events_pb2.OrderCreatedIntegrationEvent()  # type: ignore[attr-defined]
+    event.ParseFromString(record.value)
+    assert event.order_id == str(order_id)
+
+
+@pytest.mark.asyncio
+async def test_base_consumer_processes_batches_and_skips_failures() -> None:
+    broker = InMemoryBroker(default_partitions=2)
+    await broker.producer().send_batch("baskets", [b"a", b"broken", b"b"])
+    consumer = CollectingConsumer(broker)
+
+    await consumer.start()
+    for _ in range(100):
+        if len(consumer.received) == 2:
+            break
+        await asyncio.sleep(0.001)
+    await consumer.stop()
+
+    assert sorted(consumer.received) == [b"a", b"b"]
+    assert broker.lag("delivery", "baskets") == 0
+
+
+@pytest.mark.asyncio
+async def test_base_consumer_rereads_postponed_message() -> None:
+    broker = InMemoryBroker(default_partitions=2)
+    await broker.producer().send_batch("baskets", [b"a", b"retry", b"b", b"c", b"d"])
+    consumer = FlakyConsumer(broker)
+
+    await consumer.start()
+    for _ in range(100):
+        if len(consumer.received) == 5:
+            break
+        await asyncio.sleep(0.001)
+    await consumer.stop()
+
+    assert consumer.postponed == 1
+    # Ни отложенное сообщение, ни остаток пачки не потеряны и не повторены
+    assert sorted(consumer.received) == [b"a", b"b", b"c", b"d", b"retry"]
+    assert broker.lag("delivery", "baskets") == 0
+
+
+@pytest.mark.asyncio
+async def test_file_replay_source_paces_messages(tmp_path: Path) -> None:
+    path = tmp_path / "baskets.jsonl"
+    record_stream(path, [b"1", b"2", b"3"])
+    broker = InMemoryBroker()
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    sent = await FileReplaySource(path, rate=100).replay(broker.producer(), "baskets")
+
+    assert sent == 3
+    assert loop.time() - started >= 0.02
+    assert broker.end_offset(TopicPartition("baskets", 0)) == 3
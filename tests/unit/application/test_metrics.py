@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from api.adapters.http import metrics as metrics_endpoint
+from api.tasks import run_periodic
+from infrastructure.metrics import REGISTRY, TICK_DURATION, TICK_FAILURES
+from infrastructure.metrics.registry import Registry
+
+
+class TestRegistry:
+    def test_counter_and_gauge_render_with_labels(self) -> None:
+        registry = Registry()
+        counter = registry.counter("requests_total", "Запросы.", ["code"])
+        gauge = registry.gauge("queue_size", "Очередь.")
+
+        counter.labels("200").inc()
+        counter.labels("200").inc(2)
+        gauge.set(5)
+
+        text = registry.render()
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{code="200"} 3' in text
+        assert "queue_size 5" in text
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        registry = Registry()
+        histogram = registry.histogram("latency_seconds", "Задержка.", buckets=[0.1, 1])
+
+        for value in (0.05, 0.5, 0.7, 3.0):
+            histogram.observe(value)
+
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{le="1"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_count 4" in lines
+        assert "latency_seconds_sum 4.25" in lines
+
+    def test_label_values_are_escaped(self) -> None:
+        registry = Registry()
+        counter = registry.counter("errors_total", "Ошибки.", ["message"])
+
+        counter.labels('bad "quote"\n').inc()
+
+        assert 'errors_total{message="bad \\"quote\\"\\n"} 1' in registry.render()
+
+    def test_wrong_labels_rejected(self) -> None:
+        registry = Registry()
+        counter = registry.counter("errors_total", "Ошибки.", ["code"])
+
+        with pytest.raises(ValueError):
+            counter.inc()
+        with pytest.raises(ValueError):
+            counter.labels("a", "b")
+        with pytest.raises(ValueError):
+            registry.counter("errors_total", "Повтор.")
+
+    @pytest.mark.asyncio
+    async def test_failing_collector_does_not_break_collection(self) -> None:
+        registry = Registry()
+        gauge = registry.gauge("backlog", "Очередь.")
+
+        def broken() -> None:
+            raise RuntimeError("database is down")
+
+        async def backlog() -> None:
+            gauge.set(7)
+
+        registry.add_collector(broken)
+        registry.add_collector(backlog)
+        await registry.collect()
+
+        assert "backlog 7" in registry.render()
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_serves_text_format() -> None:
+    response = await metrics_endpoint.metrics()
+
+    assert response.media_type.startswith("text/plain; version=0.0.4")
+    assert b"# TYPE delivery_tick_duration_seconds histogram" in response.body
+
+
+@pytest.mark.asyncio
+async def test_run_periodic_records_tick_duration_and_failures() -> None:
+    calls = 0
+
+    async def task() -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("boom")
+
+    duration = TICK_DURATION.labels("metrics_test")
+    failures = TICK_FAILURES.labels("metrics_test")
+    count_before, failures_before = duration.count, failures.value
+
+    periodic = asyncio.create_task(run_periodic(task, interval=0, name="metrics_test"))
+    await asyncio.sleep(0.01)
+    periodic.cancel()
+
+    assert duration.count - count_before >= 3
+    assert failures.value - failures_before == 1
+    assert 'task="metrics_test"' in REGISTRY.render()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from core.application.use_cases.commands.move_couriers import MoveCouriersHandler
+from core.domain.events.order import OrderCompletedDomainEvent
+from core.domain.model.courier.courier import Courier
+from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order, OrderStatus
+from core.domain.services.route_planner import RoutePlanner
+from infrastructure.adapters.postgres.repositories.tracker import Tracker
+
+
+class MockTracker(Tracker):
+    def tx(self):
+        return None
+
+    def db(self):
+        return None
+
+    def in_tx(self):
+        return False
+
+    def track(self, aggregate):
+        pass
+
+    async def begin(self) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+@pytest.fixture
+def order_repository() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def courier_repository() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def outbox_repository() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def route_planner() -> RoutePlanner:
+    return RoutePlanner()
+
+
+@pytest.fixture
+def handler(
+    order_repository: AsyncMock,
+    courier_repository: AsyncMock,
+    outbox_repository: AsyncMock,
+    route_planner: RoutePlanner,
+) -> MoveCouriersHandler:
+    return MoveCouriersHandler(
+        order_repository=order_repository,
+        courier_repository=courier_repository,
+        tracker=MockTracker(),
+        outbox_repository=outbox_repository,
+        route_planner=route_planner,
+    )
+
+
+def assign(order: Order, courier: Courier) -> None:
+    order.pull_events()
+    order.assign(courier.id)
+    courier.take_order(order_id=order.id, volume=order.volume)
+
+
+@pytest.mark.asyncio
+async def test_move_couriers_delivers_all_orders_of_courier(
+    handler: MoveCouriersHandler,
+    order_repository: AsyncMock,
+    courier_repository: AsyncMock,
+    outbox_repository: AsyncMock,
+) -> None:
+    courier = Courier.create(name="Иван", speed=1, location=Location(x=1, y=1))
+    courier.add_storage_place(name="Багажник", total_volume=10)
+    far = Order.create(id=uuid4(), location=Location(x=1, y=4), volume=1)
+    near = Order.create(id=uuid4(), location=Location(x=1, y=2), volume=1)
+    assign(far, courier)
+    assign(near, courier)
+    courier_repository.get_all.return_value = [courier]
+
+    delivered_at_tick: dict[str, int] = {}
+    for tick in range(1, 10):
+        active = [o for o in (far, near) if o.status is OrderStatus.ASSIGNED]
+        if not active:
+            break
+        order_repository.get_all_assigned.return_value = active
+        await handler.handle()
+        for name, order in (("far", far), ("near", near)):
+            if order.status is OrderStatus.COMPLETED:
+                delivered_at_tick.setdefault(name, tick)
+
+    assert delivered_at_tick == {"near": 1, "far": 3}
+    assert all(place.order_id is None for place in courier.storage_places)
+    events = [call.args[0] for call in outbox_repository.add.call_args_list]
+    assert [e.order_id for e in events] == [near.id, far.id]
+    assert all(isinstance(e, OrderCompletedDomainEvent) for e in events)
+
+
+@pytest.mark.asyncio
+async def test_move_couriers_completes_orders_sharing_location(
+    handler: MoveCouriersHandler,
+    order_repository: AsyncMock,
+    courier_repository: AsyncMock,
+    route_planner: RoutePlanner,
+) -> None:
+    courier = Courier.create(name="Иван", speed=2, location=Location(x=1, y=1))
+    courier.add_storage_place(name="Багажник", total_volume=10)
+    first = Order.create(id=uuid4(), location=Location(x=2, y=2), volume=1)
+    second = Order.create(id=uuid4(), location=Location(x=2, y=2), volume=1)
+    assign(first, courier)
+    assign(second, courier)
+    order_repository.get_all_assigned.return_value = [first, second]
+    courier_repository.get_all.return_value = [courier]
+
+    results = await handler.handle()
+
+    assert results[0].order_completed is True
+    assert results[0].delivery_times == [first.delivery_time, second.delivery_time]
+    assert results[0].completed_order_ids == [first.id, second.id]
+    assert first.status is OrderStatus.COMPLETED
+    assert second.status is OrderStatus.COMPLETED
+    assert order_repository.update.call_count == 2
+    assert courier.id not in route_planner._routes
+
+
+@pytest.mark.asyncio
+async def test_move_couriers_completes_order_without_assigned_at(
+    handler: MoveCouriersHandler,
+    order_repository: AsyncMock,
+    courier_repository: AsyncMock,
+) -> None:
+    # Заказ назначен до того, как появилось время назначения
+    courier = Courier.create(name="Иван", speed=1, location=Location(x=1, y=1))
+    courier.add_storage_place(name="Багажник", total_volume=10)
+    order = Order._new(
+        id=uuid4(),
+        location=Location(x=1, y=2),
+        volume=1,
+        courier_id=courier.id,
+        status=OrderStatus.ASSIGNED,
+        created_at=datetime.now(UTC),
+    )
+    courier.take_order(order_id=order.id, volume=order.volume)
+    order_repository.get_all_assigned.return_value = [order]
+    courier_repository.get_all.return_value = [courier]
+
+    results = await handler.handle()
+
+    assert results[0].order_completed is True
+    assert results[0].completed_order_ids == [order.id]
+    assert results[0].delivery_times == []
+
+
+@pytest.mark.asyncio
+async def test_move_couriers_skips_couriers_without_orders(
+    handler: MoveCouriersHandler,
+    order_repository: AsyncMock,
+    courier_repository: AsyncMock,
+) -> None:
+    busy = Courier.create(name="Иван", speed=1, location=Location(x=1, y=1))
+    idle = Courier.create(name="Пётр", speed=1, location=Location(x=5, y=5))
+    order = Order.create(id=uuid4(), location=Location(x=3, y=1), volume=1)
+    assign(order, busy)
+    order_repository.get_all_assigned.return_value = [order]
+    courier_repository.get_all.return_value = [busy, idle]
+
+    results = await handler.handle()
+
+    assert [r.courier_id for r in results] == [busy.id]
+    assert results[0].new_location == (2, 1)
+    courier_repository.update.assert_called_once_with(busy)
@@ -0,0 +1,218 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from starlette.requests import Request
+
+from api.adapters.http.read_cache import (
+    CachedBody,
+    ReadCache,
+    cached_json_response,
+    etag_matches,
+)
+from api.adapters.http.v1.couriers import get_couriers
+from core.application.use_cases.queries.get_couriers import CourierDTO
+from core.domain.model.kernel.location import Location
+from core.ports.pagination import Page, PageRequest
+from infrastructure.adapters.postgres.repositories.base import RepositoryTracker
+from infrastructure.state_version import StateVersion
+
+
+def request(if_none_match: str | None = None) -> Request:
+    headers = (
+        [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    )
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def loader(*bodies: bytes) -> AsyncMock:
+    return AsyncMock(side_effect=[CachedBody(body) for body in bodies])
+
+
+class TestReadCache:
+    @pytest.mark.asyncio
+    async def test_same_version_is_served_from_cache(self) -> None:
+        cache = ReadCache(StateVersion(), ttl_seconds=60)
+        load = loader(b"[1]")
+
+        first = await cache.get_or_load("couriers", load)
+        second = await cache.get_or_load("couriers", load)
+
+        assert second is first
+        load.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_version_bump_reloads(self) -> None:
+        version = StateVersion()
+        cache = ReadCache(version, ttl_seconds=60)
+        load = loader(b"[1]", b"[2]")
+
+        await cache.get_or_load("couriers", load)
+        version.bump()
+        entry = await cache.get_or_load("couriers", load)
+
+        assert entry.body == b"[2]"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_reloaded(self) -> None:
+        cache = ReadCache(StateVersion(), ttl_seconds=0)
+        load = loader(b"[1]", b"[1]")
+
+        await cache.get_or_load("couriers", load)
+        await cache.get_or_load("couriers", load)
+
+        assert load.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self) -> None:
+        cache = ReadCache(StateVersion(), ttl_seconds=60)
+        calls = 0
+
+        async def load() -> CachedBody:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return CachedBody(b"[]")
+
+        entries = await asyncio.gather(
+            *(cache.get_or_load("couriers", load) for _ in range(10))
+        )
+
+        assert calls == 1
+        assert len({id(entry) for entry in entries}) == 1
+
+    @pytest.mark.asyncio
+    async def test_commit_during_load_leaves_entry_stale(self) -> None:
+        version = StateVersion()
+        cache = ReadCache(version, ttl_seconds=60)
+
+        async def load() -> CachedBody:
+            version.bump()
+            return CachedBody(b"[]")
+
+        await cache.get_or_load("couriers", load)
+        entry = await cache.get_or_load("couriers", loader(b"[1]"))
+
+        assert entry.body == b"[1]"
+
+    @pytest.mark.asyncio
+    async def test_etag_depends_only_on_body(self) -> None:
+        version = StateVersion()
+        cache = ReadCache(version, ttl_seconds=60)
+
+        first = await cache.get_or_load("couriers", loader(b"[1]"))
+        version.bump()
+        same = await cache.get_or_load("couriers", loader(b"[1]"))
+        version.bump()
+        other = await cache.get_or_load("couriers", loader(b"[2]"))
+
+        assert same.etag == first.etag
+        assert other.etag != first.etag
+
+    @pytest.mark.asyncio
+    async def test_params_are_cached_separately(self) -> None:
+        cache = ReadCache(StateVersion(), ttl_seconds=60)
+
+        first = await cache.get_or_load("couriers", loader(b"[1]"), params=1)
+        second = await cache.get_or_load("couriers", loader(b"[2]"), params=2)
+
+        assert (first.body, second.body) == (b"[1]", b"[2]")
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = ReadCache(StateVersion(), ttl_seconds=60, max_entries=2)
+        await cache.get_or_load("couriers", loader(b"[1]"), params=1)
+        await cache.get_or_load("couriers", loader(b"[2]"), params=2)
+        await cache.get_or_load("couriers", loader(), params=1)
+
+        await cache.get_or_load("couriers", loader(b"[3]"), params=3)
+        reloaded = await cache.get_or_load("couriers", loader(b"[2]"), params=2)
+        kept = await cache.get_or_load("couriers", loader(), params=3)
+
+        assert reloaded.body == b"[2]"
+        assert kept.body == b"[3]"
+
+
+class TestConditionalResponse:
+    def test_etag_matching(self) -> None:
+        assert etag_matches('"a"', '"a"')
+        assert etag_matches('"b", W/"a"', '"a"')
+        assert etag_matches("*", '"a"')
+        assert not etag_matches('"b"', '"a"')
+        assert not etag_matches(None, '"a"')
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_not_modified(self) -> None:
+        entry = await ReadCache(StateVersion(), ttl_seconds=60).get_or_load(
+            "couriers", loader(b"[]")
+        )
+
+        response = cached_json_response(request(entry.etag), "couriers", entry)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == entry.etag
+
+    @pytest.mark.asyncio
+    async def test_stale_etag_returns_body(self) -> None:
+        entry = await ReadCache(StateVersion(), ttl_seconds=60).get_or_load(
+            "couriers",
+            AsyncMock(return_value=CachedBody(b"[]", {"X-Next-Cursor": "c"})),
+        )
+
+        response = cached_json_response(request('"old"'), "couriers", entry)
+
+        assert response.status_code == 200
+        assert response.body == b"[]"
+        assert response.media_type == "application/json"
+        assert response.headers["x-next-cursor"] == "c"
+
+
+class TestGetCouriersEndpoint:
+    @pytest.mark.asyncio
+    async def test_serialises_couriers_once_per_version(self) -> None:
+        courier_id = uuid4()
+        handler = MagicMock()
+        handler.handle = AsyncMock(
+            return_value=Page(
+                items=[
+                    CourierDTO(id=courier_id, name="Пеший", location=Location(x=1, y=2))
+                ],
+                next_cursor=courier_id,
+            )
+        )
+        cache = ReadCache(StateVersion(), ttl_seconds=60)
+        page = PageRequest(limit=1)
+
+        first = await get_couriers(request(), page, None, handler, cache)
+        second = await get_couriers(
+            request(first.headers["etag"]), page, None, handler, cache
+        )
+
+        assert json.loads(first.body) == [
+            {"id": str(courier_id), "name": "Пеший", "location": {"x": 1, "y": 2}}
+        ]
+        assert first.headers["x-next-cursor"] == str(courier_id)
+        assert second.status_code == 304
+        handler.handle.assert_awaited_once_with(page, None)
+
+
+class TestStateVersionBump:
+    @pytest.mark.asyncio
+    async def test_commit_with_tracked_aggregates_bumps_version(self) -> None:
+        version = StateVersion()
+        session = MagicMock()
+        session.in_transaction.return_value = False
+        session.begin = AsyncMock()
+        session.commit = AsyncMock()
+        tracker = RepositoryTracker(session, state_version=version)
+
+        async with tracker.transaction():
+            pass
+        assert version.value == 0
+
+        async with tracker.transaction():
+            tracker.track(object())
+        assert version.value == 1
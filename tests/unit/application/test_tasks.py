@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import asynccontextmanager
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
 from api.tasks import assign_orders, move_couriers, process_outbox_events, run_periodic
+from core.application.use_cases.commands.assign_order import AssignResult
+from core.application.use_cases.commands.move_couriers import MoveResult
 from core.domain.events.order import OrderCreatedDomainEvent
 from core.ports.outbox_repository import OutboxMessage
+from infrastructure.metrics import ORDER_WAIT_TIME, ORDERS_COMPLETED
 
 
 class TestRunPeriodic:
@@ -61,6 +65,22 @@ class TestRunPeriodic:
             args = mock_logger.exception.call_args
             assert "my_task" in str(args)
 
+    async def test_skips_task_while_not_leader(self) -> None:
+        task = AsyncMock()
+        leader = MagicMock(is_leader=False)
+        periodic = asyncio.create_task(
+            run_periodic(task, interval=0, name="test", leader=leader)
+        )
+        await asyncio.sleep(0.02)
+
+        task.assert_not_awaited()
+
+        leader.is_leader = True
+        await asyncio.sleep(0.02)
+        periodic.cancel()
+
+        assert task.await_count >= 1
+
 
 class TestAssignOrders:
     async def test_creates_handler_and_calls_handle(self) -> None:
@@ -76,12 +96,17 @@ class TestAssignOrders:
             patch("api.tasks.AssignOrderHandler") as MockHandler,
         ):
             mock_handler_instance = AsyncMock()
+            mock_handler_instance.handle.return_value = AssignResult(
+                order_id=uuid4(), courier_id=uuid4(), wait_time=timedelta(seconds=42)
+            )
             MockHandler.return_value = mock_handler_instance
+            observed = ORDER_WAIT_TIME.labels().sum
 
             await assign_orders()
 
             MockHandler.assert_called_once()
             mock_handler_instance.handle.assert_called_once()
+            assert ORDER_WAIT_TIME.labels().sum == observed + 42
 
     async def test_uses_correct_dependencies(self) -> None:
         mock_session = AsyncMock()
@@ -95,11 +120,12 @@ class TestAssignOrders:
             patch("api.tasks.async_session_maker", mock_session_maker),
             patch("api.tasks.AssignOrderHandler") as MockHandler,
             patch("api.tasks.RepositoryTracker") as MockTracker,
-            patch("api.tasks.OrderRepository") as MockOrderRepo,
-            patch("api.tasks.CourierRepository") as MockCourierRepo,
+            patch("api.tasks.create_order_repository") as MockOrderRepo,
+            patch("api.tasks.create_courier_repository") as MockCourierRepo,
             patch("api.tasks.OrderDispatcher") as MockDispatcher,
         ):
             MockHandler.return_value = AsyncMock()
+            MockHandler.return_value.handle.return_value = None
 
             await assign_orders()
 
@@ -137,6 +163,29 @@ class TestMoveCouriers:
             MockHandler.assert_called_once()
             mock_handler_instance.handle.assert_called_once()
 
+    async def test_counts_every_order_completed_in_one_step(self) -> None:
+        mock_session_maker = MagicMock()
+        mock_session_maker.return_value.__aenter__ = AsyncMock()
+        mock_session_maker.return_value.__aexit__ = AsyncMock(return_value=False)
+        result = MoveResult(
+            courier_id=uuid4(),
+            courier_name="Пеший",
+            new_location=(2, 2),
+            order_completed=True,
+            completed_order_ids=[uuid4(), uuid4()],
+        )
+
+        with (
+            patch("api.tasks.async_session_maker", mock_session_maker),
+            patch("api.tasks.MoveCouriersHandler") as MockHandler,
+        ):
+            MockHandler.return_value.handle = AsyncMock(return_value=[result])
+            completed = ORDERS_COMPLETED.labels().value
+
+            await move_couriers()
+
+            assert ORDERS_COMPLETED.labels().value == completed + 2
+
     async def test_uses_correct_dependencies(self) -> None:
         mock_session = AsyncMock()
         mock_session_maker = MagicMock()
@@ -149,9 +198,10 @@ class TestMoveCouriers:
             patch("api.tasks.async_session_maker", mock_session_maker),
             patch("api.tasks.MoveCouriersHandler") as MockHandler,
             patch("api.tasks.RepositoryTracker") as MockTracker,
-            patch("api.tasks.OrderRepository") as MockOrderRepo,
-            patch("api.tasks.CourierRepository") as MockCourierRepo,
+            patch("api.tasks.create_order_repository") as MockOrderRepo,
+            patch("api.tasks.create_courier_repository") as MockCourierRepo,
             patch("api.tasks.OutboxRepository") as MockOutboxRepository,
+            patch("api.tasks.get_route_planner") as mock_get_route_planner,
         ):
             MockHandler.return_value = AsyncMock()
 
@@ -167,6 +217,7 @@ class TestMoveCouriers:
                 courier_repository=MockCourierRepo.return_value,
                 tracker=tracker,
                 outbox_repository=MockOutboxRepository.return_value,
+                route_planner=mock_get_route_planner.return_value,
             )
 
 
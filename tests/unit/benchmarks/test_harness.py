@@ -0,0 +1,88 @@
+import pytest
+
+from benchmarks import SCENARIOS, BenchmarkContext, BenchmarkReport, run_suite
+from benchmarks.harness import (
+    Measurement,
+    Run,
+    Scenario,
+    ScenarioSkipped,
+    compare,
+    measure,
+    parameter_grid,
+    regressions,
+)
+
+
+def make_report(commit: str, p50_ms: float) -> BenchmarkReport:
+    return BenchmarkReport(
+        commit=commit,
+        created_at="2025-01-01T00:00:00+00:00",
+        python="3.13.0",
+        measurements=[
+            Measurement(
+                scenario="dispatch",
+                params={"fleet": 10},
+                repeats=5,
+                p50_ms=p50_ms,
+            )
+        ],
+    )
+
+
+async def prepare_skipped(context: BenchmarkContext) -> Run:
+    raise ScenarioSkipped("база данных недоступна")
+
+
+def test_parameter_grid_covers_scenario_axes() -> None:
+    grid = parameter_grid(
+        SCENARIOS["dispatch"], {"fleet": [1, 2], "backlog": [10], "other": [0]}
+    )
+
+    assert grid == [{"fleet": 1, "backlog": 10}, {"fleet": 2, "backlog": 10}]
+
+
+@pytest.mark.asyncio
+async def test_run_suite_measures_in_memory_scenarios() -> None:
+    report = await run_suite(
+        scenarios=[SCENARIOS["dispatch"], SCENARIOS["outbox_relay"]],
+        values={"fleet": [5], "backlog": [20]},
+        context=BenchmarkContext(),
+        repeats=3,
+    )
+
+    dispatch, relay = report.measurements
+    assert dispatch.key == "dispatch[fleet=5,backlog=20]"
+    assert dispatch.units == 1
+    assert relay.units == 20
+    assert 0 < relay.min_ms <= relay.p50_ms <= relay.max_ms
+    assert BenchmarkReport.from_dict(report.to_dict()) == report
+
+
+@pytest.mark.asyncio
+async def test_measure_reports_skipped_scenario() -> None:
+    scenario = Scenario(name="postgres", axes=(), prepare=prepare_skipped)
+
+    measurement = await measure(scenario, {}, BenchmarkContext(), repeats=3)
+
+    assert measurement.skipped == "база данных недоступна"
+    assert measurement.repeats == 0
+
+
+@pytest.mark.asyncio
+async def test_postgres_scenarios_skip_without_database() -> None:
+    measurement = await measure(
+        SCENARIOS["repository_hydration"],
+        {"fleet": 1},
+        BenchmarkContext(database_url=None),
+        repeats=1,
+    )
+
+    assert measurement.skipped is not None
+
+
+def test_compare_flags_slower_median() -> None:
+    comparisons = compare(make_report("a", 1.0), make_report("b", 1.5))
+
+    assert [c.ratio for c in comparisons] == [1.5]
+    assert regressions(comparisons, threshold=0.1) == comparisons
+    assert regressions(comparisons, threshold=0.6) == []
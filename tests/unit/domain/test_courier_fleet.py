@@ -0,0 +1,134 @@
+import random
+from uuid import uuid4
+
+import pytest
+
+from core.domain.exceptions.courier import CourierCannotTakeOrder, OrderVolumeIncorrect
+from core.domain.exceptions.storage_place import CourierHasNoSuchOrder
+from core.domain.model.courier.courier import Courier
+from core.domain.model.courier.fleet import CourierFleet
+from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order
+from core.domain.services.order_dispatcher import OrderDispatcher
+
+
+def make_couriers(count: int, seed: int = 0) -> list[Courier]:
+    rng = random.Random(seed)
+    couriers = []
+    for i in range(count):
+        courier = Courier.create(
+            name=f"Курьер {i}",
+            speed=rng.randint(1, 3),
+            location=Location(x=rng.randint(1, 10), y=rng.randint(1, 10)),
+        )
+        if rng.random() < 0.5:
+            courier.add_storage_place(name="Багажник", total_volume=rng.randint(5, 30))
+        if rng.random() < 0.3:
+            courier.take_order(order_id=uuid4(), volume=rng.randint(1, 10))
+        couriers.append(courier)
+    return couriers
+
+
+def snapshot(courier: Courier) -> tuple[object, ...]:
+    return (
+        courier.id,
+        courier.name,
+        courier.speed,
+        courier.location,
+        [
+            (sp.id, sp.name, sp.total_volume, sp.order_id)
+            for sp in courier.iter_storage_places()
+        ],
+    )
+
+
+class TestCourierFleet:
+    def test_roundtrip_is_lossless(self) -> None:
+        couriers = make_couriers(50)
+
+        restored = CourierFleet.from_couriers(couriers).to_couriers()
+
+        assert [snapshot(c) for c in restored] == [snapshot(c) for c in couriers]
+
+    def test_eligible_mask_matches_can_take_order(self) -> None:
+        couriers = make_couriers(50)
+        fleet = CourierFleet.from_couriers(couriers)
+
+        for volume in (1, 10, 20, 31):
+            assert fleet.eligible_mask(volume) == [
+                c.can_take_order(volume) for c in couriers
+            ]
+
+    def test_steps_to_matches_courier(self) -> None:
+        couriers = make_couriers(50)
+        fleet = CourierFleet.from_couriers(couriers)
+        target = Location(x=7, y=3)
+
+        assert fleet.steps_to(target) == [
+            c.calculate_steps_to_location(target) for c in couriers
+        ]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_nearest_eligible_matches_dispatcher(self, seed: int) -> None:
+        couriers = make_couriers(30, seed=seed)
+        fleet = CourierFleet.from_couriers(couriers)
+        order = Order.create(id=uuid4(), location=Location(x=5, y=5), volume=8)
+
+        chosen = fleet.nearest_eligible(order.location, order.volume)
+        dispatched = OrderDispatcher().dispatch(order, couriers)
+
+        assert chosen == (dispatched.id if dispatched is not None else None)
+
+    def test_nearest_eligible_returns_none_without_capacity(self) -> None:
+        fleet = CourierFleet.from_couriers(make_couriers(5))
+
+        assert fleet.nearest_eligible(Location(x=1, y=1), volume=1_000) is None
+
+    def test_move_toward_matches_courier_move(self) -> None:
+        rng = random.Random(1)
+        couriers = make_couriers(50)
+        fleet = CourierFleet.from_couriers(couriers)
+        targets: list[Location | None] = [
+            Location(x=rng.randint(1, 10), y=rng.randint(1, 10))
+            if rng.random() < 0.8
+            else None
+            for _ in couriers
+        ]
+
+        fleet.move_toward(targets)
+        for courier, target in zip(couriers, targets, strict=True):
+            if target is not None:
+                courier.move(target)
+
+        assert [fleet.location_of(c.id) for c in couriers] == [
+            c.location for c in couriers
+        ]
+
+    def test_move_toward_requires_target_per_courier(self) -> None:
+        fleet = CourierFleet.from_couriers(make_couriers(3))
+
+        with pytest.raises(ValueError):
+            fleet.move_toward([None])
+
+    def test_take_and_complete_order_update_capacity(self) -> None:
+        courier = Courier.create(name="Иван", speed=1, location=Location(x=1, y=1))
+        fleet = CourierFleet.from_couriers([courier])
+        order_id = uuid4()
+
+        fleet.take_order(courier.id, order_id, volume=10)
+
+        assert fleet.eligible_mask(1) == [False]
+        with pytest.raises(CourierCannotTakeOrder):
+            fleet.take_order(courier.id, uuid4(), volume=1)
+
+        fleet.complete_order(courier.id, order_id)
+
+        assert fleet.eligible_mask(10) == [True]
+        with pytest.raises(CourierHasNoSuchOrder):
+            fleet.complete_order(courier.id, order_id)
+
+    def test_non_positive_volume_failed(self) -> None:
+        fleet = CourierFleet.from_couriers(make_couriers(1))
+
+        with pytest.raises(OrderVolumeIncorrect):
+            fleet.eligible_mask(0)
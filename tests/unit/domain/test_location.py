@@ -1,12 +1,20 @@
+import copy
+import pickle
 from dataclasses import FrozenInstanceError
 
 import pytest
 
-from core.domain.exceptions.location import LocationCoordinateIncorrect
+from core.domain.exceptions.location import (
+    GridBoundsIncorrect,
+    LocationCoordinateIncorrect,
+)
+from core.domain.model.kernel.grid import Grid
 from core.domain.model.kernel.location import (
     MAX_COORDINATE,
     MIN_COORDINATE,
     Location,
+    configure_grid,
+    current_grid,
 )
 
 
@@ -74,8 +82,84 @@ class TestLocation:
         loc2 = Location(x=x2, y=y2)
         assert loc1.distance_to(loc2) == expected_distance
 
+    def test_same_coordinates_share_instance(self) -> None:
+        assert Location(x=3, y=4) is Location(x=3, y=4)
+
+    def test_trusted_constructor_shares_instance_with_validated(self) -> None:
+        assert Location._new(2, 9) is Location(x=2, y=9)
+
+    def test_trusted_point_outside_grid_is_not_validated_later(self) -> None:
+        loaded = Location._new(0, 999)
+
+        assert (loaded.x, loaded.y) == (0, 999)
+        with pytest.raises(LocationCoordinateIncorrect):
+            Location(x=0, y=999)
+
+    def test_locations_usable_as_dict_keys(self) -> None:
+        counts = {Location(x=1, y=2): 1}
+        counts[Location(x=1, y=2)] += 1
+        assert counts == {Location(x=1, y=2): 2}
+
+    def test_copy_and_pickle_keep_equality(self) -> None:
+        location = Location(x=5, y=6)
+        assert copy.deepcopy(location) == location
+        assert pickle.loads(pickle.dumps(location)) == location
+
+    def test_repr(self) -> None:
+        assert repr(Location(x=1, y=2)) == "Location(x=1, y=2)"
+
     def test_new_random_location_creates_valid_location(self) -> None:
         location = Location.new_random_location()
         assert isinstance(location, Location)
         assert MIN_COORDINATE <= location.x <= MAX_COORDINATE
         assert MIN_COORDINATE <= location.y <= MAX_COORDINATE
+
+
+class TestGrid:
+    def test_default_grid_matches_coordinate_constants(self) -> None:
+        grid = current_grid()
+        assert grid.min_coordinate == MIN_COORDINATE
+        assert grid.max_coordinate == MAX_COORDINATE
+        assert grid.size == 10
+
+    def test_create_with_inverted_bounds_failed(self) -> None:
+        with pytest.raises(GridBoundsIncorrect):
+            Grid(min_coordinate=10, max_coordinate=1)
+
+    def test_configured_grid_accepts_city_scale_coordinates(self) -> None:
+        configure_grid(Grid(min_coordinate=1, max_coordinate=10_000))
+
+        location = Location(x=10_000, y=9_999)
+
+        assert location.distance_to(Location(x=1, y=1)) == 9_999 + 9_998
+
+    def test_configured_grid_rejects_coordinates_outside(self) -> None:
+        configure_grid(Grid(min_coordinate=1, max_coordinate=10_000))
+
+        with pytest.raises(
+            LocationCoordinateIncorrect,
+            match="Координата x имеет некорректное значение 10001",
+        ):
+            Location(x=10_001, y=1)
+
+    def test_configure_grid_revalidates_cached_locations(self) -> None:
+        Location(x=9, y=9)
+        configure_grid(Grid(min_coordinate=1, max_coordinate=5))
+
+        with pytest.raises(LocationCoordinateIncorrect):
+            Location(x=9, y=9)
+
+    def test_rows_outside_narrowed_grid_stay_invalid_for_input(self) -> None:
+        configure_grid(Grid(min_coordinate=1, max_coordinate=5))
+        Location._new(9, 9)
+
+        with pytest.raises(LocationCoordinateIncorrect):
+            Location(x=9, y=9)
+
+    def test_new_random_location_uses_configured_grid(self) -> None:
+        configure_grid(Grid(min_coordinate=500, max_coordinate=600))
+
+        location = Location.new_random_location()
+
+        assert 500 <= location.x <= 600
+        assert 500 <= location.y <= 600
@@ -1,3 +1,4 @@
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
@@ -98,3 +99,28 @@ class TestOrder:
             match="Завершить можно только назначенный заказ.",
         ):
             order.complete()
+
+    def test_transitions_record_timestamps(self) -> None:
+        created_at = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+        order = Order.create(
+            id=uuid4(), location=Location(x=1, y=1), volume=5, created_at=created_at
+        )
+
+        assert order.created_at == created_at
+        assert order.wait_time is None
+
+        order.assign(courier_id=uuid4(), at=created_at + timedelta(minutes=3))
+        order.complete(at=created_at + timedelta(minutes=20))
+
+        assert order.assigned_at == created_at + timedelta(minutes=3)
+        assert order.completed_at == created_at + timedelta(minutes=20)
+        assert order.wait_time == timedelta(minutes=3)
+        assert order.delivery_time == timedelta(minutes=17)
+
+    def test_transitions_default_to_current_time(self) -> None:
+        before = datetime.now(UTC)
+        order = Order.create(id=uuid4(), location=Location(x=1, y=1), volume=5)
+        order.assign(courier_id=uuid4())
+        order.complete()
+
+        assert before <= order.created_at <= order.assigned_at <= order.completed_at
@@ -0,0 +1,94 @@
+from uuid import uuid4
+
+from core.domain.model.courier.courier import Courier
+from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order
+from core.domain.services.route_planner import RoutePlanner, route_length
+
+
+def make_courier(x: int = 1, y: int = 1) -> Courier:
+    return Courier.create(name="Иван", speed=1, location=Location(x=x, y=y))
+
+
+def make_order(x: int, y: int) -> Order:
+    return Order.create(id=uuid4(), location=Location(x=x, y=y), volume=1)
+
+
+class TestRoutePlanner:
+    def test_plan_without_orders_returns_empty_route(self) -> None:
+        planner = RoutePlanner()
+
+        assert planner.plan(make_courier(), []) == []
+
+    def test_plan_visits_nearest_order_first(self) -> None:
+        courier = make_courier(x=1, y=1)
+        far = make_order(x=10, y=10)
+        near = make_order(x=2, y=2)
+
+        route = RoutePlanner().plan(courier, [far, near])
+
+        assert route == [near, far]
+
+    def test_plan_improves_greedy_route(self) -> None:
+        # Ближайший сосед: (3,6) -> (3,3) -> (5,2) -> (2,10), 19 шагов.
+        # 2-opt разворачивает начало маршрута и сокращает его до 15 шагов.
+        start = Location(x=4, y=5)
+        courier = make_courier(x=start.x, y=start.y)
+        orders = [
+            make_order(2, 10),
+            make_order(3, 6),
+            make_order(5, 2),
+            make_order(3, 3),
+        ]
+
+        route = RoutePlanner().plan(courier, orders)
+
+        assert [str(o.location) for o in route] == [
+            "(5, 2)",
+            "(3, 3)",
+            "(3, 6)",
+            "(2, 10)",
+        ]
+        assert route_length(start, [o.location for o in route]) == 15
+
+    def test_plan_reuses_cached_route_when_orders_delivered(self) -> None:
+        courier = make_courier(x=1, y=1)
+        first, second, third = make_order(2, 2), make_order(5, 5), make_order(9, 9)
+        planner = RoutePlanner()
+        planner.plan(courier, [third, first, second])
+
+        route = planner.plan(courier, [third, second])
+
+        assert route == [second, third]
+
+    def test_plan_rebuilds_route_on_new_assignment(self) -> None:
+        courier = make_courier(x=1, y=1)
+        far = make_order(x=9, y=9)
+        planner = RoutePlanner()
+        planner.plan(courier, [far])
+        near = make_order(x=2, y=1)
+
+        route = planner.plan(courier, [far, near])
+
+        assert route == [near, far]
+
+    def test_invalidate_drops_cached_route(self) -> None:
+        courier = make_courier(x=1, y=1)
+        first, second = make_order(x=5, y=1), make_order(x=1, y=5)
+        planner = RoutePlanner()
+        planner.plan(courier, [first, second])
+
+        planner.invalidate(courier.id)
+
+        assert courier.id not in planner._routes
+
+    def test_steps_per_order_fall_as_load_grows(self) -> None:
+        courier = make_courier(x=1, y=1)
+        cluster = [make_order(x=8, y=8), make_order(x=9, y=8), make_order(x=8, y=9)]
+        start = Location(x=1, y=1)
+
+        single = route_length(start, [cluster[0].location])
+        route = RoutePlanner().plan(courier, cluster)
+        batched = route_length(start, [o.location for o in route]) / len(route)
+
+        assert batched < single
@@ -0,0 +1,69 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from core.domain.model.order.order import OrderStatus
+from infrastructure.adapters.postgres.repositories.asyncpg_reads import (
+    record_to_courier,
+    record_to_order,
+)
+
+
+class TestAsyncpgMappers:
+    def test_record_to_courier_with_storage_places(self) -> None:
+        place_ids, order_id = [uuid4(), uuid4()], uuid4()
+        row = {
+            "id": uuid4(),
+            "name": "Иван",
+            "speed": 2,
+            "location_x": 3,
+            "location_y": 4,
+            "ids": place_ids,
+            "names": ["Сумка", "Багажник"],
+            "volumes": [10, 30],
+            "order_ids": [None, order_id],
+        }
+
+        courier = record_to_courier(row)
+
+        assert courier.id == row["id"]
+        assert (courier.location.x, courier.location.y) == (3, 4)
+        assert [sp.id for sp in courier.storage_places] == place_ids
+        assert [sp.total_volume for sp in courier.storage_places] == [10, 30]
+        assert courier.storage_places[1].order_id == order_id
+
+    def test_record_to_courier_without_storage_places(self) -> None:
+        row = {
+            "id": uuid4(),
+            "name": "Иван",
+            "speed": 1,
+            "location_x": 1,
+            "location_y": 1,
+            "ids": None,
+            "names": None,
+            "volumes": None,
+            "order_ids": None,
+        }
+
+        assert record_to_courier(row).storage_places == []
+
+    def test_record_to_order(self) -> None:
+        created_at = datetime(2024, 1, 1, tzinfo=UTC)
+        row = {
+            "id": uuid4(),
+            "courier_id": uuid4(),
+            "location_x": 5,
+            "location_y": 6,
+            "volume": 2,
+            "status": "ASSIGNED",
+            "created_at": created_at,
+            "assigned_at": created_at,
+            "completed_at": None,
+        }
+
+        order = record_to_order(row)
+
+        assert order.id == row["id"]
+        assert order.status is OrderStatus.ASSIGNED
+        assert order.courier_id == row["courier_id"]
+        assert order.wait_time is not None
+        assert order.completed_at is None
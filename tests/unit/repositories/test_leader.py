@@ -0,0 +1,112 @@
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from infrastructure.adapters.postgres.leader import LeaderElection
+from infrastructure.metrics import TICK_LEADER
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def engine(acquired: bool = True) -> Any:
+    connection = MagicMock()
+    connection.scalar = AsyncMock(return_value=acquired)
+    connection.execute = AsyncMock()
+    connection.commit = AsyncMock()
+    connection.close = AsyncMock()
+    engine = MagicMock()
+    engine.connect = AsyncMock(return_value=connection)
+    engine.connection = connection
+    return engine
+
+
+class TestLeaderElection:
+    def test_rejects_lease_not_longer_than_renew_interval(self) -> None:
+        with pytest.raises(ValueError):
+            LeaderElection(
+                engine(), lock_id=1, renew_interval_seconds=2, lease_seconds=2
+            )
+
+    @pytest.mark.asyncio
+    async def test_takes_free_lock(self) -> None:
+        election = LeaderElection(engine(), lock_id=1)
+
+        await election.renew()
+
+        assert election.is_leader
+        assert TICK_LEADER.labels().value == 1
+
+    @pytest.mark.asyncio
+    async def test_stays_follower_while_lock_is_held(self) -> None:
+        db = engine(acquired=False)
+        election = LeaderElection(db, lock_id=1)
+
+        await election.renew()
+        await election.renew()
+
+        assert not election.is_leader
+        # Соединение переиспользуется между попытками
+        db.connect.assert_awaited_once()
+        assert db.connection.commit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_leader_renews_by_pinging_connection(self) -> None:
+        db = engine()
+        election = LeaderElection(db, lock_id=1)
+        await election.renew()
+
+        await election.renew()
+
+        db.connection.scalar.assert_awaited_once()
+        db.connection.execute.assert_awaited_once()
+        assert election.is_leader
+
+    @pytest.mark.asyncio
+    async def test_steps_down_when_connection_breaks(self) -> None:
+        db = engine()
+        election = LeaderElection(db, lock_id=1)
+        await election.renew()
+        db.connection.execute.side_effect = OperationalError("SELECT 1", {}, None)
+
+        await election.renew()
+
+        assert not election.is_leader
+        assert TICK_LEADER.labels().value == 0
+        db.connection.close.assert_awaited_once()
+
+        # Следующая попытка открывает новое соединение и снова берёт блокировку
+        await election.renew()
+        assert db.connect.await_count == 2
+        assert election.is_leader
+
+    @pytest.mark.asyncio
+    async def test_leadership_expires_without_renewal(self) -> None:
+        clock = FakeClock()
+        election = LeaderElection(
+            engine(), lock_id=1, renew_interval_seconds=1, lease_seconds=3, clock=clock
+        )
+        await election.renew()
+
+        clock.now += 3
+
+        assert not election.is_leader
+
+    @pytest.mark.asyncio
+    async def test_release_unlocks_and_closes_connection(self) -> None:
+        db = engine()
+        election = LeaderElection(db, lock_id=1)
+        await election.renew()
+
+        await election.release()
+
+        assert not election.is_leader
+        assert db.connection.scalar.await_count == 2
+        db.connection.close.assert_awaited_once()
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from core.application.use_cases.commands.assign_order import AssignOrderHandler
+from core.application.use_cases.commands.move_couriers import MoveCouriersHandler
+from core.domain.events.order import OrderCompletedDomainEvent
+from core.domain.model.courier.courier import Courier
+from core.domain.model.kernel.location import Location
+from core.domain.model.order.order import Order, OrderStatus
+from core.domain.services.order_dispatcher import OrderDispatcher
+from core.domain.services.route_planner import RoutePlanner
+from core.ports.pagination import Area, PageRequest
+from infrastructure.adapters.memory import (
+    InMemoryCourierRepository,
+    InMemoryOrderRepository,
+    InMemoryOutboxRepository,
+    InMemoryStore,
+    InMemoryTracker,
+)
+
+
+def make_courier(volume: int = 10, x: int = 1, y: int = 1) -> Courier:
+    courier = Courier.create(name="Иван", speed=2, location=Location(x=x, y=y))
+    courier.add_storage_place(name="Багажник", total_volume=volume)
+    return courier
+
+
+def make_order(x: int = 5, y: int = 5, volume: int = 5) -> Order:
+    return Order.create(id=uuid4(), location=Location(x=x, y=y), volume=volume)
+
+
+@pytest.fixture
+def store() -> InMemoryStore:
+    return InMemoryStore()
+
+
+@pytest.fixture
+def tracker(store: InMemoryStore) -> InMemoryTracker:
+    return InMemoryTracker(store)
+
+
+class TestInMemoryCourierRepository:
+    @pytest.mark.asyncio
+    async def test_add_and_get_by_id_returns_copy(
+        self, tracker: InMemoryTracker
+    ) -> None:
+        repository = InMemoryCourierRepository(tracker)
+        courier = make_courier()
+
+        await repository.add(courier)
+        loaded = await repository.get_by_id(str(courier.id))
+
+        assert loaded.id == courier.id
+        assert loaded is not courier
+        assert loaded.storage_places[0].total_volume == 10
+
+    @pytest.mark.asyncio
+    async def test_get_all_free_follows_storage_places(
+        self, store: InMemoryStore, tracker: InMemoryTracker
+    ) -> None:
+        repository = InMemoryCourierRepository(tracker)
+        courier = make_courier()
+        await repository.add(courier)
+
+        courier.take_order(order_id=uuid4(), volume=5)
+        await repository.update(courier)
+
+        assert await repository.get_all_free() == []
+        assert courier.id not in store.free_courier_ids
+
+    @pytest.mark.asyncio
+    async def test_get_all_with_free_capacity_uses_buckets(
+        self, tracker: InMemoryTracker
+    ) -> None:
+        repository = InMemoryCourierRepository(tracker)
+        small, large = make_courier(volume=3), make_courier(volume=20)
+        # У обоих курьеров есть сумка объёмом 10 по умолчанию
+        await repository.add(small)
+        await repository.add(large)
+
+        couriers = await repository.get_all_with_free_capacity(volume=15)
+
+        assert [c.id for c in couriers] == [large.id]
+
+    @pytest.mark.asyncio
+    async def test_get_summaries_pages_by_id(self, tracker: InMemoryTracker) -> None:
+        repository = InMemoryCourierRepository(tracker)
+        couriers = [make_courier() for _ in range(5)]
+        for courier in couriers:
+            await repository.add(courier)
+        ids = sorted(c.id for c in couriers)
+
+        first = await repository.get_summaries(PageRequest(limit=2))
+        rest = await repository.get_summaries(PageRequest(after=first[-1].id, limit=10))
+
+        assert [s.id for s in first] == ids[:2]
+        assert [s.id for s in rest] == ids[2:]
+
+    @pytest.mark.asyncio
+    async def test_get_summaries_filters_by_area(
+        self, tracker: InMemoryTracker
+    ) -> None:
+        repository = InMemoryCourierRepository(tracker)
+        inside, outside = make_courier(x=2, y=3), make_courier(x=8, y=3)
+        await repository.add(inside)
+        await repository.add(outside)
+
+        summaries = await repository.get_summaries(PageRequest(), Area(1, 1, 5, 5))
+
+        assert [(s.id, s.name, s.location) for s in summaries] == [
+            (inside.id, inside.name, inside.location)
+        ]
+
+
+class TestInMemoryOrderRepository:
+    @pytest.mark.asyncio
+    async def test_get_first_created_is_fifo(self, tracker: InMemoryTracker) -> None:
+        repository = InMemoryOrderRepository(tracker)
+        first, second = make_order(), make_order()
+        await repository.add(first)
+        await repository.add(second)
+
+        assert (await repository.get_first_created()).id == first.id
+
+    @pytest.mark.asyncio
+    async def test_add_if_absent_skips_existing_id(
+        self, tracker: InMemoryTracker
+    ) -> None:
+        repository = InMemoryOrderRepository(tracker)
+        order = make_order(x=2, y=2)
+        duplicate = Order.create(id=order.id, location=Location(x=9, y=9), volume=1)
+
+        assert await repository.add_if_absent(order) is True
+        assert await repository.add_if_absent(duplicate) is False
+        stored = await repository.get_by_id(str(order.id))
+        assert stored is not None
+        assert stored.location == Location(x=2, y=2)
+
+    @pytest.mark.asyncio
+    async def test_status_index_follows_update(self, tracker: InMemoryTracker) -> None:
+        repository = InMemoryOrderRepository(tracker)
+        created, assigned = make_order(), make_order()
+        await repository.add(created)
+        await repository.add(assigned)
+
+        assigned.assign(uuid4())
+        await repository.update(assigned)
+
+        assert [o.id for o in await repository.get_all_assigned()] == [assigned.id]
+        assert (await repository.get_first_created()).id == created.id
+        assert len(await repository.get_all_not_completed()) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_active_summaries_skips_completed(
+        self, tracker: InMemoryTracker
+    ) -> None:
+        repository = InMemoryOrderRepository(tracker)
+        orders = [make_order(x=2, y=2), make_order(x=2, y=2), make_order(x=9, y=9)]
+        completed = make_order(x=2, y=2)
+        completed.assign(uuid4())
+        completed.complete()
+        for order in (*orders, completed):
+            await repository.add(order)
+
+        ids = sorted(o.id for o in orders)
+
+        nearby = await repository.get_active_summaries(
+            PageRequest(limit=10), Area(1, 1, 5, 5)
+        )
+        after_first = await repository.get_active_summaries(PageRequest(after=ids[0]))
+
+        assert [s.id for s in nearby] == sorted(o.id for o in orders[:2])
+        assert [s.id for s in after_first] == ids[1:]
+
+    @pytest.mark.asyncio
+    async def test_get_latency_stats_over_window(
+        self, tracker: InMemoryTracker
+    ) -> None:
+        repository = InMemoryOrderRepository(tracker)
+        now = datetime.now(UTC)
+        for minutes_ago, wait in ((90, 5), (30, 10), (20, 20), (10, 30)):
+            created_at = now - timedelta(minutes=minutes_ago)
+            order = Order.create(
+                id=uuid4(), location=Location(x=1, y=1), volume=1, created_at=created_at
+            )
+            order.assign(uuid4(), at=created_at + timedelta(seconds=wait))
+            order.complete(at=created_at + timedelta(seconds=wait + 60))
+            await repository.add(order)
+        await repository.add(make_order())
+
+        stats = await repository.get_latency_stats(now - timedelta(hours=1))
+
+        # Заказ, доставленный полтора часа назад, в окно не попадает
+        assert stats.completed == 3
+        assert stats.wait is not None
+        assert stats.wait.p50 == 20
+        assert stats.wait.p95 == pytest.approx(29)
+        assert stats.delivery is not None
+        assert stats.delivery.p99 == 60
+        assert stats.total is not None
+        assert stats.total.p50 == 80
+
+
+class TestInMemoryTracker:
+    @pytest.mark.asyncio
+    async def test_staged_rows_visible_only_inside_transaction(
+        self, store: InMemoryStore, tracker: InMemoryTracker
+    ) -> None:
+        repository = InMemoryOrderRepository(tracker)
+        other = InMemoryOrderRepository(InMemoryTracker(store))
+        order = make_order()
+
+        async with tracker.transaction():
+            await repository.add(order)
+            assert await repository.get_by_id(str(order.id)) is not None
+            assert await other.get_by_id(str(order.id)) is None
+
+        assert await other.get_by_id(str(order.id)) is not None
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_staged_rows(
+        self, store: InMemoryStore, tracker: InMemoryTracker
+    ) -> None:
+        couriers = InMemoryCourierRepository(tracker)
+        orders = InMemoryOrderRepository(tracker)
+        order = make_order()
+
+        with pytest.raises(RuntimeError):
+            async with tracker.transaction():
+                await orders.add(order)
+                await couriers.add(make_courier())
+                raise RuntimeError
+
+        assert store.orders == {}
+        assert store.couriers == {}
+        assert await orders.get_first_created() is None
+
+
+class TestInMemoryOutboxRepository:
+    @pytest.mark.asyncio
+    async def test_mark_processed_hides_message(self, tracker: InMemoryTracker) -> None:
+        repository = InMemoryOutboxRepository(tracker)
+        order = make_order()
+        for event in order.pull_events():
+            await repository.add(event)
+
+        [message] = await repository.get_unprocessed(limit=10)
+        await repository.mark_processed(message.id)
+
+        assert message.event.order_id == order.id
+        assert await repository.get_unprocessed(limit=10) == []
+
+
+@pytest.mark.asyncio
+async def test_handlers_deliver_order_without_database(
+    tracker: InMemoryTracker,
+) -> None:
+    couriers = InMemoryCourierRepository(tracker)
+    orders = InMemoryOrderRepository(tracker)
+    outbox = InMemoryOutboxRepository(tracker)
+    courier = make_courier(x=1, y=1)
+    order = make_order(x=3, y=3)
+    order.pull_events()
+    await couriers.add(courier)
+    await orders.add(order)
+    assign = AssignOrderHandler(
+        order_repository=orders,
+        courier_repository=couriers,
+        dispatcher=OrderDispatcher(),
+        tracker=tracker,
+    )
+    move = MoveCouriersHandler(
+        order_repository=orders,
+        courier_repository=couriers,
+        tracker=tracker,
+        outbox_repository=outbox,
+        route_planner=RoutePlanner(),
+    )
+
+    await assign.handle()
+    for _ in range(2):
+        await move.handle()
+
+    delivered = await orders.get_by_id(str(order.id))
+    assert delivered.status is OrderStatus.COMPLETED
+    assert [c.id for c in await couriers.get_all_free()] == [courier.id]
+    [message] = await outbox.get_unprocessed(limit=10)
+    assert isinstance(message.event, OrderCompletedDomainEvent)
@@ -0,0 +1,104 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from infrastructure.adapters.postgres.notifications import (
+    MAX_PAYLOAD_BYTES,
+    NotificationChannel,
+)
+from infrastructure.metrics import NOTIFICATIONS_DROPPED
+
+OWN_PID = 10
+
+
+def engine() -> Any:
+    driver = MagicMock()
+    driver.add_listener = AsyncMock()
+    driver.execute = AsyncMock()
+    driver.get_server_pid.return_value = OWN_PID
+    raw = MagicMock(driver_connection=driver)
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    connection.close = AsyncMock()
+    engine = MagicMock()
+    engine.connect = AsyncMock(return_value=connection)
+    engine.connection = connection
+    engine.driver = driver
+    return engine
+
+
+async def eventually(condition: Any) -> None:
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("условие не выполнилось")
+
+
+class TestNotificationChannel:
+    @pytest.mark.asyncio
+    async def test_sends_queued_payloads_and_listens(self) -> None:
+        db = engine()
+        channel = NotificationChannel(db, "live", on_notification=MagicMock())
+        channel.send("[1]")
+
+        task = asyncio.create_task(channel.run())
+        await eventually(lambda: db.driver.execute.await_count == 1)
+        task.cancel()
+
+        db.driver.add_listener.assert_awaited_once()
+        assert db.driver.add_listener.await_args.args[0] == "live"
+        db.driver.execute.assert_awaited_once_with(
+            "SELECT pg_notify($1, $2)", "live", "[1]"
+        )
+
+    def test_skips_own_notifications(self) -> None:
+        received = MagicMock()
+        channel = NotificationChannel(engine(), "live", on_notification=received)
+        driver = engine().driver
+
+        channel._receive(driver, OWN_PID, "live", "own")
+        channel._receive(driver, OWN_PID + 1, "live", "other")
+
+        received.assert_called_once_with("other")
+
+    def test_rejects_payload_over_postgres_limit(self) -> None:
+        channel = NotificationChannel(engine(), "live", on_notification=MagicMock())
+
+        with pytest.raises(ValueError):
+            channel.send("x" * (MAX_PAYLOAD_BYTES + 1))
+
+    def test_drops_payloads_when_queue_is_full(self) -> None:
+        channel = NotificationChannel(
+            engine(), "full", on_notification=MagicMock(), queue_size=1
+        )
+        dropped = NOTIFICATIONS_DROPPED.labels("full").value
+
+        channel.send("1")
+        channel.send("2")
+
+        assert NOTIFICATIONS_DROPPED.labels("full").value == dropped + 1
+
+    @pytest.mark.asyncio
+    async def test_reports_gap_after_reconnect(self) -> None:
+        db = engine()
+        gap = MagicMock()
+        channel = NotificationChannel(
+            db,
+            "live",
+            on_notification=MagicMock(),
+            on_gap=gap,
+            reconnect_interval_seconds=0.005,
+        )
+        # Первая проверка простаивающего соединения обрывается
+        db.driver.execute.side_effect = [ConnectionError()] + [None] * 100
+
+        task = asyncio.create_task(channel.run())
+        await eventually(lambda: gap.called)
+        task.cancel()
+
+        assert db.connect.await_count == 2
+        db.connection.close.assert_awaited_once()
+        gap.assert_called_once()
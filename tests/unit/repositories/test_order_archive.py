@@ -0,0 +1,83 @@
+from datetime import UTC, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from infrastructure.adapters.postgres.archive import (
+    LOCK_NOT_AVAILABLE,
+    OrderArchiver,
+    month_partition,
+)
+
+
+def lock_error(sqlstate: str) -> DBAPIError:
+    orig = Exception("lock")
+    orig.sqlstate = sqlstate  # type: ignore[attr-defined]
+    return DBAPIError("DELETE", None, orig)
+
+
+def make_archiver(batch_size: int = 2) -> OrderArchiver:
+    return OrderArchiver(
+        MagicMock(), retention=timedelta(days=7), batch_size=batch_size
+    )
+
+
+class TestMonthPartition:
+    def test_bounds_cover_calendar_month(self) -> None:
+        partition = month_partition(datetime(2024, 2, 15, 10, tzinfo=UTC))
+
+        assert partition.name == "orders_archive_2024_02"
+        assert partition.start == datetime(2024, 2, 1, tzinfo=UTC)
+        assert partition.end == datetime(2024, 3, 1, tzinfo=UTC)
+
+    def test_december_rolls_over_to_next_year(self) -> None:
+        partition = month_partition(datetime(2024, 12, 31, 23, tzinfo=UTC))
+
+        assert partition.end == datetime(2025, 1, 1, tzinfo=UTC)
+
+    def test_month_is_taken_in_utc(self) -> None:
+        moscow = timezone(timedelta(hours=3))
+
+        partition = month_partition(datetime(2024, 3, 1, 1, tzinfo=moscow))
+
+        assert partition.name == "orders_archive_2024_02"
+
+
+class TestOrderArchiver:
+    def test_rejects_non_positive_settings(self) -> None:
+        with pytest.raises(ValueError):
+            OrderArchiver(MagicMock(), retention=timedelta(0))
+        with pytest.raises(ValueError):
+            OrderArchiver(MagicMock(), retention=timedelta(days=1), batch_size=0)
+
+    @pytest.mark.asyncio
+    async def test_run_repeats_full_batches(self) -> None:
+        archiver = make_archiver(batch_size=2)
+        archiver.archive_batch = AsyncMock(side_effect=[2, 2, 1])  # type: ignore[method-assign]
+        now = datetime(2024, 5, 10, tzinfo=UTC)
+
+        archived = await archiver.run(now=now)
+
+        assert archived == 5
+        assert archiver.archive_batch.await_count == 3
+        archiver.archive_batch.assert_awaited_with(now - timedelta(days=7))
+
+    @pytest.mark.asyncio
+    async def test_run_stops_on_lock_timeout(self) -> None:
+        archiver = make_archiver(batch_size=2)
+        archiver.archive_batch = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[2, lock_error(LOCK_NOT_AVAILABLE)]
+        )
+
+        assert await archiver.run() == 2
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_other_errors(self) -> None:
+        archiver = make_archiver()
+        archiver.archive_batch = AsyncMock(  # type: ignore[method-assign]
+            side_effect=lock_error("40P01")
+        )
+
+        with pytest.raises(DBAPIError):
+            await archiver.run()
@@ -1,11 +1,16 @@
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
 from core.domain.model.kernel.location import Location
 from core.domain.model.order.order import Order, OrderStatus
 from infrastructure.adapters.postgres.models.order import OrderDTO
 from infrastructure.adapters.postgres.repositories.order_repository import (
     domain_to_dto,
     dto_to_domain,
+    status_in,
 )
 
 
@@ -66,6 +71,7 @@ class TestOrderMappers:
             location_y=8,
             volume=5,
             status=OrderStatus.CREATED,
+            created_at=datetime(2024, 1, 1, tzinfo=UTC),
         )
 
         order = dto_to_domain(dto)
@@ -88,6 +94,8 @@ class TestOrderMappers:
             location_y=2,
             volume=3,
             status=OrderStatus.ASSIGNED,
+            created_at=datetime(2024, 1, 1, tzinfo=UTC),
+            assigned_at=datetime(2024, 1, 1, 0, 5, tzinfo=UTC),
         )
 
         order = dto_to_domain(dto)
@@ -96,6 +104,7 @@ class TestOrderMappers:
         assert order.id == order_id
         assert order.courier_id == courier_id
         assert order.status == OrderStatus.ASSIGNED
+        assert order.wait_time == timedelta(minutes=5)
 
     def test_roundtrip_mapping(self) -> None:
         order_id = uuid4()
@@ -112,3 +121,23 @@ class TestOrderMappers:
         assert restored_order.location == original_order.location
         assert restored_order.volume == original_order.volume
         assert restored_order.status == original_order.status
+        assert restored_order.created_at == original_order.created_at
+        assert restored_order.assigned_at == original_order.assigned_at
+        assert restored_order.completed_at is None
+
+
+class TestStatusFilter:
+    def test_statuses_rendered_as_literals(self) -> None:
+        # Иначе частичные индексы по статусу не попадут в generic-план
+        stmt = select(OrderDTO.id).where(
+            status_in(OrderStatus.CREATED, OrderStatus.ASSIGNED)
+        )
+
+        sql = str(
+            stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"render_postcompile": True},
+            )
+        )
+
+        assert "orders.status IN ('CREATED', 'ASSIGNED')" in sql
@@ -0,0 +1,89 @@
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from infrastructure.adapters.postgres.replica import ReadRouter
+from infrastructure.metrics import DB_REPLICA_LAG
+
+
+def session_maker(lag: float | Exception = 0.0) -> Any:
+    session = MagicMock()
+    if isinstance(lag, Exception):
+        session.scalar = AsyncMock(side_effect=lag)
+    else:
+        session.scalar = AsyncMock(return_value=lag)
+    maker = MagicMock()
+    maker.return_value.__aenter__ = AsyncMock(return_value=session)
+    maker.return_value.__aexit__ = AsyncMock(return_value=None)
+    maker.session = session
+    return maker
+
+
+class TestReadRouter:
+    @pytest.mark.asyncio
+    async def test_without_replica_reads_go_to_primary(self) -> None:
+        primary = session_maker()
+        router = ReadRouter(primary, max_lag_seconds=5)
+
+        assert await router.session_maker() is primary
+
+    @pytest.mark.asyncio
+    async def test_replica_without_lag_limit_is_not_checked(self) -> None:
+        primary, replica = session_maker(), session_maker()
+        router = ReadRouter(primary, replica)
+
+        assert await router.session_maker() is replica
+        replica.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fresh_replica_is_used(self) -> None:
+        primary, replica = session_maker(), session_maker(lag=1.5)
+        router = ReadRouter(primary, replica, max_lag_seconds=5)
+
+        assert await router.session_maker() is replica
+        assert DB_REPLICA_LAG.labels().value == 1.5
+
+    @pytest.mark.asyncio
+    async def test_lagging_replica_falls_back_to_primary(self) -> None:
+        primary, replica = session_maker(), session_maker(lag=30)
+        router = ReadRouter(primary, replica, max_lag_seconds=5)
+
+        assert await router.session_maker() is primary
+
+    @pytest.mark.asyncio
+    async def test_unreachable_replica_falls_back_to_primary(self) -> None:
+        error = OperationalError("SELECT", None, OSError("refused"))
+        primary, replica = session_maker(), session_maker(lag=error)
+        router = ReadRouter(primary, replica, max_lag_seconds=5)
+
+        assert await router.session_maker() is primary
+
+    @pytest.mark.asyncio
+    async def test_lag_is_checked_once_per_interval(self) -> None:
+        primary, replica = session_maker(), session_maker(lag=0)
+        router = ReadRouter(
+            primary, replica, max_lag_seconds=5, check_interval_seconds=1
+        )
+
+        with patch("time.monotonic", side_effect=[100.0, 100.5, 101.5]):
+            for _ in range(3):
+                assert await router.session_maker() is replica
+
+        assert replica.session.scalar.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_replica_is_used_again_after_catching_up(self) -> None:
+        primary, replica = session_maker(), session_maker()
+        replica.session.scalar = AsyncMock(side_effect=[30, 0])
+        router = ReadRouter(
+            primary, replica, max_lag_seconds=5, check_interval_seconds=0
+        )
+
+        assert await router.session_maker() is primary
+        assert await router.session_maker() is replica
+
+    def test_negative_lag_limit_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            ReadRouter(session_maker(), max_lag_seconds=-1)
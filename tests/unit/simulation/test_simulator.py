@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from core.domain.model.kernel.grid import Grid
+from core.domain.model.kernel.location import current_grid
+from simulation import PoissonArrivals, SimulationConfig, simulate
+from simulation.report import percentile
+
+
+class TestPoissonArrivals:
+    def test_mean_rate_matches_configuration(self) -> None:
+        arrivals = PoissonArrivals(rate_per_hour=360)
+
+        times = arrivals.arrival_times(random.Random(1), until=100 * 3600)
+
+        assert 35_000 < len(times) < 37_000
+        assert times == sorted(times)
+
+    def test_hourly_profile_shapes_the_flow(self) -> None:
+        profile = [0.0] * 24
+        profile[12] = 1.0
+        arrivals = PoissonArrivals(rate_per_hour=100, hourly_profile=profile)
+
+        times = arrivals.arrival_times(random.Random(1), until=24 * 3600)
+
+        assert times
+        assert all(12 * 3600 <= t < 13 * 3600 for t in times)
+
+    def test_profile_must_cover_a_day(self) -> None:
+        with pytest.raises(ValueError):
+            PoissonArrivals(rate_per_hour=10, hourly_profile=[1.0] * 12)
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [1.0, 2.0, 3.0, 4.0]
+
+    assert percentile(values, 50) == 2.0
+    assert percentile(values, 99) == 4.0
+    assert percentile([], 50) == 0.0
+
+
+class TestSimulator:
+    def test_light_load_delivers_every_order(self) -> None:
+        report = simulate(
+            SimulationConfig(
+                arrivals=PoissonArrivals(rate_per_hour=60),
+                couriers=5,
+                duration_hours=2,
+            )
+        )
+
+        assert report.orders_created > 0
+        assert report.orders_delivered == report.orders_created
+        assert report.backlog_final == 0
+        assert report.delivery_seconds["p50"] <= report.delivery_seconds["p99"]
+
+    def test_same_seed_gives_same_report(self) -> None:
+        config = SimulationConfig(
+            arrivals=PoissonArrivals(rate_per_hour=600),
+            couriers=3,
+            duration_hours=1,
+            seed=7,
+        )
+
+        first, second = simulate(config), simulate(config)
+
+        assert first.delivery_seconds == second.delivery_seconds
+        assert first.orders_delivered == second.orders_delivered
+
+    def test_small_fleet_builds_backlog(self) -> None:
+        report = simulate(
+            SimulationConfig(
+                arrivals=PoissonArrivals(rate_per_hour=1200),
+                couriers=1,
+                courier_speeds=(1,),
+                duration_hours=1,
+                grid=Grid(min_coordinate=1, max_coordinate=50),
+            )
+        )
+
+        assert report.backlog_final > 0
+        assert report.orders_delivered < report.orders_created
+        assert report.courier_utilization > 0.9
+
+    def test_restores_grid_after_run(self) -> None:
+        grid = current_grid()
+
+        simulate(
+            SimulationConfig(
+                arrivals=PoissonArrivals(rate_per_hour=60),
+                duration_hours=0.1,
+                grid=Grid(min_coordinate=1, max_coordinate=1000),
+            )
+        )
+
+        assert current_grid() == grid